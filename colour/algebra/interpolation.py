@@ -253,8 +253,12 @@ class SpragueInterpolator(object):
 
     Notes
     -----
-    The minimum number :math:`k` of data points required along the
-    interpolation axis is :math:`k=6`.
+    -   The minimum number :math:`k` of data points required along the
+        interpolation axis is :math:`k=6`.
+    -   :math:`y` dependent variable can be a stack of shape (N, k) of
+        variables sharing :math:`x` independent variable, they are
+        interpolated at once and the interpolated values have shape
+        (N, ...).
 
     References
     ----------
@@ -286,6 +290,15 @@ class SpragueInterpolator(object):
 
     >>> f([0.25, 0.75])  # doctest: +ELLIPSIS
     array([ 6.7295161...,  7.8140625...])
+
+    Interpolating a stack of dependent variables sharing the same
+    independent variable:
+
+    >>> f = SpragueInterpolator(x, np.vstack((y, y * 2)))
+    >>> f([0.25, 0.75]).shape
+    (2, 2)
+    >>> f([0.25, 0.75])[1]  # doctest: +ELLIPSIS
+    array([ 13.4590322...,  15.628125 ...])
     """
 
     SPRAGUE_C_COEFFICIENTS = np.array(
@@ -307,6 +320,21 @@ class SpragueInterpolator(object):
             ISBN:978-3-901-90641-1
     """
 
+    SPRAGUE_A_COEFFICIENTS = np.array(
+        [[0, 0, 24, 0, 0, 0],
+         [2, -16, 0, 16, -2, 0],
+         [-1, 16, -30, 16, -1, 0],
+         [-9, 39, -70, 66, -33, 7],
+         [13, -64, 126, -124, 61, -12],
+         [-5, 25, -50, 50, -25, 5]]) / 24
+    """
+    Defines the coefficients used to compute the fifth-order polynomial
+    coefficients :math:`a_0, ..., a_5` of an interval from its
+    :math:`r_{i-2}, ..., r_{i+3}` neighbouring points.
+
+    SPRAGUE_A_COEFFICIENTS : array_like, (6, 6)
+    """
+
     def __init__(self, x=None, y=None):
         self._xp = None
         self._yp = None
@@ -386,26 +414,19 @@ class SpragueInterpolator(object):
         if value is not None:
             value = np.atleast_1d(value).astype(np.float_)
 
-            assert value.ndim == 1, (
-                '"y" dependent variable must have exactly one dimension!')
+            assert value.ndim in (1, 2), (
+                '"y" dependent variable must have one or two dimensions!')
 
-            assert len(value) >= 6, (
+            assert value.shape[-1] >= 6, (
                 '"y" dependent variable values count must be in domain [6:]!')
 
-            yp1 = np.ravel((np.dot(
-                self.SPRAGUE_C_COEFFICIENTS[0],
-                np.array(value[0:6]).reshape((6, 1)))) / 209)[0]
-            yp2 = np.ravel((np.dot(
-                self.SPRAGUE_C_COEFFICIENTS[1],
-                np.array(value[0:6]).reshape((6, 1)))) / 209)[0]
-            yp3 = np.ravel((np.dot(
-                self.SPRAGUE_C_COEFFICIENTS[2],
-                np.array(value[-6:]).reshape((6, 1)))) / 209)[0]
-            yp4 = np.ravel((np.dot(
-                self.SPRAGUE_C_COEFFICIENTS[3],
-                np.array(value[-6:]).reshape((6, 1)))) / 209)[0]
-
-            self._yp = np.concatenate(((yp1, yp2), value, (yp3, yp4)))
+            # Boundaries extra points of every dependent variable at once.
+            yp_s = np.dot(value[..., 0:6],
+                          self.SPRAGUE_C_COEFFICIENTS[0:2].T) / 209
+            yp_e = np.dot(value[..., -6:],
+                          self.SPRAGUE_C_COEFFICIENTS[2:4].T) / 209
+
+            self._yp = np.concatenate((yp_s, value, yp_e), axis=-1)
 
         self.__y = value
 
@@ -428,56 +449,65 @@ class SpragueInterpolator(object):
 
     def _evaluate(self, x):
         """
-        Performs the interpolating polynomial evaluation at given point.
+        Performs the interpolating polynomial evaluation at given points.
 
         Parameters
         ----------
-        x : numeric
-            Point to evaluate the interpolant at.
+        x : numeric or array_like
+            Points to evaluate the interpolant at.
 
         Returns
         -------
-        float
-            Interpolated point values.
+        numeric or ndarray
+            Interpolated points values.
+
+        Notes
+        -----
+        -   The interpolating polynomial being linear in :math:`y` dependent
+            variable, the interpolated values are expressed as the product of
+            the padded :math:`y` dependent variable with a weights matrix
+            depending only on given points, a stack of dependent variables
+            is thus interpolated with a single matrix product.
         """
 
-        x = np.asarray(x)
+        x = np.asarray(x, dtype=np.float_)
 
         self._validate_dimensions()
         self._validate_interpolation_range(x)
 
-        i = np.searchsorted(self._xp, x) - 1
-        X = (x - self._xp[i]) / (self._xp[i + 1] - self._xp[i])
+        xp, r = self._xp, self._yp
+        x_f = np.ravel(x)
+
+        i = np.searchsorted(xp, x_f) - 1
+        X = (x_f - xp[i]) / (xp[i + 1] - xp[i])
 
-        r = self._yp
+        # Weights of the :math:`r_{i-2}, ..., r_{i+3}` neighbouring points of
+        # every point, i.e. the polynomial coefficients evaluated at "X".
+        w = np.dot(X[:, np.newaxis] ** np.arange(6),
+                   self.SPRAGUE_A_COEFFICIENTS)
+        j = (i[:, np.newaxis] + np.arange(-2, 4)) % len(xp)
 
-        a0p = r[i]
-        a1p = ((2 * r[i - 2] - 16 * r[i - 1] + 16 * r[i + 1] - 2 *
-                r[i + 2]) / 24)
-        a2p = ((-r[i - 2] + 16 * r[i - 1] - 30 * r[i] + 16 * r[i + 1] -
-                r[i + 2]) / 24)
-        a3p = ((-9 * r[i - 2] + 39 * r[i - 1] - 70 * r[i] + 66 *
-                r[i + 1] - 33 * r[i + 2] + 7 * r[i + 3]) / 24)
-        a4p = ((13 * r[i - 2] - 64 * r[i - 1] + 126 * r[i] - 124 *
-                r[i + 1] + 61 * r[i + 2] - 12 * r[i + 3]) / 24)
-        a5p = ((-5 * r[i - 2] + 25 * r[i - 1] - 50 * r[i] + 50 *
-                r[i + 1] - 25 * r[i + 2] + 5 * r[i + 3]) / 24)
+        if r.ndim == 1:
+            y = np.sum(r[j] * w, axis=-1)
+        else:
+            W = np.zeros((len(xp), len(x_f)))
+            np.add.at(W, (j, np.arange(len(x_f))[:, np.newaxis]), w)
+            y = np.dot(r, W)
 
-        y = (a0p + a1p * X + a2p * X ** 2 + a3p * X ** 3 + a4p * X ** 4 +
-             a5p * X ** 5)
+        y = np.reshape(y, r.shape[:-1] + x.shape)
 
-        return y
+        return y[()] if y.ndim == 0 else y
 
     def _validate_dimensions(self):
         """
         Validates variables dimensions to be the same.
         """
 
-        if len(self.__x) != len(self.__y):
+        if len(self.__x) != self.__y.shape[-1]:
             raise ValueError(
                 ('"x" independent and "y" dependent variables have different '
                  'dimensions: "{0}", "{1}"').format(len(self.__x),
-                                                    len(self.__y)))
+                                                    self.__y.shape[-1]))
 
     def _validate_interpolation_range(self, x):
         """
@@ -521,6 +521,22 @@ class TestSpragueInterpolator(unittest.TestCase):
                 np.arange(0, len(POINTS_DATA_A) - 1 + interval, interval)),
             SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES)
 
+        sprague_interpolator = SpragueInterpolator(
+            x, np.vstack((POINTS_DATA_A,
+                          np.array(POINTS_DATA_A) * 2,
+                          np.array(POINTS_DATA_A) / 2)))
+        np.testing.assert_almost_equal(
+            sprague_interpolator(
+                np.arange(0, len(POINTS_DATA_A) - 1 + interval, interval)),
+            np.vstack((
+                SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES,
+                np.array(SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES) * 2,
+                np.array(SPRAGUE_INTERPOLATED_POINTS_DATA_A_10_SAMPLES) / 2)))
+
+        self.assertTupleEqual(
+            sprague_interpolator(np.array([[0.25, 0.5], [0.75, 1.0]])).shape,
+            (3, 2, 2))
+
     @ignore_numpy_errors
     def test_nan__call__(self):
         """
@@ -4,9 +4,9 @@
 from __future__ import absolute_import
 
 from .dslr import DSL_CAMERAS_RGB_SPECTRAL_SENSITIVITIES
-from colour.utilities import CaseInsensitiveMapping
+from colour.utilities import LazyCaseInsensitiveMapping
 
-CAMERAS_RGB_SPECTRAL_SENSITIVITIES = CaseInsensitiveMapping(
+CAMERAS_RGB_SPECTRAL_SENSITIVITIES = LazyCaseInsensitiveMapping(
     DSL_CAMERAS_RGB_SPECTRAL_SENSITIVITIES)
 
 __all__ = ['CAMERAS_RGB_SPECTRAL_SENSITIVITIES']
@@ -9,11 +9,14 @@ from .spectrum import (
     SpectralShape,
     SpectralPowerDistribution,
     TriSpectralPowerDistribution,
+    MultiSpectralPowerDistribution,
     DEFAULT_SPECTRAL_SHAPE,
+    frozen_spectral_data,
     constant_spd,
     zeros_spd,
     ones_spd)
 from .blackbody import (
+    blackbody_msa,
     blackbody_spd,
     blackbody_spectral_radiance,
     planck_law)
@@ -60,6 +63,12 @@ from .transformations import LMS_2_degree_cmfs_to_XYZ_2_degree_cmfs
 from .transformations import LMS_10_degree_cmfs_to_XYZ_10_degree_cmfs
 from .tristimulus import SPECTRAL_TO_XYZ_METHODS
 from .tristimulus import spectral_to_XYZ
+from .tristimulus import MULTI_SPECTRAL_TO_XYZ_METHODS
+from .tristimulus import multi_spectral_to_XYZ
+from .tristimulus import (
+    PARALLEL_CHUNK_SIZE,
+    PARALLEL_EXECUTORS,
+    multi_spectral_to_XYZ_parallel)
 from .tristimulus import (
     lagrange_coefficients_ASTME202211,
     tristimulus_weighting_factors_ASTME202211,
@@ -67,6 +76,9 @@ from .tristimulus import (
     spectral_to_XYZ_integration,
     spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815,
     spectral_to_XYZ_ASTME30815,
+    multi_spectral_to_XYZ_integration,
+    multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815,
+    multi_spectral_to_XYZ_ASTME30815,
     wavelength_to_XYZ)
 from .whiteness import WHITENESS_METHODS
 from .whiteness import whiteness
@@ -83,11 +95,14 @@ __all__ = ['DEFAULT_WAVELENGTH_DECIMALS',
            'SpectralShape',
            'SpectralPowerDistribution',
            'TriSpectralPowerDistribution',
+           'MultiSpectralPowerDistribution',
            'DEFAULT_SPECTRAL_SHAPE',
+           'frozen_spectral_data',
            'constant_spd',
            'zeros_spd',
            'ones_spd']
-__all__ += ['blackbody_spd',
+__all__ += ['blackbody_msa',
+            'blackbody_spd',
             'blackbody_spectral_radiance',
             'planck_law']
 __all__ += ['LMS_ConeFundamentals',
@@ -125,12 +140,20 @@ __all__ += ['LMS_2_degree_cmfs_to_XYZ_2_degree_cmfs']
 __all__ += ['LMS_10_degree_cmfs_to_XYZ_10_degree_cmfs']
 __all__ += ['SPECTRAL_TO_XYZ_METHODS']
 __all__ += ['spectral_to_XYZ']
+__all__ += ['MULTI_SPECTRAL_TO_XYZ_METHODS']
+__all__ += ['multi_spectral_to_XYZ']
+__all__ += ['PARALLEL_CHUNK_SIZE',
+            'PARALLEL_EXECUTORS',
+            'multi_spectral_to_XYZ_parallel']
 __all__ += ['lagrange_coefficients_ASTME202211',
             'tristimulus_weighting_factors_ASTME202211',
             'adjust_tristimulus_weighting_factors_ASTME30815',
             'spectral_to_XYZ_integration',
             'spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815',
             'spectral_to_XYZ_ASTME30815',
+            'multi_spectral_to_XYZ_integration',
+            'multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815',
+            'multi_spectral_to_XYZ_ASTME30815',
             'wavelength_to_XYZ']
 __all__ += ['WHITENESS_METHODS']
 __all__ += ['whiteness']
@@ -6,7 +6,11 @@ Blackbody - Planckian Radiator
 ==============================
 
 Defines objects to compute the spectral radiance of a planckian radiator and
-its spectral power distribution.
+its spectral power distribution:
+
+-   :func:`planck_law`
+-   :func:`blackbody_msa`
+-   :func:`blackbody_spd`
 
 See Also
 --------
@@ -22,6 +26,7 @@ import numpy as np
 from colour.colorimetry import (
     DEFAULT_SPECTRAL_SHAPE,
     SpectralPowerDistribution)
+from colour.utilities import LRUCache
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
@@ -35,6 +40,8 @@ __all__ = ['C1',
            'N',
            'planck_law',
            'blackbody_spectral_radiance',
+           'BLACKBODY_SPECTRA_CACHE_SIZE',
+           'blackbody_msa',
            'blackbody_spd']
 
 C1 = 3.741771e-16  # 2 * math.pi * PLANCK_CONSTANT * LIGHT_SPEED ** 2
@@ -103,6 +110,111 @@ def planck_law(wavelength, temperature, c1=C1, c2=C2, n=N):
 
 blackbody_spectral_radiance = planck_law
 
+BLACKBODY_SPECTRA_CACHE_SIZE = 1024
+"""
+Maximum count of planckian radiators spectral radiances kept in memory by
+:func:`blackbody_msa` definition.
+
+BLACKBODY_SPECTRA_CACHE_SIZE : int
+"""
+
+_BLACKBODY_SPECTRA_CACHE = None
+
+
+def blackbody_msa(temperature,
+                  shape=DEFAULT_SPECTRAL_SHAPE,
+                  c1=C1,
+                  c2=C2,
+                  n=N):
+    """
+    Returns the multi-spectral array of the planckian radiators for given
+    temperatures :math:`T[K]`.
+
+    Parameters
+    ----------
+    temperature : numeric or array_like
+        Temperatures :math:`T[K]` in kelvin degrees.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral array.
+    c1 : numeric, optional
+        The official value of :math:`c1` is provided by the Committee on Data
+        for Science and Technology (CODATA) and is
+        :math:`c1=3,741771x10.16\ W/m_2` *(Mohr and Taylor, 2000)*.
+    c2 : numeric, optional
+        Since :math:`T` is measured on the International Temperature Scale,
+        the value of :math:`c2` used in colorimetry should follow that adopted
+        in the current International Temperature Scale (ITS-90)
+        *(Preston-Thomas, 1990; Mielenz et aI., 1991)*, namely
+        :math:`c2=1,4388x10.2\ m/K`.
+    n : numeric, optional
+        Medium index of refraction. For dry air at 15°C and 101 325 Pa,
+        containing 0,03 percent by volume of carbon dioxide, it is
+        approximately 1,00028 throughout the visible region although
+        *CIE 15:2004* recommends using :math:`n=1`.
+
+    Returns
+    -------
+    ndarray, (..., W)
+        Blackbody multi-spectral array, i.e. the spectral radiances of the
+        planckian radiators in *watts per steradian per square metre*.
+
+    Notes
+    -----
+    -   The spectral radiances of the temperatures not already computed are
+        evaluated by a single :func:`planck_law` definition call on the
+        (temperatures, wavelengths) grid.
+    -   The spectral radiances are cached in
+        :attr:`_BLACKBODY_SPECTRA_CACHE` attribute, a
+        :class:`colour.utilities.LRUCache` class instance keeping the
+        :attr:`BLACKBODY_SPECTRA_CACHE_SIZE` most recently used ones. Their
+        identifier key is the temperature along the spectral shape and the
+        :math:`c1`, :math:`c2` and :math:`n` arguments.
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> blackbody_msa(  # doctest: +ELLIPSIS
+    ...     [5000, 6500], SpectralShape(400, 700, 100))
+    array([[  8.7425713...e+12,   1.2106064...e+13,   1.2761393...e+13,
+              1.1811179...e+13],
+           [  4.6134702...e+13,   4.6093855...e+13,   3.9259972...e+13,
+              3.1325453...e+13]])
+    """
+
+    global _BLACKBODY_SPECTRA_CACHE
+    if _BLACKBODY_SPECTRA_CACHE is None:
+        _BLACKBODY_SPECTRA_CACHE = LRUCache(BLACKBODY_SPECTRA_CACHE_SIZE)
+
+    temperature = np.asarray(temperature, dtype=np.float_)
+    wavelengths = shape.range()
+
+    temperatures, indexes = np.unique(temperature, return_inverse=True)
+    keys = [(T, shape.start, shape.end, shape.interval, c1, c2, n)
+            for T in temperatures.tolist()]
+
+    msa = np.empty((len(temperatures), len(wavelengths)))
+
+    # The cached spectral radiances are retrieved before caching the computed
+    # ones as they could be evicted otherwise.
+    missing = []
+    for i, key in enumerate(keys):
+        spectrum = _BLACKBODY_SPECTRA_CACHE.get(key)
+        if spectrum is not None:
+            msa[i] = spectrum
+        else:
+            missing.append(i)
+
+    if missing:
+        msa[missing] = planck_law(wavelengths * 1e-9,
+                                  temperatures[missing, np.newaxis],
+                                  c1, c2, n)
+        for i in missing:
+            spectrum = np.copy(msa[i])
+            spectrum.setflags(write=False)
+            _BLACKBODY_SPECTRA_CACHE[keys[i]] = spectrum
+
+    return np.reshape(msa[indexes], temperature.shape + (len(wavelengths),))
+
 
 def blackbody_spd(temperature,
                   shape=DEFAULT_SPECTRAL_SHAPE,
@@ -141,6 +253,10 @@ def blackbody_spd(temperature,
     SpectralPowerDistribution
         Blackbody spectral power distribution.
 
+    See Also
+    --------
+    blackbody_msa
+
     Examples
     --------
     >>> from colour import STANDARD_OBSERVERS_CMFS
@@ -155,5 +271,4 @@ def blackbody_spd(temperature,
         name='{0}K Blackbody'.format(temperature),
         data=dict(
             zip(wavelengths,
-                planck_law(
-                    wavelengths * 1e-9, temperature, c1, c2, n))))
+                blackbody_msa(temperature, shape, c1, c2, n))))
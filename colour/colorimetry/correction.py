@@ -21,6 +21,8 @@ blob/master/notebooks/colorimetry/correction.ipynb>`_
 
 from __future__ import division, unicode_literals
 
+import numpy as np
+
 from colour.utilities import CaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
@@ -71,7 +73,7 @@ def bandpass_correction_Stearns1988(spd):
     array([ 48.01664   ,  70.3729688...,  82.0919506...,  88.72618   ])
     """
 
-    values = spd.values
+    values = np.copy(spd.values)
     values[0] = (1 + ALPHA_STEARNS) * values[0] - ALPHA_STEARNS * values[1]
     values[-1] = (1 + ALPHA_STEARNS) * values[-1] - ALPHA_STEARNS * values[-2]
     for i in range(1, len(values) - 1):
@@ -79,8 +81,7 @@ def bandpass_correction_Stearns1988(spd):
                      (1 + 2 * ALPHA_STEARNS) *
                      values[i] - ALPHA_STEARNS * values[i + 1])
 
-    for i, (wavelength, _value) in enumerate(spd):
-        spd[wavelength] = values[i]
+    spd[spd.wavelengths] = values
     return spd
 
 
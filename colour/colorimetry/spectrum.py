@@ -11,6 +11,7 @@ Defines the classes handling spectral data computation:
 -   :class:`SpectralShape`
 -   :class:`SpectralPowerDistribution`
 -   :class:`TriSpectralPowerDistribution`
+-   :class:`MultiSpectralPowerDistribution`
 
 See Also
 --------
@@ -35,10 +36,11 @@ from colour.algebra import (
     PchipInterpolator)
 from colour.utilities import (
     ArbitraryPrecisionMapping,
+    LRUCache,
+    content_hash,
     is_iterable,
     is_numeric,
     is_string,
-    is_uniform,
     interval,
     tstack,
     warning)
@@ -51,11 +53,15 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = ['DEFAULT_WAVELENGTH_DECIMALS',
+           'SPECTRAL_INTERPOLATORS_CACHE_SIZE',
+           'DERIVED_SPECTRAL_DATA_CACHE_SIZE',
            'SpectralMapping',
            'SpectralShape',
            'SpectralPowerDistribution',
            'TriSpectralPowerDistribution',
+           'MultiSpectralPowerDistribution',
            'DEFAULT_SPECTRAL_SHAPE',
+           'frozen_spectral_data',
            'constant_spd',
            'zeros_spd',
            'ones_spd']
@@ -67,6 +73,124 @@ Default wavelength precision decimals.
 DEFAULT_WAVELENGTH_DECIMALS : int
 """
 
+SPECTRAL_INTERPOLATORS_CACHE_SIZE = 64
+"""
+Maximum count of prepared interpolators kept in memory by
+:meth:`SpectralPowerDistribution.interpolate` method.
+
+SPECTRAL_INTERPOLATORS_CACHE_SIZE : int
+"""
+
+_SPECTRAL_INTERPOLATORS_CACHE = None
+
+DERIVED_SPECTRAL_DATA_CACHE_SIZE = 128
+"""
+Maximum count of spectral data derived by
+:meth:`SpectralPowerDistribution.align` and
+:meth:`SpectralPowerDistribution.trim_wavelengths` methods from spectral power
+distributions with known content, e.g. frozen datasets, kept in memory.
+
+DERIVED_SPECTRAL_DATA_CACHE_SIZE : int
+"""
+
+_DERIVED_SPECTRAL_DATA_CACHE = None
+
+_IN_PLACE_OPERATIONS = {operator.add: operator.iadd,
+                        operator.sub: operator.isub,
+                        operator.mul: operator.imul,
+                        operator.truediv: operator.itruediv,
+                        operator.pow: operator.ipow}
+"""
+In-place counterparts of the arithmetical operations supported by the spectral
+power distributions.
+
+_IN_PLACE_OPERATIONS : dict
+"""
+
+
+def _interval_decimals(interval):
+    """
+    Returns the decimals count of given spectral shape interval.
+
+    Parameters
+    ----------
+    interval : numeric
+        Spectral shape interval.
+
+    Returns
+    -------
+    int
+        Decimals count.
+    """
+
+    decimals = 0
+    while (decimals < DEFAULT_WAVELENGTH_DECIMALS and
+           round(interval, decimals) != interval):
+        decimals += 1
+
+    return decimals
+
+
+def _uniform_interval(wavelengths):
+    """
+    Returns the interval of given wavelengths :math:`\lambda_n` if they are
+    uniformly spaced, their indexes can then be retrieved by index arithmetic,
+    i.e. :math:`(\lambda - \lambda_0) / interval`.
+
+    Parameters
+    ----------
+    wavelengths : ndarray
+        Sorted wavelengths :math:`\lambda_n`.
+
+    Returns
+    -------
+    numeric
+        Wavelengths :math:`\lambda_n` interval or *None* if they are not
+        uniformly spaced.
+    """
+
+    if len(wavelengths) < 2:
+        return None
+
+    interval = (wavelengths[-1] - wavelengths[0]) / (len(wavelengths) - 1)
+
+    # The wavelengths are compared within their precision so that fractional
+    # intervals, not exactly representable, are supported.
+    deviations = np.abs(wavelengths - (
+        wavelengths[0] + np.arange(len(wavelengths)) * interval))
+    if not np.all(deviations <= 10 ** -(DEFAULT_WAVELENGTH_DECIMALS - 1)):
+        return None
+
+    return interval
+
+
+def _stepped_range(origin, limit, interval):
+    """
+    Returns the wavelengths :math:`\lambda_n` stepping from given origin with
+    given interval until reaching or exceeding given limit, similarly to
+    *np.arange(origin, limit + interval, interval)* without its floating point
+    drift for fractional intervals.
+
+    Parameters
+    ----------
+    origin : numeric
+        Origin wavelength :math:`\lambda`.
+    limit : numeric
+        Limit wavelength :math:`\lambda`.
+    interval : numeric
+        Signed interval.
+
+    Returns
+    -------
+    ndarray
+        Wavelengths :math:`\lambda_n`.
+    """
+
+    count = np.ceil(np.around((limit - origin) / interval,
+                              DEFAULT_WAVELENGTH_DECIMALS)) + 1
+
+    return origin + interval * np.arange(max(count, 0))
+
 
 class SpectralMapping(ArbitraryPrecisionMapping):
     """
@@ -176,6 +300,15 @@ class SpectralShape(object):
     __eq__
     __ne__
     range
+    index
+
+    Notes
+    -----
+    -   The spectral shape defines a grid of wavelengths :math:`\lambda_n`
+        indexed by integers: the wavelength :math:`\lambda` index is given by
+        :math:`(\lambda - start) / interval`, thus fractional intervals such
+        as 0.1 nm or 0.01 nm do not accumulate floating point drift and
+        wavelengths lookups are performed in :math:`O(1)`.
 
     Examples
     --------
@@ -452,7 +585,7 @@ class SpectralShape(object):
         False
         """
 
-        return np.all(np.in1d(wavelength, self.range()))
+        return np.all(np.asarray(self.index(wavelength, -1)) != -1)
 
     def __len__(self):
         """
@@ -584,6 +717,62 @@ class SpectralShape(object):
                                           self))
         return self._range
 
+    def index(self, wavelength, default=None):
+        """
+        Returns the index of given wavelength :math:`\lambda` in the spectral
+        shape range using index arithmetic.
+
+        Parameters
+        ----------
+        wavelength : numeric or array_like
+            Wavelength :math:`\lambda` to retrieve the index.
+        default : int, optional
+            Index returned for the wavelengths :math:`\lambda` not in the
+            spectral shape range, a *ValueError* is raised if *None*.
+
+        Returns
+        -------
+        int or ndarray
+            Wavelength :math:`\lambda` index.
+
+        Raises
+        ------
+        ValueError
+            If given wavelength :math:`\lambda` is not in the spectral shape
+            range and no default index is given.
+
+        Examples
+        --------
+        >>> SpectralShape(0, 10, 0.1).index(0.5)
+        5
+        >>> SpectralShape(0, 10, 0.1).index(np.array([0.5, 9.9]))
+        array([ 5, 99])
+        >>> SpectralShape(0, 10, 0.1).index(0.51, -1)
+        -1
+        """
+
+        range_ = self.range()
+        wavelength = np.asarray(wavelength)
+
+        indexes = np.around((wavelength - self._start) / self._interval)
+        in_range = np.logical_and(indexes >= 0, indexes < len(range_))
+        indexes = np.where(in_range, indexes, 0).astype(np.int_)
+
+        found = np.logical_and(
+            in_range,
+            range_[indexes] == np.around(wavelength,
+                                         DEFAULT_WAVELENGTH_DECIMALS))
+
+        if not np.all(found):
+            if default is None:
+                raise ValueError(
+                    '"{0}" wavelength is not in "{1}" shape range!'.format(
+                        wavelength, self))
+
+            indexes = np.where(found, indexes, default)
+
+        return indexes[()] if indexes.ndim == 0 else indexes
+
 
 class SpectralPowerDistribution(object):
     """
@@ -605,8 +794,16 @@ class SpectralPowerDistribution(object):
 
     Notes
     -----
-    -   Underlying spectral data is stored within a `colour.SpectralMapping`
-        class mapping which implies that wavelengths keys will be rounded.
+    -   Underlying spectral data is stored within two contiguous and sorted
+        read-only *ndarray*, one for the wavelengths :math:`\lambda_n` and one
+        for their values. Wavelengths are rounded to
+        :attr:`DEFAULT_WAVELENGTH_DECIMALS` decimals similarly to
+        :class:`colour.SpectralMapping` class keys.
+    -   Any mutation of the spectral power distribution replaces the
+        underlying arrays, thus *ndarray* previously returned by
+        :attr:`SpectralPowerDistribution.wavelengths` and
+        :attr:`SpectralPowerDistribution.values` attributes are left
+        untouched.
 
     Attributes
     ----------
@@ -617,6 +814,8 @@ class SpectralPowerDistribution(object):
     values
     items
     shape
+    frozen
+    digest
 
     Methods
     -------
@@ -667,7 +866,12 @@ class SpectralPowerDistribution(object):
     def __init__(self, name, data, title=None):
         self._name = None
         self.name = name
-        self._data = None
+        self._wavelengths = np.array([])
+        self._values = np.array([])
+        self._uniform_interval = None
+        self._frozen = False
+        self._digest = None
+        self._owns_values = False
         self.data = data
         self._title = None
         self.title = title
@@ -705,20 +909,27 @@ class SpectralPowerDistribution(object):
     @property
     def data(self):
         """
-        Property for **self._data** private attribute.
+        Property for **self.data** attribute.
 
         Returns
         -------
         SpectralMapping
-            self._data.
+            Spectral power distribution data.
+
+        Notes
+        -----
+        -   The mapping is built on request from the underlying arrays, its
+            modification will not be reflected by the spectral power
+            distribution.
         """
 
-        return self._data
+        return SpectralMapping(
+            dict(zip(self._wavelengths.tolist(), self._values.tolist())))
 
     @data.setter
     def data(self, value):
         """
-        Setter for **self._data** private attribute.
+        Setter for **self.data** attribute.
 
         Parameters
         ----------
@@ -730,7 +941,10 @@ class SpectralPowerDistribution(object):
             assert isinstance(value, (dict, SpectralMapping)), (
                 '"{0}" attribute: "{1}" is not a "dict" or "SpectralMapping" '
                 'instance!'.format('data', value))
-        self._data = SpectralMapping(value)
+        else:
+            value = {}
+
+        self._update_data(list(value.keys()), list(value.values()), True)
 
     @property
     def title(self):
@@ -780,7 +994,7 @@ class SpectralPowerDistribution(object):
         :attr:`SpectralPowerDistribution.wavelengths` is read only.
         """
 
-        return np.array(sorted(self._data.keys()))
+        return self._wavelengths
 
     @wavelengths.setter
     def wavelengths(self, value):
@@ -811,8 +1025,11 @@ class SpectralPowerDistribution(object):
         :attr:`SpectralPowerDistribution.values` is read only.
         """
 
-        return np.array([self.get(wavelength)
-                         for wavelength in self.wavelengths])
+        # The array is now referenced outside the spectral power distribution
+        # and cannot be updated in-place anymore.
+        self._owns_values = False
+
+        return self._values
 
     @values.setter
     def values(self, value):
@@ -900,9 +1117,9 @@ class SpectralPowerDistribution(object):
         SpectralShape(512.3, 545.7, 7...)
         """
 
-        return SpectralShape(min(self.data.keys()),
-                             max(self.data.keys()),
-                             min(interval(self.wavelengths)))
+        return SpectralShape(self._wavelengths[0],
+                             self._wavelengths[-1],
+                             min(interval(self._wavelengths)))
 
     @shape.setter
     def shape(self, value):
@@ -917,6 +1134,113 @@ class SpectralPowerDistribution(object):
 
         raise AttributeError('"{0}" attribute is read only!'.format('shape'))
 
+    @property
+    def frozen(self):
+        """
+        Property for **self._frozen** private attribute.
+
+        Returns
+        -------
+        bool
+            self._frozen.
+
+        Notes
+        -----
+        -   A frozen spectral power distribution raises a *RuntimeError*
+            exception on mutation, it must be cloned first.
+        -   Freezing the spectral power distribution records its
+            :attr:`SpectralPowerDistribution.digest` attribute, the spectral
+            data derived from it or its clones by
+            :meth:`SpectralPowerDistribution.align` and
+            :meth:`SpectralPowerDistribution.trim_wavelengths` methods are
+            then kept in a *Least Recently Used* cache of
+            :attr:`DERIVED_SPECTRAL_DATA_CACHE_SIZE` items and shared.
+
+        Examples
+        --------
+        >>> data = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
+        >>> spd = SpectralPowerDistribution('Sample', data)
+        >>> spd.frozen = True
+        >>> spd[510] = 0  # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        RuntimeError: "SpectralPowerDistribution('Sample', ...)" is frozen \
+and cannot be mutated, it must be cloned first!
+        >>> spd.clone().frozen
+        False
+        """
+
+        return self._frozen
+
+    @frozen.setter
+    def frozen(self, value):
+        """
+        Setter for **self._frozen** private attribute.
+
+        Parameters
+        ----------
+        value : bool
+            Attribute value.
+        """
+
+        assert isinstance(value, bool), (
+            '"{0}" attribute: "{1}" is not a "bool" instance!'.format(
+                'frozen', value))
+
+        if value:
+            self._digest = self.digest
+
+        self._frozen = value
+
+    @property
+    def digest(self):
+        """
+        Property for **self._digest** private attribute.
+
+        Returns
+        -------
+        unicode
+            self._digest.
+
+        Notes
+        -----
+        -   The digest is computed from the spectral power distribution
+            wavelengths and values, it does not depend on its name or identity
+            and is stable across processes. It is cached until the spectral
+            power distribution is mutated.
+
+        Examples
+        --------
+        >>> data = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
+        >>> spd1 = SpectralPowerDistribution('Sample', data)
+        >>> spd2 = SpectralPowerDistribution('Other Sample', data)
+        >>> spd1.digest == spd2.digest
+        True
+        >>> spd2[510] = 0
+        >>> spd1.digest == spd2.digest
+        False
+        """
+
+        if self._digest is None:
+            self._digest = content_hash(
+                np.asarray(self._wavelengths, dtype=np.float_),
+                np.asarray(self._values, dtype=np.float_))
+
+        return self._digest
+
+    @digest.setter
+    def digest(self, value):
+        """
+        Setter for **self._digest** private attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('digest'))
+
     def __str__(self):
         """
         Returns a pretty formatted string representation of the spectral power
@@ -992,6 +1316,9 @@ class SpectralPowerDistribution(object):
         -----
         -   Reimplements the :meth:`object.__hash__` method.
 
+        -   The hash value is derived from the
+            :attr:`SpectralPowerDistribution.digest` attribute.
+
         Warning
         -------
         :class:`SpectralPowerDistribution` class is mutable and should not be
@@ -1005,7 +1332,52 @@ class SpectralPowerDistribution(object):
                 08, 2014, from http://stackoverflow.com/a/16162138/931625
         """
 
-        return hash(frozenset(self._data))
+        return hash(int(self.digest, 16))
+
+    def __setstate__(self, state):
+        """
+        Sets the spectral power distribution state when unpickling or copying
+        it.
+
+        Parameters
+        ----------
+        state : dict
+            Spectral power distribution state.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__setstate__` method so that the
+            underlying arrays stay read-only.
+        """
+
+        self.__dict__.update(state)
+
+        self._wavelengths.setflags(write=False)
+        self._values.setflags(write=False)
+
+    def __copy__(self):
+        """
+        Returns a shallow copy of the spectral power distribution sharing its
+        underlying arrays.
+
+        Returns
+        -------
+        SpectralPowerDistribution
+            Spectral power distribution shallow copy.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__copy__` method so that neither
+            the spectral power distribution nor its copy update the shared
+            values array in-place.
+        """
+
+        self._owns_values = False
+
+        spd = self.__class__.__new__(self.__class__)
+        spd.__dict__.update(self.__dict__)
+
+        return spd
 
     def __getitem__(self, wavelength):
         """
@@ -1043,12 +1415,18 @@ class SpectralPowerDistribution(object):
         """
 
         if isinstance(wavelength, slice):
-            return self.values[wavelength]
+            self._owns_values = False
+
+            return self._values[wavelength]
         else:
             wavelength = np.asarray(wavelength)
 
-            value = [self.data.__getitem__(x) for x in np.ravel(wavelength)]
-            value = np.reshape(value, wavelength.shape)
+            indexes, found = self._wavelengths_indexes(wavelength)
+            if not np.all(found):
+                raise KeyError(wavelength[np.logical_not(found)].ravel()[0])
+
+            value = np.reshape(np.asarray(self._values[indexes]),
+                               wavelength.shape)
 
             return value
 
@@ -1098,8 +1476,8 @@ class SpectralPowerDistribution(object):
                     type(wavelength)))
 
         values = np.resize(value, wavelengths.shape)
-        for i in range(len(wavelengths)):
-            self._data.__setitem__(wavelengths[i], values[i])
+
+        self._update_data(wavelengths, values)
 
     def __iter__(self):
         """
@@ -1127,7 +1505,9 @@ class SpectralPowerDistribution(object):
         (540, 88.1...)
         """
 
-        return iter(sorted(self._data.items()))
+        self._owns_values = False
+
+        return zip(self._wavelengths, self._values)
 
     def __contains__(self, wavelength):
         """
@@ -1167,7 +1547,7 @@ class SpectralPowerDistribution(object):
         False
         """
 
-        return np.all(np.in1d(wavelength, self.wavelengths))
+        return np.all(np.in1d(wavelength, self._wavelengths))
 
     def __len__(self):
         """
@@ -1191,7 +1571,7 @@ class SpectralPowerDistribution(object):
         4
         """
 
-        return len(self._data)
+        return len(self._wavelengths)
 
     def __eq__(self, spd):
         """
@@ -1225,7 +1605,9 @@ class SpectralPowerDistribution(object):
         True
         """
 
-        return isinstance(spd, self.__class__) and spd.data == self.data
+        return (isinstance(spd, self.__class__) and
+                np.array_equal(self._wavelengths, spd.wavelengths) and
+                np.array_equal(self._values, spd.values))
 
     def __ne__(self, spd):
         """
@@ -1674,110 +2056,339 @@ class SpectralPowerDistribution(object):
         -------
         SpectralPowerDistribution
             Spectral power distribution.
-        """
 
-        if issubclass(type(x), SpectralPowerDistribution):
-            x = x.values
+        Notes
+        -----
+        -   A spectral power distribution operand with different wavelengths
+            is aligned to the spectral power distribution shape.
+        -   A tri-spectral power distribution or multi-spectral power
+            distribution operand is handled by its reflected operators, e.g.
+            :meth:`TriSpectralPowerDistribution.__rmul__` method.
+        -   In-place operations update the values array directly unless it is
+            shared with a clone or has been referenced through
+            :attr:`SpectralPowerDistribution.values` attribute.
+        """
+
+        if issubclass(type(x), (TriSpectralPowerDistribution,
+                                MultiSpectralPowerDistribution)):
+            return NotImplemented
+        elif issubclass(type(x), SpectralPowerDistribution):
+            x = self._operand_values(x)
         elif is_iterable(x):
             x = np.atleast_1d(x)
 
-        data = SpectralMapping(
-            zip(self.wavelengths, operation(self.values, x)))
-
         if in_place:
-            self._data = data
+            self._validate_mutability()
+
+            in_place_operation = _IN_PLACE_OPERATIONS.get(operation)
+            if (self._owns_values and in_place_operation is not None and
+                    np.result_type(self._values, x) == self._values.dtype and
+                    np.broadcast(self._values, x).shape ==
+                    self._values.shape):
+                self._values.setflags(write=True)
+                try:
+                    in_place_operation(self._values, x)
+                finally:
+                    self._values.setflags(write=False)
+            else:
+                values = np.asarray(operation(self._values, x))
+                values.setflags(write=False)
+                self._values = values
+                self._owns_values = True
+
+            self._digest = None
             return self
         else:
+            values = np.asarray(operation(self._values, x))
+            values.setflags(write=False)
+
+            # The clone values array is replaced, the spectral power
+            # distribution keeps owning its own.
+            owns_values = self._owns_values
             clone = self.clone()
-            clone.data = data
+            self._owns_values = owns_values
+            clone._values = values
+            clone._digest = None
+            clone._owns_values = True
             return clone
 
-    def get(self, wavelength, default=np.nan):
+    def _operand_values(self, spd):
         """
-        Returns the value for given wavelength :math:`\lambda`.
+        Returns given spectral power distribution operand values at the
+        spectral power distribution wavelengths.
 
         Parameters
         ----------
-        wavelength : numeric or ndarray
-            Wavelength :math:`\lambda` to retrieve the value.
-        default : nan or numeric, optional
-            Wavelength :math:`\lambda` default value.
+        spd : SpectralPowerDistribution
+            Spectral power distribution operand.
 
         Returns
         -------
-        numeric or ndarray
-            Wavelength :math:`\lambda` value.
-
-        See Also
-        --------
-        SpectralPowerDistribution.__getitem__
+        ndarray
+            Spectral power distribution operand values.
 
-        Examples
-        --------
-        >>> data = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
-        >>> spd = SpectralPowerDistribution('Sample', data)
-        >>> # Doctests ellipsis for Python 2.x compatibility.
-        >>> spd.get(510)  # doctest: +ELLIPSIS
-        array(49.67...)
-        >>> spd.get(511)
-        array(nan)
-        >>> spd.get(np.array([510, 520]))
-        array([ 49.67,  69.59])
+        Notes
+        -----
+        -   If the operand wavelengths differ, a clone of it is aligned to the
+            spectral power distribution shape using
+            :meth:`SpectralPowerDistribution.align` method defaults.
         """
 
-        wavelength = np.asarray(wavelength)
-
-        value = [self.data.get(x, default) for x in np.ravel(wavelength)]
-        value = np.reshape(value, wavelength.shape)
+        if (spd._wavelengths.shape == self._wavelengths.shape and
+                np.allclose(spd._wavelengths, self._wavelengths)):
+            return spd._values
 
-        return value
+        return spd.clone().align(self.shape)[self._wavelengths]
 
-    def is_uniform(self):
+    def _wavelengths_indexes(self, wavelength):
         """
-        Returns if the spectral power distribution has uniformly spaced data.
+        Returns the indexes of given wavelength :math:`\lambda` in the
+        underlying wavelengths array and whether they have been found.
+
+        Parameters
+        ----------
+        wavelength : numeric or ndarray
+            Wavelength :math:`\lambda` to retrieve the indexes.
 
         Returns
         -------
-        bool
-            Is uniform.
+        tuple
+            Wavelength :math:`\lambda` indexes and found state.
 
-        See Also
-        --------
-        SpectralPowerDistribution.shape
+        Notes
+        -----
+        -   The indexes of uniformly spaced wavelengths :math:`\lambda_n` are
+            computed in :math:`O(1)` with index arithmetic, a binary search is
+            used otherwise.
+        """
 
-        Examples
-        --------
-        >>> data = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
-        >>> spd = SpectralPowerDistribution('Sample', data)
-        >>> spd.is_uniform()
-        True
+        wavelength = np.around(wavelength, DEFAULT_WAVELENGTH_DECIMALS)
 
-        Breaking the interval by introducing a new wavelength :math:`\lambda`
-        value:
+        if len(self._wavelengths) == 0:
+            return (np.zeros(wavelength.shape, np.int_),
+                    np.zeros(wavelength.shape, np.bool_))
 
-        >>> spd[511] = 3.1415
-        >>> spd.is_uniform()
-        False
-        """
+        if self._uniform_interval is not None:
+            # Index arithmetic fast path for uniformly spaced wavelengths.
+            indexes = np.around((wavelength - self._wavelengths[0]) /
+                                self._uniform_interval)
+            indexes = np.where(np.isnan(indexes), 0, indexes)
+        else:
+            indexes = np.searchsorted(self._wavelengths, wavelength)
 
-        return is_uniform(self.wavelengths)
+        indexes = np.clip(indexes, 0, len(self._wavelengths) - 1).astype(
+            np.int_)
 
-    def extrapolate(self,
-                    shape,
-                    method='Constant',
-                    left=None,
-                    right=None):
+        return indexes, self._wavelengths[indexes] == wavelength
+
+    def _update_data(self, wavelengths, values, replace=False):
         """
-        Extrapolates the spectral power distribution following *CIE 15:2004*
-        recommendation.
+        Updates the underlying wavelengths and values arrays with given
+        wavelengths :math:`\lambda_n` and values, existing wavelengths values
+        are overwritten.
 
         Parameters
         ----------
-        shape : SpectralShape
-            Spectral shape used for extrapolation.
-        method : unicode, optional
-            **{'Constant', 'Linear'}**,,
-            Extrapolation method.
+        wavelengths : array_like
+            Wavelengths :math:`\lambda_n` to update.
+        values : array_like
+            Wavelengths :math:`\lambda_n` values.
+        replace : bool, optional
+            Whether to replace the spectral power distribution data instead of
+            updating it.
+        """
+
+        self._validate_mutability()
+
+        wavelengths = np.around(np.ravel(wavelengths),
+                                DEFAULT_WAVELENGTH_DECIMALS)
+        values = np.ravel(values)
+
+        if not replace:
+            wavelengths = np.hstack((self._wavelengths, wavelengths))
+            values = np.hstack((self._values, values))
+
+        # Reversing the arrays so that the last given value for a duplicated
+        # wavelength is kept by :func:`np.unique` definition.
+        wavelengths, indexes = np.unique(wavelengths[::-1], return_index=True)
+        values = values[::-1][indexes]
+
+        wavelengths.setflags(write=False)
+        values.setflags(write=False)
+
+        self._wavelengths = wavelengths
+        self._values = values
+        self._uniform_interval = _uniform_interval(wavelengths)
+        self._digest = None
+        self._owns_values = True
+
+    def _validate_mutability(self):
+        """
+        Validates the spectral power distribution to be mutable.
+
+        Raises
+        ------
+        RuntimeError
+            If the spectral power distribution is frozen.
+        """
+
+        if self._frozen:
+            raise RuntimeError(
+                '"{0}" is frozen and cannot be mutated, it must be cloned '
+                'first!'.format(self))
+
+    def _load_derived_data(self, *args):
+        """
+        Loads the spectral data derived from the spectral power distribution
+        by the operation described by given arguments from the derived
+        spectral data cache.
+
+        Other Parameters
+        ----------------
+        \*args : list, optional
+            Operation name and arguments.
+
+        Returns
+        -------
+        tuple
+            Derived spectral data cache key, *None* if the spectral power
+            distribution digest has not been computed, and whether the data
+            has been loaded.
+        """
+
+        if self._digest is None:
+            return None, False
+
+        global _DERIVED_SPECTRAL_DATA_CACHE
+        if _DERIVED_SPECTRAL_DATA_CACHE is None:
+            _DERIVED_SPECTRAL_DATA_CACHE = LRUCache(
+                DERIVED_SPECTRAL_DATA_CACHE_SIZE)
+
+        key = content_hash(self._digest, *args)
+        derived_data = _DERIVED_SPECTRAL_DATA_CACHE.get(key)
+        if derived_data is None:
+            return key, False
+
+        self._validate_mutability()
+
+        (self._wavelengths,
+         self._values,
+         self._uniform_interval,
+         self._digest) = derived_data
+        self._owns_values = False
+
+        return key, True
+
+    def _store_derived_data(self, key):
+        """
+        Stores the spectral power distribution data into the derived spectral
+        data cache with given key.
+
+        Parameters
+        ----------
+        key : unicode
+            Derived spectral data cache key, nothing is stored if *None*.
+        """
+
+        if key is None:
+            return
+
+        _DERIVED_SPECTRAL_DATA_CACHE[key] = (
+            self._wavelengths, self._values, self._uniform_interval,
+            self.digest)
+        self._owns_values = False
+
+    def get(self, wavelength, default=np.nan):
+        """
+        Returns the value for given wavelength :math:`\lambda`.
+
+        Parameters
+        ----------
+        wavelength : numeric or ndarray
+            Wavelength :math:`\lambda` to retrieve the value.
+        default : nan or numeric, optional
+            Wavelength :math:`\lambda` default value.
+
+        Returns
+        -------
+        numeric or ndarray
+            Wavelength :math:`\lambda` value.
+
+        See Also
+        --------
+        SpectralPowerDistribution.__getitem__
+
+        Examples
+        --------
+        >>> data = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
+        >>> spd = SpectralPowerDistribution('Sample', data)
+        >>> # Doctests ellipsis for Python 2.x compatibility.
+        >>> spd.get(510)  # doctest: +ELLIPSIS
+        array(49.67...)
+        >>> spd.get(511)
+        array(nan)
+        >>> spd.get(np.array([510, 520]))
+        array([ 49.67,  69.59])
+        """
+
+        wavelength = np.asarray(wavelength)
+
+        indexes, found = self._wavelengths_indexes(wavelength)
+        if np.all(found):
+            value = self._values[indexes]
+        else:
+            value = np.where(found, self._values[indexes], default)
+
+        value = np.reshape(np.asarray(value), wavelength.shape)
+
+        return value
+
+    def is_uniform(self):
+        """
+        Returns if the spectral power distribution has uniformly spaced data.
+
+        Returns
+        -------
+        bool
+            Is uniform.
+
+        See Also
+        --------
+        SpectralPowerDistribution.shape
+
+        Examples
+        --------
+        >>> data = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
+        >>> spd = SpectralPowerDistribution('Sample', data)
+        >>> spd.is_uniform()
+        True
+
+        Breaking the interval by introducing a new wavelength :math:`\lambda`
+        value:
+
+        >>> spd[511] = 3.1415
+        >>> spd.is_uniform()
+        False
+        """
+
+        return self._uniform_interval is not None
+
+    def extrapolate(self,
+                    shape,
+                    method='Constant',
+                    left=None,
+                    right=None):
+        """
+        Extrapolates the spectral power distribution following *CIE 15:2004*
+        recommendation.
+
+        Parameters
+        ----------
+        shape : SpectralShape
+            Spectral shape used for extrapolation.
+        method : unicode, optional
+            **{'Constant', 'Linear'}**,,
+            Extrapolation method.
         left : numeric, optional
             Value to return for low extrapolation range.
         right : numeric, optional
@@ -1814,18 +2425,15 @@ class SpectralPowerDistribution(object):
         """
 
         extrapolator = Extrapolator(
-            LinearInterpolator(self.wavelengths, self.values),
+            LinearInterpolator(self._wavelengths, self._values),
             method=method, left=left, right=right)
 
         spd_shape = self.shape
-        for i in np.arange(spd_shape.start,
-                           shape.start - spd_shape.interval,
-                           -spd_shape.interval):
-            self[i] = extrapolator(np.float_(i))
-        for i in np.arange(spd_shape.end,
-                           shape.end + spd_shape.interval,
-                           spd_shape.interval):
-            self[i] = extrapolator(np.float_(i))
+        wavelengths = np.hstack((
+            _stepped_range(spd_shape.start, shape.start, -spd_shape.interval),
+            _stepped_range(spd_shape.end, shape.end, spd_shape.interval)))
+
+        self._update_data(wavelengths, extrapolator(wavelengths))
 
         return self
 
@@ -1870,6 +2478,13 @@ class SpectralPowerDistribution(object):
             :meth:`SpectralPowerDistribution.align` methods.
         -   *Sprague (1880)* interpolator cannot be used for interpolating
             functions having a non-uniformly spaced independent variable.
+        -   The interpolator is evaluated at once over the spectral shape
+            wavelengths :math:`\lambda_n`. Prepared interpolators are kept in
+            a *Least Recently Used* cache of
+            :attr:`SPECTRAL_INTERPOLATORS_CACHE_SIZE` items keyed on the
+            interpolation method and the spectral power distribution content,
+            thus resampling the same data to different shapes does not
+            prepare the interpolator again.
 
         Warning
         -------
@@ -1941,12 +2556,15 @@ class SpectralPowerDistribution(object):
         boundaries = [x[0] if x[0] is not None else x[1] for x in boundaries]
         shape = SpectralShape(*boundaries)
 
-        # Defining proper interpolation bounds.
-        # TODO: Provide support for fractional interval like 0.1, etc...
-        shape.start = max(shape.start, np.ceil(spd_shape.start))
-        shape.end = min(shape.end, np.floor(spd_shape.end))
+        # Defining proper interpolation bounds, they are rounded at the
+        # interval decimals so that fractional intervals are supported.
+        scale = 10 ** _interval_decimals(shape.interval)
+        shape.start = max(shape.start, np.ceil(np.around(
+            spd_shape.start * scale, DEFAULT_WAVELENGTH_DECIMALS)) / scale)
+        shape.end = min(shape.end, np.floor(np.around(
+            spd_shape.end * scale, DEFAULT_WAVELENGTH_DECIMALS)) / scale)
 
-        wavelengths, values = self.wavelengths, self.values
+        wavelengths, values = self._wavelengths, self._values
         uniform = self.is_uniform()
 
         if is_string(method):
@@ -1974,10 +2592,24 @@ class SpectralPowerDistribution(object):
             raise ValueError(
                 'Undefined "{0}" interpolator!'.format(method))
 
-        interpolator = interpolator(wavelengths, values)
-        self._data = SpectralMapping(
-            [(wavelength, np.float_(interpolator(wavelength)))
-             for wavelength in shape])
+        global _SPECTRAL_INTERPOLATORS_CACHE
+        if _SPECTRAL_INTERPOLATORS_CACHE is None:
+            _SPECTRAL_INTERPOLATORS_CACHE = LRUCache(
+                SPECTRAL_INTERPOLATORS_CACHE_SIZE)
+
+        name_i = content_hash(interpolator.__name__, wavelengths, values)
+        cached_interpolator = _SPECTRAL_INTERPOLATORS_CACHE.get(name_i)
+        if cached_interpolator is not None:
+            interpolator = cached_interpolator
+        else:
+            # Some *scipy* interpolators do not support read-only arrays.
+            interpolator = interpolator(np.copy(wavelengths), np.copy(values))
+            _SPECTRAL_INTERPOLATORS_CACHE[name_i] = interpolator
+
+        wavelengths = shape.range()
+        self._update_data(wavelengths,
+                          np.asarray(interpolator(wavelengths), np.float_),
+                          True)
 
         return self
 
@@ -2053,12 +2685,21 @@ class SpectralPowerDistribution(object):
                 77.18     ...,  77.18     ...,  77.18     ...,  77.18     ...])
         """
 
+        key, loaded = self._load_derived_data(
+            'align', shape.start, shape.end, shape.interval,
+            interpolation_method, extrapolation_method,
+            extrapolation_left, extrapolation_right)
+        if loaded:
+            return self
+
         self.interpolate(shape, interpolation_method)
         self.extrapolate(shape,
                          extrapolation_method,
                          extrapolation_left,
                          extrapolation_right)
 
+        self._store_derived_data(key)
+
         return self
 
     def trim_wavelengths(self, shape):
@@ -2093,10 +2734,17 @@ class SpectralPowerDistribution(object):
         array([ 520.,  530.,  540.,  550.])
         """
 
-        wavelengths = list(set(self.shape.range()).intersection(shape.range()))
+        key, loaded = self._load_derived_data(
+            'trim_wavelengths', shape.start, shape.end, shape.interval)
+        if loaded:
+            return self
+
+        wavelengths = np.intersect1d(self.shape.range(), shape.range())
         values = self[wavelengths]
 
-        self.data = SpectralMapping(zip(wavelengths, values))
+        self._update_data(wavelengths, values, True)
+
+        self._store_derived_data(key)
 
         return self
 
@@ -2149,19 +2797,18 @@ class SpectralPowerDistribution(object):
         boundaries = [x[0] if x[0] is not None else x[1] for x in boundaries]
         shape = SpectralShape(*boundaries)
 
-        data = SpectralMapping(
-            [(wavelength, self.get(wavelength, 0))
-             for wavelength in shape])
+        wavelengths = shape.range()
+        values = self.get(wavelengths, 0)
 
         values_s = max(self.shape.start, shape.start)
         values_e = min(self.shape.end, shape.end)
-        values = [self[wavelength] for wavelength in self.wavelengths
-                  if values_s <= wavelength <= values_e]
-        if not np.all(np.in1d(values, list(data.values()))):
+        values_c = self._values[np.logical_and(
+            self._wavelengths >= values_s, self._wavelengths <= values_e)]
+        if not np.all(np.in1d(values_c, values)):
             raise RuntimeError(('"{0}" cannot be zeros filled using "{1}" '
                                 'shape!').format(self, shape))
         else:
-            self._data = data
+            self._update_data(wavelengths, values, True)
 
             return self
 
@@ -2190,7 +2837,7 @@ class SpectralPowerDistribution(object):
         array([ 0.5632157...,  0.7890917...,  0.9267490...,  1.        ])
         """
 
-        self *= 1 / max(self.values) * factor
+        self *= 1 / np.max(self._values) * factor
 
         return self
 
@@ -2203,6 +2850,10 @@ class SpectralPowerDistribution(object):
         provides a convenient way to copy the spectral power distribution to a
         new object.
 
+        The clone shares the underlying read-only arrays with the spectral
+        power distribution, they are only copied when one of the two objects
+        is mutated.
+
         Returns
         -------
         SpectralPowerDistribution
@@ -2219,7 +2870,10 @@ class SpectralPowerDistribution(object):
         SpectralPowerDistribution('Sample (...)', (510..., 540..., 10...))
         """
 
-        clone = copy.deepcopy(self)
+        # The underlying arrays are read-only and replaced on mutation, thus
+        # they are shared by the clone until any of the two objects mutates.
+        clone = copy.copy(self)
+        clone._frozen = False
 
         clone.name = '{0} ({1})'.format(clone.name, id(clone))
 
@@ -2263,6 +2917,8 @@ class TriSpectralPowerDistribution(object):
     values
     items
     shape
+    frozen
+    digest
 
     Methods
     -------
@@ -2287,6 +2943,11 @@ class TriSpectralPowerDistribution(object):
     __idiv__
     __pow__
     __ipow__
+    __radd__
+    __rsub__
+    __rmul__
+    __rdiv__
+    __rpow__
     get
     is_uniform
     extrapolate
@@ -2424,6 +3085,11 @@ class TriSpectralPowerDistribution(object):
             Attribute value.
         """
 
+        if self.frozen:
+            raise RuntimeError(
+                '"{0}" is frozen and cannot be mutated, it must be cloned '
+                'first!'.format(self))
+
         if value is not None:
             assert isinstance(value, dict), (
                 '"{0}" attribute: "{1}" is not a "dict" instance!'.format(
@@ -2665,8 +3331,7 @@ class TriSpectralPowerDistribution(object):
         :attr:`TriSpectralPowerDistribution.values` is read only.
         """
 
-        return np.array([self.get(wavelength)
-                         for wavelength in self.wavelengths])
+        return tstack((self.x.values, self.y.values, self.z.values))
 
     @values.setter
     def values(self, value):
@@ -2757,6 +3422,69 @@ class TriSpectralPowerDistribution(object):
 
         raise AttributeError('"{0}" attribute is read only!'.format('shape'))
 
+    @property
+    def frozen(self):
+        """
+        Property for **self.frozen** attribute.
+
+        Returns
+        -------
+        bool
+            Whether the axes spectral power distributions are frozen.
+
+        See Also
+        --------
+        SpectralPowerDistribution.frozen
+        """
+
+        return self._data is not None and all(
+            self._data[axis].frozen for axis in ('x', 'y', 'z'))
+
+    @frozen.setter
+    def frozen(self, value):
+        """
+        Setter for **self.frozen** attribute.
+
+        Parameters
+        ----------
+        value : bool
+            Attribute value.
+        """
+
+        for axis in ('x', 'y', 'z'):
+            self._data[axis].frozen = value
+
+    @property
+    def digest(self):
+        """
+        Property for **self.digest** attribute.
+
+        Returns
+        -------
+        unicode
+            Digest of the axes spectral power distributions digests.
+
+        See Also
+        --------
+        SpectralPowerDistribution.digest
+        """
+
+        return content_hash(*[self._data[axis].digest
+                              for axis in ('x', 'y', 'z')])
+
+    @digest.setter
+    def digest(self, value):
+        """
+        Setter for **self.digest** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('digest'))
+
     def __str__(self):
         """
         Returns a pretty formatted string representation of the tri-spectral
@@ -2858,15 +3586,15 @@ class TriSpectralPowerDistribution(object):
         Notes
         -----
         -   Reimplements the :meth:`object.__hash__` method.
+        -   The hash value is derived from the
+            :attr:`TriSpectralPowerDistribution.digest` attribute.
 
         Warning
         -------
         See :meth:`SpectralPowerDistribution.__hash__` method warning section.
         """
 
-        return hash((frozenset(self._data.get('x')),
-                     frozenset(self._data.get('y')),
-                     frozenset(self._data.get('z'))))
+        return hash(int(self.digest, 16))
 
     def __getitem__(self, wavelength):
         """
@@ -3656,65 +4384,83 @@ class TriSpectralPowerDistribution(object):
 
         return self._arithmetical_operation(x, operator.pow, True)
 
-    def _arithmetical_operation(self, x, operation, in_place=False):
+    def __radd__(self, x):
         """
-        Performs given arithmetical operation on :math:`x` variable, the
-        operation can be either performed on a tri-spectral power distribution
-        clone or in-place.
+        Implements support for reflected tri-spectral power distribution
+        addition, i.e. when the tri-spectral power distribution is the
+        right operand.
 
         Parameters
         ----------
-        x : numeric or ndarray or TriSpectralPowerDistribution
-            Operand.
-        operation : object
-            Operation to perform.
-        in_place : bool, optional
-            Operation happens in place.
+        x : numeric or array_like or SpectralPowerDistribution
+            Variable to add.
 
         Returns
         -------
         TriSpectralPowerDistribution
-            Tri-spectral power distribution.
+            Variable added tri-spectral power distribution.
+
+        See Also
+        --------
+        TriSpectralPowerDistribution.__add__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__radd__` method.
         """
 
-        if issubclass(type(x), TriSpectralPowerDistribution):
-            x = x.values
-        elif is_iterable(x):
-            x = np.atleast_1d(x)
+        return self._arithmetical_operation(x, operator.add)
 
-        data = {}
-        values = operation(self.values, x)
-        for i, axis in enumerate(('x', 'y', 'z')):
-            data[self._mapping[axis]] = SpectralMapping(
-                zip(self.wavelengths, values[..., i]))
+    def __rsub__(self, x):
+        """
+        Implements support for reflected tri-spectral power distribution
+        subtraction, i.e. when the tri-spectral power distribution is the
+        right operand.
 
-        if in_place:
-            self.data = data
-            return self
-        else:
-            clone = self.clone()
-            clone.data = data
-            return clone
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution
+            Variable to subtract from.
 
-    def get(self, wavelength, default=np.nan):
+        Returns
+        -------
+        TriSpectralPowerDistribution
+            Variable subtracted tri-spectral power distribution.
+
+        See Also
+        --------
+        TriSpectralPowerDistribution.__sub__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__rsub__` method.
         """
-        Returns the values for given wavelength :math:`\lambda`.
+
+        return self._arithmetical_operation(x, lambda a, b: b - a)
+
+    def __rmul__(self, x):
+        """
+        Implements support for reflected tri-spectral power distribution
+        multiplication, i.e. when the tri-spectral power distribution is the
+        right operand.
 
         Parameters
         ----------
-        wavelength : numeric or array_like
-            Wavelength :math:`\lambda` to retrieve the values.
-        default : nan, numeric or array_like, optional
-            Wavelength :math:`\lambda` default values.
+        x : numeric or array_like or SpectralPowerDistribution
+            Variable to multiply by.
 
         Returns
         -------
-        numeric or array_like
-            Wavelength :math:`\lambda` values.
+        TriSpectralPowerDistribution
+            Variable multiplied tri-spectral power distribution.
 
         See Also
         --------
-        TriSpectralPowerDistribution.__getitem__
+        TriSpectralPowerDistribution.__mul__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__rmul__` method.
 
         Examples
         --------
@@ -3724,25 +4470,169 @@ class TriSpectralPowerDistribution(object):
         >>> data = {'x_bar': x_bar, 'y_bar': y_bar, 'z_bar': z_bar}
         >>> mapping = {'x': 'x_bar', 'y': 'y_bar', 'z': 'z_bar'}
         >>> tri_spd = TriSpectralPowerDistribution('Observer', data, mapping)
-        >>> tri_spd.get(510)
-        array([ 49.67,  90.56,  12.43])
-        >>> tri_spd.get(np.array([510, 520]))
-        array([[ 49.67,  90.56,  12.43],
-               [ 69.59,  87.34,  23.15]])
-        >>> tri_spd.get(511)
-        array([ nan,  nan,  nan])
-        >>> tri_spd.get(np.array([510, 520]))
-        array([[ 49.67,  90.56,  12.43],
-               [ 69.59,  87.34,  23.15]])
+        >>> spd = SpectralPowerDistribution('Sample', {
+        ...     510: 1, 520: 2, 530: 3, 540: 4})
+        >>> (spd * tri_spd).values
+        array([[  49.67,   90.56,   12.43],
+               [ 139.18,  174.68,   46.3 ],
+               [ 245.19,  137.28,  203.94],
+               [ 352.76,   93.8 ,  361.12]])
         """
 
-        wavelength = np.asarray(wavelength)
+        return self._arithmetical_operation(x, operator.mul)
 
-        default = np.resize(default, 3)
-        value = np.array([(self.x.get(x, default[0]),
-                           self.y.get(x, default[1]),
-                           self.z.get(x, default[2]))
-                          for x in np.ravel(wavelength)])
+    def __rdiv__(self, x):
+        """
+        Implements support for reflected tri-spectral power distribution
+        division, i.e. when the tri-spectral power distribution is the
+        right operand.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution
+            Variable to divide.
+
+        Returns
+        -------
+        TriSpectralPowerDistribution
+            Variable divided tri-spectral power distribution.
+
+        See Also
+        --------
+        TriSpectralPowerDistribution.__div__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__rdiv__` method.
+        """
+
+        return self._arithmetical_operation(x, lambda a, b: b / a)
+
+    __rtruediv__ = __rdiv__
+
+    def __rpow__(self, x):
+        """
+        Implements support for reflected tri-spectral power distribution
+        exponentiation, i.e. when the tri-spectral power distribution is the
+        right operand.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution
+            Variable to exponentiate.
+
+        Returns
+        -------
+        TriSpectralPowerDistribution
+            Variable exponentiated tri-spectral power distribution.
+
+        See Also
+        --------
+        TriSpectralPowerDistribution.__pow__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__rpow__` method.
+        """
+
+        return self._arithmetical_operation(x, lambda a, b: b ** a)
+
+    def _arithmetical_operation(self, x, operation, in_place=False):
+        """
+        Performs given arithmetical operation on :math:`x` variable, the
+        operation can be either performed on a tri-spectral power distribution
+        clone or in-place.
+
+        Parameters
+        ----------
+        x : numeric or ndarray or SpectralPowerDistribution or \
+TriSpectralPowerDistribution
+            Operand.
+        operation : object
+            Operation to perform.
+        in_place : bool, optional
+            Operation happens in place.
+
+        Returns
+        -------
+        TriSpectralPowerDistribution
+            Tri-spectral power distribution.
+
+        Notes
+        -----
+        -   The operation is performed on each axis spectral power distribution
+            values array with *Numpy* broadcasting, a
+            :class:`SpectralPowerDistribution` class operand is applied to
+            every axis.
+        -   A spectral power distribution or tri-spectral power distribution
+            operand with different wavelengths is aligned to the tri-spectral
+            power distribution shape.
+        """
+
+        axes = ('x', 'y', 'z')
+
+        if issubclass(type(x), TriSpectralPowerDistribution):
+            x = [self.x._operand_values(getattr(x, axis)) for axis in axes]
+        elif issubclass(type(x), SpectralPowerDistribution):
+            x = [self.x._operand_values(x)] * 3
+        else:
+            # Broadcasting views avoid copying the operand for each axis.
+            x = np.broadcast_to(x, (len(self.wavelengths), 3))
+            x = [x[..., i] for i in range(3)]
+
+        tri_spd = self if in_place else self.clone()
+        for i, axis in enumerate(axes):
+            getattr(tri_spd, axis)._arithmetical_operation(
+                x[i], operation, True)
+
+        return tri_spd
+
+    def get(self, wavelength, default=np.nan):
+        """
+        Returns the values for given wavelength :math:`\lambda`.
+
+        Parameters
+        ----------
+        wavelength : numeric or array_like
+            Wavelength :math:`\lambda` to retrieve the values.
+        default : nan, numeric or array_like, optional
+            Wavelength :math:`\lambda` default values.
+
+        Returns
+        -------
+        numeric or array_like
+            Wavelength :math:`\lambda` values.
+
+        See Also
+        --------
+        TriSpectralPowerDistribution.__getitem__
+
+        Examples
+        --------
+        >>> x_bar = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
+        >>> y_bar = {510: 90.56, 520: 87.34, 530: 45.76, 540: 23.45}
+        >>> z_bar = {510: 12.43, 520: 23.15, 530: 67.98, 540: 90.28}
+        >>> data = {'x_bar': x_bar, 'y_bar': y_bar, 'z_bar': z_bar}
+        >>> mapping = {'x': 'x_bar', 'y': 'y_bar', 'z': 'z_bar'}
+        >>> tri_spd = TriSpectralPowerDistribution('Observer', data, mapping)
+        >>> tri_spd.get(510)
+        array([ 49.67,  90.56,  12.43])
+        >>> tri_spd.get(np.array([510, 520]))
+        array([[ 49.67,  90.56,  12.43],
+               [ 69.59,  87.34,  23.15]])
+        >>> tri_spd.get(511)
+        array([ nan,  nan,  nan])
+        >>> tri_spd.get(np.array([510, 520]))
+        array([[ 49.67,  90.56,  12.43],
+               [ 69.59,  87.34,  23.15]])
+        """
+
+        wavelength = np.asarray(wavelength)
+
+        default = np.resize(default, 3)
+        value = tstack((self.x.get(wavelength, default[0]),
+                        self.y.get(wavelength, default[1]),
+                        self.z.get(wavelength, default[2])))
 
         value = np.reshape(value, wavelength.shape + (3,))
 
@@ -3793,7 +4683,7 @@ class TriSpectralPowerDistribution(object):
                     right=None):
         """
         Extrapolates the tri-spectral power distribution following
-        *CIE 15:2004* recommendation. [2]_ [3]_
+        *CIE 15:2004* recommendation.
 
         Parameters
         ----------
@@ -3844,7 +4734,7 @@ class TriSpectralPowerDistribution(object):
         *CIE 167:2005* recommendations: the method developed by
         *Sprague (1880)* should be used for interpolating functions having a
         uniformly spaced independent variable and a *Cubic Spline* method for
-        non-uniformly spaced independent variable. [4]_
+        non-uniformly spaced independent variable.
 
         Parameters
         ----------
@@ -4323,6 +5213,10 @@ class TriSpectralPowerDistribution(object):
         method provides a convenient way to copy the tri-spectral power
         distribution to a new object.
 
+        The clone shares the underlying read-only arrays of the axes spectral
+        power distributions, they are only copied when one of the objects is
+        mutated.
+
         Returns
         -------
         TriSpectralPowerDistribution
@@ -4361,7 +5255,13 @@ class TriSpectralPowerDistribution(object):
         TriSpectralPowerDistribution('Observer (...)', (510..., 560..., 10...))
         """
 
-        clone = copy.deepcopy(self)
+        clone = copy.copy(self)
+        clone._mapping = copy.copy(self._mapping)
+        clone._labels = copy.copy(self._labels)
+        if self._data is not None:
+            clone._data = dict((axis, copy.copy(spd))
+                               for axis, spd in self._data.items())
+            clone.frozen = False
 
         clone.name = '{0} ({1})'.format(clone.name, id(clone))
 
@@ -4371,13 +5271,1974 @@ class TriSpectralPowerDistribution(object):
         return clone
 
 
-DEFAULT_SPECTRAL_SHAPE = SpectralShape(360, 830, 1)
-"""
-Default spectral shape using the shape of
-*CIE 1931 2 Degree Standard Observer*.
+class MultiSpectralPowerDistribution(object):
+    """
+    Defines the base object for batched spectral data computations.
 
-DEFAULT_SPECTRAL_SHAPE : SpectralShape
-"""
+    A collection of :math:`N` spectral power distributions sharing the same
+    wavelengths :math:`\lambda_n` is stored within a single *ndarray* of shape
+    (N, W) so that operations are performed on all the spectral power
+    distributions at once.
+
+    Parameters
+    ----------
+    name : unicode
+        Multi-spectral power distribution name.
+    data : array_like, (N, W)
+        Multi-spectral power distribution values, each row being a spectral
+        power distribution.
+    wavelengths : array_like or SpectralShape, (W,)
+        Wavelengths :math:`\lambda_n` shared by the spectral power
+        distributions.
+    title : unicode, optional
+        Multi-spectral power distribution title for figures.
+    labels : array_like, optional
+        Spectral power distributions labels for figures.
+
+    Notes
+    -----
+    -   Similarly to :class:`SpectralPowerDistribution` class, the underlying
+        wavelengths and values *ndarray* are read-only and replaced on
+        mutation.
+
+    Attributes
+    ----------
+    name
+    title
+    labels
+    wavelengths
+    values
+    shape
+    digest
+
+    Methods
+    -------
+    __str__
+    __repr__
+    __hash__
+    __init__
+    __getitem__
+    __setitem__
+    __iter__
+    __contains__
+    __len__
+    __eq__
+    __ne__
+    __add__
+    __iadd__
+    __sub__
+    __isub__
+    __mul__
+    __imul__
+    __div__
+    __idiv__
+    __pow__
+    __ipow__
+    get
+    is_uniform
+    extrapolate
+    interpolate
+    align
+    trim_wavelengths
+    zeros
+    normalise
+    clone
+
+    See Also
+    --------
+    SpectralPowerDistribution
+
+    Examples
+    --------
+    >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+    ...                  [90.56, 87.34, 45.76, 23.45],
+    ...                  [12.43, 23.15, 67.98, 90.28]])
+    >>> multi_spd = MultiSpectralPowerDistribution(
+    ...     'Samples', data, SpectralShape(510, 540, 10))
+    >>> multi_spd.wavelengths
+    array([ 510.,  520.,  530.,  540.])
+    >>> multi_spd.values
+    array([[ 49.67,  69.59,  81.73,  88.19],
+           [ 90.56,  87.34,  45.76,  23.45],
+           [ 12.43,  23.15,  67.98,  90.28]])
+    >>> # Doctests skip for Python 2.x compatibility.
+    >>> multi_spd.shape  # doctest: +SKIP
+    SpectralShape(510.0, 540.0, 10.0)
+    """
+
+    def __init__(self, name, data, wavelengths, title=None, labels=None):
+        self._name = None
+        self.name = name
+        self._wavelengths = np.array([])
+        self._values = np.zeros((0, 0))
+        self._uniform_interval = None
+        self._digest = None
+
+        if isinstance(wavelengths, SpectralShape):
+            wavelengths = wavelengths.range()
+
+        wavelengths = np.ravel(wavelengths)
+        values = np.atleast_2d(np.asarray(data, dtype=np.float_))
+
+        assert values.ndim == 2, (
+            '"{0}" attribute: "{1}" is not an "(N, W)" shaped '
+            'array!'.format('data', values.shape))
+        assert values.shape[-1] == len(wavelengths), (
+            '"{0}" attribute values count "{1}" does not match wavelengths '
+            'count "{2}"!'.format('data', values.shape[-1], len(wavelengths)))
+
+        self._update_data(wavelengths, values, True)
+        self._title = None
+        self.title = title
+        self._labels = None
+        self.labels = labels
+
+    @property
+    def name(self):
+        """
+        Property for **self._name** private attribute.
+
+        Returns
+        -------
+        unicode
+            self._name.
+        """
+
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        """
+        Setter for **self._name** private attribute.
+
+        Parameters
+        ----------
+        value : unicode
+            Attribute value.
+        """
+
+        if value is not None:
+            assert is_string(value), (
+                ('"{0}" attribute: "{1}" is not a '
+                 '"string" like object!').format('name', value))
+        self._name = value
+
+    @property
+    def title(self):
+        """
+        Property for **self._title** private attribute.
+
+        Returns
+        -------
+        unicode
+            self._title.
+        """
+
+        if self._title is not None:
+            return self._title
+        else:
+            return self._name
+
+    @title.setter
+    def title(self, value):
+        """
+        Setter for **self._title** private attribute.
+
+        Parameters
+        ----------
+        value : unicode
+            Attribute value.
+        """
+
+        if value is not None:
+            assert is_string(value), (
+                ('"{0}" attribute: "{1}" is not a '
+                 '"string" like object!').format('title', value))
+        self._title = value
+
+    @property
+    def labels(self):
+        """
+        Property for **self._labels** private attribute.
+
+        Returns
+        -------
+        tuple
+            self._labels.
+        """
+
+        return self._labels
+
+    @labels.setter
+    def labels(self, value):
+        """
+        Setter for **self._labels** private attribute.
+
+        Parameters
+        ----------
+        value : array_like
+            Attribute value.
+        """
+
+        if value is not None:
+            assert is_iterable(value), (
+                ('"{0}" attribute: "{1}" is not an '
+                 'iterable object!').format('labels', value))
+            value = tuple(value)
+
+            assert len(value) == len(self._values), (
+                '"{0}" attribute labels count "{1}" does not match spectral '
+                'power distributions count "{2}"!'.format(
+                    'labels', len(value), len(self._values)))
+        self._labels = value
+
+    @property
+    def wavelengths(self):
+        """
+        Property for **self.wavelengths** attribute.
+
+        Returns
+        -------
+        ndarray
+            Multi-spectral power distribution wavelengths :math:`\lambda_n`.
+
+        Warning
+        -------
+        :attr:`MultiSpectralPowerDistribution.wavelengths` is read only.
+        """
+
+        return self._wavelengths
+
+    @wavelengths.setter
+    def wavelengths(self, value):
+        """
+        Setter for **self.wavelengths** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError(
+            '"{0}" attribute is read only!'.format('wavelengths'))
+
+    @property
+    def values(self):
+        """
+        Property for **self.values** attribute.
+
+        Returns
+        -------
+        ndarray, (N, W)
+            Multi-spectral power distribution wavelengths :math:`\lambda_n`
+            values.
+
+        Warning
+        -------
+        :attr:`MultiSpectralPowerDistribution.values` is read only.
+        """
+
+        return self._values
+
+    @values.setter
+    def values(self, value):
+        """
+        Setter for **self.values** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('values'))
+
+    @property
+    def shape(self):
+        """
+        Property for **self.shape** attribute.
+
+        Returns the shape of the multi-spectral power distribution in the form
+        of a :class:`SpectralShape` class instance.
+
+        Returns
+        -------
+        SpectralShape
+            Multi-spectral power distribution shape.
+
+        See Also
+        --------
+        SpectralPowerDistribution.shape
+
+        Warning
+        -------
+        :attr:`MultiSpectralPowerDistribution.shape` is read only.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> MultiSpectralPowerDistribution(  # doctest: +ELLIPSIS
+        ...     'Samples', data, SpectralShape(510, 540, 10)).shape
+        SpectralShape(510..., 540..., 10...)
+        """
+
+        return SpectralShape(self._wavelengths[0],
+                             self._wavelengths[-1],
+                             min(interval(self._wavelengths)))
+
+    @shape.setter
+    def shape(self, value):
+        """
+        Setter for **self.shape** attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('shape'))
+
+    @property
+    def digest(self):
+        """
+        Property for **self._digest** private attribute.
+
+        Returns
+        -------
+        unicode
+            self._digest.
+
+        See Also
+        --------
+        SpectralPowerDistribution.digest
+        """
+
+        if self._digest is None:
+            self._digest = content_hash(
+                np.asarray(self._wavelengths, dtype=np.float_),
+                self._values)
+
+        return self._digest
+
+    @digest.setter
+    def digest(self, value):
+        """
+        Setter for **self._digest** private attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('digest'))
+
+    def __str__(self):
+        """
+        Returns a pretty formatted string representation of the
+        multi-spectral power distribution.
+
+        Returns
+        -------
+        unicode
+            Pretty formatted string representation.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__repr__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__str__` method.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> print(MultiSpectralPowerDistribution(  # doctest: +ELLIPSIS
+        ...     'Samples', data, SpectralShape(510, 540, 10)))
+        MultiSpectralPowerDistribution('Samples', 2, (510..., 540..., 10...))
+        """
+
+        return '{0}(\'{1}\', {2}, {3})'.format(self.__class__.__name__,
+                                               self._name,
+                                               len(self._values),
+                                               str(self.shape))
+
+    def __repr__(self):
+        """
+        Returns a formatted string representation of the multi-spectral power
+        distribution.
+
+        Returns
+        -------
+        unicode
+            Formatted string representation.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__str__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__repr__` method.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> MultiSpectralPowerDistribution(  # doctest: +ELLIPSIS
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        MultiSpectralPowerDistribution(
+            'Samples',
+            array([[ 49.67,  69.59,  81.73,  88.19],
+                   [ 90.56,  87.34,  45.76,  23.45]]),
+            array([ 510.,  520.,  530.,  540.]),
+            None,
+            None)
+        """
+
+        return '{0}(\n    \'{1}\',\n    {2},\n    {3},\n    {4},' \
+               '\n    {5})'.format(
+                self.__class__.__name__,
+                self._name,
+                repr(self._values).replace('\n', '\n    '),
+                repr(self._wavelengths).replace('\n', '\n    '),
+                ('\'{0}\''.format(self._title)
+                 if self._title is not None else
+                 self._title),
+                pprint.pformat(self._labels))
+
+    def __hash__(self):
+        """
+        Returns the multi-spectral power distribution hash value.
+
+        Returns
+        -------
+        int
+            Object hash.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__hash__` method.
+        -   The hash value is derived from the
+            :attr:`MultiSpectralPowerDistribution.digest` attribute.
+
+        Warning
+        -------
+        See :meth:`SpectralPowerDistribution.__hash__` method warning section.
+        """
+
+        return hash(int(self.digest, 16))
+
+    def __setstate__(self, state):
+        """
+        Sets the multi-spectral power distribution state when unpickling or
+        copying it.
+
+        Parameters
+        ----------
+        state : dict
+            Multi-spectral power distribution state.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__setstate__` method so that the
+            underlying arrays stay read-only.
+        """
+
+        self.__dict__.update(state)
+
+        self._wavelengths.setflags(write=False)
+        self._values.setflags(write=False)
+
+    def __getitem__(self, wavelength):
+        """
+        Returns the values for given wavelength :math:`\lambda`.
+
+        Parameters
+        ----------
+        wavelength: numeric, array_like or slice
+            Wavelength :math:`\lambda` to retrieve the values.
+
+        Returns
+        -------
+        ndarray
+            Wavelength :math:`\lambda` values of each spectral power
+            distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.get
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__getitem__` method.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> multi_spd[510]
+        array([ 49.67,  90.56])
+        >>> multi_spd[np.array([510, 520])]
+        array([[ 49.67,  69.59],
+               [ 90.56,  87.34]])
+        >>> multi_spd[:]
+        array([[ 49.67,  69.59,  81.73,  88.19],
+               [ 90.56,  87.34,  45.76,  23.45]])
+        """
+
+        if isinstance(wavelength, slice):
+            return self._values[..., wavelength]
+        else:
+            wavelength = np.asarray(wavelength)
+
+            indexes, found = self._wavelengths_indexes(wavelength)
+            if not np.all(found):
+                raise KeyError(wavelength[np.logical_not(found)].ravel()[0])
+
+            return self._values[..., indexes]
+
+    def __setitem__(self, wavelength, value):
+        """
+        Sets the wavelength :math:`\lambda` with given values.
+
+        Parameters
+        ----------
+        wavelength : numeric, array_like or slice
+            Wavelength :math:`\lambda` to set.
+        value : numeric or array_like
+            Values for wavelength :math:`\lambda`.
+
+        Warning
+        -------
+        *value* parameter is broadcasted to (N, W) shape with :math:`W` the
+        *wavelength* parameter size, if *wavelength* parameter is *numeric*,
+        *value* parameter is broadcasted to (N, 1) shape.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__setitem__` method.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> multi_spd[550] = np.array([86.26, 15.34])
+        >>> multi_spd.values
+        array([[ 49.67,  69.59,  81.73,  88.19,  86.26],
+               [ 90.56,  87.34,  45.76,  23.45,  15.34]])
+        >>> multi_spd[np.array([510, 520])] = 0
+        >>> multi_spd.values
+        array([[  0.  ,   0.  ,  81.73,  88.19,  86.26],
+               [  0.  ,   0.  ,  45.76,  23.45,  15.34]])
+        """
+
+        if is_numeric(wavelength):
+            value = np.asarray(value)[..., np.newaxis]
+            wavelengths = np.ravel(wavelength)
+        elif is_iterable(wavelength):
+            wavelengths = np.ravel(wavelength)
+        elif isinstance(wavelength, slice):
+            wavelengths = self.wavelengths[wavelength]
+        else:
+            raise NotImplementedError(
+                '"{0}" type is not supported for indexing!'.format(
+                    type(wavelength)))
+
+        values = np.broadcast_to(value,
+                                 (len(self._values), len(wavelengths)))
+
+        self._update_data(wavelengths, values)
+
+    def __iter__(self):
+        """
+        Returns a generator for the multi-spectral power distribution data.
+
+        Returns
+        -------
+        generator
+            Multi-spectral power distribution data generator.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__iter__` method.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> # Doctests skip for Python 2.x compatibility.
+        >>> for wavelength, value in multi_spd:  # doctest: +SKIP
+        ...     print((wavelength, value))
+        (510.0, array([ 49.67,  90.56]))
+        (520.0, array([ 69.59,  87.34]))
+        (530.0, array([ 81.73,  45.76]))
+        (540.0, array([ 88.19,  23.45]))
+        """
+
+        return zip(self._wavelengths, np.transpose(self._values))
+
+    def __contains__(self, wavelength):
+        """
+        Returns if the multi-spectral power distribution contains given
+        wavelength :math:`\lambda`.
+
+        Parameters
+        ----------
+        wavelength : numeric or array_like
+            Wavelength :math:`\lambda`.
+
+        Returns
+        -------
+        bool
+            Is wavelength :math:`\lambda` contained in the multi-spectral
+            power distribution.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__contains__` method.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> 510 in multi_spd
+        True
+        >>> np.array([510, 520, 521]) in multi_spd
+        False
+        """
+
+        return np.all(np.in1d(wavelength, self._wavelengths))
+
+    def __len__(self):
+        """
+        Returns the multi-spectral power distribution wavelengths
+        :math:`\lambda_n` count.
+
+        Returns
+        -------
+        int
+            Multi-spectral power distribution wavelengths :math:`\lambda_n`
+            count.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__len__` method.
+        -   The spectral power distributions count is given by the first
+            dimension of :attr:`MultiSpectralPowerDistribution.values`
+            attribute.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> len(multi_spd)
+        4
+        """
+
+        return len(self._wavelengths)
+
+    def __eq__(self, multi_spd):
+        """
+        Returns the multi-spectral power distribution equality with given
+        other multi-spectral power distribution.
+
+        Parameters
+        ----------
+        multi_spd : MultiSpectralPowerDistribution
+            Multi-spectral power distribution to compare for equality.
+
+        Returns
+        -------
+        bool
+            Multi-spectral power distribution equality.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__eq__` method.
+
+        Examples
+        --------
+        >>> data1 = np.array([[49.67, 69.59, 81.73, 88.19]])
+        >>> data2 = np.array([[48.67, 69.59, 81.73, 88.19]])
+        >>> shape = SpectralShape(510, 540, 10)
+        >>> multi_spd1 = MultiSpectralPowerDistribution(
+        ...     'Samples', data1, shape)
+        >>> multi_spd2 = MultiSpectralPowerDistribution(
+        ...     'Samples', data2, shape)
+        >>> multi_spd3 = MultiSpectralPowerDistribution(
+        ...     'Samples', data2, shape)
+        >>> multi_spd1 == multi_spd2
+        False
+        >>> multi_spd2 == multi_spd3
+        True
+        """
+
+        return (isinstance(multi_spd, self.__class__) and
+                np.array_equal(self._wavelengths, multi_spd.wavelengths) and
+                np.array_equal(self._values, multi_spd.values))
+
+    def __ne__(self, multi_spd):
+        """
+        Returns the multi-spectral power distribution inequality with given
+        other multi-spectral power distribution.
+
+        Parameters
+        ----------
+        multi_spd : MultiSpectralPowerDistribution
+            Multi-spectral power distribution to compare for inequality.
+
+        Returns
+        -------
+        bool
+            Multi-spectral power distribution inequality.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__ne__` method.
+
+        Examples
+        --------
+        >>> data1 = np.array([[49.67, 69.59, 81.73, 88.19]])
+        >>> data2 = np.array([[48.67, 69.59, 81.73, 88.19]])
+        >>> shape = SpectralShape(510, 540, 10)
+        >>> multi_spd1 = MultiSpectralPowerDistribution(
+        ...     'Samples', data1, shape)
+        >>> multi_spd2 = MultiSpectralPowerDistribution(
+        ...     'Samples', data2, shape)
+        >>> multi_spd3 = MultiSpectralPowerDistribution(
+        ...     'Samples', data2, shape)
+        >>> multi_spd1 != multi_spd2
+        True
+        >>> multi_spd2 != multi_spd3
+        False
+        """
+
+        return not (self == multi_spd)
+
+    def __add__(self, x):
+        """
+        Implements support for multi-spectral power distribution addition.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Variable to add.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable added multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__iadd__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__add__` method.
+        -   *array_like* variables are broadcasted against
+            :attr:`MultiSpectralPowerDistribution.values` attribute: a (W,)
+            shaped variable is applied to each spectral power distribution
+            whereas a (N, 1) shaped variable is applied to each wavelength
+            :math:`\lambda`.
+
+        Examples
+        --------
+        Adding a single *numeric* variable:
+
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> multi_spd = multi_spd + 10
+        >>> multi_spd.values
+        array([[  59.67,   79.59,   91.73,   98.19],
+               [ 100.56,   97.34,   55.76,   33.45]])
+
+        Adding an *array_like* variable:
+
+        >>> multi_spd = multi_spd + [1, 2, 3, 4]
+        >>> multi_spd.values
+        array([[  60.67,   81.59,   94.73,  102.19],
+               [ 101.56,   99.34,   58.76,   37.45]])
+
+        Adding a :class:`SpectralPowerDistribution` class variable:
+
+        >>> spd = SpectralPowerDistribution(
+        ...     'Sample', {510: 1, 520: 2, 530: 3, 540: 4})
+        >>> multi_spd = multi_spd + spd
+        >>> multi_spd.values
+        array([[  61.67,   83.59,   97.73,  106.19],
+               [ 102.56,  101.34,   61.76,   41.45]])
+        """
+
+        return self._arithmetical_operation(x, operator.add)
+
+    def __iadd__(self, x):
+        """
+        Implements support for in-place multi-spectral power distribution
+        addition.
+
+        Usage is similar to the regular *addition* operation but make use of
+        the *augmented assignement* operator such as: `multi_spd += 10`
+        instead of `multi_spd + 10`.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Variable to in-place add.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable in-place added multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__add__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__iadd__` method.
+        """
+
+        return self._arithmetical_operation(x, operator.add, True)
+
+    def __sub__(self, x):
+        """
+        Implements support for multi-spectral power distribution subtraction.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Variable to subtract.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable subtracted multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__isub__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__sub__` method.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> multi_spd = multi_spd - [[10], [20]]
+        >>> multi_spd.values
+        array([[ 39.67,  59.59,  71.73,  78.19],
+               [ 70.56,  67.34,  25.76,   3.45]])
+        """
+
+        return self._arithmetical_operation(x, operator.sub)
+
+    def __isub__(self, x):
+        """
+        Implements support for in-place multi-spectral power distribution
+        subtraction.
+
+        Usage is similar to the regular *subtraction* operation but make use
+        of the *augmented assignement* operator such as: `multi_spd -= 10`
+        instead of `multi_spd - 10`.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Variable to in-place subtract.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable in-place subtracted multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__sub__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__isub__` method.
+        """
+
+        return self._arithmetical_operation(x, operator.sub, True)
+
+    def __mul__(self, x):
+        """
+        Implements support for multi-spectral power distribution
+        multiplication.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Variable to multiply by.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable multiplied multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__imul__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__mul__` method.
+
+        Examples
+        --------
+        Multiplying the spectral power distributions by a
+        :class:`SpectralPowerDistribution` class variable, e.g. an illuminant:
+
+        >>> data = np.array([[0.1, 0.2, 0.3, 0.4],
+        ...                  [0.4, 0.3, 0.2, 0.1]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> spd = SpectralPowerDistribution(
+        ...     'Sample', {510: 10, 520: 20, 530: 30, 540: 40})
+        >>> multi_spd = multi_spd * spd
+        >>> multi_spd.values
+        array([[  1.,   4.,   9.,  16.],
+               [  4.,   6.,   6.,   4.]])
+        """
+
+        return self._arithmetical_operation(x, operator.mul)
+
+    def __imul__(self, x):
+        """
+        Implements support for in-place multi-spectral power distribution
+        multiplication.
+
+        Usage is similar to the regular *multiplication* operation but make
+        use of the *augmented assignement* operator such as:
+        `multi_spd *= 10` instead of `multi_spd * 10`.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Variable to in-place multiply by.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable in-place multiplied multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__mul__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__imul__` method.
+        """
+
+        return self._arithmetical_operation(x, operator.mul, True)
+
+    def __div__(self, x):
+        """
+        Implements support for multi-spectral power distribution division.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Variable to divide by.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable divided multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__idiv__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__div__` method.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> multi_spd = multi_spd / 10
+        >>> multi_spd.values
+        array([[ 4.967,  6.959,  8.173,  8.819],
+               [ 9.056,  8.734,  4.576,  2.345]])
+        """
+
+        return self._arithmetical_operation(x, operator.truediv)
+
+    def __idiv__(self, x):
+        """
+        Implements support for in-place multi-spectral power distribution
+        division.
+
+        Usage is similar to the regular *division* operation but make use of
+        the *augmented assignement* operator such as: `multi_spd /= 10`
+        instead of `multi_spd / 10`.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Variable to in-place divide by.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable in-place divided multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__div__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__idiv_` method.
+        """
+
+        return self._arithmetical_operation(x, operator.truediv, True)
+
+    # Python 3 compatibility.
+    __itruediv__ = __idiv__
+    __truediv__ = __div__
+
+    def __pow__(self, x):
+        """
+        Implements support for multi-spectral power distribution
+        exponentiation.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Variable to exponentiate by.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Multi-spectral power distribution raised by power of x.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__ipow__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__pow__` method.
+
+        Examples
+        --------
+        >>> data = np.array([[1, 2, 3, 4],
+        ...                  [4, 3, 2, 1]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> multi_spd = multi_spd ** 2
+        >>> multi_spd.values
+        array([[  1.,   4.,   9.,  16.],
+               [ 16.,   9.,   4.,   1.]])
+        """
+
+        return self._arithmetical_operation(x, operator.pow)
+
+    def __ipow__(self, x):
+        """
+        Implements support for in-place multi-spectral power distribution
+        exponentiation.
+
+        Usage is similar to the regular *exponentiation* operation but make
+        use of the *augmented assignement* operator such as:
+        `multi_spd **= 2` instead of `multi_spd ** 2`.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Variable to in-place exponentiate by.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Multi-spectral power distribution in-place raised by power of x.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__pow__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__ipow__` method.
+        """
+
+        return self._arithmetical_operation(x, operator.pow, True)
+
+    def __radd__(self, x):
+        """
+        Implements support for reflected multi-spectral power distribution
+        addition, i.e. when the multi-spectral power distribution is the
+        right operand.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution
+            Variable to add.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable added multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__add__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__radd__` method.
+        """
+
+        return self._arithmetical_operation(x, operator.add)
+
+    def __rsub__(self, x):
+        """
+        Implements support for reflected multi-spectral power distribution
+        subtraction, i.e. when the multi-spectral power distribution is the
+        right operand.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution
+            Variable to subtract from.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable subtracted multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__sub__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__rsub__` method.
+        """
+
+        return self._arithmetical_operation(x, lambda a, b: b - a)
+
+    def __rmul__(self, x):
+        """
+        Implements support for reflected multi-spectral power distribution
+        multiplication, i.e. when the multi-spectral power distribution is the
+        right operand.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution
+            Variable to multiply by.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable multiplied multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__mul__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__rmul__` method.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> spd = SpectralPowerDistribution(
+        ...     'Sample', {510: 1, 520: 2, 530: 3, 540: 4})
+        >>> (spd * multi_spd).values
+        array([[  49.67,  139.18,  245.19,  352.76],
+               [  90.56,  174.68,  137.28,   93.8 ]])
+        """
+
+        return self._arithmetical_operation(x, operator.mul)
+
+    def __rdiv__(self, x):
+        """
+        Implements support for reflected multi-spectral power distribution
+        division, i.e. when the multi-spectral power distribution is the
+        right operand.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution
+            Variable to divide.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable divided multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__div__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__rdiv__` method.
+        """
+
+        return self._arithmetical_operation(x, lambda a, b: b / a)
+
+    __rtruediv__ = __rdiv__
+
+    def __rpow__(self, x):
+        """
+        Implements support for reflected multi-spectral power distribution
+        exponentiation, i.e. when the multi-spectral power distribution is the
+        right operand.
+
+        Parameters
+        ----------
+        x : numeric or array_like or SpectralPowerDistribution
+            Variable to exponentiate.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Variable exponentiated multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__pow__
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__rpow__` method.
+        """
+
+        return self._arithmetical_operation(x, lambda a, b: b ** a)
+
+    def _arithmetical_operation(self, x, operation, in_place=False):
+        """
+        Performs given arithmetical operation on :math:`x` variable, the
+        operation can be either performed on a multi-spectral power
+        distribution clone or in-place.
+
+        Parameters
+        ----------
+        x : numeric or ndarray or SpectralPowerDistribution or \
+MultiSpectralPowerDistribution
+            Operand.
+        operation : object
+            Operation to perform.
+        in_place : bool, optional
+            Operation happens in place.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Multi-spectral power distribution.
+
+        Notes
+        -----
+        -   A spectral power distribution operand with different wavelengths
+            is aligned to the multi-spectral power distribution shape.
+        """
+
+        if issubclass(type(x), MultiSpectralPowerDistribution):
+            x = x.values
+        elif issubclass(type(x), SpectralPowerDistribution):
+            if (x.wavelengths.shape == self._wavelengths.shape and
+                    np.allclose(x.wavelengths, self._wavelengths)):
+                x = x.values
+            else:
+                x = x.clone().align(self.shape)[self._wavelengths]
+        elif is_iterable(x):
+            x = np.asarray(x)
+
+        values = np.asarray(operation(self._values, x), dtype=np.float_)
+
+        assert values.shape == self._values.shape, (
+            '"{0}" operand cannot be broadcasted to "{1}" shape!'.format(
+                x, self._values.shape))
+
+        values.setflags(write=False)
+
+        if in_place:
+            self._values = values
+            self._digest = None
+            return self
+        else:
+            clone = self.clone()
+            clone._values = values
+            clone._digest = None
+            return clone
+
+    def _wavelengths_indexes(self, wavelength):
+        """
+        Returns the indexes of given wavelength :math:`\lambda` in the
+        underlying wavelengths array and whether they have been found.
+
+        Parameters
+        ----------
+        wavelength : numeric or ndarray
+            Wavelength :math:`\lambda` to retrieve the indexes.
+
+        Returns
+        -------
+        tuple
+            Wavelength :math:`\lambda` indexes and found state.
+
+        Notes
+        -----
+        -   The indexes of uniformly spaced wavelengths :math:`\lambda_n` are
+            computed in :math:`O(1)` with index arithmetic, a binary search is
+            used otherwise.
+        """
+
+        wavelength = np.around(wavelength, DEFAULT_WAVELENGTH_DECIMALS)
+
+        if len(self._wavelengths) == 0:
+            return (np.zeros(wavelength.shape, np.int_),
+                    np.zeros(wavelength.shape, np.bool_))
+
+        if self._uniform_interval is not None:
+            # Index arithmetic fast path for uniformly spaced wavelengths.
+            indexes = np.around((wavelength - self._wavelengths[0]) /
+                                self._uniform_interval)
+            indexes = np.where(np.isnan(indexes), 0, indexes)
+        else:
+            indexes = np.searchsorted(self._wavelengths, wavelength)
+
+        indexes = np.clip(indexes, 0, len(self._wavelengths) - 1).astype(
+            np.int_)
+
+        return indexes, self._wavelengths[indexes] == wavelength
+
+    def _update_data(self, wavelengths, values, replace=False):
+        """
+        Updates the underlying wavelengths and values arrays with given
+        wavelengths :math:`\lambda_n` and values, existing wavelengths values
+        are overwritten.
+
+        Parameters
+        ----------
+        wavelengths : array_like
+            Wavelengths :math:`\lambda_n` to update.
+        values : array_like, (N, W)
+            Wavelengths :math:`\lambda_n` values.
+        replace : bool, optional
+            Whether to replace the multi-spectral power distribution data
+            instead of updating it.
+        """
+
+        wavelengths = np.around(np.ravel(wavelengths),
+                                DEFAULT_WAVELENGTH_DECIMALS)
+        values = np.asarray(values, dtype=np.float_)
+
+        if not replace:
+            wavelengths = np.hstack((self._wavelengths, wavelengths))
+            values = np.hstack((self._values, values))
+
+        # Reversing the arrays so that the last given values for a duplicated
+        # wavelength are kept by :func:`np.unique` definition.
+        wavelengths, indexes = np.unique(wavelengths[::-1], return_index=True)
+        values = np.ascontiguousarray(values[..., ::-1][..., indexes])
+
+        wavelengths.setflags(write=False)
+        values.setflags(write=False)
+
+        self._wavelengths = wavelengths
+        self._values = values
+        self._uniform_interval = _uniform_interval(wavelengths)
+        self._digest = None
+
+    def get(self, wavelength, default=np.nan):
+        """
+        Returns the values for given wavelength :math:`\lambda`.
+
+        Parameters
+        ----------
+        wavelength : numeric or ndarray
+            Wavelength :math:`\lambda` to retrieve the values.
+        default : nan or numeric, optional
+            Wavelength :math:`\lambda` default values.
+
+        Returns
+        -------
+        ndarray
+            Wavelength :math:`\lambda` values of each spectral power
+            distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.__getitem__
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> multi_spd.get(510)
+        array([ 49.67,  90.56])
+        >>> multi_spd.get(511)
+        array([ nan,  nan])
+        >>> multi_spd.get(np.array([510, 511]), 0)
+        array([[ 49.67,   0.  ],
+               [ 90.56,   0.  ]])
+        """
+
+        wavelength = np.asarray(wavelength)
+
+        indexes, found = self._wavelengths_indexes(wavelength)
+        values = self._values[..., indexes]
+        if not np.all(found):
+            values = np.where(found, values, default)
+
+        return values
+
+    def is_uniform(self):
+        """
+        Returns if the multi-spectral power distribution has uniformly spaced
+        data.
+
+        Returns
+        -------
+        bool
+            Is uniform.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.shape
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> multi_spd.is_uniform()
+        True
+
+        Breaking the interval by introducing a new wavelength :math:`\lambda`
+        value:
+
+        >>> multi_spd[511] = 3.1415
+        >>> multi_spd.is_uniform()
+        False
+        """
+
+        return self._uniform_interval is not None
+
+    def extrapolate(self,
+                    shape,
+                    method='Constant',
+                    left=None,
+                    right=None):
+        """
+        Extrapolates the multi-spectral power distribution following
+        *CIE 15:2004* recommendation.
+
+        Parameters
+        ----------
+        shape : SpectralShape
+            Spectral shape used for extrapolation.
+        method : unicode, optional
+            **{'Constant', 'Linear'}**,
+            Extrapolation method.
+        left : numeric, optional
+            Value to return for low extrapolation range.
+        right : numeric, optional
+            Value to return for high extrapolation range.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Extrapolated multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.align
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> multi_spd.extrapolate(  # doctest: +ELLIPSIS
+        ...     SpectralShape(500, 550)).shape
+        SpectralShape(500..., 550..., 10...)
+        >>> multi_spd.values
+        array([[ 49.67,  49.67,  69.59,  81.73,  88.19,  88.19],
+               [ 90.56,  90.56,  87.34,  45.76,  23.45,  23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> multi_spd.extrapolate(  # doctest: +ELLIPSIS
+        ...     SpectralShape(500, 550), method='Linear').shape
+        SpectralShape(500..., 550..., 10...)
+        >>> multi_spd.values
+        array([[  29.75,   49.67,   69.59,   81.73,   88.19,   94.65],
+               [  93.78,   90.56,   87.34,   45.76,   23.45,    1.14]])
+        """
+
+        method = method.lower()
+        values = self._values
+
+        spd_shape = self.shape
+        wavelengths_l = _stepped_range(
+            spd_shape.start, shape.start, -spd_shape.interval)[1:]
+        wavelengths_r = _stepped_range(
+            spd_shape.end, shape.end, spd_shape.interval)[1:]
+
+        if method == 'linear':
+            w, v = self._wavelengths, values
+            values_l = (v[..., 0:1] + (wavelengths_l - w[0]) *
+                        (v[..., 1:2] - v[..., 0:1]) / (w[1] - w[0]))
+            values_r = (v[..., -1:] + (wavelengths_r - w[-1]) *
+                        (v[..., -1:] - v[..., -2:-1]) / (w[-1] - w[-2]))
+        elif method == 'constant':
+            values_l = np.repeat(values[..., 0:1], len(wavelengths_l), -1)
+            values_r = np.repeat(values[..., -1:], len(wavelengths_r), -1)
+        else:
+            raise ValueError(
+                'Undefined "{0}" extrapolator!'.format(method))
+
+        if left is not None:
+            values_l = np.full(values_l.shape, left)
+        if right is not None:
+            values_r = np.full(values_r.shape, right)
+
+        self._update_data(np.hstack((wavelengths_l, wavelengths_r)),
+                          np.hstack((values_l, values_r)))
+
+        return self
+
+    def interpolate(self, shape=SpectralShape(), method=None):
+        """
+        Interpolates the multi-spectral power distribution following
+        *CIE 167:2005* recommendations: the method developed by
+        *Sprague (1880)* should be used for interpolating functions having a
+        uniformly spaced independent variable and a *Cubic Spline* method for
+        non-uniformly spaced independent variable.
+
+        Parameters
+        ----------
+        shape : SpectralShape, optional
+            Spectral shape used for interpolation.
+        method : unicode, optional
+            **{None, 'Cubic Spline', 'Linear', 'Pchip', 'Sprague'}**,
+            Enforce given interpolation method.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Interpolated multi-spectral power distribution.
+
+        Raises
+        ------
+        ValueError
+            If the interpolation method is not defined.
+
+        See Also
+        --------
+        SpectralPowerDistribution.interpolate,
+        MultiSpectralPowerDistribution.align
+
+        Notes
+        -----
+        -   See :meth:`SpectralPowerDistribution.interpolate` method notes
+            section.
+        -   *Cubic Spline*, *Pchip* and *Sprague (1880)* interpolators are
+            evaluated at once along the last axis of the values. The *Linear*
+            interpolator being linear in the dependent variable, its weights
+            matrix is computed once from the shared wavelengths
+            :math:`\lambda_n` and applied to all the spectral power
+            distributions with a single dot product.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19, 86.26, 77.18],
+        ...                  [90.56, 87.34, 45.76, 23.45, 15.34, 10.11]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 560, 10))
+        >>> print(multi_spd.interpolate(SpectralShape(interval=1)))
+        MultiSpectralPowerDistribution('Samples', 2, (510.0, 560.0, 1.0))
+        >>> multi_spd[515]  # doctest: +ELLIPSIS
+        array([ 60.3121800...,  ...])
+        """
+
+        spd_shape = self.shape
+        boundaries = zip((shape.start, shape.end, shape.interval),
+                         (spd_shape.start, spd_shape.end, spd_shape.interval))
+        boundaries = [x[0] if x[0] is not None else x[1] for x in boundaries]
+        shape = SpectralShape(*boundaries)
+
+        # Defining proper interpolation bounds, they are rounded at the
+        # interval decimals so that fractional intervals are supported.
+        scale = 10 ** _interval_decimals(shape.interval)
+        shape.start = max(shape.start, np.ceil(np.around(
+            spd_shape.start * scale, DEFAULT_WAVELENGTH_DECIMALS)) / scale)
+        shape.end = min(shape.end, np.floor(np.around(
+            spd_shape.end * scale, DEFAULT_WAVELENGTH_DECIMALS)) / scale)
+
+        wavelengths, values = self._wavelengths, self._values
+        uniform = self.is_uniform()
+
+        if is_string(method):
+            method = method.lower()
+
+        if method is None:
+            if uniform:
+                interpolator = SpragueInterpolator
+            else:
+                interpolator = CubicSplineInterpolator
+        elif method == 'cubic spline':
+            interpolator = CubicSplineInterpolator
+        elif method == 'linear':
+            interpolator = LinearInterpolator
+        elif method == 'pchip':
+            interpolator = PchipInterpolator
+        elif method == 'sprague':
+            if not uniform:
+                warning(('"Sprague" interpolator should only be used for '
+                         'interpolating functions having a uniformly spaced '
+                         'independent variable!'))
+
+            interpolator = SpragueInterpolator
+        else:
+            raise ValueError(
+                'Undefined "{0}" interpolator!'.format(method))
+
+        wavelengths_i = shape.range()
+        if interpolator in (CubicSplineInterpolator, PchipInterpolator):
+            # Some *scipy* interpolators do not support read-only arrays.
+            values_i = interpolator(
+                np.copy(wavelengths), np.copy(values), axis=-1)(wavelengths_i)
+        elif interpolator is SpragueInterpolator:
+            values_i = interpolator(wavelengths, values)(wavelengths_i)
+        else:
+            weights = np.reshape(
+                [interpolator(wavelengths, basis)(wavelengths_i)
+                 for basis in np.identity(len(wavelengths))],
+                (len(wavelengths), len(wavelengths_i)))
+            values_i = np.dot(values, weights)
+
+        self._update_data(wavelengths_i, values_i, True)
+
+        return self
+
+    def align(self,
+              shape,
+              interpolation_method=None,
+              extrapolation_method='Constant',
+              extrapolation_left=None,
+              extrapolation_right=None):
+        """
+        Aligns the multi-spectral power distribution to given spectral shape:
+        Interpolates first then extrapolates to fit the given range.
+
+        Parameters
+        ----------
+        shape : SpectralShape
+            Spectral shape used for alignment.
+        interpolation_method : unicode, optional
+            **{None, 'Cubic Spline', 'Linear', 'Pchip', 'Sprague'}**,
+            Enforce given interpolation method.
+        extrapolation_method : unicode, optional
+            **{'Constant', 'Linear'}**,
+            Extrapolation method.
+        extrapolation_left : numeric, optional
+            Value to return for low extrapolation range.
+        extrapolation_right : numeric, optional
+            Value to return for high extrapolation range.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Aligned multi-spectral power distribution.
+
+        See Also
+        --------
+        MultiSpectralPowerDistribution.extrapolate,
+        MultiSpectralPowerDistribution.interpolate
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19, 86.26, 77.18],
+        ...                  [90.56, 87.34, 45.76, 23.45, 15.34, 10.11]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 560, 10))
+        >>> print(multi_spd.align(SpectralShape(505, 565, 1)))
+        MultiSpectralPowerDistribution('Samples', 2, (505.0, 565.0, 1.0))
+        >>> multi_spd.values.shape
+        (2, 61)
+        """
+
+        self.interpolate(shape, interpolation_method)
+        self.extrapolate(shape,
+                         extrapolation_method,
+                         extrapolation_left,
+                         extrapolation_right)
+
+        return self
+
+    def trim_wavelengths(self, shape):
+        """
+        Trims the multi-spectral power distribution wavelengths to given
+        spectral shape.
+
+        Parameters
+        ----------
+        shape : SpectralShape
+            Spectral shape used for trimming.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Trimed multi-spectral power distribution.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19, 86.26, 77.18],
+        ...                  [90.56, 87.34, 45.76, 23.45, 15.34, 10.11]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 560, 10))
+        >>> print(multi_spd.trim_wavelengths(SpectralShape(520, 550, 10)))
+        MultiSpectralPowerDistribution('Samples', 2, (520.0, 550.0, 10.0))
+        >>> multi_spd.values
+        array([[ 69.59,  81.73,  88.19,  86.26],
+               [ 87.34,  45.76,  23.45,  15.34]])
+        """
+
+        indexes, found = self._wavelengths_indexes(shape.range())
+        indexes = np.unique(indexes[found])
+
+        self._update_data(self._wavelengths[indexes],
+                          self._values[..., indexes],
+                          True)
+
+        return self
+
+    def zeros(self, shape=SpectralShape()):
+        """
+        Zeros fills the multi-spectral power distribution: Missing values will
+        be replaced with zeros to fit the defined range.
+
+        Parameters
+        ----------
+        shape : SpectralShape, optional
+            Spectral shape used for zeros fill.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Zeros filled multi-spectral power distribution.
+
+        Raises
+        ------
+        RuntimeError
+            If the multi-spectral power distribution cannot be zeros filled.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> print(multi_spd.zeros(SpectralShape(500, 540, 5)))
+        MultiSpectralPowerDistribution('Samples', 2, (500.0, 540.0, 5.0))
+        >>> multi_spd.values
+        array([[  0.  ,   0.  ,  49.67,   0.  ,  69.59,   0.  ,  81.73,   0.  ,
+                 88.19],
+               [  0.  ,   0.  ,  90.56,   0.  ,  87.34,   0.  ,  45.76,   0.  ,
+                 23.45]])
+        """
+
+        spd_shape = self.shape
+        boundaries = zip((shape.start, shape.end, shape.interval),
+                         (spd_shape.start, spd_shape.end, spd_shape.interval))
+        boundaries = [x[0] if x[0] is not None else x[1] for x in boundaries]
+        shape = SpectralShape(*boundaries)
+
+        wavelengths = shape.range()
+
+        wavelengths_c = self._wavelengths[np.logical_and(
+            self._wavelengths >= shape.start,
+            self._wavelengths <= shape.end)]
+        if not np.all(np.in1d(
+                wavelengths_c,
+                np.around(wavelengths, DEFAULT_WAVELENGTH_DECIMALS))):
+            raise RuntimeError(('"{0}" cannot be zeros filled using "{1}" '
+                                'shape!').format(self, shape))
+        else:
+            self._update_data(wavelengths, self.get(wavelengths, 0), True)
+
+            return self
+
+    def normalise(self, factor=1):
+        """
+        Normalises the multi-spectral power distribution with given
+        normalization factor.
+
+        Parameters
+        ----------
+        factor : numeric, optional
+            Normalization factor
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Normalised multi-spectral power distribution.
+
+        Notes
+        -----
+        -   Each spectral power distribution is normalised independently
+            using its own maximum value.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> print(multi_spd.normalise())  # doctest: +ELLIPSIS
+        MultiSpectralPowerDistribution('Samples', 2, (510..., 540..., 10...))
+        >>> multi_spd.values  # doctest: +ELLIPSIS
+        array([[ 0.5632157...,  0.7890917...,  0.9267490...,  1.        ],
+               [ 1.        ,  0.9644434...,  0.5053003...,  0.2589443...]])
+        """
+
+        self *= factor / np.max(self._values, axis=-1)[..., np.newaxis]
+
+        return self
+
+    def clone(self):
+        """
+        Clones the multi-spectral power distribution.
+
+        Most of the :class:`MultiSpectralPowerDistribution` class operations
+        are conducted in-place. The
+        :meth:`MultiSpectralPowerDistribution.clone` method provides a
+        convenient way to copy the multi-spectral power distribution to a new
+        object.
+
+        The clone shares the underlying read-only arrays with the
+        multi-spectral power distribution, they are only copied when one of
+        the two objects is mutated.
+
+        Returns
+        -------
+        MultiSpectralPowerDistribution
+            Cloned multi-spectral power distribution.
+
+        Examples
+        --------
+        >>> data = np.array([[49.67, 69.59, 81.73, 88.19],
+        ...                  [90.56, 87.34, 45.76, 23.45]])
+        >>> multi_spd = MultiSpectralPowerDistribution(
+        ...     'Samples', data, SpectralShape(510, 540, 10))
+        >>> print(multi_spd)  # doctest: +ELLIPSIS
+        MultiSpectralPowerDistribution('Samples', 2, (510..., 540..., 10...))
+        >>> multi_spd_clone = multi_spd.clone()
+        >>> print(multi_spd_clone)  # doctest: +ELLIPSIS
+        MultiSpectralPowerDistribution('Samples (...)', 2, \
+(510..., 540..., 10...))
+        """
+
+        # The underlying arrays are read-only and replaced on mutation, thus
+        # they are shared by the clone until any of the two objects mutates.
+        clone = copy.copy(self)
+
+        clone.name = '{0} ({1})'.format(clone.name, id(clone))
+
+        if self._title is None:
+            clone.title = self._name
+
+        return clone
+
+
+DEFAULT_SPECTRAL_SHAPE = SpectralShape(360, 830, 1)
+"""
+Default spectral shape using the shape of
+*CIE 1931 2 Degree Standard Observer*.
+
+DEFAULT_SPECTRAL_SHAPE : SpectralShape
+"""
+
+
+def frozen_spectral_data(constructor, *args, **kwargs):
+    """
+    Returns a frozen spectral power distribution or tri-spectral power
+    distribution built with given constructor and arguments, it is meant to be
+    used by the datasets loaders.
+
+    Parameters
+    ----------
+    constructor : type or callable
+        Spectral power distribution or tri-spectral power distribution class
+        or callable returning an instance of them.
+
+    Other Parameters
+    ----------------
+    \*args : list, optional
+        Arguments passed to the constructor.
+    \**kwargs : dict, optional
+        Keywords arguments passed to the constructor.
+
+    Returns
+    -------
+    SpectralPowerDistribution or TriSpectralPowerDistribution
+        Frozen spectral power distribution or tri-spectral power distribution.
+
+    Examples
+    --------
+    >>> data = {510: 49.67, 520: 69.59, 530: 81.73, 540: 88.19}
+    >>> frozen_spectral_data(SpectralPowerDistribution, 'Sample', data).frozen
+    True
+    """
+
+    spectral_data = constructor(*args, **kwargs)
+    spectral_data.frozen = True
+
+    return spectral_data
 
 
 def constant_spd(k,
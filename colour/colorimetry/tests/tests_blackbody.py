@@ -14,7 +14,9 @@ from itertools import permutations
 from colour.colorimetry import (
     SpectralShape,
     planck_law,
+    blackbody_msa,
     blackbody_spd)
+from colour.colorimetry import blackbody
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -27,6 +29,7 @@ __status__ = 'Production'
 __all__ = ['PLANCK_LAW_DATA',
            'BLACKBODY_SPD_DATA',
            'TestPlanckLaw',
+           'TestBlackbodyMsa',
            'TestBlackbodySpd']
 
 PLANCK_LAW_DATA = {
@@ -4568,6 +4571,107 @@ class TestPlanckLaw(unittest.TestCase):
             planck_law(case, case),
 
 
+class TestBlackbodyMsa(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.blackbody.blackbody_msa` definition unit
+    tests methods.
+    """
+
+    def test_blackbody_msa(self):
+        """
+        Tests :func:`colour.colorimetry.blackbody.blackbody_msa` definition.
+        """
+
+        shape = SpectralShape(10, 1000, 10)
+        for temperature in PLANCK_LAW_DATA:
+            np.testing.assert_allclose(
+                blackbody_msa(temperature, shape),
+                [PLANCK_LAW_DATA[temperature][wavelength]
+                 for wavelength in shape],
+                rtol=0.0000001,
+                atol=0.0000001)
+
+        np.testing.assert_allclose(
+            blackbody_msa([5000, 5000], SpectralShape(360, 830, 1)),
+            [BLACKBODY_SPD_DATA, BLACKBODY_SPD_DATA],
+            rtol=0.0000001,
+            atol=0.0000001)
+
+    def test_cache_blackbody_msa(self):
+        """
+        Tests :func:`colour.colorimetry.blackbody.blackbody_msa` definition
+        cache.
+        """
+
+        shape = SpectralShape(360, 830, 10)
+        temperatures = np.linspace(1000, 10000, 8)
+        msa = blackbody_msa(temperatures, shape)
+
+        key = (temperatures[3], shape.start, shape.end, shape.interval,
+               blackbody.C1, blackbody.C2, blackbody.N)
+        self.assertIn(key, blackbody._BLACKBODY_SPECTRA_CACHE)
+        np.testing.assert_equal(blackbody._BLACKBODY_SPECTRA_CACHE[key],
+                                msa[3])
+
+        np.testing.assert_equal(
+            blackbody_msa(temperatures[::-1], shape), msa[::-1])
+
+        maximum_size = blackbody._BLACKBODY_SPECTRA_CACHE.maximum_size
+        try:
+            blackbody._BLACKBODY_SPECTRA_CACHE.maximum_size = 2
+            np.testing.assert_equal(
+                blackbody_msa(temperatures + 1, shape),
+                blackbody_msa(temperatures + 1, shape, n=1.0))
+            self.assertEqual(len(blackbody._BLACKBODY_SPECTRA_CACHE), 2)
+        finally:
+            blackbody._BLACKBODY_SPECTRA_CACHE.maximum_size = maximum_size
+
+        self.assertNotEqual(
+            blackbody_msa(5000, shape, n=1.00028)[10],
+            blackbody_msa(5000, shape)[10])
+
+    def test_n_dimensional_blackbody_msa(self):
+        """
+        Tests :func:`colour.colorimetry.blackbody.blackbody_msa` definition
+        n-dimensional arrays support.
+        """
+
+        shape = SpectralShape(360, 830, 1)
+        temperature = 5000
+        msa = BLACKBODY_SPD_DATA
+        np.testing.assert_allclose(
+            blackbody_msa(temperature, shape),
+            msa,
+            rtol=0.0000001,
+            atol=0.0000001)
+
+        temperature = np.tile(temperature, 6)
+        msa = np.tile(msa, (6, 1))
+        np.testing.assert_allclose(
+            blackbody_msa(temperature, shape),
+            msa,
+            rtol=0.0000001,
+            atol=0.0000001)
+
+        temperature = np.reshape(temperature, (2, 3))
+        msa = np.reshape(msa, (2, 3, len(BLACKBODY_SPD_DATA)))
+        np.testing.assert_allclose(
+            blackbody_msa(temperature, shape),
+            msa,
+            rtol=0.0000001,
+            atol=0.0000001)
+
+    @ignore_numpy_errors
+    def test_nan_blackbody_msa(self):
+        """
+        Tests :func:`colour.colorimetry.blackbody.blackbody_msa` definition nan
+        support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        blackbody_msa(cases, SpectralShape(360, 830, 10))
+
+
 class TestBlackbodySpd(unittest.TestCase):
     """
     Defines
@@ -10,12 +10,14 @@ from __future__ import division, unicode_literals
 import numpy as np
 import operator
 import unittest
+import warnings
 
 from colour.colorimetry.spectrum import (
     SpectralMapping,
     SpectralShape,
     SpectralPowerDistribution,
     TriSpectralPowerDistribution,
+    MultiSpectralPowerDistribution,
     constant_spd,
     zeros_spd,
     ones_spd)
@@ -39,6 +41,7 @@ __all__ = ['SAMPLE_SPD_DATA',
            'TestSpectralShape',
            'TestSpectralPowerDistribution',
            'TestTriSpectralPowerDistribution',
+           'TestMultiSpectralPowerDistribution',
            'TestConstantSpd',
            'TestZerosSpd',
            'TestOnes_spd']
@@ -1937,7 +1940,8 @@ class TestSpectralShape(unittest.TestCase):
                             '__len__',
                             '__eq__',
                             '__ne__',
-                            'range')
+                            'range',
+                            'index')
 
         for method in required_methods:
             self.assertIn(method, dir(SpectralShape))
@@ -2044,6 +2048,25 @@ class TestSpectralShape(unittest.TestCase):
             [wavelength for wavelength in SpectralShape(0, 10, 0.1)],
             np.arange(0, 10 + 0.1, 0.1))
 
+    def test_index(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.SpectralShape.index` method.
+        """
+
+        shape = SpectralShape(360, 830, 0.01)
+
+        self.assertEqual(shape.index(360), 0)
+        self.assertEqual(shape.index(830), 47000)
+
+        np.testing.assert_equal(
+            shape.index(shape.range()), np.arange(len(shape)))
+
+        np.testing.assert_equal(
+            shape.index(np.array([[400.01, 359.99], [555.555, 830.01]]), -1),
+            np.array([[4001, -1], [-1, -1]]))
+
+        self.assertRaises(ValueError, lambda: shape.index(555.555))
+
 
 class TestSpectralPowerDistribution(unittest.TestCase):
     """
@@ -2073,7 +2096,9 @@ class TestSpectralPowerDistribution(unittest.TestCase):
                                'title',
                                'wavelengths',
                                'values',
-                               'shape')
+                               'shape',
+                               'frozen',
+                               'digest')
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(SpectralPowerDistribution))
@@ -2143,6 +2168,16 @@ SpectralPowerDistribution.values` attribute.
             self._spd.values,
             [v for k, v in sorted(SAMPLE_SPD_DATA.items())])
 
+        spd = self._spd.clone()
+        values = spd.values
+        self.assertIs(spd.values, values)
+        self.assertRaises(ValueError, values.__setitem__, 0, 1)
+
+        spd[340] = 1
+        self.assertIsNot(spd.values, values)
+        self.assertEqual(spd.values[0], 1)
+        self.assertEqual(values[0], 0)
+
     def test_shape(self):
         """
         Tests :attr:`colour.colorimetry.spectrum.\
@@ -2182,6 +2217,23 @@ SpectralPowerDistribution.__getitem__` method.
             self._spd[3:6],
             np.array([0.0641, 0.0645, 0.0562]))
 
+        self.assertRaises(KeyError, lambda: self._spd[350])
+
+        self.assertRaises(KeyError, lambda: self._spd[np.array([340, 900])])
+
+        spd = SpectralPowerDistribution(
+            'Spd', dict(zip(np.linspace(400, 500, 1001),
+                            np.linspace(0, 1, 1001))))
+        np.testing.assert_almost_equal(
+            spd[np.array([[400, 400.1], [455.5, 500]])],
+            np.array([[0, 0.001], [0.555, 1]]))
+
+        self.assertEqual(self._non_uniform_spd[391.898], 16.331740)
+
+        np.testing.assert_almost_equal(
+            self._non_uniform_spd[np.array([405.606, 464.742])],
+            np.array([40.197224, 29.534647]))
+
     def test__setitem__(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2292,6 +2344,11 @@ SpectralPowerDistribution.__add__`,
                 operation(self._spd, self._spd).values,
                 operation(self._spd.values, self._spd.values))
 
+            spd = (self._spd + 1).align(SpectralShape(340, 820, 5))
+            np.testing.assert_almost_equal(
+                operation(self._spd, spd).values,
+                operation(self._spd.values, self._spd.values + 1))
+
     def test_arithmetical_ioperation(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2316,13 +2373,13 @@ SpectralPowerDistribution.__iadd__`,
             self.assertTrue(operation(spd, 1) is spd)
 
             spd = self._spd.clone()
-            values = spd.values
+            values = np.copy(spd.values)
             np.testing.assert_almost_equal(
                 operation(spd, 2).values,
                 operation(values, 2))
 
             spd = self._spd.clone()
-            values = spd.values
+            values = np.copy(spd.values)
             random = np.random.random(len(values))
             np.testing.assert_almost_equal(
                 operation(spd, random).values,
@@ -2332,7 +2389,18 @@ SpectralPowerDistribution.__iadd__`,
             spd2 = self._spd.clone()
             np.testing.assert_almost_equal(
                 operation(spd1, spd2).values,
-                operation(self._spd.values, self._spd.values))
+                operation(np.copy(self._spd.values), self._spd.values))
+
+        spd = self._spd * 1
+        values = spd._values
+        spd *= 2
+        self.assertIs(spd._values, values)
+        np.testing.assert_almost_equal(spd.values, self._spd.values * 2)
+
+        values = spd.values
+        spd *= 2
+        self.assertIsNot(spd.values, values)
+        np.testing.assert_almost_equal(values, self._spd.values * 2)
 
     def test_get(self):
         """
@@ -2364,6 +2432,22 @@ SpectralPowerDistribution.is_uniform` method.
 
         self.assertTrue(self._spd.is_uniform())
 
+        wavelengths = SpectralShape(300, 310, 0.1).range()
+        spd = SpectralPowerDistribution(
+            '', dict(zip(wavelengths, np.sin(wavelengths))))
+        self.assertTrue(spd.is_uniform())
+
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+            spd.clone().interpolate(SpectralShape(300, 310, 0.05), 'Sprague')
+
+        self.assertListEqual(records, [])
+        np.testing.assert_almost_equal(
+            spd.clone().interpolate(SpectralShape(300, 310, 0.05)).values,
+            spd.clone().interpolate(
+                SpectralShape(300, 310, 0.05), 'Sprague').values,
+            decimal=7)
+
     def test_extrapolate(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2410,6 +2494,31 @@ SpectralPowerDistribution.interpolate` method.
             np.array(0.064399379844961),
             decimal=7)
 
+        spd = self._spd.clone().interpolate(SpectralShape(interval=0.1))
+        self.assertEqual(spd.shape, SpectralShape(340, 820, 0.1))
+        np.testing.assert_almost_equal(
+            spd[np.array([410, 410.5])],
+            self._spd.clone().interpolate(
+                SpectralShape(interval=0.5))[np.array([410, 410.5])],
+            decimal=7)
+
+        spd = self._non_uniform_spd.clone().interpolate(
+            SpectralShape(interval=0.1))
+        self.assertEqual(spd.shape.start, 391.9)
+
+        # Resampling the same data with the cached interpolator.
+        np.testing.assert_almost_equal(
+            self._spd.clone().interpolate(
+                SpectralShape(interval=5)).values,
+            INTERPOLATED_SAMPLE_SPD_DATA[::5],
+            decimal=7)
+
+        spd = self._spd.clone()
+        spd[400] = 1
+        self.assertNotAlmostEqual(
+            spd.interpolate(SpectralShape(interval=1))[411],
+            INTERPOLATED_SAMPLE_SPD_DATA[71])
+
     def test_align(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2470,6 +2579,68 @@ SpectralPowerDistribution.clone` method.
         self.assertFalse(self._spd is self._spd.clone())
         self.assertEqual(self._spd.title, self._spd.clone().title)
 
+        values = np.copy(self._spd.values)
+        clone = self._spd.clone()
+        self.assertIs(clone.values, self._spd.values)
+
+        clone[400] = 1
+        clone *= 2
+        np.testing.assert_equal(self._spd.values, values)
+        self.assertEqual(clone[400], 2)
+
+    def test_frozen(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+SpectralPowerDistribution.frozen` attribute.
+        """
+
+        spd = self._spd.clone()
+        self.assertFalse(spd.frozen)
+
+        spd.frozen = True
+        self.assertTrue(spd.frozen)
+        self.assertRaises(RuntimeError, spd.__setitem__, 400, 1)
+        self.assertRaises(RuntimeError, spd.__imul__, 2)
+        self.assertRaises(RuntimeError, spd.normalise)
+        self.assertFalse(spd.clone().frozen)
+
+        shape = SpectralShape(400, 700, 5)
+        spd_a = spd.clone().align(shape)
+        spd_b = spd.clone().align(shape)
+        self.assertIs(spd_a.values, spd_b.values)
+        np.testing.assert_almost_equal(
+            spd_a.values,
+            self._spd.clone().align(shape).values)
+
+        spd_a[400] = 1
+        self.assertNotEqual(spd_b[400], 1)
+
+    def test_digest(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+SpectralPowerDistribution.digest` attribute.
+        """
+
+        spd = SpectralPowerDistribution('Other Sample', SAMPLE_SPD_DATA)
+        self.assertEqual(spd.digest, self._spd.digest)
+        self.assertEqual(hash(spd), hash(self._spd))
+
+        digest = spd.digest
+        spd[400] = 0
+        self.assertNotEqual(spd.digest, digest)
+
+        spd = self._spd.clone()
+        spd *= 2
+        self.assertNotEqual(spd.digest, self._spd.digest)
+        spd /= 2
+        self.assertEqual(spd.digest, self._spd.digest)
+
+        spd = self._spd.clone()
+        spd.frozen = True
+        spd_a = spd.clone().align(SpectralShape(400, 700, 5))
+        spd_b = self._spd.clone().align(SpectralShape(400, 700, 5))
+        self.assertEqual(spd_a.digest, spd_b.digest)
+
 
 class TestTriSpectralPowerDistribution(unittest.TestCase):
     """
@@ -2529,7 +2700,9 @@ class TestTriSpectralPowerDistribution(unittest.TestCase):
                                'z',
                                'wavelengths',
                                'values',
-                               'shape')
+                               'shape',
+                               'frozen',
+                               'digest')
 
         for attribute in required_attributes:
             self.assertIn(attribute, dir(TriSpectralPowerDistribution))
@@ -2774,6 +2947,15 @@ and :func:`colour.colorimetry.spectrum.TriSpectralPowerDistribution.__pow__`
                 operation(self._tri_spd, self._tri_spd).values,
                 operation(self._tri_spd.values, self._tri_spd.values))
 
+            spd = self._tri_spd.y
+            np.testing.assert_almost_equal(
+                operation(self._tri_spd, spd).values,
+                operation(values, spd.values[..., np.newaxis]))
+
+            np.testing.assert_almost_equal(
+                operation(spd, self._tri_spd).values,
+                operation(spd.values[..., np.newaxis], values))
+
     def test_arithmetical_ioperation(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2816,6 +2998,13 @@ and :func:`colour.colorimetry.spectrum.TriSpectralPowerDistribution.__ipow__`
                 operation(tri_spd1, tri_spd2).values,
                 operation(self._tri_spd.values, self._tri_spd.values))
 
+        tri_spd = self._tri_spd * 1
+        values = tri_spd.x._values
+        tri_spd *= [1, 2, 3]
+        self.assertIs(tri_spd.x._values, values)
+        np.testing.assert_almost_equal(
+            tri_spd.values, self._tri_spd.values * [1, 2, 3])
+
     def test_get(self):
         """
         Tests :func:`colour.colorimetry.spectrum.\
@@ -2991,6 +3180,518 @@ TriSpectralPowerDistribution.clone` method.
         self.assertFalse(self._tri_spd is self._tri_spd.clone())
         self.assertEqual(self._tri_spd.title, self._tri_spd.clone().title)
 
+        values = np.copy(self._tri_spd.values)
+        clone = self._tri_spd.clone()
+        self.assertIs(clone.x.values, self._tri_spd.x.values)
+
+        clone.trim_wavelengths(SpectralShape(400, 500, 10))
+        clone.mapping['x'] = 'undefined'
+        np.testing.assert_equal(self._tri_spd.values, values)
+        self.assertNotEqual(self._tri_spd.mapping['x'], 'undefined')
+
+    def test_frozen(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+TriSpectralPowerDistribution.frozen` attribute.
+        """
+
+        tri_spd = self._tri_spd.clone()
+        self.assertFalse(tri_spd.frozen)
+
+        tri_spd.frozen = True
+        self.assertTrue(tri_spd.frozen)
+        self.assertTrue(tri_spd.x.frozen)
+        self.assertRaises(RuntimeError, tri_spd.normalise)
+        self.assertFalse(tri_spd.clone().frozen)
+
+    def test_digest(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+TriSpectralPowerDistribution.digest` attribute.
+        """
+
+        tri_spd = self._tri_spd.clone()
+        self.assertEqual(tri_spd.digest, self._tri_spd.digest)
+        self.assertEqual(hash(tri_spd), hash(self._tri_spd))
+
+        tri_spd.x[400] = 0
+        self.assertNotEqual(tri_spd.digest, self._tri_spd.digest)
+
+
+class TestMultiSpectralPowerDistribution(unittest.TestCase):
+    """
+    Defines :class:`colour.colorimetry.spectrum.MultiSpectralPowerDistribution`
+    class unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._wavelengths = np.array(sorted(SAMPLE_SPD_DATA.keys()))
+        self._values = np.array(
+            [[SAMPLE_SPD_DATA[wavelength] * i
+              for wavelength in self._wavelengths]
+             for i in (1, 2, 3)])
+
+        self._multi_spd = MultiSpectralPowerDistribution(
+            name='Samples',
+            data=self._values,
+            wavelengths=self._wavelengths,
+            labels=('a', 'b', 'c'))
+
+        non_uniform_wavelengths = np.array(
+            sorted(NON_UNIFORM_SAMPLE_SPD_DATA.keys()))
+        self._non_uniform_multi_spd = MultiSpectralPowerDistribution(
+            name='Non Uniform Samples',
+            data=[[NON_UNIFORM_SAMPLE_SPD_DATA[wavelength]
+                   for wavelength in non_uniform_wavelengths]] * 3,
+            wavelengths=non_uniform_wavelengths)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('name',
+                               'title',
+                               'labels',
+                               'wavelengths',
+                               'values',
+                               'shape',
+                               'digest')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(MultiSpectralPowerDistribution))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__str__',
+                            '__repr__',
+                            '__hash__',
+                            '__getitem__',
+                            '__setitem__',
+                            '__iter__',
+                            '__contains__',
+                            '__len__',
+                            '__eq__',
+                            '__ne__',
+                            '__add__',
+                            '__iadd__',
+                            '__sub__',
+                            '__isub__',
+                            '__mul__',
+                            '__imul__',
+                            '__div__',
+                            '__idiv__',
+                            '__pow__',
+                            '__ipow__',
+                            '__radd__',
+                            '__rsub__',
+                            '__rmul__',
+                            '__rdiv__',
+                            '__rpow__',
+                            'get',
+                            'is_uniform',
+                            'extrapolate',
+                            'interpolate',
+                            'align',
+                            'trim_wavelengths',
+                            'zeros',
+                            'normalise',
+                            'clone')
+
+        for method in required_methods:
+            self.assertIn(method, dir(MultiSpectralPowerDistribution))
+
+    def test_wavelengths(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.wavelengths` attribute.
+        """
+
+        np.testing.assert_almost_equal(self._multi_spd.wavelengths,
+                                       self._wavelengths)
+
+        np.testing.assert_almost_equal(
+            MultiSpectralPowerDistribution(
+                '', self._values, self._multi_spd.shape).wavelengths,
+            self._wavelengths)
+
+    def test_values(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.values` attribute.
+        """
+
+        np.testing.assert_almost_equal(self._multi_spd.values, self._values)
+
+        values = self._multi_spd.values
+        self.assertTrue(values.flags.c_contiguous)
+        self.assertRaises(ValueError, operator.setitem, values, 0, 1)
+
+    def test_shape(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.shape` attribute.
+        """
+
+        self.assertEqual(self._multi_spd.shape, SpectralShape(340, 820, 20))
+
+    def test__getitem__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__getitem__` method.
+        """
+
+        np.testing.assert_almost_equal(self._multi_spd[340],
+                                       np.array([0.0, 0.0, 0.0]))
+
+        np.testing.assert_almost_equal(
+            self._multi_spd[np.array([620, 820])],
+            np.array([[0.1511, 0.0],
+                      [0.3022, 0.0],
+                      [0.4533, 0.0]]))
+
+        np.testing.assert_almost_equal(self._multi_spd[:], self._values)
+
+        self.assertRaises(KeyError, self._multi_spd.__getitem__, 341)
+
+    def test__setitem__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__setitem__` method.
+        """
+
+        multi_spd = self._multi_spd.clone()
+
+        multi_spd[850] = np.array([1, 2, 3])
+        np.testing.assert_almost_equal(multi_spd[850], np.array([1, 2, 3]))
+
+        multi_spd[np.array([860, 870])] = 1
+        np.testing.assert_almost_equal(
+            multi_spd[np.array([860, 870])], np.ones((3, 2)))
+
+        multi_spd[:] = 0
+        np.testing.assert_almost_equal(multi_spd.values,
+                                       np.zeros((3, 28)))
+
+    def test__iter__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__iter__` method.
+        """
+
+        for i, (wavelength, values) in enumerate(self._multi_spd):
+            self.assertEqual(wavelength, self._wavelengths[i])
+            np.testing.assert_almost_equal(values, self._values[:, i])
+
+    def test__contains__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__contains__` method.
+        """
+
+        self.assertIn(340, self._multi_spd)
+
+        self.assertIn(np.array([340, 360]), self._multi_spd)
+
+        self.assertNotIn(np.array([340, 341]), self._multi_spd)
+
+    def test__len__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__len__` method.
+        """
+
+        self.assertEqual(len(self._multi_spd), 25)
+
+    def test__eq__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__eq__` method.
+        """
+
+        self.assertEqual(self._multi_spd, self._multi_spd.clone())
+
+    def test__ne__(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__ne__` method.
+        """
+
+        self.assertNotEqual(self._multi_spd,
+                            self._non_uniform_multi_spd)
+
+    def test_arithmetical_operation(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__add__`,
+        :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__sub__`,
+        :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__mul__`,
+        :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__div__`,
+        :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__pow__` methods and their reflected
+        counterparts.
+        """
+
+        spd = SpectralPowerDistribution('', SAMPLE_SPD_DATA)
+        spd_1 = (spd + 1).interpolate(SpectralShape(interval=1))
+
+        for operation in (operator.add,
+                          operator.sub,
+                          operator.mul,
+                          operator.truediv,
+                          operator.pow):
+            multi_spd = self._multi_spd.clone()
+
+            np.testing.assert_almost_equal(
+                operation(multi_spd, 10).values,
+                operation(self._values, 10))
+
+            np.testing.assert_almost_equal(
+                operation(multi_spd, [[1], [2], [3]]).values,
+                operation(self._values, [[1], [2], [3]]))
+
+            np.testing.assert_almost_equal(
+                operation(multi_spd, spd).values,
+                operation(self._values, spd.values))
+
+            np.testing.assert_almost_equal(
+                operation(spd, multi_spd).values,
+                operation(spd.values, self._values))
+
+            np.testing.assert_almost_equal(
+                operation(multi_spd, spd_1).values,
+                operation(self._values, spd.values + 1))
+
+            np.testing.assert_almost_equal(
+                operation(spd_1, multi_spd).values,
+                operation(spd.values + 1, self._values))
+
+            np.testing.assert_almost_equal(
+                operation(10, multi_spd).values,
+                operation(10, self._values))
+
+            np.testing.assert_almost_equal(
+                operation(multi_spd, multi_spd).values,
+                operation(self._values, self._values))
+
+            np.testing.assert_almost_equal(multi_spd.values, self._values)
+
+        self.assertRaises(AssertionError,
+                          operator.add,
+                          self._multi_spd,
+                          np.ones((2, 3, 25)))
+
+    def test_arithmetical_ioperation(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__iadd__`,
+        :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__isub__`,
+        :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__imul__`,
+        :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__idiv__` and
+        :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.__ipow__` methods.
+        """
+
+        for operation, ioperation in ((operator.add, operator.iadd),
+                                      (operator.sub, operator.isub),
+                                      (operator.mul, operator.imul),
+                                      (operator.truediv, operator.itruediv),
+                                      (operator.pow, operator.ipow)):
+            multi_spd = self._multi_spd.clone()
+            values = multi_spd.values
+
+            self.assertIs(ioperation(multi_spd, 2), multi_spd)
+            np.testing.assert_almost_equal(multi_spd.values,
+                                           operation(self._values, 2))
+            np.testing.assert_almost_equal(values, self._values)
+
+    def test_get(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.get` method.
+        """
+
+        np.testing.assert_almost_equal(self._multi_spd.get(340),
+                                       np.array([0.0, 0.0, 0.0]))
+
+        np.testing.assert_almost_equal(
+            self._multi_spd.get(np.array([620, 621]), 1),
+            np.array([[0.1511, 1.0],
+                      [0.3022, 1.0],
+                      [0.4533, 1.0]]))
+
+        np.testing.assert_almost_equal(self._multi_spd.get(341),
+                                       np.array([np.nan, np.nan, np.nan]))
+
+    def test_is_uniform(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.is_uniform` method.
+        """
+
+        self.assertTrue(self._multi_spd.is_uniform())
+
+        self.assertFalse(self._non_uniform_multi_spd.is_uniform())
+
+        self.assertTrue(MultiSpectralPowerDistribution(
+            '', np.ones((2, 101)), SpectralShape(300, 310, 0.1)).is_uniform())
+
+    def test_extrapolate(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.extrapolate` method.
+        """
+
+        for method in ('Constant', 'Linear'):
+            multi_spd = self._multi_spd.clone().extrapolate(
+                SpectralShape(300, 900), method, 0.5)
+
+            for i, values in enumerate(self._values):
+                spd = SpectralPowerDistribution(
+                    '', dict(zip(self._wavelengths, values))).extrapolate(
+                    SpectralShape(300, 900), method, 0.5)
+
+                np.testing.assert_almost_equal(multi_spd.wavelengths,
+                                               spd.wavelengths)
+                np.testing.assert_almost_equal(multi_spd.values[i],
+                                               spd.values)
+
+    def test_interpolate(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.interpolate` method.
+        """
+
+        multi_spd = self._multi_spd.clone().interpolate(
+            SpectralShape(interval=1))
+        np.testing.assert_almost_equal(
+            multi_spd.values,
+            np.array([INTERPOLATED_SAMPLE_SPD_DATA]) * [[1], [2], [3]],
+            decimal=7)
+
+        multi_spd = self._non_uniform_multi_spd.clone().interpolate(
+            SpectralShape(interval=1))
+        for values in multi_spd.values:
+            np.testing.assert_allclose(
+                values,
+                INTERPOLATED_NON_UNIFORM_SAMPLE_SPD_DATA,
+                rtol=0.0000001,
+                atol=0.0000001)
+
+        for method in ('Cubic Spline', 'Linear', 'Pchip', 'Sprague'):
+            multi_spd = self._multi_spd.clone().interpolate(
+                SpectralShape(interval=1), method)
+
+            for i, values in enumerate(self._values):
+                spd = SpectralPowerDistribution(
+                    '', dict(zip(self._wavelengths, values))).interpolate(
+                    SpectralShape(interval=1), method)
+
+                np.testing.assert_almost_equal(multi_spd.values[i],
+                                               spd.values)
+
+        self.assertRaises(ValueError,
+                          self._multi_spd.clone().interpolate,
+                          SpectralShape(interval=1),
+                          'Undefined')
+
+    def test_align(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.align` method.
+        """
+
+        multi_spd = self._multi_spd.clone()
+
+        shape = SpectralShape(100, 900, 5)
+        self.assertEqual(multi_spd.align(shape).shape, shape)
+
+        shape = SpectralShape(600, 650, 1)
+        self.assertEqual(multi_spd.align(shape).shape, shape)
+
+        self.assertTupleEqual(multi_spd.values.shape, (3, 51))
+
+    def test_trim_wavelengths(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.trim_wavelengths` method.
+        """
+
+        shape = SpectralShape(400, 700, 20)
+        multi_spd = self._multi_spd.clone().trim_wavelengths(shape)
+        self.assertEqual(multi_spd.shape, shape)
+        np.testing.assert_almost_equal(multi_spd.values,
+                                       self._values[:, 3:19])
+
+        shape = SpectralShape(200, 900, 1)
+        self.assertEqual(
+            self._multi_spd.clone().trim_wavelengths(shape).shape,
+            self._multi_spd.shape)
+
+    def test_zeros(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.zeros` method.
+        """
+
+        multi_spd = self._multi_spd.clone().zeros(SpectralShape(interval=1))
+        np.testing.assert_almost_equal(
+            multi_spd.values,
+            np.array([ZEROS_SAMPLE_SPD_DATA]) * [[1], [2], [3]])
+
+        self.assertRaises(RuntimeError,
+                          self._multi_spd.clone().zeros,
+                          SpectralShape(interval=15))
+
+    def test_normalise(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.normalise` method.
+        """
+
+        np.testing.assert_almost_equal(
+            self._multi_spd.clone().normalise(100).values,
+            np.array([NORMALISED_SAMPLE_SPD_DATA] * 3))
+
+    def test_clone(self):
+        """
+        Tests :func:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.clone` method.
+        """
+
+        clone = self._multi_spd.clone()
+
+        self.assertFalse(self._multi_spd is clone)
+        self.assertEqual(self._multi_spd.title, clone.title)
+        self.assertEqual(self._multi_spd.labels, clone.labels)
+        self.assertRaises(ValueError, operator.setitem, clone.values, 0, 1)
+
+    def test_digest(self):
+        """
+        Tests :attr:`colour.colorimetry.spectrum.\
+MultiSpectralPowerDistribution.digest` attribute.
+        """
+
+        multi_spd = self._multi_spd.clone()
+        self.assertEqual(multi_spd.digest, self._multi_spd.digest)
+        self.assertEqual(hash(multi_spd), hash(self._multi_spd))
+
+        multi_spd *= 2
+        self.assertNotEqual(multi_spd.digest, self._multi_spd.digest)
+
 
 class TestConstantSpd(unittest.TestCase):
     """
@@ -8,12 +8,16 @@ Defines unit tests for :mod:`colour.colorimetry.tristimulus` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 
 from colour.colorimetry import (
     CMFS,
     CIE_standard_illuminant_A_function,
     ILLUMINANTS_RELATIVE_SPDS,
+    MultiSpectralPowerDistribution,
     SpectralPowerDistribution,
     SpectralShape)
 from colour.colorimetry import (
@@ -23,6 +27,11 @@ from colour.colorimetry import (
     spectral_to_XYZ_integration,
     spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815,
     spectral_to_XYZ_ASTME30815,
+    multi_spectral_to_XYZ_integration,
+    multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815,
+    multi_spectral_to_XYZ_ASTME30815,
+    multi_spectral_to_XYZ,
+    multi_spectral_to_XYZ_parallel,
     wavelength_to_XYZ)
 
 __author__ = 'Colour Developers'
@@ -44,6 +53,11 @@ __all__ = ['SAMPLE_SPD',
            'TestAdjustTristimulusWeightingFactorsASTME30815',
            'TestSpectral_to_XYZ_integration',
            'TestSpectral_to_XYZ_ASTME30815',
+           'TestMultiSpectral_to_XYZ_integration',
+           'TestMultiSpectral_to_XYZ_tristimulus_weighting_factors_ASTME30815',
+           'TestMultiSpectral_to_XYZ_ASTME30815',
+           'TestMultiSpectral_to_XYZ',
+           'TestMultiSpectral_to_XYZ_parallel',
            'TestWavelength_to_XYZ']
 
 SAMPLE_SPD = SpectralPowerDistribution(
@@ -367,6 +381,31 @@ tristimulus_weighting_factors_ASTME202211` definition.
             D65_CIE_1931_2_20_TWF,
             decimal=3)
 
+        # Same name but different spectral data must not collide.
+        D65_s = D65.clone()
+        D65_s.name = D65.name
+        D65_s[D65_s.wavelengths] = D65_s.values * np.linspace(
+            0.5, 1.5, len(D65_s))
+        np.testing.assert_almost_equal(
+            np.round(tristimulus_weighting_factors_ASTME202211(
+                cmfs, D65, SpectralShape(360, 830, 20)), 3),
+            D65_CIE_1931_2_20_TWF,
+            decimal=3)
+        self.assertFalse(np.allclose(
+            tristimulus_weighting_factors_ASTME202211(
+                cmfs, D65_s, SpectralShape(360, 830, 20)),
+            D65_CIE_1931_2_20_TWF,
+            atol=1e-3))
+
+        # A 1 nm interval has no interpolated values, the weighting factors
+        # are the normalised illuminant weighted colour matching functions.
+        W = D65.values[:, np.newaxis] * cmfs.values
+        np.testing.assert_almost_equal(
+            tristimulus_weighting_factors_ASTME202211(
+                cmfs, D65, SpectralShape(360, 830, 1)),
+            W * 100 / np.sum(W, axis=0)[1],
+            decimal=7)
+
 
 class TestAdjustTristimulusWeightingFactorsASTME30815(unittest.TestCase):
     """
@@ -752,6 +791,322 @@ class TestSpectral_to_XYZ_ASTME30815(unittest.TestCase):
             decimal=7)
 
 
+class TestMultiSpectral_to_XYZ_integration(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_integration` definition unit tests methods.
+    """
+
+    def test_multi_spectral_to_XYZ_integration(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_integration` definition.
+        """
+
+        msa = np.array([SAMPLE_SPD.values, SAMPLE_SPD.values / 2])
+
+        cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_integration(
+                msa,
+                SAMPLE_SPD.shape,
+                cmfs,
+                ILLUMINANTS_RELATIVE_SPDS.get('A')),
+            np.array([[14.46365624, 10.85827910, 2.04662343],
+                      [7.23182812, 5.42913955, 1.02331172]]),
+            decimal=7)
+
+        cmfs = CMFS.get('CIE 1964 10 Degree Standard Observer')
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_integration(
+                msa,
+                SAMPLE_SPD.shape,
+                cmfs,
+                ILLUMINANTS_RELATIVE_SPDS.get('C')),
+            np.array([[10.77031004, 9.44863775, 6.62745989],
+                      [5.38515502, 4.72431888, 3.31372995]]),
+            decimal=7)
+
+    def test_n_dimensional_multi_spectral_to_XYZ_integration(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_integration` definition n-dimensional arrays support.
+        """
+
+        cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+        illuminant = ILLUMINANTS_RELATIVE_SPDS.get('A')
+
+        msa = SAMPLE_SPD.values
+        XYZ = multi_spectral_to_XYZ_integration(
+            msa, SAMPLE_SPD.shape, cmfs, illuminant)
+        np.testing.assert_almost_equal(
+            XYZ,
+            spectral_to_XYZ_integration(SAMPLE_SPD, cmfs, illuminant),
+            decimal=7)
+
+        msa = np.tile(msa, (6, 1))
+        XYZ = np.tile(XYZ, (6, 1))
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_integration(
+                msa, SAMPLE_SPD.shape, cmfs, illuminant),
+            XYZ,
+            decimal=7)
+
+        msa = np.reshape(msa, (2, 3, -1))
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_integration(
+                msa, SAMPLE_SPD.shape, cmfs, illuminant),
+            XYZ,
+            decimal=7)
+
+
+class TestMultiSpectral_to_XYZ_tristimulus_weighting_factors_ASTME30815(
+        unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815`
+    definition unit tests methods.
+    """
+
+    def test_multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815(
+            self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815`
+        definition.
+        """
+
+        msa = np.array([SAMPLE_SPD.values, SAMPLE_SPD.values / 2])
+
+        cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815(
+                msa,
+                SAMPLE_SPD.shape,
+                cmfs,
+                ILLUMINANTS_RELATIVE_SPDS.get('A')),
+            np.array([[14.46366344, 10.85828513, 2.04663792],
+                      [7.23183172, 5.42914257, 1.02331896]]),
+            decimal=7)
+
+        cmfs = CMFS.get('CIE 1964 10 Degree Standard Observer')
+        spd = SAMPLE_SPD.clone().trim_wavelengths(SpectralShape(400, 700, 5))
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815(
+                np.array([spd.values, spd.values / 2]),
+                spd.shape,
+                cmfs,
+                ILLUMINANTS_RELATIVE_SPDS.get('A')),
+            np.array([[14.38180830, 10.74512906, 2.01579131],
+                      [7.19090415, 5.37256453, 1.00789566]]),
+            decimal=7)
+
+
+class TestMultiSpectral_to_XYZ_ASTME30815(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._spd = SAMPLE_SPD.clone()
+        self._cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+        wl = self._cmfs.shape.range()
+        self.__A = SpectralPowerDistribution(
+            'A (360, 830, 1)',
+            dict(zip(wl, CIE_standard_illuminant_A_function(wl))))
+
+    def test_multi_spectral_to_XYZ_ASTME30815(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition.
+        """
+
+        for shape, kwargs, XYZ in (
+                (SpectralShape(400, 700, 1), {},
+                 np.array([14.54173397, 10.88628632, 2.04965822])),
+                (SpectralShape(360, 830, 5), {},
+                 np.array([14.46372173, 10.85832502, 2.04664734])),
+                (SpectralShape(400, 700, 5),
+                 {'mi_5nm_omission_method': False},
+                 np.array([14.54022093, 10.88575468, 2.04951057])),
+                (SpectralShape(360, 830, 10), {},
+                 np.array([14.47779980, 10.86358645, 2.04751388])),
+                (SpectralShape(360, 820, 20), {},
+                 np.array([14.50187464, 10.87217124, 2.04918305])),
+                (SpectralShape(400, 700, 20),
+                 {'use_practice_range': False},
+                 np.array([14.54143704, 10.88642877, 2.04915501])),
+                (SpectralShape(400, 700, 20),
+                 {'mi_20nm_interpolation_method': False},
+                 np.array([14.54242562, 10.88694088, 2.04919645]))):
+            spd = self._spd.clone().align(shape)
+            np.testing.assert_almost_equal(
+                multi_spectral_to_XYZ_ASTME30815(
+                    np.array([spd.values, spd.values / 2]),
+                    shape,
+                    self._cmfs,
+                    self.__A,
+                    **kwargs),
+                np.array([XYZ, XYZ / 2]),
+                decimal=7)
+
+        self.assertRaises(ValueError,
+                          multi_spectral_to_XYZ_ASTME30815,
+                          self._spd.values,
+                          SpectralShape(340, 830, 2),
+                          self._cmfs,
+                          self.__A)
+
+    def test_n_dimensional_multi_spectral_to_XYZ_ASTME30815_mi_20nm(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_ASTME30815` definition n-dimensional arrays support
+        with 20 nm measurement intervals.
+        """
+
+        shape = SpectralShape(340, 840, 20)
+        wl = shape.range()
+        msa = np.random.RandomState(20).uniform(size=(2, 3, len(wl)))
+
+        XYZ = np.array([[spectral_to_XYZ_ASTME30815(
+            SpectralPowerDistribution('Sample', dict(zip(wl, R))),
+            self._cmfs,
+            self.__A) for R in msa_s] for msa_s in msa])
+
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ_ASTME30815(
+                msa, shape, self._cmfs, self.__A),
+            XYZ,
+            decimal=10)
+
+
+class TestMultiSpectral_to_XYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.multi_spectral_to_XYZ`
+    definition unit tests methods.
+    """
+
+    def test_multi_spectral_to_XYZ(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.multi_spectral_to_XYZ`
+        definition.
+        """
+
+        cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+        illuminant = ILLUMINANTS_RELATIVE_SPDS.get('A')
+        multi_spd = MultiSpectralPowerDistribution(
+            'Samples',
+            [SAMPLE_SPD.values, SAMPLE_SPD.values / 2],
+            SAMPLE_SPD.wavelengths)
+
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ(
+                multi_spd,
+                cmfs=cmfs,
+                illuminant=illuminant,
+                method='Integration'),
+            np.array([[14.46365624, 10.85827910, 2.04662343],
+                      [7.23182812, 5.42913955, 1.02331172]]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            multi_spectral_to_XYZ(
+                multi_spd.values,
+                multi_spd.shape,
+                cmfs,
+                illuminant,
+                use_practice_range=False),
+            spectral_to_XYZ_ASTME30815(
+                SAMPLE_SPD, cmfs, illuminant, use_practice_range=False) *
+            np.array([[1], [0.5]]),
+            decimal=7)
+
+        self.assertRaises(AssertionError,
+                          multi_spectral_to_XYZ,
+                          multi_spd.values)
+
+
+class TestMultiSpectral_to_XYZ_parallel(unittest.TestCase):
+    """
+    Defines :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_parallel` definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+        self._cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+        self._illuminant = ILLUMINANTS_RELATIVE_SPDS.get('A')
+        self._msa = np.random.RandomState(4).random_sample(
+            (10, 25, len(SAMPLE_SPD.wavelengths)))
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_multi_spectral_to_XYZ_parallel(self):
+        """
+        Tests :func:`colour.colorimetry.tristimulus.\
+multi_spectral_to_XYZ_parallel` definition.
+        """
+
+        for method in ('ASTM E308–15', 'Integration'):
+            XYZ = multi_spectral_to_XYZ(
+                self._msa, SAMPLE_SPD.shape, self._cmfs, self._illuminant,
+                method)
+
+            np.testing.assert_almost_equal(
+                multi_spectral_to_XYZ_parallel(
+                    self._msa, SAMPLE_SPD.shape, self._cmfs,
+                    self._illuminant, method, workers=3, chunk_size=16),
+                XYZ,
+                decimal=7)
+
+        XYZ = multi_spectral_to_XYZ_parallel(
+            self._msa, SAMPLE_SPD.shape, self._cmfs, self._illuminant,
+            workers=1, chunk_size=16)
+
+        np.testing.assert_equal(
+            multi_spectral_to_XYZ_parallel(
+                self._msa, SAMPLE_SPD.shape, self._cmfs, self._illuminant,
+                workers=4, chunk_size=16),
+            XYZ)
+
+        np.testing.assert_equal(
+            multi_spectral_to_XYZ_parallel(
+                self._msa, SAMPLE_SPD.shape, self._cmfs, self._illuminant,
+                executor='Process', workers=2, chunk_size=16),
+            XYZ)
+
+        path = os.path.join(self._temporary_directory, 'msa.npy')
+        np.save(path, self._msa)
+        out = np.zeros(XYZ.shape)
+        np.testing.assert_equal(
+            multi_spectral_to_XYZ_parallel(
+                np.load(path, mmap_mode='r'), SAMPLE_SPD.shape, self._cmfs,
+                self._illuminant, executor='Process', workers=2,
+                chunk_size=16, out=out),
+            XYZ)
+        np.testing.assert_equal(out, XYZ)
+
+        self.assertRaises(AssertionError,
+                          multi_spectral_to_XYZ_parallel,
+                          self._msa)
+
+
 class TestWavelength_to_XYZ(unittest.TestCase):
     """
     Defines :func:`colour.colorimetry.tristimulus.wavelength_to_XYZ` definition
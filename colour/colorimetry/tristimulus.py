@@ -12,6 +12,11 @@ Defines objects for tristimulus values computation from spectral data:
 -   :func:`spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815`
 -   :func:`spectral_to_XYZ_ASTME30815`
 -   :func:`spectral_to_XYZ`
+-   :func:`multi_spectral_to_XYZ_integration`
+-   :func:`multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815`
+-   :func:`multi_spectral_to_XYZ_ASTME30815`
+-   :func:`multi_spectral_to_XYZ`
+-   :func:`multi_spectral_to_XYZ_parallel`
 -   :func:`wavelength_to_XYZ`
 
 The default implementation is based on practise *ASTM E308–15* method [2]_.
@@ -38,6 +43,7 @@ blob/master/notebooks/colorimetry/spectrum.ipynb>`_
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
 
 from colour.algebra import (
     CubicSplineInterpolator,
@@ -45,9 +51,15 @@ from colour.algebra import (
     PchipInterpolator,
     SpragueInterpolator,
     lagrange_coefficients)
-from colour.colorimetry import SpectralShape, STANDARD_OBSERVERS_CMFS, ones_spd
+from colour.colorimetry import (
+    MultiSpectralPowerDistribution,
+    SpectralShape,
+    STANDARD_OBSERVERS_CMFS,
+    ones_spd)
 from colour.utilities import (
     CaseInsensitiveMapping,
+    LRUCache,
+    content_hash,
     filter_kwargs,
     is_string,
     tsplit,
@@ -60,7 +72,8 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['lagrange_coefficients_ASTME202211',
+__all__ = ['TRISTIMULUS_WEIGHTING_FACTORS_CACHE_SIZE',
+           'lagrange_coefficients_ASTME202211',
            'tristimulus_weighting_factors_ASTME202211',
            'adjust_tristimulus_weighting_factors_ASTME30815',
            'spectral_to_XYZ_integration',
@@ -68,10 +81,25 @@ __all__ = ['lagrange_coefficients_ASTME202211',
            'spectral_to_XYZ_ASTME30815',
            'SPECTRAL_TO_XYZ_METHODS',
            'spectral_to_XYZ',
+           'multi_spectral_to_XYZ_integration',
+           'multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815',
+           'multi_spectral_to_XYZ_ASTME30815',
+           'MULTI_SPECTRAL_TO_XYZ_METHODS',
+           'multi_spectral_to_XYZ',
+           'PARALLEL_CHUNK_SIZE',
+           'PARALLEL_EXECUTORS',
+           'multi_spectral_to_XYZ_parallel',
            'wavelength_to_XYZ']
 
 _LAGRANGE_INTERPOLATING_COEFFICIENTS_CACHE = None
 
+TRISTIMULUS_WEIGHTING_FACTORS_CACHE_SIZE = 128
+"""
+Maximum count of tables of tristimulus weighting factors kept in memory.
+
+TRISTIMULUS_WEIGHTING_FACTORS_CACHE_SIZE : int
+"""
+
 _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = None
 
 
@@ -177,13 +205,14 @@ def tristimulus_weighting_factors_ASTME202211(cmfs, illuminant, shape):
     Warning
     -------
     -   The tables of tristimulus weighting factors are cached in
-        :attr:`_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their
-        identifier key is defined by the colour matching functions and
-        illuminant names along the current shape such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0)`
-        Considering the above, one should be mindful that using similar colour
-        matching functions and illuminant names but with different spectral
-        data will lead to unexpected behaviour.
+        :attr:`_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute, a
+        :class:`colour.utilities.LRUCache` class instance keeping the
+        :attr:`TRISTIMULUS_WEIGHTING_FACTORS_CACHE_SIZE` most recently used
+        tables. Their identifier key is a digest of the colour matching
+        functions and illuminant spectral data along the current shape.
+        The tables are also persisted into the directory defined by the
+        *COLOUR_TRISTIMULUS_WEIGHTING_FACTORS_CACHE_DIRECTORY* environment
+        variable if set, allowing new processes to warm-start.
 
     Notes
     -----
@@ -244,11 +273,19 @@ def tristimulus_weighting_factors_ASTME202211(cmfs, illuminant, shape):
 
     global _TRISTIMULUS_WEIGHTING_FACTORS_CACHE
     if _TRISTIMULUS_WEIGHTING_FACTORS_CACHE is None:
-        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = CaseInsensitiveMapping()
-
-    name_twf = ', '.join((cmfs.name, illuminant.name, str(shape)))
-    if name_twf in _TRISTIMULUS_WEIGHTING_FACTORS_CACHE:
-        return _TRISTIMULUS_WEIGHTING_FACTORS_CACHE[name_twf]
+        _TRISTIMULUS_WEIGHTING_FACTORS_CACHE = LRUCache(
+            TRISTIMULUS_WEIGHTING_FACTORS_CACHE_SIZE,
+            os.environ.get(
+                'COLOUR_TRISTIMULUS_WEIGHTING_FACTORS_CACHE_DIRECTORY'))
+
+    name_twf = content_hash(cmfs.digest,
+                            illuminant.digest,
+                            shape.start,
+                            shape.end,
+                            shape.interval)
+    W = _TRISTIMULUS_WEIGHTING_FACTORS_CACHE.get(name_twf)
+    if W is not None:
+        return W
 
     Y = cmfs.values
     S = illuminant.values
@@ -271,30 +308,27 @@ def tristimulus_weighting_factors_ASTME202211(cmfs, illuminant, shape):
     i_c = W.shape[0]
     i_cm = i_c - 1
 
-    for i in range(3):
+    # Illuminant weighted colour matching functions.
+    P = S[:, np.newaxis] * Y
+
+    # A 1 nm measurement interval has no interpolated values.
+    if r_c != 0:
         # First interval.
-        for j in range(r_c):
-            for k in range(3):
-                W[k, i] = W[k, i] + c_c[j, k] * S[j + 1] * Y[j + 1, i]
+        W[0:3] += np.dot(c_c.T, P[1:r_c + 1])
 
         # Last interval.
-        for j in range(r_c):
-            for k in range(i_cm, i_cm - 3, -1):
-                W[k, i] = (W[k, i] + c_c[r_c - j - 1, i_cm - k] *
-                           S[j + w_lif] * Y[j + w_lif, i])
-
-        # Intermediate intervals.
-        for j in range(i_c - 3):
-            for k in range(r_c):
-                w_i = (r_c + 1) * (j + 1) + 1 + k
-                W[j, i] = W[j, i] + c_b[k, 0] * S[w_i] * Y[w_i, i]
-                W[j + 1, i] = W[j + 1, i] + c_b[k, 1] * S[w_i] * Y[w_i, i]
-                W[j + 2, i] = W[j + 2, i] + c_b[k, 2] * S[w_i] * Y[w_i, i]
-                W[j + 3, i] = W[j + 3, i] + c_b[k, 3] * S[w_i] * Y[w_i, i]
-
-        # Extrapolation of potential incomplete interval.
-        for j in range(int(w_c - ((w_c - 1) % shape.interval)), w_c, 1):
-            W[i_cm, i] = W[i_cm, i] + S[j] * Y[j, i]
+        W[i_cm - 2:i_c] += np.dot(c_c[::-1].T, P[w_lif:w_lif + r_c])[::-1]
+
+        # Intermediate intervals, each one contributes to the 4 surrounding
+        # measurement wavelengths.
+        j = np.arange(i_c - 3)
+        w_i = (r_c + 1) * (j[:, np.newaxis] + 1) + 1 + np.arange(r_c)
+        W_i = np.einsum('kq,jkc->qjc', c_b, P[w_i])
+        for q in range(4):
+            W[q:q + len(j)] += W_i[q]
+
+    # Extrapolation of potential incomplete interval.
+    W[i_cm] += np.sum(P[int(w_c - ((w_c - 1) % shape.interval)):w_c], axis=0)
 
     W *= 100 / np.sum(W, axis=0)[1]
 
@@ -554,6 +588,52 @@ def spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815(
     return XYZ
 
 
+def _mi_20nm_interpolation_ASTME30815(R):
+    """
+    Interpolates given 20 nm measurement intervals spectral data to 10 nm
+    measurement intervals using practise *ASTM E308–15* method [2]_: The
+    spectral data is padded with an extrapolated 20 nm interval on both ends
+    and every odd numbered value is interpolated with a third order
+    *Lagrange* polynomial.
+
+    Parameters
+    ----------
+    R : array_like
+        Spectral data of shape (..., W) with 20 nm measurement intervals.
+
+    Returns
+    -------
+    ndarray
+        Spectral data of shape (..., 2W - 1) with 10 nm measurement
+        intervals.
+
+    Examples
+    --------
+    >>> R = np.array([0.1, 0.2, 0.4, 0.8, 1.6])
+    >>> _mi_20nm_interpolation_ASTME30815(R)
+    array([ 0.1    ,  0.1375 ,  0.2    ,  0.28125,  0.4    ,  0.5625 ,
+            0.8    ,  1.15   ,  1.6    ])
+    """
+
+    R = np.asarray(R)
+
+    # Extrapolation of additional 20nm padding intervals.
+    R_p = np.concatenate((
+        3 * R[..., 0:1] - 3 * R[..., 1:2] + R[..., 2:3],
+        R,
+        R[..., -3:-2] - 3 * R[..., -2:-1] + 3 * R[..., -1:]), axis=-1)
+
+    # Interpolating every odd numbered values.
+    R_i = np.zeros(R.shape[:-1] + (R.shape[-1] * 2 - 1,))
+    R_i[..., ::2] = R
+    R_i[..., 1::2] = (-0.0625 * R_p[..., :-3] +
+                      0.5625 * R_p[..., 1:-2] +
+                      0.5625 * R_p[..., 2:-1] -
+                      0.0625 * R_p[..., 3:])
+
+    return R_i
+
+
 def spectral_to_XYZ_ASTME30815(
         spd,
         cmfs=STANDARD_OBSERVERS_CMFS.get(
@@ -598,13 +678,14 @@ def spectral_to_XYZ_ASTME30815(
     Warning
     -------
     -   The tables of tristimulus weighting factors are cached in
-        :attr:`_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute. Their
-        identifier key is defined by the colour matching functions and
-        illuminant names along the current shape such as:
-        `CIE 1964 10 Degree Standard Observer, A, (360.0, 830.0, 10.0)`
-        Considering the above, one should be mindful that using similar colour
-        matching functions and illuminant names but with different spectral
-        data will lead to unexpected behaviour.
+        :attr:`_TRISTIMULUS_WEIGHTING_FACTORS_CACHE` attribute, a
+        :class:`colour.utilities.LRUCache` class instance keeping the
+        :attr:`TRISTIMULUS_WEIGHTING_FACTORS_CACHE_SIZE` most recently used
+        tables. Their identifier key is a digest of the colour matching
+        functions and illuminant spectral data along the current shape.
+        The tables are also persisted into the directory defined by the
+        *COLOUR_TRISTIMULUS_WEIGHTING_FACTORS_CACHE_DIRECTORY* environment
+        variable if set, allowing new processes to warm-start.
     -   The output range of that definition is non standard!
 
     Notes
@@ -664,29 +745,9 @@ def spectral_to_XYZ_ASTME30815(
                 'colour matching functions shape.'.format(illuminant, cmfs))
             spd.trim_wavelengths(cmfs.shape)
 
-        # Extrapolation of additional 20nm padding intervals.
-        spd.align(SpectralShape(spd.shape.start - 20, spd.shape.end + 20, 10))
-        for i in range(2):
-            spd[spd.wavelengths[i]] = (3 * spd.values[i + 2] -
-                                       3 * spd.values[i + 4] +
-                                       spd.values[i + 6])
-            i_e = len(spd) - 1 - i
-            spd[spd.wavelengths[i_e]] = (spd.values[i_e - 6] -
-                                         3 * spd.values[i_e - 4] +
-                                         3 * spd.values[i_e - 2])
-
-        # Interpolating every odd numbered values.
-        # TODO: Investigate code vectorisation.
-        for i in range(3, len(spd) - 3, 2):
-            spd[spd.wavelengths[i]] = (-0.0625 * spd.values[i - 3] +
-                                       0.5625 * spd.values[i - 1] +
-                                       0.5625 * spd.values[i + 1] -
-                                       0.0625 * spd.values[i + 3])
-
-        # Discarding the additional 20nm padding intervals.
-        spd.trim_wavelengths(SpectralShape(spd.shape.start + 20,
-                                           spd.shape.end - 20,
-                                           10))
+        values = spd.values
+        spd.zeros(SpectralShape(spd.shape.start, spd.shape.end, 10))
+        spd[spd.wavelengths] = _mi_20nm_interpolation_ASTME30815(values)
 
     XYZ = method(spd, cmfs, illuminant)
 
@@ -808,6 +869,659 @@ def spectral_to_XYZ(
     return function(spd, cmfs, illuminant, **kwargs)
 
 
+def multi_spectral_to_XYZ_integration(
+        msa,
+        shape,
+        cmfs=STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer'),
+        illuminant=ones_spd(STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer').shape)):
+    """
+    Converts given multi-spectral array to *CIE XYZ* tristimulus values
+    using given colour matching functions and illuminant accordingly to
+    classical integration method.
+
+    Parameters
+    ----------
+    msa : array_like, (..., W)
+        Multi-spectral array, the last axis holds the spectral data of each
+        sample at the wavelengths :math:`\lambda_n` defined by given spectral
+        shape.
+    shape : SpectralShape
+        Spectral shape of the multi-spectral array.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    See Also
+    --------
+    spectral_to_XYZ_integration
+
+    Warning
+    -------
+    The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+    -   The alignment of the multi-spectral array to the colour matching
+        functions shape being linear in the spectral data, it is performed on
+        the identity matrix and folded into the (W, 3) weights so that the
+        multi-spectral array is converted with a single matrix product.
+
+    Examples
+    --------
+    >>> from colour import CMFS, ILLUMINANTS_RELATIVE_SPDS
+    >>> cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+    >>> msa = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852]])
+    >>> illuminant = ILLUMINANTS_RELATIVE_SPDS.get('D50')
+    >>> multi_spectral_to_XYZ_integration(  # doctest: +ELLIPSIS
+    ...     msa, SpectralShape(400, 700, 20), cmfs, illuminant)
+    array([[ 11.5296285...,   9.9499467...,   4.7066079...],
+           [ 11.5296285...,   9.9499467...,   4.7066079...]])
+    """
+
+    if illuminant.shape != cmfs.shape:
+        warning('Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant, cmfs))
+        illuminant = illuminant.clone().align(cmfs.shape)
+
+    S = illuminant.values
+    y_bar = cmfs.values[..., 1]
+    dw = cmfs.shape.interval
+
+    k = 100 / (np.sum(y_bar * S) * dw)
+
+    W = k * cmfs.values * S[..., np.newaxis] * dw
+
+    if shape != cmfs.shape:
+        warning('Aligning "{0}" multi-spectral array shape to "{1}" colour '
+                'matching functions shape.'.format(shape, cmfs))
+        W = np.dot(MultiSpectralPowerDistribution(
+            'Identity', np.identity(len(shape.range())), shape).align(
+            cmfs.shape).values, W)
+
+    XYZ = np.dot(msa, W)
+
+    return XYZ
+
+
+def multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815(
+    msa,
+    shape,
+    cmfs=STANDARD_OBSERVERS_CMFS.get(
+        'CIE 1931 2 Degree Standard Observer'),
+    illuminant=ones_spd(STANDARD_OBSERVERS_CMFS.get(
+        'CIE 1931 2 Degree Standard Observer').shape)):
+    """
+    Converts given multi-spectral array to *CIE XYZ* tristimulus values
+    using given colour matching functions and illuminant using a table
+    of tristimulus weighting factors accordingly to practise
+    *ASTM E308–15* method [2]_.
+
+    Parameters
+    ----------
+    msa : array_like, (..., W)
+        Multi-spectral array, the last axis holds the spectral data of each
+        sample at the wavelengths :math:`\lambda_n` defined by given spectral
+        shape.
+    shape : SpectralShape
+        Spectral shape of the multi-spectral array.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    See Also
+    --------
+    spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815
+
+    Warning
+    -------
+    The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+
+    Examples
+    --------
+    >>> from colour import CMFS, ILLUMINANTS_RELATIVE_SPDS
+    >>> cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+    >>> msa = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852]])
+    >>> illuminant = ILLUMINANTS_RELATIVE_SPDS.get('D50')
+    >>> multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815(
+    ...     msa, SpectralShape(400, 700, 20), cmfs, illuminant)
+    ... # doctest: +ELLIPSIS
+    array([[ 11.5296311...,   9.9505845...,   4.7098037...],
+           [ 11.5296311...,   9.9505845...,   4.7098037...]])
+    """
+
+    if illuminant.shape != cmfs.shape:
+        warning('Aligning "{0}" illuminant shape to "{1}" colour matching '
+                'functions shape.'.format(illuminant, cmfs))
+        illuminant = illuminant.clone().align(cmfs.shape)
+
+    wavelengths = shape.range()
+    trimmed = np.logical_and(wavelengths >= cmfs.shape.start,
+                             wavelengths <= cmfs.shape.end)
+    if shape.boundaries != cmfs.shape.boundaries:
+        warning('Trimming "{0}" multi-spectral array shape to "{1}" '
+                'colour matching functions shape.'.format(shape, cmfs))
+        shape = SpectralShape(wavelengths[trimmed][0],
+                              wavelengths[trimmed][-1],
+                              shape.interval)
+
+    W = tristimulus_weighting_factors_ASTME202211(
+        cmfs, illuminant, SpectralShape(
+            cmfs.shape.start, cmfs.shape.end, shape.interval))
+    start_w = cmfs.shape.start
+    end_w = cmfs.shape.start + shape.interval * (W.shape[0] - 1)
+    W = adjust_tristimulus_weighting_factors_ASTME30815(
+        W, SpectralShape(start_w, end_w, shape.interval), shape)
+
+    # Trimmed wavelengths are given null weights.
+    W_t = np.zeros((len(wavelengths), 3))
+    W_t[trimmed] = W
+
+    XYZ = np.dot(msa, W_t)
+
+    return XYZ
+
+
+def multi_spectral_to_XYZ_ASTME30815(
+        msa,
+        shape,
+        cmfs=STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer'),
+        illuminant=ones_spd(
+            STANDARD_OBSERVERS_CMFS.get(
+                'CIE 1931 2 Degree Standard Observer').shape),
+        use_practice_range=True,
+        mi_5nm_omission_method=True,
+        mi_20nm_interpolation_method=True):
+    """
+    Converts given multi-spectral array to *CIE XYZ* tristimulus values
+    using given colour matching functions and illuminant accordingly to
+    practise *ASTM E308–15* method [2]_.
+
+    Parameters
+    ----------
+    msa : array_like, (..., W)
+        Multi-spectral array, the last axis holds the spectral data of each
+        sample at the wavelengths :math:`\lambda_n` defined by given spectral
+        shape.
+    shape : SpectralShape
+        Spectral shape of the multi-spectral array.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    use_practice_range : bool, optional
+        Practise *ASTM E308–15* working wavelengths range is [360, 780],
+        if `True` this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        5 nm measurement intervals multi-spectral array conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        20 nm measurement intervals multi-spectral array conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    See Also
+    --------
+    spectral_to_XYZ_ASTME30815
+
+    Warning
+    -------
+    -   See :func:`spectral_to_XYZ_ASTME30815` definition warning section.
+    -   The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+    -   The 20 nm measurement intervals interpolation method being linear in
+        the spectral data, it is performed on the identity matrix and folded
+        into the (W, 3) weights so that the multi-spectral array is converted
+        with a single matrix product.
+
+    Examples
+    --------
+    >>> from colour import CMFS, ILLUMINANTS_RELATIVE_SPDS
+    >>> cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+    >>> msa = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852]])
+    >>> illuminant = ILLUMINANTS_RELATIVE_SPDS.get('D50')
+    >>> multi_spectral_to_XYZ_ASTME30815(  # doctest: +ELLIPSIS
+    ...     msa, SpectralShape(400, 700, 20), cmfs, illuminant)
+    array([[ 11.5290265...,   9.9502091...,   4.7098882...],
+           [ 11.5290265...,   9.9502091...,   4.7098882...]])
+    """
+
+    if shape.interval not in (1, 5, 10, 20):
+        raise ValueError(
+            'Tristimulus values conversion from spectral data accordingly to '
+            'practise "ASTM E308-15" should be performed on spectral data '
+            'with measurement interval of 1, 5, 10 or 20nm!')
+
+    if use_practice_range:
+        cmfs = cmfs.clone().trim_wavelengths(SpectralShape(360, 780, 1))
+
+    method = multi_spectral_to_XYZ_tristimulus_weighting_factors_ASTME30815
+    if shape.interval == 1:
+        method = multi_spectral_to_XYZ_integration
+    elif shape.interval == 5 and mi_5nm_omission_method:
+        if cmfs.shape.interval != 5:
+            cmfs = cmfs.clone().interpolate(SpectralShape(interval=5))
+        method = multi_spectral_to_XYZ_integration
+    elif shape.interval == 20 and mi_20nm_interpolation_method:
+        wavelengths = shape.range()
+        R = np.identity(len(wavelengths))
+        if shape.boundaries != cmfs.shape.boundaries:
+            warning(
+                'Trimming "{0}" multi-spectral array shape to "{1}" colour '
+                'matching functions shape.'.format(shape, cmfs))
+            trimmed = np.logical_and(wavelengths >= cmfs.shape.start,
+                                     wavelengths <= cmfs.shape.end)
+            R = R[..., trimmed]
+            shape = SpectralShape(wavelengths[trimmed][0],
+                                  wavelengths[trimmed][-1],
+                                  shape.interval)
+
+        R_i = _mi_20nm_interpolation_ASTME30815(R)
+
+        W = method(R_i,
+                   SpectralShape(shape.start, shape.end, 10),
+                   cmfs,
+                   illuminant)
+
+        return np.dot(msa, W)
+
+    XYZ = method(msa, shape, cmfs, illuminant)
+
+    return XYZ
+
+
+MULTI_SPECTRAL_TO_XYZ_METHODS = CaseInsensitiveMapping(
+    {'ASTM E308–15': multi_spectral_to_XYZ_ASTME30815,
+     'Integration': multi_spectral_to_XYZ_integration})
+"""
+Supported multi-spectral array to *CIE XYZ* tristimulus values conversion
+methods
+
+MULTI_SPECTRAL_TO_XYZ_METHODS : CaseInsensitiveMapping
+    **{'ASTM E308–15', 'Integration'}**
+
+Aliases:
+
+-   'astm2015': 'ASTM E308–15'
+"""
+MULTI_SPECTRAL_TO_XYZ_METHODS['astm2015'] = (
+    MULTI_SPECTRAL_TO_XYZ_METHODS['ASTM E308–15'])
+
+
+def multi_spectral_to_XYZ(
+        msa,
+        shape=None,
+        cmfs=STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer'),
+        illuminant=ones_spd(STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer').shape),
+        method='ASTM E308–15',
+        **kwargs):
+    """
+    Converts given multi-spectral array or multi-spectral power distribution
+    to *CIE XYZ* tristimulus values using given colour matching functions,
+    illuminant and method.
+
+    Parameters
+    ----------
+    msa : array_like or MultiSpectralPowerDistribution
+        Multi-spectral array of shape (..., W) or multi-spectral power
+        distribution.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral array, required if ``msa`` is
+        not a :class:`MultiSpectralPowerDistribution` class instance.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    method : unicode, optional
+        **{'ASTM E308–15', 'Integration'}**,
+        Computation method.
+
+    Other Parameters
+    ----------------
+    use_practice_range : bool, optional
+        {:func:`multi_spectral_to_XYZ_ASTME30815`},
+        Practise *ASTM E308–15* working wavelengths range is [360, 780],
+        if `True` this argument will trim the colour matching functions
+        appropriately.
+    mi_5nm_omission_method : bool, optional
+        {:func:`multi_spectral_to_XYZ_ASTME30815`},
+        5 nm measurement intervals multi-spectral array conversion to
+        tristimulus values will use a 5 nm version of the colour matching
+        functions instead of a table of tristimulus weighting factors.
+    mi_20nm_interpolation_method : bool, optional
+        {:func:`multi_spectral_to_XYZ_ASTME30815`},
+        20 nm measurement intervals multi-spectral array conversion to
+        tristimulus values will use a dedicated interpolation method instead
+        of a table of tristimulus weighting factors.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    See Also
+    --------
+    spectral_to_XYZ
+
+    Warning
+    -------
+    The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+
+    Examples
+    --------
+    >>> from colour import (
+    ...     CMFS, ILLUMINANTS_RELATIVE_SPDS, MultiSpectralPowerDistribution)
+    >>> cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+    >>> msa = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852]])
+    >>> illuminant = ILLUMINANTS_RELATIVE_SPDS.get('D50')
+    >>> multi_spectral_to_XYZ(  # doctest: +ELLIPSIS
+    ...     msa, SpectralShape(400, 700, 20), cmfs, illuminant)
+    array([[ 11.5290265...,   9.9502091...,   4.7098882...],
+           [ 11.5290265...,   9.9502091...,   4.7098882...]])
+    >>> multi_spd = MultiSpectralPowerDistribution(
+    ...     'Samples', msa, SpectralShape(400, 700, 20))
+    >>> multi_spectral_to_XYZ(  # doctest: +ELLIPSIS
+    ...     multi_spd, cmfs=cmfs, illuminant=illuminant,
+    ...     method='Integration')
+    array([[ 11.5296285...,   9.9499467...,   4.7066079...],
+           [ 11.5296285...,   9.9499467...,   4.7066079...]])
+    """
+
+    if isinstance(msa, MultiSpectralPowerDistribution):
+        shape, msa = msa.shape, msa.values
+
+    assert shape is not None, (
+        '"shape" argument must be given for multi-spectral array!')
+
+    function = MULTI_SPECTRAL_TO_XYZ_METHODS[method]
+
+    return function(msa, shape, cmfs, illuminant,
+                    **filter_kwargs(function, **kwargs))
+
+
+PARALLEL_CHUNK_SIZE = 16384
+"""
+Count of spectral samples converted by each task of
+:func:`multi_spectral_to_XYZ_parallel` definition.
+
+PARALLEL_CHUNK_SIZE : int
+"""
+
+PARALLEL_EXECUTORS = CaseInsensitiveMapping(
+    {'Thread': 'ThreadPoolExecutor',
+     'Process': 'ProcessPoolExecutor'})
+"""
+Supported :func:`multi_spectral_to_XYZ_parallel` definition executors and
+their :mod:`concurrent.futures` module class names, the module is only
+imported when converting.
+
+PARALLEL_EXECUTORS : CaseInsensitiveMapping
+    **{'Thread', 'Process'}**
+"""
+
+
+def _multi_spectral_to_XYZ_chunk(msa, W, start, end):
+    """
+    Converts given multi-spectral array chunk to *CIE XYZ* tristimulus values
+    using given table of weights, this definition is the
+    :func:`multi_spectral_to_XYZ_parallel` definition workers task.
+
+    Parameters
+    ----------
+    msa : ndarray or SharedArrayHandle
+        Multi-spectral array of shape (N, W) or handle to it.
+    W : ndarray, (W, 3)
+        Table of weights.
+    start : int
+        Chunk start index.
+    end : int
+        Chunk end index.
+
+    Returns
+    -------
+    ndarray, (end - start, 3)
+        *CIE XYZ* tristimulus values.
+    """
+
+    from colour.utilities.sharing import SharedArrayHandle, attach_shared_array
+
+    if isinstance(msa, SharedArrayHandle):
+        msa = attach_shared_array(msa)
+
+    return np.dot(msa[start:end], W)
+
+
+def multi_spectral_to_XYZ_parallel(
+        msa,
+        shape=None,
+        cmfs=STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer'),
+        illuminant=ones_spd(STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer').shape),
+        method='ASTM E308–15',
+        executor='Thread',
+        workers=None,
+        chunk_size=PARALLEL_CHUNK_SIZE,
+        out=None,
+        **kwargs):
+    """
+    Converts given large multi-spectral array or multi-spectral power
+    distribution to *CIE XYZ* tristimulus values by splitting it into chunks
+    converted concurrently by a pool of workers.
+
+    Parameters
+    ----------
+    msa : array_like or MultiSpectralPowerDistribution
+        Multi-spectral array of shape (..., W) or multi-spectral power
+        distribution.
+    shape : SpectralShape, optional
+        Spectral shape of the multi-spectral array, required if ``msa`` is
+        not a :class:`MultiSpectralPowerDistribution` class instance.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    method : unicode, optional
+        **{'ASTM E308–15', 'Integration'}**,
+        Computation method.
+    executor : unicode, optional
+        **{'Thread', 'Process'}**,
+        Workers pool executor.
+    workers : int, optional
+        Workers count, default to :func:`multiprocessing.cpu_count`
+        definition.
+    chunk_size : int, optional
+        Count of spectral samples converted by each task.
+    out : ndarray, optional
+        *C-contiguous* array of shape (..., 3) the *CIE XYZ* tristimulus values
+        are written into as the tasks complete, e.g. a
+        :class:`numpy.memmap` class instance.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments passed to :func:`multi_spectral_to_XYZ`
+        definition.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        *CIE XYZ* tristimulus values.
+
+    See Also
+    --------
+    multi_spectral_to_XYZ
+
+    Warning
+    -------
+    The output range of that definition is non standard!
+
+    Notes
+    -----
+    -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+    -   The conversion methods being linear in the spectral data, the (W, 3)
+        table of weights is computed once by converting the identity matrix
+        with :func:`multi_spectral_to_XYZ` definition, the workers then only
+        perform a matrix product on their chunk.
+    -   The chunks boundaries only depend on ``chunk_size`` argument: the
+        results are deterministic regardless of the executor and workers
+        count.
+    -   The *Thread* executor shares the multi-spectral array with the
+        workers, *Numpy* releasing the *GIL* during the matrix product. The
+        *Process* executor hands the workers a lightweight handle to the file
+        of a *memory-mapped* multi-spectral array, e.g. as returned by
+        :func:`numpy.load` definition with ``mmap_mode`` argument, the
+        multi-spectral array is otherwise published once with
+        :class:`colour.utilities.sharing.SharedArray` class.
+    -   At most twice as many tasks as workers are in flight at any time.
+
+    Examples
+    --------
+    >>> from colour import CMFS, ILLUMINANTS_RELATIVE_SPDS
+    >>> cmfs = CMFS.get('CIE 1931 2 Degree Standard Observer')
+    >>> msa = np.array([
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852],
+    ...     [0.0641, 0.0645, 0.0562, 0.0537, 0.0559, 0.0651, 0.0705, 0.0772,
+    ...      0.0870, 0.1128, 0.1360, 0.1511, 0.1688, 0.1996, 0.2397, 0.2852]])
+    >>> illuminant = ILLUMINANTS_RELATIVE_SPDS.get('D50')
+    >>> multi_spectral_to_XYZ_parallel(  # doctest: +ELLIPSIS
+    ...     msa, SpectralShape(400, 700, 20), cmfs, illuminant,
+    ...     workers=2, chunk_size=1)
+    array([[ 11.5290265...,   9.9502091...,   4.7098882...],
+           [ 11.5290265...,   9.9502091...,   4.7098882...]])
+    """
+
+    import concurrent.futures
+    import mmap
+    import multiprocessing
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    from colour.utilities.sharing import SharedArray, SharedArrayHandle
+
+    if isinstance(msa, MultiSpectralPowerDistribution):
+        shape, msa = msa.shape, msa.values
+
+    assert shape is not None, (
+        '"shape" argument must be given for multi-spectral array!')
+
+    wavelengths_c = len(shape.range())
+    W = multi_spectral_to_XYZ(
+        np.identity(wavelengths_c), shape, cmfs, illuminant, method, **kwargs)
+
+    handle = None
+    if (isinstance(msa, np.memmap) and isinstance(msa.base, mmap.mmap) and
+            msa.flags.c_contiguous):
+        handle = SharedArrayHandle(
+            'Memory Map', msa.filename, msa.dtype.str,
+            (msa.size // wavelengths_c, wavelengths_c), msa.offset)
+
+    msa = np.asarray(msa)
+    output_shape = msa.shape[:-1] + (3,)
+    msa = np.reshape(msa, (-1, wavelengths_c))
+    samples_c = msa.shape[0]
+
+    if out is None:
+        out = np.empty(output_shape)
+
+    assert out.shape == output_shape and out.flags.c_contiguous, (
+        '"out" argument must be a "C-contiguous" array of "{0}" '
+        'shape!'.format(output_shape))
+
+    XYZ = np.reshape(out, (samples_c, 3))
+
+    workers = workers if workers else multiprocessing.cpu_count()
+    executor = getattr(concurrent.futures, PARALLEL_EXECUTORS[executor])
+
+    def collect(futures, done):
+        """
+        Writes given completed futures results into the output array.
+        """
+
+        for future in done:
+            start = futures.pop(future)
+            XYZ[start:start + chunk_size] = future.result()
+
+    shared_array = None
+    if executor is ProcessPoolExecutor and handle is None:
+        shared_array = SharedArray(msa)
+        handle = shared_array.handle
+
+    try:
+        with executor(max_workers=workers) as pool:
+            futures = {}
+            for start in range(0, samples_c, chunk_size):
+                if len(futures) >= 2 * workers:
+                    done, _pending = wait(futures,
+                                          return_when=FIRST_COMPLETED)
+                    collect(futures, done)
+
+                futures[pool.submit(
+                    _multi_spectral_to_XYZ_chunk,
+                    handle if executor is ProcessPoolExecutor else msa,
+                    W,
+                    start,
+                    min(start + chunk_size, samples_c))] = start
+
+            collect(futures, list(futures))
+    finally:
+        if shared_array is not None:
+            shared_array.close()
+
+    return out
+
+
 def wavelength_to_XYZ(wavelength,
                       cmfs=STANDARD_OBSERVERS_CMFS.get(
                           'CIE 1931 2 Degree Standard Observer'),
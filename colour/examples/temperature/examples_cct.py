@@ -27,6 +27,15 @@ print(colour.uv_to_CCT_Ohno2013(uv, cmfs=cmfs, iterations=3))
 
 print('\n')
 
+message_box(('Converting to "CCT" and "D_uv" from given "CIE UCS" colourspace '
+             '"uv" chromaticity coordinates using "Planckian Locus Table" '
+             'method:\n'
+             '\n\t{0}'.format(uv)))
+print(colour.uv_to_CCT_planckian_locus_table(uv, cmfs=cmfs))
+print(colour.uv_to_CCT(uv, method='Planckian Locus Table', cmfs=cmfs))
+
+print('\n')
+
 message_box(('Converting to "CCT" and "D_uv" from given "CIE UCS" colourspace '
              '"uv" chromaticity coordinates using "Robertson (1968)" method:\n'
              '\n\t{0}'.format(uv)))
@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Hyperspectral Cubes Input / Output
+==================================
+
+Defines various input / output objects for hyperspectral cubes, i.e.
+multi-spectral arrays of shape (H, W, B) where *B* is the bands count:
+
+-   :func:`read_hyperspectral_cube`
+-   :func:`hyperspectral_cube_to_XYZ`
+-   :func:`hyperspectral_cube_to_RGB`
+
+The conversion objects are streaming the cubes in tiles of rows so that
+arbitrarily large memory-mapped cubes can be converted with bounded memory.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.colorimetry import (
+    STANDARD_OBSERVERS_CMFS,
+    multi_spectral_to_XYZ,
+    ones_spd)
+from colour.models import XYZ_to_RGB, XYZ_to_xy
+from colour.utilities import CaseInsensitiveMapping
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['HYPERSPECTRAL_INTERLEAVES',
+           'DEFAULT_HYPERSPECTRAL_TILE_SIZE',
+           'read_hyperspectral_cube',
+           'hyperspectral_cube_to_XYZ',
+           'hyperspectral_cube_to_RGB']
+
+HYPERSPECTRAL_INTERLEAVES = CaseInsensitiveMapping(
+    {'BIL': ((0, 2, 1), lambda h, w, b: (h, b, w)),
+     'BIP': ((0, 1, 2), lambda h, w, b: (h, w, b)),
+     'BSQ': ((1, 2, 0), lambda h, w, b: (b, h, w))})
+"""
+Supported raw hyperspectral cubes interleaves: the axes permutation returning
+a (H, W, B) view of the file layout and the file layout shape builder.
+
+HYPERSPECTRAL_INTERLEAVES : CaseInsensitiveMapping
+    **{'BIL', 'BIP', 'BSQ'}**
+"""
+
+DEFAULT_HYPERSPECTRAL_TILE_SIZE = 64
+"""
+Default rows count of the tiles processed at once.
+
+DEFAULT_HYPERSPECTRAL_TILE_SIZE : int
+"""
+
+
+def read_hyperspectral_cube(path,
+                            shape=None,
+                            dtype=np.float32,
+                            interleave='BIL',
+                            offset=0):
+    """
+    Reads given hyperspectral cube file as a read-only memory-mapped array of
+    shape (H, W, B).
+
+    Parameters
+    ----------
+    path : unicode
+        Hyperspectral cube file path, either a *.npy* file storing a (H, W, B)
+        array or a headerless raw band-interleaved file.
+    shape : array_like, optional
+        (H, W, B) shape of the cube, required for raw files.
+    dtype : object, optional
+        Data type of the raw file samples.
+    interleave : unicode, optional
+        **{'BIL', 'BIP', 'BSQ'}**,
+        Raw file interleave: *Band Interleaved by Line* (H, B, W), *Band
+        Interleaved by Pixel* (H, W, B) or *Band Sequential* (B, H, W).
+    offset : int, optional
+        Raw file header size in bytes.
+
+    Returns
+    -------
+    ndarray
+        Memory-mapped hyperspectral cube view of shape (H, W, B).
+
+    Notes
+    -----
+    -   The file content is not read until the returned array is accessed.
+
+    Examples
+    --------
+    >>> import os
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'cube.raw')
+    >>> np.arange(24, dtype=np.float32).tofile(path)
+    >>> cube = read_hyperspectral_cube(path, (2, 3, 4), interleave='BIL')
+    >>> cube.shape
+    (2, 3, 4)
+    >>> cube[0, 0]
+    memmap([ 0.,  3.,  6.,  9.], dtype=float32)
+    """
+
+    if path.lower().endswith('.npy'):
+        cube = np.load(path, mmap_mode='r')
+
+        assert cube.ndim == 3, (
+            '"{0}" cube must be 3-dimensional!'.format(path))
+
+        return cube
+
+    assert shape is not None, (
+        '"shape" must be given for raw hyperspectral cubes!')
+
+    axes, layout = HYPERSPECTRAL_INTERLEAVES.get(interleave)
+    cube = np.memmap(path,
+                     dtype=dtype,
+                     mode='r',
+                     offset=offset,
+                     shape=layout(*shape))
+
+    return np.transpose(cube, axes)
+
+
+def _hyperspectral_cube_output(cube, output, channels=3):
+    """
+    Returns the writable output array for given hyperspectral cube.
+
+    Parameters
+    ----------
+    cube : ndarray
+        Hyperspectral cube of shape (H, W, B).
+    output : unicode or ndarray, optional
+        *.npy* file path or array of shape (H, W, channels), a new array is
+        allocated if *None*.
+    channels : int, optional
+        Output channels count.
+
+    Returns
+    -------
+    ndarray
+        Writable output array.
+    """
+
+    shape = (cube.shape[0], cube.shape[1], channels)
+
+    if output is None:
+        return np.zeros(shape)
+    elif isinstance(output, np.ndarray):
+        assert output.shape == shape, (
+            'Output array shape must be "{0}"!'.format(shape))
+
+        return output
+    else:
+        return np.lib.format.open_memmap(
+            output, mode='w+', dtype=np.float_, shape=shape)
+
+
+def _hyperspectral_cube_stream(cube, output, function, tile_size):
+    """
+    Applies given function to given hyperspectral cube tiles of rows and
+    writes the results into given output array.
+
+    Parameters
+    ----------
+    cube : ndarray
+        Hyperspectral cube of shape (H, W, B).
+    output : ndarray
+        Writable output array.
+    function : callable
+        Function converting a tile of shape (h, W, B).
+    tile_size : int
+        Rows count of the tiles.
+
+    Returns
+    -------
+    ndarray
+        Output array.
+    """
+
+    tile_size = max(int(tile_size), 1)
+    for i in range(0, cube.shape[0], tile_size):
+        output[i:i + tile_size] = function(
+            np.asarray(cube[i:i + tile_size], dtype=np.float_))
+
+        if isinstance(output, np.memmap):
+            output.flush()
+
+    return output
+
+
+def hyperspectral_cube_to_XYZ(
+        cube,
+        shape,
+        output=None,
+        cmfs=STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer'),
+        illuminant=ones_spd(STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer').shape),
+        method='ASTM E308–15',
+        tile_size=DEFAULT_HYPERSPECTRAL_TILE_SIZE,
+        **kwargs):
+    """
+    Converts given hyperspectral cube to *CIE XYZ* tristimulus values by
+    streaming it in tiles of rows.
+
+    Parameters
+    ----------
+    cube : array_like
+        Hyperspectral cube of shape (H, W, B), typically returned by
+        :func:`read_hyperspectral_cube` definition.
+    shape : SpectralShape
+        Spectral shape of the hyperspectral cube bands.
+    output : unicode or ndarray, optional
+        *.npy* file path or array of shape (H, W, 3) the *CIE XYZ* tristimulus
+        values are incrementally written to, a new array is allocated if
+        *None*.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    method : unicode, optional
+        **{'ASTM E308–15', 'Integration'}**,
+        Computation method.
+    tile_size : int, optional
+        Rows count of the tiles processed at once.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments passed to :func:`multi_spectral_to_XYZ`
+        definition.
+
+    Returns
+    -------
+    ndarray
+        *CIE XYZ* tristimulus values of shape (H, W, 3).
+
+    Notes
+    -----
+    -   The conversion being linear in the spectral data, the weights of the
+        bands are computed once by :func:`multi_spectral_to_XYZ` definition
+        and each tile is converted with a single matrix product.
+    -   Output *CIE XYZ* tristimulus values are in range [0, 100].
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> cube = np.full((2, 2, 41), 0.5)
+    >>> hyperspectral_cube_to_XYZ(
+    ...     cube, SpectralShape(400, 800, 10))[0, 0]  # doctest: +ELLIPSIS
+    array([ 50.0038354...,  50.        ,  50.0166274...])
+    """
+
+    cube = np.asarray(cube)
+    assert cube.shape[-1] == len(shape.range()), (
+        'Cube bands count must match "{0}" spectral shape!'.format(shape))
+
+    W = multi_spectral_to_XYZ(
+        np.identity(cube.shape[-1]), shape, cmfs, illuminant, method,
+        **kwargs)
+
+    return _hyperspectral_cube_stream(
+        cube,
+        _hyperspectral_cube_output(cube, output),
+        lambda x: np.dot(x, W),
+        tile_size)
+
+
+def hyperspectral_cube_to_RGB(
+        cube,
+        shape,
+        colourspace,
+        output=None,
+        cmfs=STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer'),
+        illuminant=ones_spd(STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer').shape),
+        method='ASTM E308–15',
+        chromatic_adaptation_transform='CAT02',
+        apply_encoding_cctf=True,
+        tile_size=DEFAULT_HYPERSPECTRAL_TILE_SIZE,
+        **kwargs):
+    """
+    Converts given hyperspectral cube to given *RGB* colourspace by streaming
+    it in tiles of rows.
+
+    Parameters
+    ----------
+    cube : array_like
+        Hyperspectral cube of shape (H, W, B), typically returned by
+        :func:`read_hyperspectral_cube` definition.
+    shape : SpectralShape
+        Spectral shape of the hyperspectral cube bands.
+    colourspace : RGB_Colourspace
+        Output *RGB* colourspace.
+    output : unicode or ndarray, optional
+        *.npy* file path or array of shape (H, W, 3) the *RGB* colourspace
+        array is incrementally written to, a new array is allocated if
+        *None*.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    method : unicode, optional
+        **{'ASTM E308–15', 'Integration'}**,
+        Computation method.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* transform, from the illuminant whitepoint to
+        the *RGB* colourspace whitepoint.
+    apply_encoding_cctf : bool, optional
+        Apply the *RGB* colourspace encoding colour component transfer
+        function.
+    tile_size : int, optional
+        Rows count of the tiles processed at once.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments passed to :func:`multi_spectral_to_XYZ`
+        definition.
+
+    Returns
+    -------
+    ndarray
+        *RGB* colourspace array of shape (H, W, 3).
+
+    Examples
+    --------
+    >>> from colour import SpectralShape
+    >>> from colour.models import sRGB_COLOURSPACE
+    >>> cube = np.full((2, 2, 41), 0.5)
+    >>> hyperspectral_cube_to_RGB(
+    ...     cube, SpectralShape(400, 800, 10),
+    ...     sRGB_COLOURSPACE)[0, 0]  # doctest: +ELLIPSIS
+    array([ 0.7353...,  0.7353...,  0.7353...])
+    """
+
+    cube = np.asarray(cube)
+    assert cube.shape[-1] == len(shape.range()), (
+        'Cube bands count must match "{0}" spectral shape!'.format(shape))
+
+    W = multi_spectral_to_XYZ(
+        np.identity(cube.shape[-1]), shape, cmfs, illuminant, method,
+        **kwargs) / 100
+    xy = XYZ_to_xy(np.sum(W, axis=0))
+    encoding_cctf = (colourspace.encoding_cctf
+                     if apply_encoding_cctf else None)
+
+    return _hyperspectral_cube_stream(
+        cube,
+        _hyperspectral_cube_output(cube, output),
+        lambda x: XYZ_to_RGB(np.dot(x, W),
+                             xy,
+                             colourspace.whitepoint,
+                             colourspace.XYZ_to_RGB_matrix,
+                             chromatic_adaptation_transform,
+                             encoding_cctf),
+        tile_size)
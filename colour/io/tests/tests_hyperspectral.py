@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.io.hyperspectral` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import unittest
+import tempfile
+
+from colour.colorimetry import (
+    ILLUMINANTS_RELATIVE_SPDS,
+    SpectralShape,
+    multi_spectral_to_XYZ)
+from colour.io import (
+    read_hyperspectral_cube,
+    hyperspectral_cube_to_XYZ,
+    hyperspectral_cube_to_RGB)
+from colour.models import XYZ_to_RGB, XYZ_to_xy, sRGB_COLOURSPACE
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['CUBE_SHAPE',
+           'CUBE',
+           'TestReadHyperspectralCube',
+           'TestHyperspectralCubeToXYZ',
+           'TestHyperspectralCubeToRGB']
+
+CUBE_SHAPE = SpectralShape(400, 700, 20)
+
+CUBE = np.random.RandomState(4).uniform(
+    size=(7, 5, len(CUBE_SHAPE.range())))
+
+
+class TestReadHyperspectralCube(unittest.TestCase):
+    """
+    Defines :func:`colour.io.hyperspectral.read_hyperspectral_cube`
+    definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_hyperspectral_cube(self):
+        """
+        Tests :func:`colour.io.hyperspectral.read_hyperspectral_cube`
+        definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'cube.npy')
+        np.save(path, CUBE)
+        np.testing.assert_equal(read_hyperspectral_cube(path), CUBE)
+
+        for interleave, axes in (('BIL', (0, 2, 1)),
+                                 ('BIP', (0, 1, 2)),
+                                 ('BSQ', (2, 0, 1))):
+            path = os.path.join(self._temporary_directory,
+                                'cube.{0}'.format(interleave.lower()))
+            np.transpose(CUBE, axes).astype(np.float32).tofile(path)
+
+            cube = read_hyperspectral_cube(
+                path, CUBE.shape, interleave=interleave)
+            self.assertTupleEqual(cube.shape, CUBE.shape)
+            np.testing.assert_equal(cube, CUBE.astype(np.float32))
+
+
+class TestHyperspectralCubeToXYZ(unittest.TestCase):
+    """
+    Defines :func:`colour.io.hyperspectral.hyperspectral_cube_to_XYZ`
+    definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_hyperspectral_cube_to_XYZ(self):
+        """
+        Tests :func:`colour.io.hyperspectral.hyperspectral_cube_to_XYZ`
+        definition.
+        """
+
+        illuminant = ILLUMINANTS_RELATIVE_SPDS.get('D65')
+        for method in ('ASTM E308–15', 'Integration'):
+            XYZ = multi_spectral_to_XYZ(
+                CUBE, CUBE_SHAPE, illuminant=illuminant, method=method)
+
+            for tile_size in (1, 3, 64):
+                np.testing.assert_almost_equal(
+                    hyperspectral_cube_to_XYZ(
+                        CUBE,
+                        CUBE_SHAPE,
+                        illuminant=illuminant,
+                        method=method,
+                        tile_size=tile_size),
+                    XYZ,
+                    decimal=10)
+
+        path = os.path.join(self._temporary_directory, 'XYZ.npy')
+        hyperspectral_cube_to_XYZ(CUBE, CUBE_SHAPE, path, tile_size=2)
+        np.testing.assert_almost_equal(
+            np.load(path),
+            multi_spectral_to_XYZ(CUBE, CUBE_SHAPE),
+            decimal=10)
+
+        output = np.zeros((7, 5, 3))
+        self.assertIs(
+            hyperspectral_cube_to_XYZ(CUBE, CUBE_SHAPE, output), output)
+
+
+class TestHyperspectralCubeToRGB(unittest.TestCase):
+    """
+    Defines :func:`colour.io.hyperspectral.hyperspectral_cube_to_RGB`
+    definition units tests methods.
+    """
+
+    def test_hyperspectral_cube_to_RGB(self):
+        """
+        Tests :func:`colour.io.hyperspectral.hyperspectral_cube_to_RGB`
+        definition.
+        """
+
+        illuminant = ILLUMINANTS_RELATIVE_SPDS.get('A')
+        XYZ = multi_spectral_to_XYZ(
+            CUBE, CUBE_SHAPE, illuminant=illuminant) / 100
+        XYZ_w = multi_spectral_to_XYZ(
+            np.ones(len(CUBE_SHAPE.range())),
+            CUBE_SHAPE,
+            illuminant=illuminant) / 100
+        RGB = XYZ_to_RGB(XYZ,
+                         XYZ_to_xy(XYZ_w),
+                         sRGB_COLOURSPACE.whitepoint,
+                         sRGB_COLOURSPACE.XYZ_to_RGB_matrix,
+                         'Bradford',
+                         sRGB_COLOURSPACE.encoding_cctf)
+
+        np.testing.assert_almost_equal(
+            hyperspectral_cube_to_RGB(
+                CUBE,
+                CUBE_SHAPE,
+                sRGB_COLOURSPACE,
+                illuminant=illuminant,
+                chromatic_adaptation_transform='Bradford',
+                tile_size=2),
+            RGB,
+            decimal=10)
+
+        np.testing.assert_almost_equal(
+            hyperspectral_cube_to_RGB(
+                np.ones((1, 1, len(CUBE_SHAPE.range()))),
+                CUBE_SHAPE,
+                sRGB_COLOURSPACE,
+                apply_encoding_cctf=False),
+            np.ones((1, 1, 3)),
+            decimal=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
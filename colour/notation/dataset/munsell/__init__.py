@@ -3,23 +3,27 @@
 
 from __future__ import absolute_import
 
-from .all import MUNSELL_COLOURS_ALL
-from .experimental import MUNSELL_COLOURS_1929
-from .real import MUNSELL_COLOURS_REAL
-from colour.utilities import CaseInsensitiveMapping
-
-__all__ = ['MUNSELL_COLOURS_ALL']
-__all__ += ['MUNSELL_COLOURS_1929']
-__all__ += ['MUNSELL_COLOURS_REAL']
-
-MUNSELL_COLOURS = CaseInsensitiveMapping({
-    'Munsell Colours All': MUNSELL_COLOURS_ALL,
-    'Munsell Colours 1929': MUNSELL_COLOURS_1929,
-    'Munsell Colours Real': MUNSELL_COLOURS_REAL})
+from functools import partial
+
+from colour.utilities import LazyCaseInsensitiveMapping
+from colour.utilities.packing import dataset_pack_data
+
+__all__ = []
+
+MUNSELL_COLOURS = LazyCaseInsensitiveMapping({
+    'Munsell Colours All': partial(
+        dataset_pack_data, '{0}.all'.format(__name__), 'MUNSELL_COLOURS_ALL'),
+    'Munsell Colours 1929': partial(
+        dataset_pack_data, '{0}.experimental'.format(__name__),
+        'MUNSELL_COLOURS_1929'),
+    'Munsell Colours Real': partial(
+        dataset_pack_data, '{0}.real'.format(__name__),
+        'MUNSELL_COLOURS_REAL')})
 """
-Aggregated *Munsell* colours.
+Aggregated *Munsell* colours, read from the bundled datasets array pack if
+available.
 
-MUNSELL_COLOURS : CaseInsensitiveMapping
+MUNSELL_COLOURS : LazyCaseInsensitiveMapping
 
 Aliases:
 
@@ -27,8 +31,11 @@ Aliases:
 -   '1929': 'Munsell Colours 1929'
 -   'real': 'Munsell Colours Real'
 """
-MUNSELL_COLOURS['all'] = MUNSELL_COLOURS['Munsell Colours All']
-MUNSELL_COLOURS['1929'] = MUNSELL_COLOURS['Munsell Colours 1929']
-MUNSELL_COLOURS['real'] = MUNSELL_COLOURS['Munsell Colours Real']
+MUNSELL_COLOURS['all'] = partial(
+    MUNSELL_COLOURS.__getitem__, 'Munsell Colours All')
+MUNSELL_COLOURS['1929'] = partial(
+    MUNSELL_COLOURS.__getitem__, 'Munsell Colours 1929')
+MUNSELL_COLOURS['real'] = partial(
+    MUNSELL_COLOURS.__getitem__, 'Munsell Colours Real')
 
 __all__ += ['MUNSELL_COLOURS']
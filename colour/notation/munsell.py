@@ -59,13 +59,14 @@ from colour.constants import (
     FLOATING_POINT_NUMBER_PATTERN)
 from colour.models import Lab_to_LCHab, XYZ_to_Lab, XYZ_to_xy, xyY_to_XYZ
 from colour.volume import is_within_macadam_limits
-from colour.notation import MUNSELL_COLOURS_ALL
+from colour.notation import MUNSELL_COLOURS
 from colour.utilities import (
     CaseInsensitiveMapping,
     Lookup,
     is_integer,
     is_numeric,
-    tsplit)
+    tsplit,
+    tstack)
 
 __author__ = 'Colour Developers, Paul Centore'
 __copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
@@ -145,6 +146,7 @@ MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES = ILLUMINANTS.get(
 _MUNSELL_SPECIFICATIONS_CACHE = None
 _MUNSELL_VALUE_ASTM_D1535_08_INTERPOLATOR_CACHE = None
 _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE = None
+_MUNSELL_RENOTATION_TABLES_CACHE = None
 
 
 def _munsell_specifications():
@@ -177,7 +179,7 @@ def _munsell_specifications():
         _MUNSELL_SPECIFICATIONS_CACHE = [
             munsell_colour_to_munsell_specification(
                 MUNSELL_COLOUR_FORMAT.format(*colour[0]))
-            for colour in MUNSELL_COLOURS_ALL]
+            for colour in MUNSELL_COLOURS['Munsell Colours All']]
     return _MUNSELL_SPECIFICATIONS_CACHE
 
 
@@ -217,7 +219,7 @@ def _munsell_maximum_chromas_from_renotation():
     global _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
     if _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE is None:
         chromas = OrderedDict()
-        for munsell_colour in MUNSELL_COLOURS_ALL:
+        for munsell_colour in MUNSELL_COLOURS['Munsell Colours All']:
             hue, value, chroma, code = munsell_colour_to_munsell_specification(
                 MUNSELL_COLOUR_FORMAT.format(*munsell_colour[0]))
             index = (hue, value, code)
@@ -231,6 +233,63 @@ def _munsell_maximum_chromas_from_renotation():
     return _MUNSELL_MAXIMUM_CHROMAS_FROM_RENOTATION_CACHE
 
 
+def _munsell_renotation_tables():
+    """
+    Returns the *Munsell Renotation System* data, maximum *Munsell* chromas
+    and ovoids radial interpolation usage for the integer *Munsell* values as
+    dense tables and caches them if not existing.
+
+    The *CIE xyY* colourspace table is indexed by the hue divided by 2.5, the
+    value, the chroma divided by 2 and the code, the maximum chromas table is
+    indexed by the hue divided by 2.5, the value and the code. The entries
+    missing from the *Munsell Renotation System* data are set to *nan*.
+
+    The radial interpolation table is indexed by the value, the chroma divided
+    by 2 and the *ASTM* hue divided by 2.5.
+
+    Returns
+    -------
+    tuple
+        *CIE xyY* colourspace table of shape (5, 11, 26, 11, 3), maximum
+        *Munsell* chromas table of shape (5, 11, 11) and radial interpolation
+        table of shape (10, 26, 40).
+    """
+
+    global _MUNSELL_RENOTATION_TABLES_CACHE
+    if _MUNSELL_RENOTATION_TABLES_CACHE is None:
+        xyY_table = np.full((5, 11, 26, 11, 3), np.nan)
+        for (hue, value, chroma, code), munsell_colour in zip(
+                _munsell_specifications(),
+                MUNSELL_COLOURS['Munsell Colours All']):
+            if value % 1 == 0:
+                xyY_table[int(round(hue / 2.5)), int(value),
+                          int(round(chroma / 2)), code] = munsell_colour[1]
+
+        chromas_table = np.full((5, 11, 11), np.nan)
+        for (hue, value, code), chroma in (
+                _munsell_maximum_chromas_from_renotation()):
+            if value % 1 == 0:
+                chromas_table[int(round(hue / 2.5)), int(value), code] = chroma
+
+        # The *ASTM* hue ranges bounds are multiples of 2.5, the radial
+        # interpolation is thus tabulated for each 2.5 wide *ASTM* hue range.
+        radial_table = np.zeros((10, 26, 40), dtype=np.bool_)
+        ASTM_hues = np.arange(40) * 2.5 + 1.25
+        for (value, chroma_minimum, chroma_maximum,
+             ASTM_hues_ranges) in _RENOTATION_OVOID_RADIAL_ASTM_HUES:
+            chromas = np.arange(26) * 2
+            chromas = np.logical_and(chromas >= chroma_minimum,
+                                     chromas <= chroma_maximum)
+            for ASTM_hue_minimum, ASTM_hue_maximum in ASTM_hues_ranges:
+                radial_table[value, chromas] |= np.logical_and(
+                    ASTM_hues > ASTM_hue_minimum,
+                    ASTM_hues < ASTM_hue_maximum)
+
+        _MUNSELL_RENOTATION_TABLES_CACHE = (
+            xyY_table, chromas_table, radial_table)
+    return _MUNSELL_RENOTATION_TABLES_CACHE
+
+
 def munsell_value_Priest1920(Y):
     """
     Returns the *Munsell* value :math:`V` of given *luminance* :math:`Y` using
@@ -665,26 +724,36 @@ def xyY_to_munsell_specification(xyY):
 
     Parameters
     ----------
-    xyY : array_like, (3,)
+    xyY : array_like
         *CIE xyY* colourspace array.
 
     Returns
     -------
-    numeric or tuple
-        *Munsell* *Colorlab* specification.
+    numeric or tuple or ndarray
+        *Munsell* *Colorlab* specification, a numeric value for a grey colour
+        and a tuple otherwise if given a single *CIE xyY* colourspace array,
+        an array of shape (..., 4) otherwise.
 
     Raises
     ------
     ValueError
-        If the given *CIE xyY* colourspace array is not within MacAdam
+        If the given single *CIE xyY* colourspace array is not within MacAdam
         limits.
     RuntimeError
         If the maximum iterations count has been reached without converging to
-        a result.
+        a result for the given single *CIE xyY* colourspace array.
 
     Notes
     -----
     -   Input *CIE xyY* colourspace array is in domain [0, 1].
+    -   The samples are iterated in lockstep, the converged ones being masked
+        out of the subsequent iterations.
+    -   The hue, chroma and code of the grey colours in the output array of
+        shape (..., 4) are set to *nan*.
+    -   The specifications of the samples that cannot be converted, e.g. not
+        within MacAdam limits, out of the *Munsell Renotation System* domain
+        or not converging, are set to *nan* in the output array of shape
+        (..., 4) instead of raising an exception.
 
     References
     ----------
@@ -697,204 +766,27 @@ def xyY_to_munsell_specification(xyY):
     >>> xyY = np.array([0.38736945, 0.35751656, 0.59362000])
     >>> xyY_to_munsell_specification(xyY)  # doctest: +ELLIPSIS
     (4.1742530..., 8.0999999..., 5.3044360..., 6)
+    >>> xyY = np.array([[0.38736945, 0.35751656, 0.59362000],
+    ...                 [0.31006000, 0.31616000, 0.74613400]])
+    >>> xyY_to_munsell_specification(xyY)
+    array([[ 4.17425303,  8.09999998,  5.304436  ,  6.        ],
+           [        nan,  8.89999758,         nan,         nan]])
     """
 
-    if not is_within_macadam_limits(xyY, MUNSELL_DEFAULT_ILLUMINANT):
-        raise ValueError(
-            ('"{0}" is not within "MacAdam" limits for illuminant '
-             '"{1}"!').format(xyY, MUNSELL_DEFAULT_ILLUMINANT))
+    xyY = np.asarray(xyY)
 
-    x, y, Y = np.ravel(xyY)
+    if xyY.ndim == 1:
+        hue, value, chroma, code = _xyY_to_munsell_specification_batch(
+            np.reshape(xyY, (-1, 3)))[0]
+        if np.isnan(hue):
+            return value
 
-    # Scaling *Y* for algorithm needs.
-    value = munsell_value_ASTMD153508(Y * 100)
-    if is_integer(value):
-        value = round(value)
+        return hue, value, chroma, int(code)
 
-    x_center, y_center, Y_center = np.ravel(
-        munsell_specification_to_xyY(value))
-    rho_input, phi_input, _z_input = cartesian_to_cylindrical(
-        (x - x_center, y - y_center, Y_center))
-    phi_input = np.degrees(phi_input)
+    specification = _xyY_to_munsell_specification_batch_nan(
+        np.reshape(xyY, (-1, 3)))
 
-    grey_threshold = 0.001
-    if rho_input < grey_threshold:
-        return value
-
-    X, Y, Z = np.ravel(xyY_to_XYZ((x, y, Y)))
-    xi, yi = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
-    Xr, Yr, Zr = np.ravel(xyY_to_XYZ((xi, yi, Y)))
-
-    XYZ = np.array([X, Y, Z])
-    XYZr = np.array([(1 / Yr) * Xr, 1, (1 / Yr) * Zr])
-
-    Lab = XYZ_to_Lab(XYZ, XYZ_to_xy(XYZr))
-    LCHab = Lab_to_LCHab(Lab)
-    hue_initial, _value_initial, chroma_initial, code_initial = (
-        LCHab_to_munsell_specification(LCHab))
-    specification_current = [hue_initial,
-                             value,
-                             (5 / 5.5) * chroma_initial,
-                             code_initial]
-
-    convergence_threshold = 0.0001
-    iterations_maximum = 64
-    iterations = 0
-
-    while iterations <= iterations_maximum:
-        iterations += 1
-
-        hue_current, _value_current, chroma_current, code_current = (
-            specification_current)
-        hue_angle_current = hue_to_hue_angle(hue_current, code_current)
-
-        chroma_maximum = maximum_chroma_from_renotation(hue_current,
-                                                        value,
-                                                        code_current)
-        if chroma_current > chroma_maximum:
-            chroma_current = specification_current[2] = chroma_maximum
-
-        x_current, y_current, _Y_current = np.ravel(
-            munsell_specification_to_xyY(specification_current))
-
-        rho_current, phi_current, _z_current = cartesian_to_cylindrical(
-            (x_current - x_center, y_current - y_center, Y_center))
-        phi_current = np.degrees(phi_current)
-        phi_current_difference = (360 - phi_input + phi_current) % 360
-        if phi_current_difference > 180:
-            phi_current_difference -= 360
-
-        phi_differences = [phi_current_difference]
-        hue_angles = [hue_angle_current]
-        hue_angles_differences = [0]
-
-        iterations_maximum_inner = 16
-        iterations_inner = 0
-        extrapolate = False
-
-        while np.sign(min(phi_differences)) == np.sign(
-                max(phi_differences)) and extrapolate is False:
-            iterations_inner += 1
-
-            if iterations_inner > iterations_maximum_inner:
-                raise RuntimeError(('Maximum inner iterations count reached '
-                                    'without convergence!'))
-
-            hue_angle_inner = ((hue_angle_current + iterations_inner *
-                                (phi_input - phi_current)) % 360)
-            hue_angle_difference_inner = (iterations_inner *
-                                          (phi_input - phi_current) % 360)
-            if hue_angle_difference_inner > 180:
-                hue_angle_difference_inner -= 360
-
-            hue_inner, code_inner = hue_angle_to_hue(hue_angle_inner)
-            x_inner, y_inner, _Y_inner = np.ravel(
-                munsell_specification_to_xyY((hue_inner,
-                                              value,
-                                              chroma_current,
-                                              code_inner)))
-
-            if len(phi_differences) >= 2:
-                extrapolate = True
-
-            if extrapolate is False:
-                rho_inner, phi_inner, _z_inner = cartesian_to_cylindrical(
-                    (x_inner - x_center, y_inner - y_center, Y_center))
-                phi_inner = np.degrees(phi_inner)
-                phi_inner_difference = (
-                    (360 - phi_input + phi_inner) % 360)
-                if phi_inner_difference > 180:
-                    phi_inner_difference -= 360
-
-                phi_differences.append(phi_inner_difference)
-                hue_angles.append(hue_angle_inner)
-                hue_angles_differences.append(hue_angle_difference_inner)
-
-        phi_differences = np.array(phi_differences)
-        hue_angles_differences = np.array(hue_angles_differences)
-
-        phi_differences_indexes = phi_differences.argsort()
-
-        phi_differences = phi_differences[phi_differences_indexes]
-        hue_angles_differences = hue_angles_differences[
-            phi_differences_indexes]
-
-        hue_angle_difference_new = Extrapolator(
-            LinearInterpolator(
-                phi_differences,
-                hue_angles_differences))(0) % 360
-        hue_angle_new = (hue_angle_current + hue_angle_difference_new) % 360
-
-        hue_new, code_new = hue_angle_to_hue(hue_angle_new)
-        specification_current = [hue_new, value, chroma_current, code_new]
-
-        x_current, y_current, _Y_current = np.ravel(
-            munsell_specification_to_xyY(specification_current))
-        difference = euclidean_distance((x, y), (x_current, y_current))
-        if difference < convergence_threshold:
-            return tuple(specification_current)
-
-        # TODO: Consider refactoring implementation.
-        hue_current, _value_current, chroma_current, code_current = (
-            specification_current)
-        chroma_maximum = maximum_chroma_from_renotation(hue_current,
-                                                        value,
-                                                        code_current)
-        if chroma_current > chroma_maximum:
-            chroma_current = specification_current[2] = chroma_maximum
-
-        x_current, y_current, Y_current = np.ravel(
-            munsell_specification_to_xyY(specification_current))
-
-        rho_current, phi_current, _z_current = cartesian_to_cylindrical(
-            (x_current - x_center, y_current - y_center, Y_center))
-
-        rho_bounds = [rho_current]
-        chroma_bounds = [chroma_current]
-
-        iterations_maximum_inner = 16
-        iterations_inner = 0
-        while not (min(rho_bounds) < rho_input < max(rho_bounds)):
-            iterations_inner += 1
-
-            if iterations_inner > iterations_maximum_inner:
-                raise RuntimeError(('Maximum inner iterations count reached '
-                                    'without convergence!'))
-
-            chroma_inner = (((rho_input / rho_current) ** iterations_inner) *
-                            chroma_current)
-            if chroma_inner > chroma_maximum:
-                chroma_inner = specification_current[2] = chroma_maximum
-
-            specification_inner = (
-                hue_current, value, chroma_inner, code_current)
-            x_inner, y_inner, _Y_inner = np.ravel(
-                munsell_specification_to_xyY(specification_inner))
-
-            rho_inner, phi_inner, _z_inner = cartesian_to_cylindrical(
-                (x_inner - x_center, y_inner - y_center, Y_center))
-
-            rho_bounds.append(rho_inner)
-            chroma_bounds.append(chroma_inner)
-
-        rho_bounds = np.array(rho_bounds)
-        chroma_bounds = np.array(chroma_bounds)
-
-        rhos_bounds_indexes = rho_bounds.argsort()
-
-        rho_bounds = rho_bounds[rhos_bounds_indexes]
-        chroma_bounds = chroma_bounds[rhos_bounds_indexes]
-        chroma_new = LinearInterpolator(rho_bounds, chroma_bounds)(rho_input)
-
-        specification_current = [hue_current, value, chroma_new, code_current]
-        x_current, y_current, Y_current = np.ravel(
-            munsell_specification_to_xyY(specification_current))
-        difference = euclidean_distance((x, y), (x_current, y_current))
-        if difference < convergence_threshold:
-            return tuple(specification_current)
-
-    raise RuntimeError(
-        'Maximum outside iterations count reached without convergence!')
+    return np.reshape(specification, xyY.shape[:-1] + (4,))
 
 
 def xyY_to_munsell_colour(xyY,
@@ -1171,7 +1063,8 @@ def xyY_from_renotation(specification):
 
     specifications = _munsell_specifications()
     try:
-        return MUNSELL_COLOURS_ALL[specifications.index(specification)][1]
+        return MUNSELL_COLOURS['Munsell Colours All'][
+            specifications.index(specification)][1]
     except ValueError:
         # TODO: Should raise KeyError, need to check the tests.
         raise ValueError(
@@ -2053,3 +1946,909 @@ def munsell_specification_to_xy(specification):
                                    (y_minus, y_plus))(chroma)
 
         return np.array([x, y])
+
+
+_RENOTATION_OVOID_RADIAL_ASTM_HUES = (
+    (1, 2, 2, ((15, 30), (60, 85))),
+    (1, 4, 4, ((12.5, 27.5), (57.5, 80))),
+    (1, 6, 6, ((55, 80),)),
+    (1, 8, 8, ((67.5, 77.5),)),
+    (1, 10, np.inf, ((72.5, 77.5),)),
+    (2, 2, 2, ((15, 27.5), (77.5, 80))),
+    (2, 4, 4, ((12.5, 30), (62.5, 80))),
+    (2, 6, 6, ((7.5, 22.5), (62.5, 80))),
+    (2, 8, 8, ((7.5, 15), (60, 80))),
+    (2, 10, np.inf, ((65, 77.5),)),
+    (3, 2, 2, ((10, 37.5), (65, 85))),
+    (3, 4, 4, ((5, 37.5), (55, 72.5))),
+    (3, 6, 10, ((7.5, 37.5), (57.5, 82.5))),
+    (3, 12, np.inf, ((7.5, 42.5), (57.5, 80))),
+    (4, 2, 4, ((7.5, 42.5), (57.5, 85))),
+    (4, 6, 8, ((7.5, 40), (57.5, 82.5))),
+    (4, 10, np.inf, ((7.5, 40), (57.5, 80))),
+    (5, 2, 2, ((5, 37.5), (55, 85))),
+    (5, 4, 8, ((2.5, 42.5), (55, 85))),
+    (5, 10, np.inf, ((2.5, 42.5), (55, 82.5))),
+    (6, 2, 4, ((5, 37.5), (55, 87.5))),
+    (6, 6, 6, ((5, 42.5), (57.5, 87.5))),
+    (6, 8, 10, ((5, 42.5), (60, 85))),
+    (6, 12, 14, ((5, 42.5), (60, 82.5))),
+    (6, 16, np.inf, ((5, 42.5), (60, 80))),
+    (7, 2, 6, ((5, 42.5), (60, 85))),
+    (7, 8, 8, ((5, 42.5), (60, 82.5))),
+    (7, 10, 10, ((30, 42.5), (5, 25), (60, 82.5))),
+    (7, 12, 12, ((30, 42.5), (7.5, 27.5), (80, 82.5))),
+    (7, 14, np.inf, ((32.5, 40), (7.5, 15), (80, 82.5))),
+    (8, 2, 12, ((5, 40), (60, 85))),
+    (8, 14, np.inf, ((32.5, 40), (5, 15), (60, 85))),
+    (9, 2, 4, ((5, 40), (55, 80))),
+    (9, 6, 14, ((5, 42.5),)),
+    (9, 16, np.inf, ((35, 42.5),)))
+"""
+*ASTM* hue ranges on which radial interpolation is used when drawing ovoids
+through data points in the *Munsell Renotation System* data, as
+(value, chroma minimum, chroma maximum, *ASTM* hue ranges) tuples, linear
+interpolation is used outside of them.
+
+_RENOTATION_OVOID_RADIAL_ASTM_HUES : tuple
+
+See Also
+--------
+interpolation_method_from_renotation_ovoid
+"""
+
+
+def _linear_interpolation_batch(x, x_0, x_1, y_0, y_1, extrapolate=False):
+    """
+    Linearly interpolates given points between the bounding points
+    :math:`(x_0, y_0)` and :math:`(x_1, y_1)`, each point having its own
+    bounding points, consistently with :class:`colour.LinearInterpolator`
+    class and :class:`colour.Extrapolator` class.
+
+    Parameters
+    ----------
+    x : array_like
+        Points to interpolate.
+    x_0 : array_like
+        Lower bounding points :math:`x` independent variable.
+    x_1 : array_like
+        Upper bounding points :math:`x` independent variable.
+    y_0 : array_like
+        Lower bounding points :math:`y` dependent variable.
+    y_1 : array_like
+        Upper bounding points :math:`y` dependent variable.
+    extrapolate : bool, optional
+        Whether to linearly extrapolate the points outside the interpolation
+        range.
+
+    Returns
+    -------
+    ndarray
+        Interpolated points.
+
+    Raises
+    ------
+    ValueError
+        If some points are outside the interpolation range and extrapolation
+        is disabled.
+    """
+
+    x, x_0, x_1, y_0, y_1 = np.broadcast_arrays(x, x_0, x_1, y_0, y_1)
+
+    below_interpolation_range = x < x_0
+    above_interpolation_range = x > x_1
+
+    if not extrapolate:
+        if np.any(below_interpolation_range):
+            raise ValueError('"{0}" is below interpolation range.'.format(
+                x[below_interpolation_range]))
+
+        if np.any(above_interpolation_range):
+            raise ValueError('"{0}" is above interpolation range.'.format(
+                x[above_interpolation_range]))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y = np.where(x == x_1, y_1,
+                     (y_1 - y_0) / (x_1 - x_0) * (x - x_0) + y_0)
+
+        if extrapolate:
+            y = np.where(below_interpolation_range,
+                         y_0 + (x - x_0) * (y_1 - y_0) / (x_1 - x_0), y)
+            y = np.where(above_interpolation_range,
+                         y_1 + (x - x_1) * (y_1 - y_0) / (x_1 - x_0), y)
+
+    return y
+
+
+def _xyY_from_renotation_batch(hue, value, chroma, code):
+    """
+    Returns given existing *Munsell* *Colorlab* specifications *CIE xyY*
+    colourspace arrays from *Munsell Renotation System* data.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications standard hues.
+    value : ndarray
+        *Munsell* *Colorlab* specifications integer values.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications even chromas.
+    code : ndarray
+        *Munsell* *Colorlab* specifications codes.
+
+    Returns
+    -------
+    ndarray, (n, 3)
+        *CIE xyY* colourspace arrays.
+
+    Raises
+    ------
+    ValueError
+        If some of the given specifications don't exist in
+        *Munsell Renotation System* data.
+    """
+
+    xyY_table, _chromas_table, _radial_table = _munsell_renotation_tables()
+
+    xyY = xyY_table[np.around(hue / 2.5).astype(np.int_),
+                    np.around(value).astype(np.int_),
+                    np.around(chroma / 2).astype(np.int_),
+                    np.asarray(code).astype(np.int_)]
+
+    missing = np.isnan(xyY[..., 0])
+    if np.any(missing):
+        raise ValueError(
+            ('"{0}" specifications do not exist in '
+             '"Munsell Renotation System" data!').format(
+                np.transpose((hue, value, chroma, code))[missing]))
+
+    return xyY
+
+
+def _bounding_hues_from_renotation_batch(hue, code):
+    """
+    Returns for given hues the two bounding hues from
+    *Munsell Renotation System* data.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hues.
+    code : ndarray
+        *Munsell* *Colorlab* specifications codes.
+
+    Returns
+    -------
+    tuple
+        Clockwise hues and codes, counter-clockwise hues and codes.
+
+    See Also
+    --------
+    bounding_hues_from_renotation
+    """
+
+    standard = hue % 2.5 == 0
+
+    hue_cw = np.where(standard, hue, 2.5 * np.floor(hue / 2.5))
+    hue_ccw = np.where(standard, hue, (hue_cw + 2.5) % 10)
+    hue_ccw = np.where(hue_ccw == 0, 10, hue_ccw)
+
+    code_cw = np.where(hue_cw == 0, (code + 1) % 10, code)
+    code_cw = np.where(
+        np.logical_and(hue_cw == 0, ~standard) & (code_cw == 0), 10, code_cw)
+    code_ccw = np.where(standard, code_cw, code)
+    hue_cw = np.where(hue_cw == 0, 10, hue_cw)
+    hue_ccw = np.where(standard, hue_cw, hue_ccw)
+
+    return hue_cw, code_cw, hue_ccw, code_ccw
+
+
+def _hue_angle_to_hue_batch(hue_angle):
+    """
+    Converts from hue angles in degrees to the *Munsell* *Colorlab*
+    specification hues.
+
+    Parameters
+    ----------
+    hue_angle : ndarray
+        Hue angles in degrees.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specifications hues and codes.
+
+    See Also
+    --------
+    hue_angle_to_hue
+    """
+
+    single_hue = LinearInterpolator(
+        (0, 45, 70, 135, 160, 225, 255, 315, 360),
+        (0, 2, 3, 4, 5, 6, 8, 9, 10))(np.atleast_1d(hue_angle))
+    single_hue = np.atleast_1d(single_hue)
+
+    code = np.array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8, 7])[
+        np.searchsorted(np.arange(0.5, 10, 1), single_hue)]
+
+    hue = (10 * (single_hue % 1) + 5) % 10
+    hue = np.where(hue == 0, 10, hue)
+
+    return hue, code
+
+
+def _LCHab_to_munsell_specification_batch(LCHab):
+    """
+    Converts from *CIE LCHab* colourspace arrays to approximate *Munsell*
+    *Colorlab* specifications.
+
+    Parameters
+    ----------
+    LCHab : ndarray, (n, 3)
+        *CIE LCHab* colourspace arrays.
+
+    Returns
+    -------
+    tuple
+        *Munsell* *Colorlab* specifications hues, values, chromas and codes.
+
+    See Also
+    --------
+    LCHab_to_munsell_specification
+    """
+
+    L, C, Hab = tsplit(LCHab)
+
+    code = np.array([7, 6, 5, 4, 3, 2, 1, 10, 9, 8])[
+        np.searchsorted(np.arange(36, 360, 36), Hab)]
+    code = np.where(Hab == 0, 8, code)
+
+    hue = _linear_interpolation_batch(Hab % 36, 0, 36, 0, 10)
+    hue = np.where(hue == 0, 10, hue)
+
+    return hue, L / 10, C / 5, code
+
+
+def _maximum_chroma_from_renotation_batch(hue, value, code):
+    """
+    Returns the maximum *Munsell* chromas from *Munsell Renotation System*
+    data using given *Munsell* *Colorlab* specifications hues, values and
+    codes.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hues.
+    value : ndarray
+        *Munsell* *Colorlab* specifications values.
+    code : ndarray
+        *Munsell* *Colorlab* specifications codes.
+
+    Returns
+    -------
+    ndarray
+        Maximum chromas.
+
+    See Also
+    --------
+    maximum_chroma_from_renotation
+    """
+
+    _xyY_table, chromas_table, _radial_table = _munsell_renotation_tables()
+
+    # Ideal white, no chroma.
+    white = value >= 9.99
+
+    assert np.all(np.logical_and(value[~white] >= 1, value[~white] <= 10)), (
+        '"{0}" value must be in domain [1, 10]!'.format(value[~white]))
+
+    integer = value % 1 == 0
+    value_minus = np.where(integer, value, np.floor(value))
+    value_plus = np.where(integer, value, value_minus + 1)
+
+    hue_cw, code_cw, hue_ccw, code_ccw = _bounding_hues_from_renotation_batch(
+        hue, code)
+    hue_cw = np.around(hue_cw / 2.5).astype(np.int_)
+    hue_ccw = np.around(hue_ccw / 2.5).astype(np.int_)
+    code_cw = code_cw.astype(np.int_)
+    code_ccw = code_ccw.astype(np.int_)
+    value_minus = np.where(white, 0, value_minus).astype(np.int_)
+    value_plus = np.where(value_plus <= 9, value_plus, 0).astype(np.int_)
+
+    maximum_chromas = np.array([
+        chromas_table[hue_cw, value_minus, code_cw],
+        chromas_table[hue_ccw, value_minus, code_ccw],
+        chromas_table[hue_cw, value_plus, code_cw],
+        chromas_table[hue_ccw, value_plus, code_ccw]])
+
+    # The maximum chromas for the values greater than 9 are interpolated
+    # between value 9 and the ideal white.
+    interpolate = ~white & (value_plus == 0)
+    L = luminance_ASTMD153508(value[interpolate])
+    L9 = luminance_ASTMD153508(9)
+    L10 = luminance_ASTMD153508(10)
+    maximum_chromas[:2, interpolate] = _linear_interpolation_batch(
+        L, L9, L10, maximum_chromas[:2, interpolate], 0)
+    maximum_chromas[2:, interpolate] = np.inf
+    maximum_chromas[..., white] = 0
+
+    if np.any(np.isnan(maximum_chromas)):
+        raise ValueError(
+            ('"{0}" specifications do not exist in '
+             '"Munsell Renotation System" data!').format(
+                np.transpose((hue, value, code))[
+                    np.any(np.isnan(maximum_chromas), axis=0)]))
+
+    return np.min(maximum_chromas, axis=0)
+
+
+def _is_radial_interpolation_from_renotation_ovoid_batch(
+        hue, value, chroma, code):
+    """
+    Returns whether to use radial interpolation rather than linear
+    interpolation when drawing ovoids through data points in the
+    *Munsell Renotation System* data from given specifications.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hues.
+    value : ndarray
+        *Munsell* *Colorlab* specifications integer values in domain [1, 9].
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications even chromas in domain [2, 50].
+    code : ndarray
+        *Munsell* *Colorlab* specifications codes.
+
+    Returns
+    -------
+    ndarray
+        Whether to use radial interpolation.
+
+    Notes
+    -----
+    -   Input *Munsell* *Colorlab* specifications hues must not be standard
+        *Munsell Renotation System* hues.
+
+    See Also
+    --------
+    interpolation_method_from_renotation_ovoid
+    """
+
+    _xyY_table, _chromas_table, radial_table = _munsell_renotation_tables()
+
+    ASTM_hue = 10 * ((7 - code) % 10) + hue
+    ASTM_hue = np.where(ASTM_hue == 0, 100, ASTM_hue)
+
+    return radial_table[np.around(value).astype(np.int_),
+                        np.around(chroma / 2).astype(np.int_),
+                        np.clip(np.floor(ASTM_hue / 2.5), 0,
+                                39).astype(np.int_)]
+
+
+def _xy_from_renotation_ovoid_batch(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications to *xy* chromaticity
+    coordinates on *Munsell Renotation System* ovoids.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hues.
+    value : ndarray
+        *Munsell* *Colorlab* specifications integer values in domain [1, 9].
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications even chromas in domain [2, 50].
+    code : ndarray
+        *Munsell* *Colorlab* specifications codes.
+
+    Returns
+    -------
+    ndarray, (n, 2)
+        *xy* chromaticity coordinates.
+
+    See Also
+    --------
+    xy_from_renotation_ovoid
+    """
+
+    assert np.all(np.logical_and(value >= 1, value <= 9)), (
+        '"{0}" specifications values must be in domain [1, 9]!'.format(
+            value))
+    assert np.all(np.abs(value - np.around(value)) <= INTEGER_THRESHOLD), (
+        '"{0}" specifications values must be integers!'.format(value))
+    value = np.around(value)
+    assert np.all(np.logical_and(chroma >= 2, chroma <= 50)), (
+        '"{0}" specifications chromas must be in domain [2, 50]!'.format(
+            chroma))
+    assert np.all(np.abs(2 * (chroma / 2 - np.around(chroma / 2))) <=
+                  INTEGER_THRESHOLD), (
+        ('"{0}" specifications chromas must be integers and '
+         'multiples of 2!').format(chroma))
+    chroma = 2 * np.around(chroma / 2)
+
+    xy = np.empty(hue.shape + (2,))
+
+    # Checking if renotation data is available without interpolation using
+    # given threshold.
+    threshold = 0.001
+    hue_standard = 2.5 * np.around(hue / 2.5)
+    standard = np.abs(hue - hue_standard) < threshold
+    if np.any(standard):
+        xy[standard] = _xyY_from_renotation_batch(
+            hue_standard[standard], value[standard], chroma[standard],
+            code[standard])[..., 0:2]
+
+    interpolated = ~standard
+    if not np.any(interpolated):
+        return xy
+
+    hue, value, chroma, code = (hue[interpolated], value[interpolated],
+                                chroma[interpolated], code[interpolated])
+
+    hue_minus, code_minus, hue_plus, code_plus = (
+        _bounding_hues_from_renotation_batch(hue, code))
+
+    x_grey, y_grey = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+
+    x_minus, y_minus, _Y_minus = tsplit(
+        _xyY_from_renotation_batch(hue_minus, value, chroma, code_minus))
+    rho_minus = np.hypot(x_minus - x_grey, y_minus - y_grey)
+    phi_minus = np.degrees(np.arctan2(y_minus - y_grey, x_minus - x_grey))
+
+    x_plus, y_plus, _Y_plus = tsplit(
+        _xyY_from_renotation_batch(hue_plus, value, chroma, code_plus))
+    rho_plus = np.hypot(x_plus - x_grey, y_plus - y_grey)
+    phi_plus = np.degrees(np.arctan2(y_plus - y_grey, x_plus - x_grey))
+
+    lower_hue_angle = np.atleast_1d(hue_to_hue_angle(hue_minus, code_minus))
+    hue_angle = np.atleast_1d(hue_to_hue_angle(hue, code))
+    upper_hue_angle = np.atleast_1d(hue_to_hue_angle(hue_plus, code_plus))
+
+    phi_plus = np.where(phi_minus - phi_plus > 180, phi_plus + 360, phi_plus)
+
+    lower_hue_angle = np.where(lower_hue_angle == 0, 360, lower_hue_angle)
+    wrap = lower_hue_angle > upper_hue_angle
+    hue_angle = np.where(
+        np.logical_and(wrap, lower_hue_angle <= hue_angle),
+        hue_angle - 360, hue_angle)
+    lower_hue_angle = np.where(wrap, lower_hue_angle - 360, lower_hue_angle)
+
+    radial = _is_radial_interpolation_from_renotation_ovoid_batch(
+        hue, value, chroma, code)
+
+    x = _linear_interpolation_batch(
+        hue_angle, lower_hue_angle, upper_hue_angle, x_minus, x_plus)
+    y = _linear_interpolation_batch(
+        hue_angle, lower_hue_angle, upper_hue_angle, y_minus, y_plus)
+
+    theta = _linear_interpolation_batch(
+        hue_angle, lower_hue_angle, upper_hue_angle, phi_minus, phi_plus)
+    rho = _linear_interpolation_batch(
+        hue_angle, lower_hue_angle, upper_hue_angle, rho_minus, rho_plus)
+    x_radial, y_radial = tsplit(
+        polar_to_cartesian(tstack((rho, np.radians(theta)))) +
+        np.asarray((x_grey, y_grey)))
+
+    xy[interpolated] = tstack((np.where(radial, x_radial, x),
+                               np.where(radial, y_radial, y)))
+
+    return xy
+
+
+def _munsell_specification_to_xy_batch(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications to *xy* chromaticity
+    coordinates by interpolating over *Munsell Renotation System* data.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hues.
+    value : ndarray
+        *Munsell* *Colorlab* specifications integer values.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chromas.
+    code : ndarray
+        *Munsell* *Colorlab* specifications codes.
+
+    Returns
+    -------
+    ndarray, (n, 2)
+        *xy* chromaticity coordinates.
+
+    See Also
+    --------
+    munsell_specification_to_xy
+    """
+
+    assert np.all(np.logical_and(value >= 0, value <= 10)), (
+        '"{0}" specifications values must be in domain [0, 10]!'.format(
+            value))
+    assert np.all(np.abs(value - np.around(value)) <= INTEGER_THRESHOLD), (
+        '"{0}" specifications values must be integers!'.format(value))
+    value = np.around(value)
+
+    even = chroma % 2 == 0
+    chroma_minus = np.where(even, chroma, 2 * np.floor(chroma / 2))
+    chroma_plus = np.where(even, chroma, chroma_minus + 2)
+
+    # Smallest chroma ovoid collapses to illuminant chromaticity coordinates.
+    xy_minus = np.tile(MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES,
+                       (hue.size, 1))
+    ovoid = chroma_minus != 0
+    if np.any(ovoid):
+        xy_minus[ovoid] = _xy_from_renotation_ovoid_batch(
+            hue[ovoid], value[ovoid], chroma_minus[ovoid], code[ovoid])
+
+    xy_plus = _xy_from_renotation_ovoid_batch(hue, value, chroma_plus, code)
+
+    xy = xy_minus
+    odd = ~even
+    if np.any(odd):
+        xy[odd] = _linear_interpolation_batch(
+            chroma[odd][..., np.newaxis],
+            chroma_minus[odd][..., np.newaxis],
+            chroma_plus[odd][..., np.newaxis],
+            xy_minus[odd], xy_plus[odd])
+
+    return xy
+
+
+def _munsell_specification_to_xyY_batch(hue, value, chroma, code):
+    """
+    Converts given *Munsell* *Colorlab* specifications to *CIE xyY*
+    colourspace.
+
+    Parameters
+    ----------
+    hue : ndarray
+        *Munsell* *Colorlab* specifications hues.
+    value : ndarray
+        *Munsell* *Colorlab* specifications values.
+    chroma : ndarray
+        *Munsell* *Colorlab* specifications chromas.
+    code : ndarray
+        *Munsell* *Colorlab* specifications codes.
+
+    Returns
+    -------
+    ndarray, (n, 3)
+        *CIE xyY* colourspace arrays.
+
+    See Also
+    --------
+    munsell_specification_to_xyY
+    """
+
+    assert np.all(np.logical_and(hue >= 0, hue <= 10)), (
+        '"{0}" specifications hues must be in domain [0, 10]!'.format(hue))
+    assert np.all(np.logical_and(value >= 0, value <= 10)), (
+        '"{0}" specifications values must be in domain [0, 10]!'.format(
+            value))
+
+    Y = luminance_ASTMD153508(value)
+
+    integer = np.abs(value - np.around(value)) <= INTEGER_THRESHOLD
+    value_minus = np.where(integer, np.around(value), np.floor(value))
+    value_plus = np.where(integer, np.around(value), value_minus + 1)
+
+    xy_minus = _munsell_specification_to_xy_batch(
+        hue, value_minus, chroma, code)
+
+    xy_plus = np.tile(MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES,
+                      (hue.size, 1))
+    chromatic = value_plus != 10
+    if np.any(chromatic):
+        xy_plus[chromatic] = _munsell_specification_to_xy_batch(
+            hue[chromatic], value_plus[chromatic], chroma[chromatic],
+            code[chromatic])
+
+    xy = xy_minus
+    interpolated = ~integer
+    if np.any(interpolated):
+        Y_minus = luminance_ASTMD153508(value_minus[interpolated])
+        Y_plus = luminance_ASTMD153508(value_plus[interpolated])
+        xy[interpolated] = _linear_interpolation_batch(
+            Y[interpolated][..., np.newaxis], Y_minus[..., np.newaxis],
+            Y_plus[..., np.newaxis], xy_minus[interpolated],
+            xy_plus[interpolated])
+
+    return tstack((xy[..., 0], xy[..., 1], Y / 100))
+
+
+def _xyY_to_munsell_specification_batch(xyY):
+    """
+    Converts from *CIE xyY* colourspace arrays to *Munsell* *Colorlab*
+    specifications by iterating over all the samples in lockstep.
+
+    Parameters
+    ----------
+    xyY : ndarray, (n, 3)
+        *CIE xyY* colourspace arrays.
+
+    Returns
+    -------
+    ndarray, (n, 4)
+        *Munsell* *Colorlab* specifications, the hue, chroma and code of the
+        grey colours are set to *nan*.
+
+    See Also
+    --------
+    xyY_to_munsell_specification
+    """
+
+    within_macadam_limits = np.atleast_1d(
+        is_within_macadam_limits(xyY, MUNSELL_DEFAULT_ILLUMINANT))
+    if not np.all(within_macadam_limits):
+        raise ValueError(
+            ('"{0}" is not within "MacAdam" limits for illuminant '
+             '"{1}"!').format(xyY[~within_macadam_limits][0],
+                              MUNSELL_DEFAULT_ILLUMINANT))
+
+    x, y, Y = tsplit(xyY)
+
+    # Scaling *Y* for algorithm needs.
+    value = np.atleast_1d(munsell_value_ASTMD153508(Y * 100))
+    value = np.where(np.abs(value - np.around(value)) <= INTEGER_THRESHOLD,
+                     np.around(value), value)
+
+    x_center, y_center = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+    rho_input = np.hypot(x - x_center, y - y_center)
+    phi_input = np.degrees(np.arctan2(y - y_center, x - x_center))
+
+    specification = np.full((len(xyY), 4), np.nan)
+    specification[..., 1] = value
+
+    grey_threshold = 0.001
+    indexes = np.where(~(rho_input < grey_threshold))[0]
+    if indexes.size == 0:
+        return specification
+
+    x, y, Y, value, rho_input, phi_input = [
+        a[indexes] for a in (x, y, Y, value, rho_input, phi_input)]
+
+    XYZ = xyY_to_XYZ(tstack((x, y, Y)))
+    xi, yi = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+    Xr, Yr, Zr = tsplit(xyY_to_XYZ(
+        tstack((np.full(Y.shape, xi), np.full(Y.shape, yi), Y))))
+
+    XYZr = tstack(((1 / Yr) * Xr, np.ones(Yr.shape), (1 / Yr) * Zr))
+
+    Lab = XYZ_to_Lab(XYZ, XYZ_to_xy(XYZr))
+    LCHab = Lab_to_LCHab(Lab)
+    hue, _value, chroma, code = _LCHab_to_munsell_specification_batch(LCHab)
+    chroma = (5 / 5.5) * chroma
+
+    def phi_difference(x_current, y_current):
+        """
+        Returns the signed differences in degrees between the input hue angles
+        and the hue angles of given *xy* chromaticity coordinates.
+        """
+
+        phi_current = np.degrees(
+            np.arctan2(y_current - y_center, x_current - x_center))
+        phi_current_difference = (360 - phi_input + phi_current) % 360
+
+        return (np.where(phi_current_difference > 180,
+                         phi_current_difference - 360,
+                         phi_current_difference),
+                phi_current)
+
+    convergence_threshold = 0.0001
+    iterations_maximum = 64
+    iterations_maximum_inner = 16
+
+    for _iteration in range(iterations_maximum + 1):
+        hue_angle_current = np.atleast_1d(hue_to_hue_angle(hue, code))
+
+        chroma_maximum = _maximum_chroma_from_renotation_batch(
+            hue, value, code)
+        chroma = np.where(chroma > chroma_maximum, chroma_maximum, chroma)
+
+        x_current, y_current, _Y_current = tsplit(
+            _munsell_specification_to_xyY_batch(hue, value, chroma, code))
+        phi_current_difference, phi_current = phi_difference(
+            x_current, y_current)
+
+        # The hue angles are extrapolated from the current hue angles and the
+        # hue angles rotated by the input and current hue angles difference.
+        hue_angle_inner = (hue_angle_current + (phi_input - phi_current)) % 360
+        hue_angle_difference_inner = (phi_input - phi_current) % 360
+        hue_angle_difference_inner = np.where(
+            hue_angle_difference_inner > 180,
+            hue_angle_difference_inner - 360,
+            hue_angle_difference_inner)
+
+        hue_inner, code_inner = _hue_angle_to_hue_batch(hue_angle_inner)
+        x_inner, y_inner, _Y_inner = tsplit(
+            _munsell_specification_to_xyY_batch(
+                hue_inner, value, chroma, code_inner))
+        phi_inner_difference, _phi_inner = phi_difference(x_inner, y_inner)
+
+        # The hue angles rotated twice are only evaluated for the samples
+        # whose phi differences have the same sign so that the specifications
+        # outside the *Munsell Renotation System* data are rejected.
+        same_sign = np.where(np.sign(phi_current_difference) ==
+                             np.sign(phi_inner_difference))[0]
+        if same_sign.size != 0:
+            hue_outer, code_outer = _hue_angle_to_hue_batch(
+                (hue_angle_current[same_sign] + 2 *
+                 (phi_input[same_sign] - phi_current[same_sign])) % 360)
+            _munsell_specification_to_xyY_batch(
+                hue_outer, value[same_sign], chroma[same_sign], code_outer)
+
+        swap = phi_inner_difference < phi_current_difference
+        hue_angle_difference_new = _linear_interpolation_batch(
+            0,
+            np.where(swap, phi_inner_difference, phi_current_difference),
+            np.where(swap, phi_current_difference, phi_inner_difference),
+            np.where(swap, hue_angle_difference_inner, 0),
+            np.where(swap, 0, hue_angle_difference_inner),
+            extrapolate=True) % 360
+        hue_angle_new = (hue_angle_current + hue_angle_difference_new) % 360
+
+        hue, code = _hue_angle_to_hue_batch(hue_angle_new)
+
+        x_current, y_current, _Y_current = tsplit(
+            _munsell_specification_to_xyY_batch(hue, value, chroma, code))
+        difference = euclidean_distance(
+            tstack((x, y)), tstack((x_current, y_current)))
+
+        converged = difference < convergence_threshold
+        specification[indexes[converged]] = tstack(
+            (hue, value, chroma, code))[converged]
+
+        unconverged = ~converged
+        if not np.any(unconverged):
+            return specification
+
+        (indexes, x, y, value, rho_input, phi_input, hue, chroma,
+         code) = [a[unconverged] for a in (indexes, x, y, value, rho_input,
+                                           phi_input, hue, chroma, code)]
+
+        chroma_maximum = _maximum_chroma_from_renotation_batch(
+            hue, value, code)
+        chroma = np.where(chroma > chroma_maximum, chroma_maximum, chroma)
+
+        x_current, y_current, _Y_current = tsplit(
+            _munsell_specification_to_xyY_batch(hue, value, chroma, code))
+        rho_current = np.hypot(x_current - x_center, y_current - y_center)
+
+        # The chromas are interpolated between the closest chromas bounding
+        # the input radii, they are searched by scaling the current chromas
+        # by the input and current radii ratio powers.
+        rho_minimum = np.copy(rho_current)
+        rho_maximum = np.copy(rho_current)
+        rho_lower = np.where(rho_current <= rho_input, rho_current, -np.inf)
+        rho_upper = np.where(rho_current > rho_input, rho_current, np.inf)
+        chroma_lower = np.copy(chroma)
+        chroma_upper = np.copy(chroma)
+
+        iterations_inner = 0
+        while True:
+            bracketing = np.where(~np.logical_and(
+                rho_minimum < rho_input, rho_input < rho_maximum))[0]
+            if bracketing.size == 0:
+                break
+
+            iterations_inner += 1
+
+            if iterations_inner > iterations_maximum_inner:
+                raise RuntimeError(('Maximum inner iterations count reached '
+                                    'without convergence!'))
+
+            chroma_inner = (((rho_input[bracketing] /
+                              rho_current[bracketing]) ** iterations_inner) *
+                            chroma[bracketing])
+            chroma_inner = np.where(
+                chroma_inner > chroma_maximum[bracketing],
+                chroma_maximum[bracketing], chroma_inner)
+
+            x_inner, y_inner, _Y_inner = tsplit(
+                _munsell_specification_to_xyY_batch(
+                    hue[bracketing], value[bracketing], chroma_inner,
+                    code[bracketing]))
+            rho_inner = np.hypot(x_inner - x_center, y_inner - y_center)
+
+            rho_minimum[bracketing] = np.minimum(
+                rho_minimum[bracketing], rho_inner)
+            rho_maximum[bracketing] = np.maximum(
+                rho_maximum[bracketing], rho_inner)
+
+            lower = np.logical_and(rho_inner <= rho_input[bracketing],
+                                   rho_inner >= rho_lower[bracketing])
+            rho_lower[bracketing[lower]] = rho_inner[lower]
+            chroma_lower[bracketing[lower]] = chroma_inner[lower]
+
+            upper = np.logical_and(rho_inner > rho_input[bracketing],
+                                   rho_inner < rho_upper[bracketing])
+            rho_upper[bracketing[upper]] = rho_inner[upper]
+            chroma_upper[bracketing[upper]] = chroma_inner[upper]
+
+        chroma = _linear_interpolation_batch(
+            rho_input, rho_lower, rho_upper, chroma_lower, chroma_upper)
+
+        x_current, y_current, _Y_current = tsplit(
+            _munsell_specification_to_xyY_batch(hue, value, chroma, code))
+        difference = euclidean_distance(
+            tstack((x, y)), tstack((x_current, y_current)))
+
+        converged = difference < convergence_threshold
+        specification[indexes[converged]] = tstack(
+            (hue, value, chroma, code))[converged]
+
+        unconverged = ~converged
+        if not np.any(unconverged):
+            return specification
+
+        (indexes, x, y, value, rho_input, phi_input, hue, chroma,
+         code) = [a[unconverged] for a in (indexes, x, y, value, rho_input,
+                                           phi_input, hue, chroma, code)]
+
+    raise RuntimeError(
+        'Maximum outside iterations count reached without convergence!')
+
+
+def _xyY_to_munsell_specification_batch_nan(xyY):
+    """
+    Converts from *CIE xyY* colourspace arrays to *Munsell* *Colorlab*
+    specifications, the specifications of the samples that cannot be
+    converted are set to *nan*.
+
+    Parameters
+    ----------
+    xyY : ndarray, (n, 3)
+        *CIE xyY* colourspace arrays.
+
+    Returns
+    -------
+    ndarray, (n, 4)
+        *Munsell* *Colorlab* specifications.
+
+    See Also
+    --------
+    xyY_to_munsell_specification
+
+    Notes
+    -----
+    -   The samples not within MacAdam limits and the non grey samples whose
+        *Munsell* value is not in domain [1, 10] are rejected beforehand.
+    -   The batches failing during the iterations are bisected until the
+        failing samples are isolated, the other samples being converted
+        together.
+    """
+
+    specification = np.full((len(xyY), 4), np.nan)
+
+    x, y, Y = tsplit(xyY)
+    value = np.atleast_1d(munsell_value_ASTMD153508(Y * 100))
+    x_center, y_center = MUNSELL_DEFAULT_ILLUMINANT_CHROMATICITY_COORDINATES
+    grey = np.hypot(x - x_center, y - y_center) < 0.001
+
+    valid = np.logical_and(
+        np.atleast_1d(
+            is_within_macadam_limits(xyY, MUNSELL_DEFAULT_ILLUMINANT)),
+        np.logical_or(
+            grey,
+            np.logical_and(value >= 1 - INTEGER_THRESHOLD,
+                           value <= 10 + INTEGER_THRESHOLD)))
+
+    def convert(indexes):
+        """
+        Converts the samples at given indexes, bisecting them on failure.
+        """
+
+        try:
+            specification[indexes] = _xyY_to_munsell_specification_batch(
+                xyY[indexes])
+        except (AssertionError, ValueError, RuntimeError):
+            if len(indexes) > 1:
+                convert(indexes[:len(indexes) // 2])
+                convert(indexes[len(indexes) // 2:])
+
+    indexes = np.where(valid)[0]
+    if indexes.size != 0:
+        convert(indexes)
+
+    return specification
@@ -4559,6 +4559,80 @@ class TestxyY_to_munsell_specification(unittest.TestCase):
                 specification,
                 decimal=7)
 
+    def test_n_dimensional_xyY_to_munsell_specification(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition n-dimensional arrays support.
+        """
+
+        xyY = np.array([case[0] for case in XYY_TO_MUNSELL_SPECIFICATIONS])
+        specification = np.array(
+            [case[1] for case in XYY_TO_MUNSELL_SPECIFICATIONS])
+        np.testing.assert_almost_equal(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            decimal=7)
+
+        xyY = np.reshape(xyY[:240], (4, 60, 3))
+        specification = np.reshape(specification[:240], (4, 60, 4))
+        np.testing.assert_almost_equal(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            decimal=7)
+
+        xyY = np.array([case[0] for case in
+                        XYY_TO_MUNSELL_GREYS_SPECIFICATIONS])
+        specification = np.full((len(xyY), 4), np.nan)
+        specification[..., 1] = [case[1] for case in
+                                 XYY_TO_MUNSELL_GREYS_SPECIFICATIONS]
+        np.testing.assert_almost_equal(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            decimal=7)
+
+        for xyY in NON_CONVERGING_XYY:
+            np.testing.assert_almost_equal(
+                xyY_to_munsell_specification(
+                    np.array([XYY_TO_MUNSELL_SPECIFICATIONS[0][0], xyY])),
+                np.array([XYY_TO_MUNSELL_SPECIFICATIONS[0][1],
+                          np.full(4, np.nan)]),
+                decimal=7)
+
+    def test_invalid_samples_xyY_to_munsell_specification(self):
+        """
+        Tests :func:`colour.notation.munsell.xyY_to_munsell_specification`
+        definition invalid samples handling.
+        """
+
+        xyY = np.array([XYY_TO_MUNSELL_SPECIFICATIONS[0][0],
+                        (0.00000000, 0.00000000, 0.00000000),
+                        XYY_TO_MUNSELL_SPECIFICATIONS[1][0],
+                        (0.35000000, 0.35000000, 0.00010000),
+                        (0.15000000, 0.06000000, 0.07219231),
+                        XYY_TO_MUNSELL_GREYS_SPECIFICATIONS[0][0],
+                        NON_CONVERGING_XYY[0],
+                        XYY_TO_MUNSELL_SPECIFICATIONS[2][0]])
+        specification = np.full((len(xyY), 4), np.nan)
+        specification[0] = XYY_TO_MUNSELL_SPECIFICATIONS[0][1]
+        specification[2] = XYY_TO_MUNSELL_SPECIFICATIONS[1][1]
+        specification[5, 1] = XYY_TO_MUNSELL_GREYS_SPECIFICATIONS[0][1]
+        specification[7] = XYY_TO_MUNSELL_SPECIFICATIONS[2][1]
+        np.testing.assert_almost_equal(
+            xyY_to_munsell_specification(xyY),
+            specification,
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            xyY_to_munsell_specification(np.reshape(xyY, (2, 4, 3))),
+            np.reshape(specification, (2, 4, 4)),
+            decimal=7)
+
+        for xyY_i in xyY[[1, 3, 4, 6]]:
+            self.assertRaises(
+                (AssertionError, RuntimeError, ValueError),
+                xyY_to_munsell_specification,
+                xyY_i)
+
 
 class TestxyY_to_munsell_colour(unittest.TestCase):
     """
@@ -37,7 +37,9 @@ from colour.colorimetry import (
     ILLUMINANTS_RELATIVE_SPDS,
     LIGHTNESS_METHODS,
     SpectralShape,
+    blackbody_msa,
     blackbody_spd,
+    multi_spectral_to_XYZ,
     spectral_to_XYZ,
     wavelength_to_XYZ)
 from colour.models import XYZ_to_sRGB
@@ -735,17 +737,11 @@ def blackbody_colours_plot(shape=SpectralShape(150, 12500, 50),
 
     cmfs = get_cmfs(cmfs)
 
-    colours = []
-    temperatures = []
+    temperatures = shape.range()
 
-    for temperature in shape:
-        spd = blackbody_spd(temperature, cmfs.shape)
-
-        XYZ = spectral_to_XYZ(spd, cmfs)
-        RGB = normalise_maximum(XYZ_to_sRGB(XYZ / 100))
-
-        colours.append(RGB)
-        temperatures.append(temperature)
+    XYZ = multi_spectral_to_XYZ(
+        blackbody_msa(temperatures, cmfs.shape), cmfs.shape, cmfs)
+    colours = normalise_maximum(XYZ_to_sRGB(XYZ / 100), axis=-1)
 
     settings = {
         'title': 'Blackbody Colours',
@@ -12,12 +12,14 @@ from .cct import (
 from .cct import uv_to_CCT
 from .cct import (
     uv_to_CCT_Ohno2013,
+    uv_to_CCT_planckian_locus_table,
     uv_to_CCT_Robertson1968)
 from .cct import CCT_TO_XY_METHODS, XY_TO_CCT_METHODS
 from .cct import CCT_to_xy
 from .cct import CCT_to_xy_Kang2002, CCT_to_xy_CIE_D
 from .cct import xy_to_CCT
 from .cct import xy_to_CCT_McCamy1992, xy_to_CCT_Hernandez1999
+from .maps import XYZ_to_CCT_map, RGB_to_CCT_map
 
 __all__ = ['CCT_TO_UV_METHODS', 'UV_TO_CCT_METHODS',
            'CCT_to_uv',
@@ -26,7 +28,9 @@ __all__ = ['CCT_TO_UV_METHODS', 'UV_TO_CCT_METHODS',
            'CCT_to_uv_Krystek1985',
            'uv_to_CCT',
            'uv_to_CCT_Ohno2013',
+           'uv_to_CCT_planckian_locus_table',
            'uv_to_CCT_Robertson1968',
            'CCT_TO_XY_METHODS', 'XY_TO_CCT_METHODS',
            'CCT_to_xy', 'CCT_to_xy_Kang2002', 'CCT_to_xy_CIE_D',
-           'xy_to_CCT', 'xy_to_CCT_McCamy1992', 'xy_to_CCT_Hernandez1999']
+           'xy_to_CCT', 'xy_to_CCT_McCamy1992', 'xy_to_CCT_Hernandez1999',
+           'XYZ_to_CCT_map', 'RGB_to_CCT_map']
@@ -7,12 +7,18 @@ Correlated Colour Temperature :math:`T_{cp}`
 
 Defines correlated colour temperature :math:`T_{cp}` computations objects:
 
+-   :func:`planckian_locus_table`: Densely sampled *Planckian* locus table
+    used by *Planckian Locus Table* method.
 -   :func:`uv_to_CCT_Ohno2013`: Correlated colour temperature :math:`T_{cp}`
     and :math:`\Delta_{uv}` computation of given *CIE UCS* colourspace *uv*
     chromaticity coordinates using *Ohno (2013)* method.
 -   :func:`CCT_to_uv_Ohno2013`: *CIE UCS* colourspace *uv* chromaticity
     coordinates computation of given correlated colour temperature
     :math:`T_{cp}`, :math:`\Delta_{uv}` using *Ohno (2013)* method.
+-   :func:`uv_to_CCT_planckian_locus_table`: Correlated colour temperature
+    :math:`T_{cp}` and :math:`\Delta_{uv}` computation of given *CIE UCS*
+    colourspace *uv* chromaticity coordinates using *Planckian Locus Table*
+    method.
 -   :func:`uv_to_CCT_Robertson1968`: Correlated colour temperature
     :math:`T_{cp}` and :math:`\Delta_{uv}` computation of given *CIE UCS*
     colourspace *uv* chromaticity coordinates using *Robertson (1968)* method.
@@ -56,11 +62,16 @@ from collections import namedtuple
 from colour.colorimetry import (
     STANDARD_OBSERVERS_CMFS,
     blackbody_spd,
+    multi_spectral_to_XYZ,
+    planck_law,
     spectral_to_XYZ)
+from colour.colorimetry.blackbody import C2, N
 from colour.models import UCS_to_uv, XYZ_to_UCS
 from colour.utilities import (
     CaseInsensitiveMapping,
+    LRUCache,
     as_numeric,
+    content_hash,
     filter_kwargs,
     tsplit,
     tstack,
@@ -74,17 +85,22 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = ['PLANCKIAN_TABLE_TUVD',
+           'PLANCKIAN_LOCUS_TABLE_TUVDUDV',
            'CCT_MINIMAL',
            'CCT_MAXIMAL',
            'CCT_SAMPLES',
            'CCT_CALCULATION_ITERATIONS',
+           'PLANCKIAN_LOCUS_TABLE_SAMPLES',
+           'PLANCKIAN_LOCUS_TABLES_CACHE_SIZE',
            'ROBERTSON_ISOTEMPERATURE_LINES_DATA',
            'ROBERTSON_ISOTEMPERATURE_LINES_RUVT',
            'ROBERTSON_ISOTEMPERATURE_LINES',
            'planckian_table',
            'planckian_table_minimal_distance_index',
+           'planckian_locus_table',
            'uv_to_CCT_Ohno2013',
            'CCT_to_uv_Ohno2013',
+           'uv_to_CCT_planckian_locus_table',
            'uv_to_CCT_Robertson1968',
            'CCT_to_uv_Robertson1968',
            'CCT_to_uv_Krystek1985',
@@ -104,11 +120,31 @@ __all__ = ['PLANCKIAN_TABLE_TUVD',
 PLANCKIAN_TABLE_TUVD = namedtuple('PlanckianTable_Tuvdi',
                                   ('Ti', 'ui', 'vi', 'di'))
 
+PLANCKIAN_LOCUS_TABLE_TUVDUDV = namedtuple(
+    'PlanckianLocusTable_Tuvdudv', ('T', 'u', 'v', 'du', 'dv'))
+
 CCT_MINIMAL = 1000
 CCT_MAXIMAL = 100000
 CCT_SAMPLES = 10
 CCT_CALCULATION_ITERATIONS = 6
 
+PLANCKIAN_LOCUS_TABLE_SAMPLES = 4096
+"""
+Temperatures count of the *Planckian* locus tables, the temperatures are
+geometrically spaced, i.e. about every 0.1% over the default range.
+
+PLANCKIAN_LOCUS_TABLE_SAMPLES : int
+"""
+
+PLANCKIAN_LOCUS_TABLES_CACHE_SIZE = 8
+"""
+Maximum count of *Planckian* locus tables kept in memory.
+
+PLANCKIAN_LOCUS_TABLES_CACHE_SIZE : int
+"""
+
+_PLANCKIAN_LOCUS_TABLES_CACHE = None
+
 ROBERTSON_ISOTEMPERATURE_LINES_DATA = (
     (0, 0.18006, 0.26352, -0.24341),
     (10, 0.18066, 0.26589, -0.25479),
@@ -272,56 +308,192 @@ def planckian_table_minimal_distance_index(planckian_table_):
     return distances.index(min(distances))
 
 
-def uv_to_CCT_Ohno2013(uv,
-                       cmfs=STANDARD_OBSERVERS_CMFS.get(
-                           'CIE 1931 2 Degree Standard Observer'),
-                       start=CCT_MINIMAL,
-                       end=CCT_MAXIMAL,
-                       count=CCT_SAMPLES,
-                       iterations=CCT_CALCULATION_ITERATIONS):
+def _planckian_locus(T, cmfs):
     """
-    Returns the correlated colour temperature :math:`T_{cp}` and
-    :math:`\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
-    coordinates, colour matching functions and temperature range using
-    *Ohno (2013)* method.
+    Returns the *CIE UCS* colourspace *uv* chromaticity coordinates of the
+    planckian radiators at given temperatures and their derivatives with
+    respect to the temperature.
 
-    The iterations parameter defines the calculations precision: The higher its
-    value, the more planckian tables will be generated through cascade
-    expansion in order to converge to the exact solution.
+    Parameters
+    ----------
+    T : array_like
+        Temperatures :math:`T[K]` in kelvin degrees.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+
+    Returns
+    -------
+    tuple
+        *uv* chromaticity coordinates and their derivatives
+        :math:`\cfrac{duv}{dT}`.
+
+    Notes
+    -----
+    -   The spectral radiances of the planckian radiators and their analytical
+        derivatives are evaluated on a (temperatures, wavelengths) grid and
+        converted to *CIE XYZ* tristimulus values as multi-spectral arrays.
+    """
+
+    T = np.asarray(T, dtype=np.float_)
+
+    shape = cmfs.shape
+    wavelengths = shape.range() * 1e-9
+
+    P = planck_law(wavelengths, T[..., np.newaxis])
+    x = C2 / (N * wavelengths * T[..., np.newaxis])
+    dP_dT = P * (x / T[..., np.newaxis]) / -np.expm1(-x)
+
+    XYZ = multi_spectral_to_XYZ(P, shape, cmfs)
+    dXYZ_dT = multi_spectral_to_XYZ(dP_dT, shape, cmfs)
+
+    uv = UCS_to_uv(XYZ_to_UCS(XYZ))
+
+    X, Y, Z = tsplit(XYZ)
+    dX_dT, dY_dT, dZ_dT = tsplit(dXYZ_dT)
+    D = X + 15 * Y + 3 * Z
+    dD_dT = dX_dT + 15 * dY_dT + 3 * dZ_dT
+
+    duv_dT = tstack((4 * (dX_dT * D - X * dD_dT) / D ** 2,
+                     6 * (dY_dT * D - Y * dD_dT) / D ** 2))
+
+    return uv, duv_dT
+
+
+def _planckian_locus_hermite_coefficients(table, index):
+    """
+    Returns the coefficients of the cubic *Hermite* polynomials interpolating
+    the *CIE UCS* colourspace *uv* chromaticity coordinates of the *Planckian*
+    locus in given table intervals.
+
+    Parameters
+    ----------
+    table : PlanckianLocusTable_Tuvdudv
+        *Planckian* locus table.
+    index : array_like
+        Index :math:`i` of the table intervals :math:`[T_i, T_{i + 1}]`.
+
+    Returns
+    -------
+    tuple
+        Coefficients :math:`c_0`, :math:`c_1`, :math:`c_2` and :math:`c_3` of
+        the polynomials :math:`uv(t) = c_0 + c_1t + c_2t^2 + c_3t^3` with
+        :math:`t = \cfrac{T - T_i}{T_{i + 1} - T_i}` in domain [0, 1].
+    """
+
+    h = np.asarray(table.T[index + 1] - table.T[index])[..., np.newaxis]
+    p_0 = tstack((table.u[index], table.v[index]))
+    p_1 = tstack((table.u[index + 1], table.v[index + 1]))
+    m_0 = tstack((table.du[index], table.dv[index])) * h
+    m_1 = tstack((table.du[index + 1], table.dv[index + 1])) * h
+
+    return (p_0,
+            m_0,
+            3 * (p_1 - p_0) - 2 * m_0 - m_1,
+            2 * (p_0 - p_1) + m_0 + m_1)
+
+
+def planckian_locus_table(
+        cmfs=STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer'),
+        start=CCT_MINIMAL,
+        end=CCT_MAXIMAL,
+        samples=PLANCKIAN_LOCUS_TABLE_SAMPLES):
+    """
+    Returns a densely sampled *Planckian* locus table for given colour
+    matching functions and temperature range.
 
     Parameters
     ----------
-    uv : array_like
-        *CIE UCS* colourspace *uv* chromaticity coordinates.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
     start : numeric, optional
         Temperature range start in kelvins.
     end : numeric, optional
         Temperature range end in kelvins.
-    count : int, optional
-        Temperatures count in the planckian tables.
-    iterations : int, optional
-        Number of planckian tables to generate.
+    samples : int, optional
+        Temperatures count in the *Planckian* locus table.
 
     Returns
     -------
-    ndarray
-        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
+    PlanckianLocusTable_Tuvdudv
+        *Planckian* locus table, the temperatures :math:`T`, the *CIE UCS*
+        colourspace *u* and *v* chromaticity coordinates and their
+        derivatives :math:`\cfrac{du}{dT}` and :math:`\cfrac{dv}{dT}` as
+        read-only *ndarray*.
 
-    References
-    ----------
-    .. [3]  Ohno, Y. (2014). Practical Use and Calculation of CCT and Duv.
-            LEUKOS, 10(1), 47–55. doi:10.1080/15502724.2014.839020
+    Notes
+    -----
+    -   The temperatures are geometrically spaced so that the table resolution
+        is constant relatively to the temperature.
+    -   The tables are cached in :attr:`_PLANCKIAN_LOCUS_TABLES_CACHE`
+        attribute, a :class:`colour.utilities.LRUCache` class instance keeping
+        the :attr:`PLANCKIAN_LOCUS_TABLES_CACHE_SIZE` most recently used
+        tables. Their identifier key is a digest of the colour matching
+        functions spectral data along the temperature range and samples
+        count.
 
     Examples
     --------
-    >>> from colour import STANDARD_OBSERVERS_CMFS
-    >>> cmfs = 'CIE 1931 2 Degree Standard Observer'
-    >>> cmfs = STANDARD_OBSERVERS_CMFS.get(cmfs)
-    >>> uv = np.array([0.1978, 0.3122])
-    >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
-    array([  6.5075128...e+03,   3.2233587...e-03])
+    >>> table = planckian_locus_table()
+    >>> table.T[0], table.T[-1]
+    (1000.0, 100000.0)
+    >>> table.u[0], table.v[0]  # doctest: +ELLIPSIS
+    (0.4479628..., 0.3546296...)
+    """
+
+    global _PLANCKIAN_LOCUS_TABLES_CACHE
+    if _PLANCKIAN_LOCUS_TABLES_CACHE is None:
+        _PLANCKIAN_LOCUS_TABLES_CACHE = LRUCache(
+            PLANCKIAN_LOCUS_TABLES_CACHE_SIZE)
+
+    name_plt = content_hash(cmfs.digest, start, end, samples)
+    table = _PLANCKIAN_LOCUS_TABLES_CACHE.get(name_plt)
+    if table is not None:
+        return table
+
+    T = np.logspace(np.log10(start), np.log10(end), samples)
+    # Removing the logarithm round-trip error on the range boundaries.
+    T[0], T[-1] = start, end
+
+    uv, duv_dT = _planckian_locus(T, cmfs)
+    u, v = tsplit(uv)
+    du, dv = tsplit(duv_dT)
+
+    table = PLANCKIAN_LOCUS_TABLE_TUVDUDV(
+        *[np.ascontiguousarray(x) for x in (T, u, v, du, dv)])
+    for array in table:
+        array.setflags(write=False)
+
+    _PLANCKIAN_LOCUS_TABLES_CACHE[name_plt] = table
+
+    return table
+
+
+def _uv_to_CCT_Ohno2013(uv, cmfs, start, end, count, iterations):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` from given single *CIE UCS* colourspace *uv*
+    chromaticity coordinates using *Ohno (2013)* method.
+
+    Parameters
+    ----------
+    uv : array_like
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    start : numeric
+        Temperature range start in kelvins.
+    end : numeric
+        Temperature range end in kelvins.
+    count : int
+        Temperatures count in the planckian tables.
+    iterations : int
+        Number of planckian tables to generate.
+
+    Returns
+    -------
+    ndarray
+        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
     """
 
     # Ensuring we do at least one iteration to initialise variables.
@@ -378,6 +550,71 @@ def uv_to_CCT_Ohno2013(uv,
     return np.array([T, D_uv])
 
 
+def uv_to_CCT_Ohno2013(uv,
+                       cmfs=STANDARD_OBSERVERS_CMFS.get(
+                           'CIE 1931 2 Degree Standard Observer'),
+                       start=CCT_MINIMAL,
+                       end=CCT_MAXIMAL,
+                       count=CCT_SAMPLES,
+                       iterations=CCT_CALCULATION_ITERATIONS):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
+    coordinates, colour matching functions and temperature range using
+    *Ohno (2013)* method.
+
+    The iterations parameter defines the calculations precision: The higher its
+    value, the more planckian tables will be generated through cascade
+    expansion in order to converge to the exact solution.
+
+    Parameters
+    ----------
+    uv : array_like
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    start : numeric, optional
+        Temperature range start in kelvins.
+    end : numeric, optional
+        Temperature range end in kelvins.
+    count : int, optional
+        Temperatures count in the planckian tables.
+    iterations : int, optional
+        Number of planckian tables to generate.
+
+    Returns
+    -------
+    ndarray
+        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
+
+    Notes
+    -----
+    -   The planckian tables cascade expansion is performed independently for
+        each of the given *uv* chromaticity coordinates.
+
+    References
+    ----------
+    .. [3]  Ohno, Y. (2014). Practical Use and Calculation of CCT and Duv.
+            LEUKOS, 10(1), 47–55. doi:10.1080/15502724.2014.839020
+
+    Examples
+    --------
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = 'CIE 1931 2 Degree Standard Observer'
+    >>> cmfs = STANDARD_OBSERVERS_CMFS.get(cmfs)
+    >>> uv = np.array([0.1978, 0.3122])
+    >>> uv_to_CCT_Ohno2013(uv, cmfs)  # doctest: +ELLIPSIS
+    array([  6.5075128...e+03,   3.2233587...e-03])
+    """
+
+    uv = np.asarray(uv)
+
+    CCT_D_uv = [_uv_to_CCT_Ohno2013(x, cmfs, start, end, count, iterations)
+                for x in np.reshape(uv, (-1, 2))]
+
+    return np.reshape(CCT_D_uv, uv.shape)
+
+
 def CCT_to_uv_Ohno2013(CCT,
                        D_uv=0,
                        cmfs=STANDARD_OBSERVERS_CMFS.get(
@@ -389,9 +626,9 @@ def CCT_to_uv_Ohno2013(CCT,
 
     Parameters
     ----------
-    CCT : numeric
+    CCT : numeric or array_like
         Correlated colour temperature :math:`T_{cp}`.
-    D_uv : numeric, optional
+    D_uv : numeric or array_like, optional
         :math:`\Delta_{uv}`.
     cmfs : XYZ_ColourMatchingFunctions, optional
         Standard observer colour matching functions.
@@ -401,6 +638,13 @@ def CCT_to_uv_Ohno2013(CCT,
     ndarray
         *CIE UCS* colourspace *uv* chromaticity coordinates.
 
+    Notes
+    -----
+    -   The *Planckian* locus and its normal are interpolated in the default
+        :func:`planckian_locus_table` definition table, the correlated colour
+        temperatures outside its range are computed from the spectral
+        radiances of the planckian radiators.
+
     References
     ----------
     .. [4]  Ohno, Y. (2014). Practical Use and Calculation of CCT and Duv.
@@ -417,31 +661,155 @@ def CCT_to_uv_Ohno2013(CCT,
     array([ 0.1977999...,  0.3122004...])
     """
 
-    shape = cmfs.shape
-    delta = 0.01
-
-    spd = blackbody_spd(CCT, shape)
-    XYZ = spectral_to_XYZ(spd, cmfs)
-    XYZ *= 1 / np.max(XYZ)
-    UVW = XYZ_to_UCS(XYZ)
-    u0, v0 = UCS_to_uv(UVW)
-
-    if D_uv == 0:
-        return np.array([u0, v0])
-    else:
-        spd = blackbody_spd(CCT + delta, shape)
-        XYZ = spectral_to_XYZ(spd, cmfs)
-        XYZ *= 1 / np.max(XYZ)
-        UVW = XYZ_to_UCS(XYZ)
-        u1, v1 = UCS_to_uv(UVW)
+    CCT = np.asarray(CCT, dtype=np.float_)
+    D_uv = np.asarray(D_uv)
+
+    shape = CCT.shape
+    CCT = np.ravel(CCT)
+
+    table = planckian_locus_table(cmfs)
 
-        du = u0 - u1
-        dv = v0 - v1
+    index = np.clip(np.searchsorted(table.T, CCT) - 1, 0, len(table.T) - 2)
+    h = (table.T[index + 1] - table.T[index])[..., np.newaxis]
+    t = (CCT[..., np.newaxis] - table.T[index][..., np.newaxis]) / h
 
-        u = u0 - D_uv * (dv / np.hypot(du, dv))
-        v = v0 + D_uv * (du / np.hypot(du, dv))
+    c_0, c_1, c_2, c_3 = _planckian_locus_hermite_coefficients(table, index)
+    uv_0 = c_0 + t * (c_1 + t * (c_2 + t * c_3))
+    duv_dT = (c_1 + t * (2 * c_2 + 3 * t * c_3)) / h
 
-        return np.array([u, v])
+    outside = np.logical_or(CCT < table.T[0], CCT > table.T[-1])
+    if np.any(outside):
+        uv_0[outside], duv_dT[outside] = _planckian_locus(CCT[outside], cmfs)
+
+    u_0, v_0 = tsplit(np.reshape(uv_0, shape + (2,)))
+    du, dv = tsplit(np.reshape(duv_dT, shape + (2,)))
+
+    u = u_0 + D_uv * (dv / np.hypot(du, dv))
+    v = v_0 - D_uv * (du / np.hypot(du, dv))
+
+    return tstack((u, v))
+
+
+def uv_to_CCT_planckian_locus_table(
+        uv,
+        cmfs=STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer'),
+        start=CCT_MINIMAL,
+        end=CCT_MAXIMAL,
+        samples=PLANCKIAN_LOCUS_TABLE_SAMPLES,
+        iterations=CCT_CALCULATION_ITERATIONS):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` from given *CIE UCS* colourspace *uv* chromaticity
+    coordinates, colour matching functions and temperature range using
+    *Planckian Locus Table* method.
+
+    The closest *Planckian* locus table interval is located by binary search
+    in a cached densely sampled *Planckian* locus table, the iterations
+    parameter then defines the calculations precision: The higher its value,
+    the more local refinement iterations will be performed on the locus
+    interpolated in that interval in order to converge to the exact solution.
+
+    Parameters
+    ----------
+    uv : array_like
+        *CIE UCS* colourspace *uv* chromaticity coordinates.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    start : numeric, optional
+        Temperature range start in kelvins.
+    end : numeric, optional
+        Temperature range end in kelvins.
+    samples : int, optional
+        Temperatures count in the *Planckian* locus table.
+    iterations : int, optional
+        Number of local refinement iterations.
+
+    Returns
+    -------
+    ndarray
+        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`.
+
+    Notes
+    -----
+    -   The *Planckian* locus table is built once per colour matching
+        functions, temperature range and temperatures count by
+        :func:`planckian_locus_table` definition.
+    -   The locus is interpolated in the closest table interval with a cubic
+        *Hermite* polynomial of the table chromaticity coordinates and their
+        derivatives, the local refinement is a *Newton-Raphson* minimisation
+        of the distance to that polynomial.
+    -   The solution is the closest point of the interpolated locus instead
+        of the triangular and parabolic solutions of the planckian tables
+        cascade expansion of :func:`uv_to_CCT_Ohno2013` definition, the
+        results are thus slightly different but the computation is orders of
+        magnitude faster, e.g. for images.
+
+    Examples
+    --------
+    >>> from colour import STANDARD_OBSERVERS_CMFS
+    >>> cmfs = 'CIE 1931 2 Degree Standard Observer'
+    >>> cmfs = STANDARD_OBSERVERS_CMFS.get(cmfs)
+    >>> uv = np.array([0.1978, 0.3122])
+    >>> uv_to_CCT_planckian_locus_table(uv, cmfs)  # doctest: +ELLIPSIS
+    array([  6.5074692...e+03,   3.2233462...e-03])
+    """
+
+    table = planckian_locus_table(cmfs, start, end, samples)
+
+    u, v = tsplit(uv)
+
+    def projection(index):
+        """
+        Returns the projection of the distance vector between given
+        chromaticity coordinates and the *Planckian* locus table samples at
+        given index on the locus tangent.
+        """
+
+        return ((u - table.u[index]) * table.du[index] +
+                (v - table.v[index]) * table.dv[index])
+
+    # Binary search of the table interval holding the closest point of the
+    # locus, the projection decreases from positive to negative values.
+    index_s = np.zeros(u.shape, dtype=np.int_)
+    index_e = np.full(u.shape, len(table.T) - 1, dtype=np.int_)
+
+    if np.any(projection(index_s) <= 0):
+        warning(
+            ('Minimal distance index is on lowest planckian table bound, '
+             'unpredictable results may occur!'))
+    if np.any(projection(index_e) > 0):
+        warning(
+            ('Minimal distance index is on highest planckian table bound, '
+             'unpredictable results may occur!'))
+
+    for _i in range(int(np.ceil(np.log2(len(table.T) - 1)))):
+        index = (index_s + index_e) // 2
+        positive = projection(index) > 0
+        index_s = np.where(positive, index, index_s)
+        index_e = np.where(positive, index_e, index)
+
+    # Local refinement, minimising the distance to the interpolated locus
+    # with respect to the normalised temperature in the table interval.
+    c_0, c_1, c_2, c_3 = _planckian_locus_hermite_coefficients(table, index_s)
+    d_0 = tstack((u, v)) - c_0
+    t = np.full(u.shape + (1,), 0.5)
+    for _i in range(max(iterations, 1)):
+        d_uv = d_0 - t * (c_1 + t * (c_2 + t * c_3))
+        duv_dt = c_1 + t * (2 * c_2 + 3 * t * c_3)
+        d2uv_dt2 = 2 * c_2 + 6 * t * c_3
+
+        g = np.sum(d_uv * duv_dt, axis=-1)[..., np.newaxis]
+        dg_dt = np.sum(d_uv * d2uv_dt2 - duv_dt ** 2, axis=-1)[..., np.newaxis]
+        t = np.clip(t - g / dg_dt, 0, 1)
+
+    u_d, v_d = tsplit(d_0 - t * (c_1 + t * (c_2 + t * c_3)))
+    t = t[..., 0]
+
+    T = table.T[index_s] + (table.T[index_s + 1] - table.T[index_s]) * t
+    D_uv = np.where(v_d >= 0, 1, -1) * np.hypot(u_d, v_d)
+
+    return tstack((T, D_uv))
 
 
 def uv_to_CCT_Robertson1968(uv):
@@ -478,57 +846,49 @@ def uv_to_CCT_Robertson1968(uv):
     array([  6.5000162...e+03,   8.3333289...e-03])
     """
 
-    u, v = uv
-
-    last_dt = last_dv = last_du = 0
-
-    for i in range(1, 31):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_previous = ROBERTSON_ISOTEMPERATURE_LINES[i - 1]
-
-        du = 1
-        dv = wr_ruvt.t
-
-        length = np.hypot(1, dv)
-
-        du /= length
-        dv /= length
+    u, v = tsplit(uv)
 
-        uu = u - wr_ruvt.u
-        vv = v - wr_ruvt.v
+    r_i, u_i, v_i, t_i = tsplit(
+        np.asarray(ROBERTSON_ISOTEMPERATURE_LINES_DATA))
+    du_i = 1 / np.hypot(1, t_i)
+    dv_i = t_i / np.hypot(1, t_i)
 
-        dt = -uu * dv + vv * du
+    def distance(i):
+        """
+        Returns the signed distance of the chromaticity coordinates to given
+        isotemperature lines.
+        """
 
-        if dt <= 0 or i == 30:
-            if dt > 0:
-                dt = 0
+        return -(u - u_i[i]) * dv_i[i] + (v - v_i[i]) * du_i[i]
 
-            dt = -dt
+    # Index of the first isotemperature line, from the second one, having
+    # the chromaticity coordinates on its left side, or of the last one.
+    on_left = (-(u[..., np.newaxis] - u_i[1:]) * dv_i[1:] +
+               (v[..., np.newaxis] - v_i[1:]) * du_i[1:]) <= 0
+    on_left[..., -1] = True
+    i = np.argmax(on_left, axis=-1) + 1
 
-            f = 0 if i == 1 else dt / (last_dt + dt)
+    dt = -np.minimum(distance(i), 0)
+    last_dt = distance(i - 1)
 
-            T = 1.0e6 / (wr_ruvt_previous.r * f + wr_ruvt.r * (1 - f))
+    f = np.where(i == 1, 0, dt / (last_dt + dt))
 
-            uu = u - (wr_ruvt_previous.u * f + wr_ruvt.u * (1 - f))
-            vv = v - (wr_ruvt_previous.v * f + wr_ruvt.v * (1 - f))
+    T = 1.0e6 / (r_i[i - 1] * f + r_i[i] * (1 - f))
 
-            du = du * (1 - f) + last_du * f
-            dv = dv * (1 - f) + last_dv * f
+    uu = u - (u_i[i - 1] * f + u_i[i] * (1 - f))
+    vv = v - (v_i[i - 1] * f + v_i[i] * (1 - f))
 
-            length = np.hypot(du, dv)
+    du = du_i[i] * (1 - f) + du_i[i - 1] * f
+    dv = dv_i[i] * (1 - f) + dv_i[i - 1] * f
 
-            du /= length
-            dv /= length
+    length = np.hypot(du, dv)
 
-            D_uv = uu * du + vv * dv
+    du /= length
+    dv /= length
 
-            break
+    D_uv = uu * du + vv * dv
 
-        last_dt = dt
-        last_du = du
-        last_dv = dv
-
-    return np.array([T, -D_uv])
+    return tstack((T, -D_uv))
 
 
 def CCT_to_uv_Robertson1968(CCT, D_uv=0):
@@ -539,9 +899,9 @@ def CCT_to_uv_Robertson1968(CCT, D_uv=0):
 
     Parameters
     ----------
-    CCT : numeric
+    CCT : numeric or array_like
         Correlated colour temperature :math:`T_{cp}`.
-    D_uv : numeric
+    D_uv : numeric or array_like
         :math:`\Delta_{uv}`.
 
     Returns
@@ -568,42 +928,33 @@ def CCT_to_uv_Robertson1968(CCT, D_uv=0):
     array([ 0.1937413...,  0.3152210...])
     """
 
-    r = 1.0e6 / CCT
-
-    for i in range(30):
-        wr_ruvt = ROBERTSON_ISOTEMPERATURE_LINES[i]
-        wr_ruvt_next = ROBERTSON_ISOTEMPERATURE_LINES[i + 1]
-
-        if r < wr_ruvt_next.r or i == 29:
-            f = (wr_ruvt_next.r - r) / (wr_ruvt_next.r - wr_ruvt.r)
+    r = 1.0e6 / np.asarray(CCT)
 
-            u = wr_ruvt.u * f + wr_ruvt_next.u * (1 - f)
-            v = wr_ruvt.v * f + wr_ruvt_next.v * (1 - f)
+    r_i, u_i, v_i, t_i = tsplit(
+        np.asarray(ROBERTSON_ISOTEMPERATURE_LINES_DATA))
+    uu_i = 1 / np.hypot(1, t_i)
+    vv_i = t_i / np.hypot(1, t_i)
 
-            uu1 = uu2 = 1.0
-            vv1, vv2 = wr_ruvt.t, wr_ruvt_next.t
+    # Index of the isotemperature lines enclosing the reciprocal temperature.
+    i = np.clip(np.searchsorted(r_i, r, side='right') - 1, 0, 29)
 
-            length1 = np.hypot(1, vv1)
-            length2 = np.hypot(1, vv2)
+    f = (r_i[i + 1] - r) / (r_i[i + 1] - r_i[i])
 
-            uu1 /= length1
-            vv1 /= length1
+    u = u_i[i] * f + u_i[i + 1] * (1 - f)
+    v = v_i[i] * f + v_i[i + 1] * (1 - f)
 
-            uu2 /= length2
-            vv2 /= length2
+    uu = uu_i[i] * f + uu_i[i + 1] * (1 - f)
+    vv = vv_i[i] * f + vv_i[i + 1] * (1 - f)
 
-            uu3 = uu1 * f + uu2 * (1 - f)
-            vv3 = vv1 * f + vv2 * (1 - f)
+    length = np.hypot(uu, vv)
 
-            len3 = np.sqrt(uu3 * uu3 + vv3 * vv3)
+    uu /= length
+    vv /= length
 
-            uu3 /= len3
-            vv3 /= len3
+    u = u - uu * D_uv
+    v = v - vv * D_uv
 
-            u += uu3 * -D_uv
-            v += vv3 * -D_uv
-
-            return np.array([u, v])
+    return tstack((u, v))
 
 
 def CCT_to_uv_Krystek1985(CCT):
@@ -613,7 +964,7 @@ def CCT_to_uv_Krystek1985(CCT):
 
     Parameters
     ----------
-    CCT : numeric
+    CCT : numeric or array_like
         Correlated colour temperature :math:`T_{cp}`.
 
     Returns
@@ -650,20 +1001,24 @@ def CCT_to_uv_Krystek1985(CCT):
 
 UV_TO_CCT_METHODS = CaseInsensitiveMapping(
     {'Ohno 2013': uv_to_CCT_Ohno2013,
+     'Planckian Locus Table': uv_to_CCT_planckian_locus_table,
      'Robertson 1968': uv_to_CCT_Robertson1968})
 """
 Supported *CIE UCS* colourspace *uv* chromaticity coordinates to correlated
 colour temperature :math:`T_{cp}` computation methods.
 
 UV_TO_CCT_METHODS : CaseInsensitiveMapping
-    **{'Ohno 2013', 'Robertson 1968'}**
+    **{'Ohno 2013', 'Planckian Locus Table', 'Robertson 1968'}**
 
 Aliases:
 
 -   'ohno2013': 'Ohno 2013'
+-   'planckian_locus_table': 'Planckian Locus Table'
 -   'robertson1968': 'Robertson 1968'
 """
 UV_TO_CCT_METHODS['ohno2013'] = UV_TO_CCT_METHODS['Ohno 2013']
+UV_TO_CCT_METHODS['planckian_locus_table'] = (
+    UV_TO_CCT_METHODS['Planckian Locus Table'])
 UV_TO_CCT_METHODS['robertson1968'] = UV_TO_CCT_METHODS['Robertson 1968']
 
 
@@ -678,26 +1033,30 @@ def uv_to_CCT(uv, method='Ohno 2013', **kwargs):
     uv : array_like
         *CIE UCS* colourspace *uv* chromaticity coordinates.
     method : unicode, optional
-        **{'Ohno 2013', 'Robertson 1968'}**,
+        **{'Ohno 2013', 'Planckian Locus Table', 'Robertson 1968'}**,
         Computation method.
 
     Other Parameters
     ----------------
     cmfs : XYZ_ColourMatchingFunctions, optional
-        {:func:`uv_to_CCT_Ohno2013`},
+        {:func:`uv_to_CCT_Ohno2013`, :func:`uv_to_CCT_planckian_locus_table`},
         Standard observer colour matching functions.
     start : numeric, optional
-        {:func:`uv_to_CCT_Ohno2013`},
+        {:func:`uv_to_CCT_Ohno2013`, :func:`uv_to_CCT_planckian_locus_table`},
         Temperature range start in kelvins.
     end : numeric, optional
-        {:func:`uv_to_CCT_Ohno2013`},
+        {:func:`uv_to_CCT_Ohno2013`, :func:`uv_to_CCT_planckian_locus_table`},
         Temperature range end in kelvins.
     count : int, optional
         {:func:`uv_to_CCT_Ohno2013`},
         Temperatures count in the planckian tables.
+    samples : int, optional
+        {:func:`uv_to_CCT_planckian_locus_table`},
+        Temperatures count in the *Planckian* locus table.
     iterations : int, optional
-        {:func:`uv_to_CCT_Ohno2013`},
-        Number of planckian tables to generate.
+        {:func:`uv_to_CCT_Ohno2013`, :func:`uv_to_CCT_planckian_locus_table`},
+        Number of planckian tables to generate or of local refinement
+        iterations.
 
     Returns
     -------
@@ -716,9 +1075,7 @@ def uv_to_CCT(uv, method='Ohno 2013', **kwargs):
 
     function = UV_TO_CCT_METHODS[method]
 
-    filter_kwargs(function, **kwargs)
-
-    return function(uv, **kwargs)
+    return function(uv, **filter_kwargs(function, **kwargs))
 
 
 CCT_TO_UV_METHODS = CaseInsensitiveMapping(
@@ -748,7 +1105,7 @@ def CCT_to_uv(CCT, method='Ohno 2013', **kwargs):
 
     Parameters
     ----------
-    CCT : numeric
+    CCT : numeric or array_like
         Correlated colour temperature :math:`T_{cp}`.
     method : unicode, optional
         **{'Ohno 2013', 'Robertson 1968', 'Krystek 1985}**,
@@ -756,7 +1113,7 @@ def CCT_to_uv(CCT, method='Ohno 2013', **kwargs):
 
     Other Parameters
     ----------------
-    D_uv : numeric
+    D_uv : numeric or array_like
        {:func:`CCT_to_uv_Ohno2013, CCT_to_uv_Robertson1968`},
        :math:`\Delta_{uv}`.
     cmfs : XYZ_ColourMatchingFunctions, optional
@@ -781,9 +1138,7 @@ def CCT_to_uv(CCT, method='Ohno 2013', **kwargs):
 
     function = CCT_TO_UV_METHODS[method]
 
-    filter_kwargs(function, **kwargs)
-
-    return function(CCT, **kwargs)
+    return function(CCT, **filter_kwargs(function, **kwargs))
 
 
 def xy_to_CCT_McCamy1992(xy):
@@ -0,0 +1,380 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Correlated Colour Temperature :math:`T_{cp}` Maps
+=================================================
+
+Defines per-pixel correlated colour temperature :math:`T_{cp}` and
+:math:`\Delta_{uv}` maps computation objects for images:
+
+-   :func:`XYZ_to_CCT_map`: Correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` maps computation of given *CIE XYZ* tristimulus values
+    image.
+-   :func:`RGB_to_CCT_map`: Correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` maps computation of given *RGB* colourspace image.
+
+See Also
+--------
+:mod:`colour.temperature.cct`
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.models import RGB_to_XYZ, UCS_to_uv, XYZ_to_UCS, XYZ_to_xy
+from colour.temperature.cct import (
+    CCT_MAXIMAL,
+    CCT_MINIMAL,
+    UV_TO_CCT_METHODS,
+    XY_TO_CCT_METHODS,
+    CCT_to_uv_Ohno2013)
+from colour.utilities import filter_kwargs, tsplit, tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['CCT_MAP_TILE_SIZE',
+           'XYZ_to_CCT_map',
+           'RGB_to_CCT_map']
+
+CCT_MAP_TILE_SIZE = 65536
+"""
+Count of pixels processed by each tile of :func:`XYZ_to_CCT_map` and
+:func:`RGB_to_CCT_map` definitions.
+
+CCT_MAP_TILE_SIZE : int
+"""
+
+
+def _CCT_map_tile(tile, to_XYZ, method, domain, kwargs):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` of given image tile, this definition is the
+    :func:`_CCT_map` definition tiles task.
+
+    Parameters
+    ----------
+    tile : ndarray, (N, 3)
+        Image tile.
+    to_XYZ : callable
+        Definition converting the image tile to *CIE XYZ* tristimulus values,
+        *None* if the image is already in *CIE XYZ* tristimulus values.
+    method : unicode
+        Computation method.
+    domain : array_like
+        Correlated colour temperature :math:`T_{cp}` domain in kelvins.
+    kwargs : dict
+        Keywords arguments passed to the computation method.
+
+    Returns
+    -------
+    ndarray, (N, 2)
+        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`,
+        *NaN* for the masked pixels.
+    """
+
+    XYZ = tile if to_XYZ is None else to_XYZ(tile)
+
+    CCT_D_uv = np.full((XYZ.shape[0], 2), np.nan)
+
+    valid = np.logical_and(np.all(np.isfinite(XYZ), axis=-1), XYZ[..., 1] > 0)
+    if not np.any(valid):
+        return CCT_D_uv
+
+    XYZ = XYZ[valid]
+    uv = UCS_to_uv(XYZ_to_UCS(XYZ))
+
+    if method in UV_TO_CCT_METHODS:
+        function = UV_TO_CCT_METHODS[method]
+        CCT, D_uv = tsplit(function(uv, **filter_kwargs(function, **kwargs)))
+    else:
+        CCT = XY_TO_CCT_METHODS[method](XYZ_to_xy(XYZ))
+
+        # :math:`\Delta_{uv}` is the signed distance to the *Planckian* locus
+        # along its normal at the computed correlated colour temperature.
+        cmfs_kwargs = filter_kwargs(CCT_to_uv_Ohno2013, **kwargs)
+        CCT_l = np.clip(np.nan_to_num(CCT), domain[0], domain[1])
+        uv_0 = CCT_to_uv_Ohno2013(CCT_l, 0, **cmfs_kwargs)
+        normal = CCT_to_uv_Ohno2013(CCT_l, 1, **cmfs_kwargs) - uv_0
+        D_uv = np.sum((uv - uv_0) * normal, axis=-1)
+
+    in_domain = np.logical_and(CCT >= domain[0], CCT <= domain[1])
+    CCT_D_uv[valid] = np.where(in_domain[..., np.newaxis],
+                               tstack((CCT, D_uv)),
+                               np.nan)
+
+    return CCT_D_uv
+
+
+def _CCT_map(image, to_XYZ, method, domain, workers, tile_size, out, kwargs):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` maps of given image by splitting it into tiles,
+    optionally processed concurrently by a pool of threads.
+
+    Parameters
+    ----------
+    image : array_like
+        Image of shape (..., 3).
+    to_XYZ : callable
+        Definition converting the image tiles to *CIE XYZ* tristimulus values,
+        *None* if the image is already in *CIE XYZ* tristimulus values.
+    method : unicode
+        Computation method.
+    domain : array_like
+        Correlated colour temperature :math:`T_{cp}` domain in kelvins.
+    workers : int
+        Threads count, the tiles are processed sequentially if 1.
+    tile_size : int
+        Count of pixels processed by each tile.
+    out : ndarray
+        *C-contiguous* array of shape (..., 2) the maps are written into.
+    kwargs : dict
+        Keywords arguments passed to the computation method.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`
+        maps.
+    """
+
+    assert method in UV_TO_CCT_METHODS or method in XY_TO_CCT_METHODS, (
+        '"{0}" method is not supported, it must be one of "{1}"!'.format(
+            method, sorted(set(UV_TO_CCT_METHODS.keys()) |
+                           set(XY_TO_CCT_METHODS.keys()))))
+
+    image = np.asarray(image)
+    output_shape = image.shape[:-1] + (2,)
+    image = np.reshape(image, (-1, 3))
+    pixels_c = image.shape[0]
+
+    if out is None:
+        out = np.empty(output_shape)
+
+    assert out.shape == output_shape and out.flags.c_contiguous, (
+        '"out" argument must be a "C-contiguous" array of "{0}" '
+        'shape!'.format(output_shape))
+
+    CCT_D_uv = np.reshape(out, (pixels_c, 2))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if workers == 1:
+            for start in range(0, pixels_c, tile_size):
+                CCT_D_uv[start:start + tile_size] = _CCT_map_tile(
+                    image[start:start + tile_size], to_XYZ, method, domain,
+                    kwargs)
+
+            return out
+
+        from concurrent.futures import (
+            FIRST_COMPLETED,
+            ThreadPoolExecutor,
+            wait)
+
+        def collect(futures, done):
+            """
+            Writes given completed futures results into the output array.
+            """
+
+            for future in done:
+                start = futures.pop(future)
+                CCT_D_uv[start:start + tile_size] = future.result()
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for start in range(0, pixels_c, tile_size):
+                if len(futures) >= 2 * workers:
+                    done, _pending = wait(futures,
+                                          return_when=FIRST_COMPLETED)
+                    collect(futures, done)
+
+                futures[pool.submit(
+                    _CCT_map_tile,
+                    image[start:start + tile_size],
+                    to_XYZ,
+                    method,
+                    domain,
+                    kwargs)] = start
+
+            collect(futures, list(futures))
+
+    return out
+
+
+def XYZ_to_CCT_map(XYZ,
+                   method='Planckian Locus Table',
+                   domain=(CCT_MINIMAL, CCT_MAXIMAL),
+                   workers=1,
+                   tile_size=CCT_MAP_TILE_SIZE,
+                   out=None,
+                   **kwargs):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` maps of given *CIE XYZ* tristimulus values image using
+    given method.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values image of shape (..., 3).
+    method : unicode, optional
+        **{'Planckian Locus Table', 'Ohno 2013', 'Robertson 1968',
+        'McCamy 1992', 'Hernandez 1999'}**,
+        Computation method.
+    domain : array_like, optional
+        Correlated colour temperature :math:`T_{cp}` domain in kelvins, the
+        pixels outside of it are masked.
+    workers : int, optional
+        Threads count, the tiles are processed sequentially if 1.
+    tile_size : int, optional
+        Count of pixels processed by each tile.
+    out : ndarray, optional
+        *C-contiguous* array of shape (..., 2) the maps are written into, e.g.
+        a :class:`numpy.memmap` class instance.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments passed to the computation method, e.g. ``cmfs`` and
+        ``iterations`` for *Planckian Locus Table* method.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`
+        maps.
+
+    See Also
+    --------
+    RGB_to_CCT_map
+
+    Notes
+    -----
+    -   Input *CIE XYZ* tristimulus values are in domain [0, :math:`\infty`].
+    -   The pixels with non-finite tristimulus values, null or negative
+        luminance or correlated colour temperature :math:`T_{cp}` outside of
+        ``domain`` argument are masked with *NaN* in both maps.
+    -   *McCamy 1992* and *Hernandez 1999* methods only compute the
+        correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}` is
+        then the signed distance of the *CIE UCS* colourspace *uv*
+        chromaticity coordinates to the *Planckian* locus along its normal at
+        that correlated colour temperature :math:`T_{cp}`.
+    -   *Ohno 2013* method performs the planckian tables cascade expansion
+        for each pixel and is thus much slower than *Planckian Locus Table*
+        method.
+    -   The tiles boundaries only depend on ``tile_size`` argument: the
+        results are deterministic regardless of the workers count.
+
+    Examples
+    --------
+    >>> XYZ = np.array([[[0.95047, 1.00000, 1.08883],
+    ...                  [0.96422, 1.00000, 0.82521]],
+    ...                 [[0.00000, 0.00000, 0.00000],
+    ...                  [np.nan, 1.00000, 1.00000]]])
+    >>> XYZ_to_CCT_map(XYZ)  # doctest: +ELLIPSIS
+    array([[[  6.5026934...e+03,   3.2053028...e-03],
+            [  5.0018131...e+03,   3.2032590...e-03]],
+    <BLANKLINE>
+           [[             nan,              nan],
+            [             nan,              nan]]])
+    """
+
+    return _CCT_map(XYZ, None, method, domain, workers, tile_size, out,
+                    kwargs)
+
+
+def RGB_to_CCT_map(RGB,
+                   colourspace,
+                   method='Planckian Locus Table',
+                   apply_decoding_cctf=False,
+                   domain=(CCT_MINIMAL, CCT_MAXIMAL),
+                   workers=1,
+                   tile_size=CCT_MAP_TILE_SIZE,
+                   out=None,
+                   **kwargs):
+    """
+    Returns the correlated colour temperature :math:`T_{cp}` and
+    :math:`\Delta_{uv}` maps of given *RGB* colourspace image using given
+    method.
+
+    Parameters
+    ----------
+    RGB : array_like
+        *RGB* colourspace image of shape (..., 3).
+    colourspace : RGB_Colourspace
+        *RGB* colourspace of the image.
+    method : unicode, optional
+        **{'Planckian Locus Table', 'Ohno 2013', 'Robertson 1968',
+        'McCamy 1992', 'Hernandez 1999'}**,
+        Computation method.
+    apply_decoding_cctf : bool, optional
+        Apply the *RGB* colourspace decoding colour component transfer
+        function, i.e. the image is non-linearly encoded.
+    domain : array_like, optional
+        Correlated colour temperature :math:`T_{cp}` domain in kelvins, the
+        pixels outside of it are masked.
+    workers : int, optional
+        Threads count, the tiles are processed sequentially if 1.
+    tile_size : int, optional
+        Count of pixels processed by each tile.
+    out : ndarray, optional
+        *C-contiguous* array of shape (..., 2) the maps are written into, e.g.
+        a :class:`numpy.memmap` class instance.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments passed to the computation method, e.g. ``cmfs`` and
+        ``iterations`` for *Planckian Locus Table* method.
+
+    Returns
+    -------
+    ndarray, (..., 2)
+        Correlated colour temperature :math:`T_{cp}`, :math:`\Delta_{uv}`
+        maps.
+
+    See Also
+    --------
+    XYZ_to_CCT_map
+
+    Notes
+    -----
+    -   Input *RGB* colourspace array is in domain [0, :math:`\infty`].
+    -   The image tiles are converted to *CIE XYZ* tristimulus values without
+        chromatic adaptation, i.e. relatively to the *RGB* colourspace
+        whitepoint, no *CIE XYZ* tristimulus values image is allocated.
+    -   The masking rules are those of :func:`XYZ_to_CCT_map` definition.
+
+    Examples
+    --------
+    >>> from colour import sRGB_COLOURSPACE
+    >>> RGB = np.array([[[1.00, 1.00, 1.00],
+    ...                  [1.00, 0.50, 0.25]]])
+    >>> RGB_to_CCT_map(RGB, sRGB_COLOURSPACE)  # doctest: +ELLIPSIS
+    array([[[  6.5034378...e+03,   3.1995984...e-03],
+            [  3.2597004...e+03,  -5.5201576...e-03]]])
+    """
+
+    decoding_cctf = colourspace.decoding_cctf if apply_decoding_cctf else None
+
+    def to_XYZ(RGB):
+        """
+        Converts given *RGB* colourspace image tile to *CIE XYZ* tristimulus
+        values.
+        """
+
+        return RGB_to_XYZ(RGB,
+                          colourspace.whitepoint,
+                          colourspace.whitepoint,
+                          colourspace.RGB_to_XYZ_matrix,
+                          decoding_cctf=decoding_cctf)
+
+    return _CCT_map(RGB, to_XYZ, method, domain, workers, tile_size, out,
+                    kwargs)
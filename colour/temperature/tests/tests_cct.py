@@ -17,6 +17,7 @@ from colour.temperature import (
     CCT_to_uv_Robertson1968,
     CCT_to_uv_Krystek1985,
     uv_to_CCT_Ohno2013,
+    uv_to_CCT_planckian_locus_table,
     uv_to_CCT_Robertson1968,
     CCT_to_xy_Kang2002,
     CCT_to_xy_CIE_D,
@@ -24,7 +25,8 @@ from colour.temperature import (
     xy_to_CCT_Hernandez1999)
 from colour.temperature.cct import (
     planckian_table,
-    planckian_table_minimal_distance_index)
+    planckian_table_minimal_distance_index,
+    planckian_locus_table)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -36,8 +38,10 @@ __status__ = 'Production'
 
 __all__ = ['TestPlanckianTable',
            'TestPlanckianTableMinimalDistanceIndex',
+           'TestPlanckianLocusTable',
            'Testuv_to_CCT_Ohno2013',
            'TestCCT_to_uv_Ohno2013',
+           'Testuv_to_CCT_planckian_locus_table',
            'Testuv_to_CCT_Robertson1968',
            'TestCCT_to_uv_Robertson1968',
            'TestCCT_to_uv_Krystek1985',
@@ -202,6 +206,57 @@ planckian_table_minimal_distance_index` definition.
             9)
 
 
+class TestPlanckianLocusTable(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.cct.planckian_locus_table` definition
+    units tests methods.
+    """
+
+    def test_planckian_locus_table(self):
+        """
+        Tests :func:`colour.temperature.cct.planckian_locus_table` definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer')
+
+        table = planckian_locus_table(cmfs, 1000, 1010, 10)
+        np.testing.assert_almost_equal(table.T[[0, -1]], [1000, 1010])
+        np.testing.assert_almost_equal(
+            table.T, np.logspace(np.log10(1000), np.log10(1010), 10))
+
+        for T, u, v in zip(table.T, table.u, table.v):
+            x = planckian_table(np.array([0, 0]), cmfs, T, T, 1)[0]
+            np.testing.assert_almost_equal((u, v), (x.ui, x.vi), decimal=7)
+
+        delta = 0.001
+        for i in (0, 5, 9):
+            T = table.T[i]
+            x_p = planckian_table(np.array([0, 0]), cmfs, T + delta, T, 1)[0]
+            x_n = planckian_table(np.array([0, 0]), cmfs, T - delta, T, 1)[0]
+            np.testing.assert_allclose(
+                (table.du[i], table.dv[i]),
+                ((x_p.ui - x_n.ui) / (2 * delta),
+                 (x_p.vi - x_n.vi) / (2 * delta)),
+                rtol=0.0001)
+
+    def test_planckian_locus_table_cache(self):
+        """
+        Tests :func:`colour.temperature.cct.planckian_locus_table` definition
+        cache.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer')
+
+        table = planckian_locus_table(cmfs, 1000, 1010, 10)
+        self.assertIs(planckian_locus_table(cmfs, 1000, 1010, 10), table)
+        self.assertIs(planckian_locus_table(cmfs.clone(), 1000, 1010, 10),
+                      table)
+        self.assertIsNot(planckian_locus_table(cmfs, 1000, 1010, 11), table)
+        self.assertFalse(table.T.flags.writeable)
+
+
 class Testuv_to_CCT_Ohno2013(unittest.TestCase):
     """
     Defines :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition units
@@ -230,6 +285,45 @@ class Testuv_to_CCT_Ohno2013(unittest.TestCase):
             np.array([2452.15316417, -0.08437064]),
             decimal=7)
 
+    def test_n_dimensional_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        uv = np.array([0.1978, 0.3122])
+        CCT_D_uv = np.array([6507.51282029, 0.00322336])
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.tile(uv, (6, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (6, 1))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Ohno2013(uv),
+            CCT_D_uv,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_uv_to_CCT_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Ohno2013` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            uv_to_CCT_Ohno2013(case)
+
 
 class TestCCT_to_uv_Ohno2013(unittest.TestCase):
     """
@@ -262,6 +356,136 @@ class TestCCT_to_uv_Ohno2013(unittest.TestCase):
             np.array([0.29256477, 0.2722181]),
             decimal=7)
 
+    def test_n_dimensional_CCT_to_uv_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Ohno2013` definition
+        n-dimensional arrays support.
+        """
+
+        CCT = 6507.43422010
+        D_uv = 0.003223690901513
+        uv = np.array([0.19779990, 0.31220046])
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv),
+            uv,
+            decimal=7)
+
+        CCT = np.tile(CCT, 6)
+        D_uv = np.tile(D_uv, 6)
+        uv = np.tile(uv, (6, 1))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv),
+            uv,
+            decimal=7)
+
+        CCT = np.reshape(CCT, (2, 3))
+        D_uv = np.reshape(D_uv, (2, 3))
+        uv = np.reshape(uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Ohno2013(CCT, D_uv),
+            uv,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_CCT_to_uv_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Ohno2013` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            CCT_to_uv_Ohno2013(*case)
+
+
+class Testuv_to_CCT_planckian_locus_table(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.cct.uv_to_CCT_planckian_locus_table`
+    definition units tests methods.
+    """
+
+    def test_uv_to_CCT_planckian_locus_table(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_planckian_locus_table`
+        definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer')
+        np.testing.assert_almost_equal(
+            uv_to_CCT_planckian_locus_table(np.array([0.1978, 0.3122]), cmfs),
+            np.array([6507.46924032, 0.00322335]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            uv_to_CCT_planckian_locus_table(np.array([0.4328, 0.2883]), cmfs),
+            np.array([1041.67774927, -0.06737805]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            uv_to_CCT_planckian_locus_table(
+                np.array([0.2927, 0.2722]), cmfs, iterations=4),
+            np.array([2444.97090396, -0.08437064]),
+            decimal=7)
+
+    def test_uv_to_CCT_planckian_locus_table_CCT_to_uv_Ohno2013(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_planckian_locus_table`
+        definition round trip with
+        :func:`colour.temperature.cct.CCT_to_uv_Ohno2013` definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS.get(
+            'CIE 1931 2 Degree Standard Observer')
+        for CCT in (1500, 4000, 6504, 25000):
+            for D_uv in (-0.02, 0, 0.02):
+                np.testing.assert_allclose(
+                    uv_to_CCT_planckian_locus_table(
+                        CCT_to_uv_Ohno2013(CCT, D_uv, cmfs), cmfs),
+                    np.array([CCT, D_uv]),
+                    rtol=0.00001,
+                    atol=0.00001)
+
+    def test_n_dimensional_uv_to_CCT_planckian_locus_table(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_planckian_locus_table`
+        definition n-dimensional arrays support.
+        """
+
+        uv = np.array([0.1978, 0.3122])
+        CCT_D_uv = np.array([6507.46924032, 0.00322335])
+        np.testing.assert_almost_equal(
+            uv_to_CCT_planckian_locus_table(uv),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.tile(uv, (6, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (6, 1))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_planckian_locus_table(uv),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_planckian_locus_table(uv),
+            CCT_D_uv,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_uv_to_CCT_planckian_locus_table(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_planckian_locus_table`
+        definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            uv_to_CCT_planckian_locus_table(case)
+
 
 class Testuv_to_CCT_Robertson1968(unittest.TestCase):
     """
@@ -281,6 +505,45 @@ class Testuv_to_CCT_Robertson1968(unittest.TestCase):
                 key,
                 atol=0.25)
 
+    def test_n_dimensional_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968` definition
+        n-dimensional arrays support.
+        """
+
+        uv = np.array([0.193741375998230, 0.315221043940594])
+        CCT_D_uv = np.array([6500.01628795, 0.00833333])
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.tile(uv, (6, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (6, 1))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv),
+            CCT_D_uv,
+            decimal=7)
+
+        uv = np.reshape(uv, (2, 3, 2))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            uv_to_CCT_Robertson1968(uv),
+            CCT_D_uv,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_uv_to_CCT_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.uv_to_CCT_Robertson1968` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            uv_to_CCT_Robertson1968(case)
+
 
 class TestCCT_to_uv_Robertson1968(unittest.TestCase):
     """
@@ -300,6 +563,48 @@ class TestCCT_to_uv_Robertson1968(unittest.TestCase):
                 value,
                 decimal=7)
 
+    def test_n_dimensional_CCT_to_uv_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Robertson1968` definition
+        n-dimensional arrays support.
+        """
+
+        CCT = 6500.0081378199056
+        D_uv = 0.008333331244225
+        uv = np.array([0.193741375998230, 0.315221043940594])
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Robertson1968(CCT, D_uv),
+            uv,
+            decimal=7)
+
+        CCT = np.tile(CCT, 6)
+        D_uv = np.tile(D_uv, 6)
+        uv = np.tile(uv, (6, 1))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Robertson1968(CCT, D_uv),
+            uv,
+            decimal=7)
+
+        CCT = np.reshape(CCT, (2, 3))
+        D_uv = np.reshape(D_uv, (2, 3))
+        uv = np.reshape(uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            CCT_to_uv_Robertson1968(CCT, D_uv),
+            uv,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_CCT_to_uv_Robertson1968(self):
+        """
+        Tests :func:`colour.temperature.cct.CCT_to_uv_Robertson1968` definition
+        nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=2))
+        for case in cases:
+            CCT_to_uv_Robertson1968(*case)
+
 
 class TestCCT_to_uv_Krystek1985(unittest.TestCase):
     """
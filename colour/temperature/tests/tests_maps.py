@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.temperature.maps` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from itertools import permutations
+
+from colour.models import RGB_to_XYZ, UCS_to_uv, XYZ_to_UCS, sRGB_COLOURSPACE
+from colour.temperature import (
+    RGB_to_CCT_map,
+    XYZ_to_CCT_map,
+    uv_to_CCT)
+from colour.utilities import ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['XYZ_IMAGE',
+           'TestXYZ_to_CCT_map',
+           'TestRGB_to_CCT_map']
+
+XYZ_IMAGE = np.array([
+    [[0.95047, 1.00000, 1.08883],
+     [0.96422, 1.00000, 0.82521],
+     [1.09850, 1.00000, 0.35585]],
+    [[0.94811, 1.00000, 1.07304],
+     [0.20654, 0.12197, 0.05136],
+     [0.14222, 0.23042, 0.10495]]])
+
+
+class TestXYZ_to_CCT_map(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.maps.XYZ_to_CCT_map` definition units
+    tests methods.
+    """
+
+    def test_XYZ_to_CCT_map(self):
+        """
+        Tests :func:`colour.temperature.maps.XYZ_to_CCT_map` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            XYZ_to_CCT_map(XYZ_IMAGE[0]),
+            np.array([[6502.69341077, 0.00320530],
+                      [5001.81313853, 0.00320326],
+                      [2855.51946087, -0.00000034]]),
+            decimal=7)
+
+        for method in ('Ohno 2013', 'Robertson 1968'):
+            np.testing.assert_almost_equal(
+                XYZ_to_CCT_map(XYZ_IMAGE, method),
+                uv_to_CCT(UCS_to_uv(XYZ_to_UCS(XYZ_IMAGE)), method),
+                decimal=7)
+
+        for method in ('McCamy 1992', 'Hernandez 1999'):
+            CCT_D_uv = XYZ_to_CCT_map(XYZ_IMAGE[0], method)
+            np.testing.assert_allclose(
+                CCT_D_uv[..., 0],
+                XYZ_to_CCT_map(XYZ_IMAGE[0])[..., 0],
+                rtol=0.025)
+            np.testing.assert_almost_equal(
+                CCT_D_uv[..., 1],
+                XYZ_to_CCT_map(XYZ_IMAGE[0])[..., 1],
+                decimal=4)
+
+    def test_tiles_XYZ_to_CCT_map(self):
+        """
+        Tests :func:`colour.temperature.maps.XYZ_to_CCT_map` definition tiles
+        and workers support.
+        """
+
+        CCT_D_uv = XYZ_to_CCT_map(XYZ_IMAGE)
+        for tile_size in (1, 4, 256):
+            for workers in (1, 2):
+                np.testing.assert_equal(
+                    XYZ_to_CCT_map(
+                        XYZ_IMAGE, workers=workers, tile_size=tile_size),
+                    CCT_D_uv)
+
+        out = np.zeros((2, 3, 2))
+        self.assertIs(XYZ_to_CCT_map(XYZ_IMAGE, workers=2, tile_size=2,
+                                     out=out), out)
+        np.testing.assert_equal(out, CCT_D_uv)
+
+    def test_masking_XYZ_to_CCT_map(self):
+        """
+        Tests :func:`colour.temperature.maps.XYZ_to_CCT_map` definition
+        masking.
+        """
+
+        XYZ = np.array([[0.00000, 0.00000, 0.00000],
+                        [0.50000, -0.10000, 0.50000],
+                        [np.nan, 1.00000, 1.00000],
+                        [0.95047, 1.00000, np.inf],
+                        [0.95047, 1.00000, 1.08883]])
+        CCT_D_uv = XYZ_to_CCT_map(XYZ)
+        self.assertTrue(np.all(np.isnan(CCT_D_uv[:-1])))
+        self.assertFalse(np.any(np.isnan(CCT_D_uv[-1])))
+
+        CCT_D_uv = XYZ_to_CCT_map(XYZ_IMAGE, domain=(4000, 7000))
+        np.testing.assert_equal(
+            np.isnan(CCT_D_uv[..., 0]),
+            np.array([[False, False, True],
+                      [False, True, False]]))
+        np.testing.assert_equal(
+            np.isnan(CCT_D_uv[..., 0]), np.isnan(CCT_D_uv[..., 1]))
+
+    def test_raise_exception_XYZ_to_CCT_map(self):
+        """
+        Tests :func:`colour.temperature.maps.XYZ_to_CCT_map` definition
+        raised exception.
+        """
+
+        self.assertRaises(AssertionError, XYZ_to_CCT_map, XYZ_IMAGE,
+                          'Undefined')
+        self.assertRaises(AssertionError, XYZ_to_CCT_map, XYZ_IMAGE,
+                          out=np.zeros((6, 2)))
+
+    def test_n_dimensional_XYZ_to_CCT_map(self):
+        """
+        Tests :func:`colour.temperature.maps.XYZ_to_CCT_map` definition
+        n-dimensional arrays support.
+        """
+
+        XYZ = np.array([0.95047, 1.00000, 1.08883])
+        CCT_D_uv = np.array([6502.69341077, 0.00320530])
+        np.testing.assert_almost_equal(
+            XYZ_to_CCT_map(XYZ),
+            CCT_D_uv,
+            decimal=7)
+
+        XYZ = np.tile(XYZ, (6, 1))
+        CCT_D_uv = np.tile(CCT_D_uv, (6, 1))
+        np.testing.assert_almost_equal(
+            XYZ_to_CCT_map(XYZ),
+            CCT_D_uv,
+            decimal=7)
+
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        CCT_D_uv = np.reshape(CCT_D_uv, (2, 3, 2))
+        np.testing.assert_almost_equal(
+            XYZ_to_CCT_map(XYZ),
+            CCT_D_uv,
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_XYZ_to_CCT_map(self):
+        """
+        Tests :func:`colour.temperature.maps.XYZ_to_CCT_map` definition nan
+        support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for method in ('Ohno 2013', 'Robertson 1968', 'McCamy 1992',
+                       'Hernandez 1999'):
+            XYZ_to_CCT_map(np.array(list(cases)), method)
+
+
+class TestRGB_to_CCT_map(unittest.TestCase):
+    """
+    Defines :func:`colour.temperature.maps.RGB_to_CCT_map` definition units
+    tests methods.
+    """
+
+    def test_RGB_to_CCT_map(self):
+        """
+        Tests :func:`colour.temperature.maps.RGB_to_CCT_map` definition.
+        """
+
+        RGB = np.array([[[1.00, 1.00, 1.00],
+                         [1.00, 0.50, 0.25]],
+                        [[0.50, 0.50, 0.00],
+                         [0.00, 0.00, 0.00]]])
+
+        XYZ = RGB_to_XYZ(RGB,
+                         sRGB_COLOURSPACE.whitepoint,
+                         sRGB_COLOURSPACE.whitepoint,
+                         sRGB_COLOURSPACE.RGB_to_XYZ_matrix)
+        np.testing.assert_almost_equal(
+            RGB_to_CCT_map(RGB, sRGB_COLOURSPACE, tile_size=3),
+            XYZ_to_CCT_map(XYZ),
+            decimal=7)
+
+        XYZ = RGB_to_XYZ(RGB,
+                         sRGB_COLOURSPACE.whitepoint,
+                         sRGB_COLOURSPACE.whitepoint,
+                         sRGB_COLOURSPACE.RGB_to_XYZ_matrix,
+                         decoding_cctf=sRGB_COLOURSPACE.decoding_cctf)
+        np.testing.assert_almost_equal(
+            RGB_to_CCT_map(RGB, sRGB_COLOURSPACE, 'Robertson 1968',
+                           apply_decoding_cctf=True, workers=2),
+            XYZ_to_CCT_map(XYZ, 'Robertson 1968'),
+            decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,7 +16,8 @@ from .common import (
     is_string,
     is_numeric,
     is_integer,
-    filter_kwargs)
+    filter_kwargs,
+    content_hash)
 from .array import (
     as_numeric,
     closest,
@@ -36,7 +37,9 @@ from .data_structures import (
     ArbitraryPrecisionMapping,
     Lookup,
     Structure,
-    CaseInsensitiveMapping)
+    CaseInsensitiveMapping,
+    LazyCaseInsensitiveMapping,
+    LRUCache)
 from .verbose import ColourWarning, message_box, warning, filter_warnings
 
 __all__ = ['handle_numpy_errors',
@@ -51,7 +54,8 @@ __all__ = ['handle_numpy_errors',
            'is_string',
            'is_numeric',
            'is_integer',
-           'filter_kwargs']
+           'filter_kwargs',
+           'content_hash']
 __all__ += ['as_numeric',
             'closest',
             'normalise_maximum',
@@ -69,5 +73,7 @@ __all__ += ['as_numeric',
 __all__ += ['ArbitraryPrecisionMapping',
             'Lookup',
             'Structure',
-            'CaseInsensitiveMapping']
+            'CaseInsensitiveMapping',
+            'LazyCaseInsensitiveMapping',
+            'LRUCache']
 __all__ += ['ColourWarning', 'message_box', 'warning', 'filter_warnings']
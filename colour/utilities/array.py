@@ -168,10 +168,9 @@ def interval(distribution):
     array([1, 4])
     """
 
-    distribution = sorted(distribution)
+    distribution = np.sort(distribution)
 
-    return np.unique([distribution[i + 1] - distribution[i]
-                      for i in range(len(distribution) - 1)])
+    return np.unique(np.diff(distribution))
 
 
 def is_uniform(distribution):
@@ -12,6 +12,7 @@ from __future__ import division, unicode_literals
 
 from copy import deepcopy
 import functools
+import hashlib
 import numpy as np
 import sys
 import warnings
@@ -38,7 +39,8 @@ __all__ = ['handle_numpy_errors',
            'is_string',
            'is_numeric',
            'is_integer',
-           'filter_kwargs']
+           'filter_kwargs',
+           'content_hash']
 
 
 def handle_numpy_errors(**kwargs):
@@ -354,3 +356,77 @@ def filter_kwargs(function, **kwargs):
         kwargs.pop(key)
 
     return kwargs
+
+
+def content_hash(*args):
+    """
+    Returns a digest of given objects content, suitable as a cache key that
+    does not depend on objects names or identity.
+
+    Other Parameters
+    ----------------
+    \*args : list, optional
+        Objects to hash, strings are hashed using their *UTF-8* encoding,
+        numeric *array_like* are hashed using their shape and data once
+        converted to *float64* so that equal values of different types, e.g.
+        *int* and *float*, produce the same digest, the other *ndarray* are
+        hashed using their shape, data type and data while the remaining
+        objects are hashed using their *repr*.
+
+    Returns
+    -------
+    unicode
+        Hexadecimal *SHA-1* digest.
+
+    Notes
+    -----
+    -   The digests are stable across *Python* versions and platforms for
+        strings and numeric *array_like*, allowing their use as on-disk cache
+        keys.
+
+    Examples
+    --------
+    >>> content_hash(np.array([1, 2, 3]), 'a') == content_hash(
+    ...     np.array([1, 2, 3]), 'a')
+    True
+    >>> content_hash(np.array([1, 2, 3])) == content_hash(np.array([1, 2, 4]))
+    False
+    >>> content_hash(5) == content_hash(5.0)
+    True
+    """
+
+    digest = hashlib.sha1()
+    for a in args:
+        if is_string(a) or isinstance(a, bytes):
+            if not isinstance(a, bytes):
+                a = a.encode('utf-8')
+
+            digest.update(b's')
+            digest.update(a)
+        else:
+            try:
+                array = np.asarray(a)
+            except ValueError:
+                array = None
+
+            if array is not None and array.dtype.kind in 'biufc':
+                dtype = '<c16' if array.dtype.kind == 'c' else '<f8'
+                array = np.asarray(array, dtype=dtype, order='C')
+                digest.update(dtype.encode('utf-8'))
+                digest.update(np.asarray(
+                    (array.ndim, ) + array.shape, '<i8').tobytes())
+                digest.update(array.tobytes())
+            elif isinstance(a, np.ndarray):
+                a = np.asarray(a, order='C')
+                digest.update(a.dtype.str.encode('utf-8'))
+                digest.update(np.asarray(
+                    (a.ndim, ) + a.shape, '<i8').tobytes())
+                digest.update(a.tobytes())
+            else:
+                digest.update(b'r')
+                digest.update(repr(a).encode('utf-8'))
+
+        # Separator preventing collisions between concatenated objects.
+        digest.update(b'\x00')
+
+    return digest.hexdigest()
@@ -14,11 +14,20 @@ Defines various data structures classes:
     values.
 -   :class:`CaseInsensitiveMapping`: A case insensitive mapping allowing values
     retrieving from keys while ignoring the key case.
+-   :class:`LazyCaseInsensitiveMapping`: A case insensitive mapping whose
+    values are loaded from callables on first retrieval.
+-   :class:`LRUCache`: A mutable mapping discarding its least recently used
+    items beyond a maximum size, with an optional on-disk tier.
 """
 
 from __future__ import division, unicode_literals
 
-from collections import Mapping, MutableMapping
+import numpy as np
+import os
+import tempfile
+import threading
+from collections import Mapping, MutableMapping, OrderedDict
+from functools import partial
 
 from colour.utilities import is_numeric
 
@@ -32,7 +41,9 @@ __status__ = 'Production'
 __all__ = ['ArbitraryPrecisionMapping',
            'Structure',
            'Lookup',
-           'CaseInsensitiveMapping']
+           'CaseInsensitiveMapping',
+           'LazyCaseInsensitiveMapping',
+           'LRUCache']
 
 
 class ArbitraryPrecisionMapping(MutableMapping):
@@ -714,3 +725,534 @@ blob/v1.2.3/requests/structures.py#L37
         """
 
         return ((item, value[1]) for (item, value) in self._data.items())
+
+
+class LazyCaseInsensitiveMapping(CaseInsensitiveMapping):
+    """
+    Implements a lazy case-insensitive mutable mapping / *dict* object.
+
+    The values being callables are considered as loaders: they are called
+    without arguments the first time the value is retrieved and their result
+    replaces them in the mapping. This allows datasets to only build the
+    objects that are actually used.
+
+    Parameters
+    ----------
+    data : dict
+        *dict* of data to store into the mapping at initialisation.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Key / Value pairs to store into the mapping at initialisation.
+
+    Methods
+    -------
+    __getitem__
+    copy
+    update
+    lower_items
+    is_loaded
+
+    Warning
+    -------
+    Callable values, e.g. functions, cannot be stored as is in the mapping
+    and must be wrapped into a loader returning them.
+
+    Notes
+    -----
+    -   Updating a lazy mapping with another lazy mapping shares the loaders
+        of the latter so that a value is only loaded once and both mappings
+        return the same object.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> mapping = LazyCaseInsensitiveMapping({'Sum': partial(sum, (1, 2))})
+    >>> mapping.is_loaded('sum')
+    False
+    >>> mapping['sum']
+    3
+    >>> mapping.is_loaded('sum')
+    True
+    """
+
+    def __getitem__(self, item):
+        """
+        Returns the value of given item, loading it if required.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+
+        Returns
+        -------
+        object
+            Item value.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`CaseInsensitiveMapping.__getitem__`
+            method.
+        """
+
+        name, value = self._data[item.lower()]
+        if callable(value):
+            value = value()
+            self._data[item.lower()] = (name, value)
+
+        return value
+
+    def copy(self):
+        """
+        Returns a copy of the mapping, the values not loaded yet are shared
+        with the copy.
+
+        Returns
+        -------
+        LazyCaseInsensitiveMapping
+            Mapping copy.
+        """
+
+        return LazyCaseInsensitiveMapping(self)
+
+    def update(self, data=None, **kwargs):
+        """
+        Updates the mapping with given data without loading the values of
+        given lazy mappings.
+
+        Parameters
+        ----------
+        data : dict
+            *dict* of data to store into the mapping.
+
+        Other Parameters
+        ----------------
+        \**kwargs : dict, optional
+            Key / Value pairs to store into the mapping.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.update` method.
+        """
+
+        if isinstance(data, LazyCaseInsensitiveMapping):
+            for name, value in data._data.values():
+                self[name] = (partial(data.__getitem__, name)
+                              if callable(value) else value)
+            data = None
+
+        super(LazyCaseInsensitiveMapping, self).update(
+            {} if data is None else data, **kwargs)
+
+    def lower_items(self):
+        """
+        Iterates over the lower items names, loading their values.
+
+        Returns
+        -------
+        generator
+            Lower item names.
+        """
+
+        return ((item, self[item]) for item in list(self._data.keys()))
+
+    def is_loaded(self, item):
+        """
+        Returns whether the value of given item has been loaded.
+
+        Parameters
+        ----------
+        item : unicode
+            Item name.
+
+        Returns
+        -------
+        bool
+            Is item value loaded.
+        """
+
+        return not callable(self._data[item.lower()][1])
+
+
+class LRUCache(MutableMapping):
+    """
+    Implements a *Least Recently Used* (LRU) cache mutable mapping / *dict*
+    object.
+
+    The least recently used items are discarded when the items count exceeds
+    the maximum size. An optional on-disk tier persists the items as *.npy*
+    files into a directory so that they survive the process and can be shared
+    between processes.
+
+    Parameters
+    ----------
+    maximum_size : int, optional
+        Maximum items count of the in-memory tier, *None* means unbounded.
+    directory : unicode, optional
+        On-disk tier directory, the on-disk tier is disabled if *None*.
+
+    Attributes
+    ----------
+    maximum_size
+    directory
+
+    Methods
+    -------
+    __setitem__
+    __getitem__
+    __delitem__
+    __contains__
+    __iter__
+    __len__
+    __repr__
+    get
+
+    Warning
+    -------
+    The on-disk tier expects the keys to be valid file names, e.g.
+    hexadecimal digests, and the values to be *ndarray*.
+
+    Notes
+    -----
+    -   Iterating over the cache and its items count only account for the
+        in-memory tier.
+    -   The on-disk tier files are written atomically, concurrent processes
+        sharing a directory will at worst compute the same item twice.
+    -   The cache operations are guarded by a re-entrant lock so that the
+        cache can be shared between threads, :meth:`LRUCache.get` definition
+        should be used instead of a membership test followed by a retrieval
+        as the item could be evicted in-between.
+
+    Examples
+    --------
+    >>> cache = LRUCache(2)
+    >>> cache['a'] = 1
+    >>> cache['b'] = 2
+    >>> cache['a']
+    1
+    >>> cache['c'] = 3
+    >>> sorted(cache.keys())
+    ['a', 'c']
+    """
+
+    def __init__(self, maximum_size=None, directory=None):
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+        self._maximum_size = None
+        self.maximum_size = maximum_size
+        self._directory = None
+        self.directory = directory
+
+    @property
+    def maximum_size(self):
+        """
+        Property for **self._maximum_size** private attribute.
+
+        Returns
+        -------
+        int
+            self._maximum_size.
+        """
+
+        return self._maximum_size
+
+    @maximum_size.setter
+    def maximum_size(self, value):
+        """
+        Setter for **self._maximum_size** private attribute.
+
+        Parameters
+        ----------
+        value : int
+            Attribute value.
+        """
+
+        if value is not None:
+            assert value >= 1, (
+                '"{0}" attribute: "{1}" must be greater than or equal to '
+                '1!'.format('maximum_size', value))
+
+        with self._lock:
+            self._maximum_size = value
+
+            self._evict()
+
+    @property
+    def directory(self):
+        """
+        Property for **self._directory** private attribute.
+
+        Returns
+        -------
+        unicode
+            self._directory.
+        """
+
+        return self._directory
+
+    @directory.setter
+    def directory(self, value):
+        """
+        Setter for **self._directory** private attribute.
+
+        Parameters
+        ----------
+        value : unicode
+            Attribute value.
+        """
+
+        if value is not None and not os.path.exists(value):
+            os.makedirs(value)
+
+        self._directory = value
+
+    def __setitem__(self, item, value):
+        """
+        Sets given item with given value, the item becomes the most recently
+        used one and is written to the on-disk tier if enabled.
+
+        Parameters
+        ----------
+        item : object
+            Attribute.
+        value : object
+            Value.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__setitem__` method.
+        """
+
+        with self._lock:
+            self._data.pop(item, None)
+            self._data[item] = value
+
+            self._evict()
+
+        path = self._path(item)
+        if path is not None:
+            file_descriptor, temporary_path = tempfile.mkstemp(
+                suffix='.npy', dir=self._directory)
+            with os.fdopen(file_descriptor, 'wb') as file_:
+                np.save(file_, value)
+            try:
+                os.rename(temporary_path, path)
+            except OSError:
+                os.remove(temporary_path)
+
+    def __getitem__(self, item):
+        """
+        Returns the value of given item, the item becomes the most recently
+        used one. Items missing from the in-memory tier are loaded from the
+        on-disk tier if enabled.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+
+        Returns
+        -------
+        object
+            Item value.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__getitem__` method.
+        """
+
+        with self._lock:
+            if item in self._data:
+                value = self._data.pop(item)
+            else:
+                path = self._path(item)
+                if path is None or not os.path.exists(path):
+                    raise KeyError(item)
+
+                try:
+                    value = np.load(path)
+                except (IOError, OSError):
+                    raise KeyError(item)
+
+            self._data[item] = value
+
+            self._evict()
+
+            return value
+
+    def __delitem__(self, item):
+        """
+        Deletes the item with given name from both the in-memory and on-disk
+        tiers.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__delitem__` method.
+        """
+
+        with self._lock:
+            path = self._path(item)
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+            elif item not in self._data:
+                raise KeyError(item)
+
+            self._data.pop(item, None)
+
+    def __contains__(self, item):
+        """
+        Returns if the cache contains given item in any of its tiers.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+
+        Returns
+        -------
+        bool
+            Is item in cache.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__contains__` method.
+        """
+
+        with self._lock:
+            if item in self._data:
+                return True
+
+            path = self._path(item)
+
+            return path is not None and os.path.exists(path)
+
+    def __iter__(self):
+        """
+        Iterates over the in-memory tier items names from the least to the
+        most recently used.
+
+        Returns
+        -------
+        generator
+            Item names.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__iter__` method.
+        """
+
+        with self._lock:
+            return iter(list(self._data.keys()))
+
+    def __len__(self):
+        """
+        Returns the in-memory tier items count.
+
+        Returns
+        -------
+        int
+            Items count.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__len__` method.
+        """
+
+        with self._lock:
+            return len(self._data)
+
+    def __repr__(self):
+        """
+        Returns the cache representation.
+
+        Returns
+        -------
+        unicode
+            Cache representation.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.__repr__` method.
+        """
+
+        return '{0}({1}, {2!r})'.format(self.__class__.__name__,
+                                        self._maximum_size,
+                                        self._directory)
+
+    def get(self, item, default=None):
+        """
+        Returns the value of given item or given default value if the item is
+        not in the cache, the lookup is atomic with respect to the other
+        threads sharing the cache.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+        default : object, optional
+            Value returned if the item is not in the cache.
+
+        Returns
+        -------
+        object
+            Item value.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`MutableMapping.get` method.
+
+        Examples
+        --------
+        >>> cache = LRUCache(2)
+        >>> cache['a'] = 1
+        >>> cache.get('a')
+        1
+        >>> print(cache.get('b'))
+        None
+        """
+
+        with self._lock:
+            try:
+                return self[item]
+            except KeyError:
+                return default
+
+    def _path(self, item):
+        """
+        Returns the on-disk tier file path of given item.
+
+        Parameters
+        ----------
+        item : object
+            Item name.
+
+        Returns
+        -------
+        unicode
+            File path or *None* if the on-disk tier is disabled.
+        """
+
+        if self._directory is None:
+            return None
+
+        return os.path.join(self._directory, '{0}.npy'.format(item))
+
+    def _evict(self):
+        """
+        Discards the least recently used items of the in-memory tier exceeding
+        the maximum size.
+        """
+
+        if self._maximum_size is None:
+            return
+
+        while len(self._data) > self._maximum_size:
+            self._data.popitem(last=False)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Import Profiling
+================
+
+Defines objects to profile the time and memory spent importing a package:
+
+-   :class:`ImportProfile`
+-   :func:`profile_imports`
+-   :func:`import_profile_report`
+
+The imports are profiled in a fresh interpreter so that the modules already
+imported by the caller, e.g. *colour* itself, do not hide their cost. The
+module is also a command line entry point::
+
+    python -m colour.utilities.import_profiling colour --maximum-time 1.5
+
+which prints the ranked report and exits with a non-zero status if the
+package import exceeds the given time budget.
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import namedtuple
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['IMPORT_PROFILE_SORTING_KEYS',
+           'ImportProfile',
+           'profile_imports',
+           'import_profile_report',
+           'main']
+
+IMPORT_PROFILE_SORTING_KEYS = ('self_time',
+                               'cumulative_time',
+                               'self_memory',
+                               'cumulative_memory')
+"""
+Supported :class:`ImportProfile` class sorting keys.
+
+IMPORT_PROFILE_SORTING_KEYS : tuple
+    **{'self_time', 'cumulative_time', 'self_memory', 'cumulative_memory'}**
+"""
+
+_IMPORT_PROFILING_BOOTSTRAP = """
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+module, path, trace_memory = sys.argv[1], sys.argv[2], sys.argv[3] == '1'
+timer = getattr(time, 'perf_counter', time.time)
+if trace_memory and tracemalloc is not None:
+    tracemalloc.start()
+    memory = lambda: tracemalloc.get_traced_memory()[0]
+else:
+    memory = lambda: 0
+
+records, stack = [], []
+
+
+def timed(name, exec_module):
+    def wrapper(module):
+        frame = [0, 0]
+        stack.append(frame)
+        time_s, memory_s = timer(), memory()
+        try:
+            exec_module(module)
+        finally:
+            stack.pop()
+            time_c, memory_c = timer() - time_s, memory() - memory_s
+            records.append((name, time_c - frame[0], time_c,
+                            memory_c - frame[1], memory_c))
+            if stack:
+                stack[-1][0] += time_c
+                stack[-1][1] += memory_c
+
+    return wrapper
+
+
+class Finder(object):
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        if (loader is not None and not isinstance(loader, type) and
+                hasattr(loader, 'exec_module')):
+            loader.exec_module = timed(name, loader.exec_module)
+
+        return spec
+
+
+sys.meta_path.insert(0, Finder())
+time_s, memory_s = timer(), memory()
+__import__(module)
+total = (timer() - time_s, memory() - memory_s)
+
+import json  # noqa
+
+with open(path, 'w') as file_:
+    json.dump({'records': records, 'total': total}, file_)
+"""
+
+
+class ImportProfile(
+    namedtuple('ImportProfile',
+               ('name',
+                'self_time',
+                'cumulative_time',
+                'self_memory',
+                'cumulative_memory'))):
+    """
+    Defines the class storing the import profile of a module.
+
+    Parameters
+    ----------
+    name : unicode
+        Module name.
+    self_time : numeric
+        Time in seconds spent executing the module body, excluding the
+        imports it triggers.
+    cumulative_time : numeric
+        Time in seconds spent executing the module body, including the
+        imports it triggers.
+    self_memory : int
+        Net memory in bytes allocated by the module body, excluding the
+        imports it triggers.
+    cumulative_memory : int
+        Net memory in bytes allocated by the module body, including the
+        imports it triggers.
+    """
+
+
+def profile_imports(module='colour',
+                    trace_memory=True,
+                    executable=sys.executable):
+    """
+    Profiles the import of given module in a fresh interpreter.
+
+    Parameters
+    ----------
+    module : unicode, optional
+        Module to import.
+    trace_memory : bool, optional
+        Whether to trace the memory allocations with :mod:`tracemalloc`,
+        tracing slows down the imports, thus time budgets should be checked
+        with it disabled.
+    executable : unicode, optional
+        *Python* interpreter executable, it must be *Python 3.4* or newer.
+
+    Returns
+    -------
+    tuple
+        Tuple of :class:`ImportProfile` class instances of every imported
+        module in import completion order and :class:`ImportProfile` class
+        instance of the whole import.
+
+    Raises
+    ------
+    RuntimeError
+        If the module cannot be imported by the interpreter.
+
+    Examples
+    --------
+    >>> profiles, total = profile_imports('json')
+    >>> 'json.decoder' in [profile.name for profile in profiles]
+    True
+    >>> total.name
+    'json'
+    """
+
+    descriptor, path = tempfile.mkstemp(suffix='.json')
+    os.close(descriptor)
+    try:
+        process = subprocess.Popen(
+            [executable, '-c', _IMPORT_PROFILING_BOOTSTRAP,
+             module, path, '1' if trace_memory else '0'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE)
+        _stdout, stderr = process.communicate()
+
+        if process.returncode != 0:
+            raise RuntimeError(
+                '"{0}" module import failed:\n{1}'.format(
+                    module, stderr.decode('utf-8', 'replace')))
+
+        with open(path) as file_:
+            data = json.load(file_)
+    finally:
+        os.remove(path)
+
+    time, memory = data['total']
+
+    return ([ImportProfile(*record) for record in data['records']],
+            ImportProfile(module, time, time, memory, memory))
+
+
+def import_profile_report(profiles, total, sort_by='self_time', limit=25):
+    """
+    Returns a ranked report of given import profiles.
+
+    Parameters
+    ----------
+    profiles : array_like
+        :class:`ImportProfile` class instances to rank.
+    total : ImportProfile
+        :class:`ImportProfile` class instance of the whole import.
+    sort_by : unicode, optional
+        **{'self_time', 'cumulative_time', 'self_memory',
+        'cumulative_memory'}**,
+        Ranking key.
+    limit : int, optional
+        Ranked modules count, all the modules are reported if *None*.
+
+    Returns
+    -------
+    unicode
+        Import profile report.
+
+    Examples
+    --------
+    >>> profiles = [ImportProfile('a.b', 0.2, 0.2, 2048, 2048),
+    ...             ImportProfile('a', 0.1, 0.3, 1024, 3072)]
+    >>> print(import_profile_report(
+    ...     profiles, ImportProfile('a', 0.3, 0.3, 3072, 3072)))
+    Import profile of "a": 300.000ms, 3.0KiB, 2 modules, sorted by "self_time".
+    <BLANKLINE>
+    Rank    Self (ms)    Cumul. (ms)   Self (KiB)  Cumul. (KiB)  Module
+       1      200.000        200.000          2.0           2.0  a.b
+       2      100.000        300.000          1.0           3.0  a
+    """
+
+    assert sort_by in IMPORT_PROFILE_SORTING_KEYS, (
+        '"{0}" sorting key is not supported, it must be one of {1}!'.format(
+            sort_by, IMPORT_PROFILE_SORTING_KEYS))
+
+    ranked = sorted(profiles,
+                    key=lambda x: getattr(x, sort_by),
+                    reverse=True)[:limit]
+
+    lines = ['Import profile of "{0}": {1:.3f}ms, {2:.1f}KiB, {3} modules, '
+             'sorted by "{4}".'.format(total.name,
+                                       total.cumulative_time * 1000,
+                                       total.cumulative_memory / 1024,
+                                       len(profiles),
+                                       sort_by),
+             '',
+             '{0:<4}{1:>13}{2:>15}{3:>13}{4:>14}  {5}'.format(
+                 'Rank', 'Self (ms)', 'Cumul. (ms)', 'Self (KiB)',
+                 'Cumul. (KiB)', 'Module')]
+    for i, profile in enumerate(ranked):
+        lines.append('{0:>4}{1:>13.3f}{2:>15.3f}{3:>13.1f}{4:>14.1f}  '
+                     '{5}'.format(i + 1,
+                                  profile.self_time * 1000,
+                                  profile.cumulative_time * 1000,
+                                  profile.self_memory / 1024,
+                                  profile.cumulative_memory / 1024,
+                                  profile.name))
+
+    return '\n'.join(lines)
+
+
+def main(arguments=None):
+    """
+    Command line entry point printing the import profile report of a module.
+
+    Parameters
+    ----------
+    arguments : array_like, optional
+        Command line arguments, :attr:`sys.argv` is used if *None*.
+
+    Returns
+    -------
+    int
+        Exit status, *1* if the import exceeded the maximum time.
+    """
+
+    parser = argparse.ArgumentParser(
+        description='Profiles the time and memory spent importing a module.')
+    parser.add_argument('module', nargs='?', default='colour',
+                        help='Module to import.')
+    parser.add_argument('--sort-by', default='self_time',
+                        choices=IMPORT_PROFILE_SORTING_KEYS,
+                        help='Ranking key.')
+    parser.add_argument('--limit', type=int, default=25,
+                        help='Ranked modules count.')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Disable the memory allocations tracing.')
+    parser.add_argument('--maximum-time', type=float, default=None,
+                        help='Import time budget in seconds.')
+    arguments = parser.parse_args(arguments)
+
+    profiles, total = profile_imports(arguments.module,
+                                      not arguments.no_memory)
+
+    print(import_profile_report(
+        profiles, total, arguments.sort_by, arguments.limit))
+
+    if (arguments.maximum_time is not None and
+            total.cumulative_time > arguments.maximum_time):
+        print('\n"{0}" import time {1:.3f}s exceeds the {2:.3f}s '
+              'budget!'.format(arguments.module,
+                               total.cumulative_time,
+                               arguments.maximum_time))
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
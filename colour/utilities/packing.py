@@ -0,0 +1,808 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Array Packs
+===========
+
+Defines the objects to write and read *array packs*, a compact binary format
+storing many named arrays:
+
+-   :func:`write_array_pack`
+-   :func:`read_array_pack`
+-   :func:`read_array_pack_metadata`
+-   :func:`build_dataset_pack`
+-   :func:`dataset_pack`
+-   :func:`dataset_pack_data`
+-   :func:`dataset_pack_loader`
+-   :func:`dataset_pack_mapping`
+
+An array pack is made of two files sharing the same path stem:
+
+-   *<path>.npy*: A single flat *Numpy* array concatenating the data of every
+    array, allowing it to be memory-mapped.
+-   *<path>.json*: A manifest storing for every array its offset into the
+    flat array, its shape and optional metadata, and optionally the hashes of
+    the source files the arrays have been built from.
+
+Reading an array pack only maps the *.npy* file and parses the manifest, the
+arrays data is paged in on access, thus startup time and resident memory
+scale with the data actually used.
+
+The bundled datasets array pack is built from the datasets modules literals
+by the *setup.py* *build_py* command or the *utilities/build_dataset_pack.py*
+utility. Its datasets are read without importing the literals modules, those
+are only imported when the array pack is not available or when their source
+does not match the hash stored in the array pack.
+"""
+
+from __future__ import division, unicode_literals
+
+import codecs
+import hashlib
+import importlib
+import json
+import numpy as np
+import os
+from functools import partial
+
+from colour.utilities import LazyCaseInsensitiveMapping, warning
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['ARRAY_PACK_VERSION',
+           'DEFAULT_DATASET_PACK_PATH',
+           'SPECTRAL_DATASET_MODULES',
+           'MUNSELL_DATASETS',
+           'write_array_pack',
+           'read_array_pack',
+           'read_array_pack_metadata',
+           'spectral_dataset_arrays',
+           'munsell_dataset_arrays',
+           'build_dataset_pack',
+           'dataset_pack',
+           'dataset_pack_data',
+           'dataset_pack_loader',
+           'dataset_pack_mapping']
+
+ARRAY_PACK_VERSION = 2
+"""
+Array packs format version.
+
+ARRAY_PACK_VERSION : int
+"""
+
+DEFAULT_DATASET_PACK_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'resources', 'datasets')
+"""
+Default path stem of the bundled datasets array pack built by the *setup.py*
+*build_py* command or the *utilities/build_dataset_pack.py* utility.
+
+DEFAULT_DATASET_PACK_PATH : unicode
+"""
+
+SPECTRAL_DATASET_MODULES = (
+    'colour.characterisation.dataset.cameras.dslr.spectral_sensitivities_data',
+    'colour.characterisation.dataset.colour_checkers.spds_data',
+    'colour.characterisation.dataset.displays.crt.rgb_primaries_data',
+    'colour.characterisation.dataset.displays.lcd.rgb_primaries_data',
+    'colour.colorimetry.dataset.cmfs_data',
+    'colour.colorimetry.dataset.illuminants.d_illuminants_s_spds_data',
+    'colour.colorimetry.dataset.illuminants.spds_data',
+    'colour.colorimetry.dataset.lefs_data',
+    'colour.colorimetry.dataset.light_sources.spds_data',
+    'colour.quality.dataset.tcs_data',
+    'colour.quality.dataset.vs_data',
+    'colour.recovery.dataset.smits1999_data')
+"""
+Modules whose spectral datasets, i.e. the module attributes named
+*\*_DATA* and mapping names to wavelengths / values mappings, are packed.
+
+SPECTRAL_DATASET_MODULES : tuple
+"""
+
+MUNSELL_DATASETS = (
+    ('colour.notation.dataset.munsell.all', 'MUNSELL_COLOURS_ALL'),
+    ('colour.notation.dataset.munsell.experimental', 'MUNSELL_COLOURS_1929'),
+    ('colour.notation.dataset.munsell.real', 'MUNSELL_COLOURS_REAL'))
+"""
+*Munsell* datasets packed as (module, attribute) tuples.
+
+MUNSELL_DATASETS : tuple
+"""
+
+_DATASET_PACK_CACHE = None
+"""
+Bundled datasets array pack arrays and index, the manifest is parsed once.
+
+_DATASET_PACK_CACHE : tuple
+"""
+
+
+def write_array_pack(path, arrays, metadata=None, dtype=np.float_,
+                     sources=None):
+    """
+    Writes given arrays into an array pack at given path stem.
+
+    Parameters
+    ----------
+    path : unicode
+        Array pack path stem, the *.npy* and *.json* extensions are appended.
+    arrays : dict
+        Arrays to write, keys are the arrays names.
+    metadata : dict, optional
+        *JSON* serialisable metadata of the arrays, keys are the arrays names.
+    dtype : object, optional
+        Data type the arrays are stored with.
+    sources : dict, optional
+        Hashes of the sources the arrays are built from, keys are the sources
+        names.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'pack')
+    >>> write_array_pack(path, {'a': np.arange(3), 'b': np.ones((2, 2))})
+    True
+    """
+
+    if metadata is None:
+        metadata = {}
+
+    if sources is None:
+        sources = {}
+
+    manifest = {'version': ARRAY_PACK_VERSION,
+                'dtype': np.dtype(dtype).str,
+                'sources': sources,
+                'arrays': {}}
+
+    names = sorted(arrays.keys())
+    arrays = [np.asarray(arrays[name], dtype=dtype) for name in names]
+
+    offset = 0
+    for name, array in zip(names, arrays):
+        manifest['arrays'][name] = {'offset': offset,
+                                    'shape': list(array.shape),
+                                    'metadata': metadata.get(name)}
+        offset += array.size
+
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+
+    np.save('{0}.npy'.format(path),
+            np.concatenate([array.ravel() for array in arrays])
+            if arrays else np.array([], dtype=dtype))
+
+    with codecs.open('{0}.json'.format(path), 'w', encoding='utf-8') as file_:
+        json.dump(manifest, file_, indent=0, sort_keys=True)
+
+    return True
+
+
+def _read_array_pack_manifest(path):
+    """
+    Reads the manifest of given array pack.
+
+    Parameters
+    ----------
+    path : unicode
+        Array pack path stem.
+
+    Returns
+    -------
+    dict
+        Array pack manifest.
+
+    Raises
+    ------
+    ValueError
+        If the array pack version is not supported.
+    """
+
+    with codecs.open('{0}.json'.format(path), encoding='utf-8') as file_:
+        manifest = json.load(file_)
+
+    if manifest.get('version') != ARRAY_PACK_VERSION:
+        raise ValueError(
+            '"{0}" array pack version "{1}" is not supported!'.format(
+                path, manifest.get('version')))
+
+    return manifest
+
+
+def read_array_pack(path):
+    """
+    Reads the array pack at given path stem.
+
+    Parameters
+    ----------
+    path : unicode
+        Array pack path stem.
+
+    Returns
+    -------
+    LazyCaseInsensitiveMapping
+        Read-only arrays of the pack, they are views into the memory-mapped
+        *.npy* file.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'pack')
+    >>> write_array_pack(path, {'a': np.arange(3), 'b': np.ones((2, 2))})
+    True
+    >>> pack = read_array_pack(path)
+    >>> sorted(pack.keys())
+    ['a', 'b']
+    >>> pack['b']
+    memmap([[ 1.,  1.],
+           [ 1.,  1.]])
+    """
+
+    return _read_array_pack_arrays(path, _read_array_pack_manifest(path))
+
+
+def _read_array_pack_arrays(path, manifest):
+    """
+    Reads the arrays of the array pack at given path stem using given
+    manifest.
+
+    Parameters
+    ----------
+    path : unicode
+        Array pack path stem.
+    manifest : dict
+        Array pack manifest.
+
+    Returns
+    -------
+    LazyCaseInsensitiveMapping
+        Read-only arrays of the pack.
+    """
+
+    data = np.load('{0}.npy'.format(path), mmap_mode='r')
+
+    def view(offset, shape):
+        """
+        Returns the array with given offset and shape.
+        """
+
+        return data[offset:offset + int(np.prod(shape))].reshape(shape)
+
+    return LazyCaseInsensitiveMapping(dict(
+        (name, partial(view, entry['offset'], tuple(entry['shape'])))
+        for name, entry in manifest['arrays'].items()))
+
+
+def read_array_pack_metadata(path):
+    """
+    Reads the metadata of the arrays of the array pack at given path stem.
+
+    Parameters
+    ----------
+    path : unicode
+        Array pack path stem.
+
+    Returns
+    -------
+    dict
+        Arrays metadata, keys are the arrays names.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), 'pack')
+    >>> write_array_pack(path, {'a': np.arange(3)}, {'a': {'unit': 'nm'}})
+    True
+    >>> read_array_pack_metadata(path)['a']['unit']
+    'nm'
+    """
+
+    return dict((name, entry['metadata']) for name, entry in
+                _read_array_pack_manifest(path)['arrays'].items())
+
+
+def _is_spectral_data(data):
+    """
+    Returns if given mapping is a wavelengths / values mapping.
+    """
+
+    return (isinstance(data, dict) and len(data) > 0 and
+            all(isinstance(key, (int, float)) and
+                isinstance(value, (int, float, tuple, list))
+                for key, value in data.items()))
+
+
+def spectral_dataset_arrays(module):
+    """
+    Returns the arrays and metadata of the spectral datasets of given module.
+
+    Parameters
+    ----------
+    module : unicode
+        Module path.
+
+    Returns
+    -------
+    tuple
+        Arrays keyed by module path, attribute name and entry names, their
+        first column stores the wavelengths and the following ones the values,
+        and metadata storing the module path, attribute name and entry names
+        of the arrays and whether their wavelengths are integers.
+    """
+
+    module = importlib.import_module(module)
+
+    arrays, metadata = {}, {}
+
+    def walk(data, name, attribute, keys):
+        """
+        Collects the spectral data arrays of given mapping.
+        """
+
+        if _is_spectral_data(data):
+            wavelengths = sorted(data.keys())
+            values = np.array([data[wavelength] for wavelength in wavelengths],
+                              dtype=np.float_)
+            arrays[name] = np.hstack([
+                np.array(wavelengths, dtype=np.float_)[:, np.newaxis],
+                np.reshape(values, (len(wavelengths), -1))])
+            metadata[name] = {'module': module.__name__,
+                              'variable': attribute,
+                              'keys': keys,
+                              'integer': all(isinstance(wavelength, int)
+                                             for wavelength in wavelengths)}
+        elif isinstance(data, dict):
+            for key, value in data.items():
+                walk(value, '{0}.{1}'.format(name, key), attribute,
+                     keys + [key])
+
+    for attribute in sorted(dir(module)):
+        if attribute.endswith('_DATA'):
+            walk(getattr(module, attribute),
+                 '{0}.{1}'.format(module.__name__, attribute), attribute, [])
+
+    return arrays, metadata
+
+
+def munsell_dataset_arrays(module, attribute):
+    """
+    Returns the array and metadata of given *Munsell* dataset.
+
+    Parameters
+    ----------
+    module : unicode
+        Module path.
+    attribute : unicode
+        *Munsell* dataset attribute name.
+
+    Returns
+    -------
+    tuple
+        Array of shape (N, 5) storing the *Munsell* values, chromas and *CIE
+        xyY* colourspace arrays, and metadata storing the module path,
+        attribute name and *Munsell* hues.
+    """
+
+    data = getattr(importlib.import_module(module), attribute)
+
+    array = np.array([(value, chroma) + tuple(xyY)
+                      for (_hue, value, chroma), xyY in data],
+                     dtype=np.float_)
+    metadata = {'module': module,
+                'variable': attribute,
+                'hues': [hue for (hue, _value, _chroma), _xyY in data]}
+
+    return array, metadata
+
+
+def _dataset_module_hash(module):
+    """
+    Returns the *SHA-256* hash of given dataset module source file without
+    importing the module.
+
+    Parameters
+    ----------
+    module : unicode
+        Module path.
+
+    Returns
+    -------
+    unicode
+        Module source file hash or *None* if the source file does not exist.
+    """
+
+    path = '{0}.py'.format(os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(
+            os.path.abspath(__file__)))),
+        *module.split('.')))
+
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'rb') as file_:
+        return hashlib.sha256(file_.read()).hexdigest()
+
+
+def build_dataset_pack(path=DEFAULT_DATASET_PACK_PATH):
+    """
+    Builds the bundled datasets array pack.
+
+    Parameters
+    ----------
+    path : unicode, optional
+        Array pack path stem.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   The *Python* literals remain the canonical source of the datasets,
+        the hashes of their modules source files are stored in the array pack
+        so that the datasets of a module modified afterwards are read from its
+        literals.
+    """
+
+    arrays, metadata, sources = {}, {}, {}
+    for module in SPECTRAL_DATASET_MODULES:
+        module_arrays, module_metadata = spectral_dataset_arrays(module)
+        arrays.update(module_arrays)
+        metadata.update(module_metadata)
+        sources[module] = _dataset_module_hash(module)
+
+    for module, attribute in MUNSELL_DATASETS:
+        name = '{0}.{1}'.format(module, attribute)
+        arrays[name], metadata[name] = munsell_dataset_arrays(
+            module, attribute)
+        sources[module] = _dataset_module_hash(module)
+
+    return write_array_pack(path, arrays, metadata, sources=sources)
+
+
+def _dataset_pack_index(manifest):
+    """
+    Builds the index of the datasets of given bundled datasets array pack
+    manifest.
+
+    Parameters
+    ----------
+    manifest : dict
+        Bundled datasets array pack manifest.
+
+    Returns
+    -------
+    dict
+        Datasets modules indexes keyed by module path, they store the module
+        source hash, whether it matches the module source file, and for every
+        module variable, the variable entries arrays names, keys and
+        wavelengths type or the *Munsell* dataset array name and hues.
+    """
+
+    index = {}
+    for name, entry in manifest['arrays'].items():
+        metadata = entry['metadata'] or {}
+        if 'module' not in metadata:
+            continue
+
+        module = metadata['module']
+        if module not in index:
+            index[module] = {'hash': manifest['sources'].get(module),
+                             'valid': None,
+                             'variables': {}}
+
+        variable = index[module]['variables'].setdefault(
+            metadata['variable'], {})
+        if 'hues' in metadata:
+            variable[None] = (name, metadata['hues'])
+        else:
+            keys = metadata['keys']
+            variable.setdefault(keys[0], []).append(
+                (name, keys[1:], metadata.get('integer', False)))
+
+    return index
+
+
+def _dataset_pack_cache():
+    """
+    Returns the bundled datasets array pack arrays and index if it has been
+    built.
+
+    Returns
+    -------
+    tuple
+        Bundled datasets array pack arrays and index or *None* if the array
+        pack is not available.
+
+    Warning
+    -------
+    An array pack whose version is not supported is ignored.
+    """
+
+    global _DATASET_PACK_CACHE
+    if _DATASET_PACK_CACHE is None:
+        if not os.path.exists('{0}.json'.format(DEFAULT_DATASET_PACK_PATH)):
+            return None
+
+        try:
+            manifest = _read_array_pack_manifest(DEFAULT_DATASET_PACK_PATH)
+        except ValueError as error:
+            warning(('{0} The datasets are read from the modules '
+                     'literals!').format(error))
+            _DATASET_PACK_CACHE = (None, {})
+        else:
+            _DATASET_PACK_CACHE = (
+                _read_array_pack_arrays(DEFAULT_DATASET_PACK_PATH, manifest),
+                _dataset_pack_index(manifest))
+
+    return _DATASET_PACK_CACHE
+
+
+def dataset_pack():
+    """
+    Returns the bundled datasets array pack if it has been built.
+
+    Returns
+    -------
+    LazyCaseInsensitiveMapping
+        Bundled datasets arrays or *None* if the array pack is not available.
+
+    Notes
+    -----
+    -   The array pack is built by the *setup.py* *build_py* command or the
+        *utilities/build_dataset_pack.py* utility, every spectral dataset
+        array is keyed by its module path, variable name and entry name, e.g.
+        `colour.colorimetry.dataset.illuminants.spds_data.\
+ILLUMINANTS_RELATIVE_SPDS_DATA.D65` and stores the wavelengths in its first
+        column and the values in the following ones.
+    """
+
+    cache = _dataset_pack_cache()
+
+    return None if cache is None else cache[0]
+
+
+def _dataset_pack_variable(module, variable):
+    """
+    Returns the bundled datasets array pack arrays and given dataset variable
+    index if the array pack is available and given dataset module source
+    matches the array pack.
+
+    Parameters
+    ----------
+    module : unicode
+        Dataset module path.
+    variable : unicode
+        Dataset variable name.
+
+    Returns
+    -------
+    tuple
+        Bundled datasets array pack arrays and dataset variable index or
+        *None*.
+    """
+
+    cache = _dataset_pack_cache()
+    if cache is None:
+        return None
+
+    arrays, index = cache
+    if module not in index:
+        return None
+
+    module_index = index[module]
+    if module_index['valid'] is None:
+        module_hash = _dataset_module_hash(module)
+        module_index['valid'] = (module_hash is not None and
+                                 module_hash == module_index['hash'])
+        if module_hash is not None and not module_index['valid']:
+            warning(('"{0}" module source does not match the bundled datasets '
+                     'array pack, its datasets are read from the module '
+                     'literals!').format(module))
+
+    if not module_index['valid']:
+        return None
+
+    if variable not in module_index['variables']:
+        return None
+
+    return arrays, module_index['variables'][variable]
+
+
+def _dataset_pack_spectral_data(array, integer=False):
+    """
+    Returns the wavelengths / values mapping stored in given array, the
+    wavelengths are converted to integers if *integer* is *True*.
+    """
+
+    wavelengths = array[:, 0].tolist()
+    if integer:
+        wavelengths = [int(wavelength) for wavelength in wavelengths]
+
+    values = (array[:, 1].tolist() if array.shape[1] == 2 else
+              [tuple(value) for value in array[:, 1:].tolist()])
+
+    return dict(zip(wavelengths, values))
+
+
+def _dataset_pack_entry_data(arrays, entry):
+    """
+    Returns given dataset entry data from its arrays names, keys and
+    wavelengths type.
+    """
+
+    data = {}
+    for name, keys, integer in entry:
+        if not keys:
+            return _dataset_pack_spectral_data(arrays[name], integer)
+
+        mapping = data
+        for key in keys[:-1]:
+            mapping = mapping.setdefault(key, {})
+        mapping[keys[-1]] = _dataset_pack_spectral_data(arrays[name], integer)
+
+    return data
+
+
+def dataset_pack_data(module, variable, name=None):
+    """
+    Returns given dataset data read from the bundled datasets array pack if
+    available, from the dataset module literals otherwise.
+
+    Parameters
+    ----------
+    module : unicode
+        Dataset module path, e.g.
+        `colour.colorimetry.dataset.illuminants.spds_data`.
+    variable : unicode
+        Dataset variable name, e.g. `ILLUMINANTS_RELATIVE_SPDS_DATA`.
+    name : unicode, optional
+        Dataset entry name, e.g. `D65`, the whole variable data is returned if
+        *None*.
+
+    Returns
+    -------
+    dict or tuple
+        Dataset data: a wavelengths / values mapping, a mapping of wavelengths
+        / values mappings or a *Munsell* dataset.
+
+    Notes
+    -----
+    -   The dataset module is not imported when the data is read from the
+        bundled datasets array pack.
+
+    Examples
+    --------
+    >>> data = dataset_pack_data(
+    ...     'colour.colorimetry.dataset.illuminants.spds_data',
+    ...     'ILLUMINANTS_RELATIVE_SPDS_DATA', 'D65')
+    >>> data[560]
+    100.0
+    """
+
+    pack_variable = _dataset_pack_variable(module, variable)
+    if pack_variable is not None:
+        arrays, entries = pack_variable
+        if name is None and None in entries:
+            array_name, hues = entries[None]
+            rows = arrays[array_name].tolist()
+
+            return tuple(((hue, row[0], row[1]), np.array(row[2:]))
+                         for hue, row in zip(hues, rows))
+        elif name is None:
+            return dict((key, _dataset_pack_entry_data(arrays, entry))
+                        for key, entry in entries.items())
+        elif name in entries:
+            return _dataset_pack_entry_data(arrays, entries[name])
+
+    data = getattr(importlib.import_module(module), variable)
+
+    return data if name is None else data[name]
+
+
+def dataset_pack_loader(constructor, module, variable, name, *args, **kwargs):
+    """
+    Builds an object with given constructor from given dataset entry data
+    read from the bundled datasets array pack if available, it is meant to be
+    used by the datasets loaders.
+
+    Parameters
+    ----------
+    constructor : callable
+        Object constructor, called with the entry name, the entry data and
+        given arguments.
+    module : unicode
+        Dataset module path, e.g.
+        `colour.colorimetry.dataset.illuminants.spds_data`.
+    variable : unicode
+        Dataset variable name, e.g. `ILLUMINANTS_RELATIVE_SPDS_DATA`.
+    name : unicode
+        Dataset entry name.
+
+    Other Parameters
+    ----------------
+    \*args : list, optional
+        Arguments passed to the constructor.
+    \**kwargs : dict, optional
+        Keywords arguments passed to the constructor.
+
+    Returns
+    -------
+    object
+        Constructed object.
+
+    See Also
+    --------
+    dataset_pack_data
+
+    Examples
+    --------
+    >>> dataset_pack_loader(  # doctest: +ELLIPSIS
+    ...     lambda name, data: (name, data[560]),
+    ...     'colour.colorimetry.dataset.illuminants.spds_data',
+    ...     'ILLUMINANTS_RELATIVE_SPDS_DATA', 'D65')
+    ('D65', 100.0)
+    """
+
+    return constructor(name,
+                       dataset_pack_data(module, variable, name),
+                       *args,
+                       **kwargs)
+
+
+def dataset_pack_mapping(constructor, module, variable, names):
+    """
+    Returns a lazy mapping of given dataset entries whose loaders build them
+    with :func:`dataset_pack_loader` definition.
+
+    Parameters
+    ----------
+    constructor : callable
+        Entries constructor, called with the entry name, the entry data and
+        the entry title if defined.
+    module : unicode
+        Dataset module path, e.g.
+        `colour.colorimetry.dataset.illuminants.spds_data`.
+    variable : unicode
+        Dataset variable name, e.g. `ILLUMINANTS_RELATIVE_SPDS_DATA`.
+    names : array_like or dict
+        Dataset entries names or mapping of entries names to titles.
+
+    Returns
+    -------
+    LazyCaseInsensitiveMapping
+        Dataset entries lazy mapping.
+
+    Examples
+    --------
+    >>> mapping = dataset_pack_mapping(
+    ...     lambda name, data: (name, data[560]),
+    ...     'colour.colorimetry.dataset.illuminants.spds_data',
+    ...     'ILLUMINANTS_RELATIVE_SPDS_DATA', ('D50', 'D65'))
+    >>> mapping.is_loaded('D65')
+    False
+    >>> mapping['D65']
+    ('D65', 100.0)
+    """
+
+    if not isinstance(names, dict):
+        names = dict((name, None) for name in names)
+
+    return LazyCaseInsensitiveMapping(dict(
+        (name, partial(dataset_pack_loader, constructor, module, variable,
+                       name, *(() if title is None else (title, ))))
+        for name, title in names.items()))
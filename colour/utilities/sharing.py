@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Shared Arrays
+=============
+
+Defines the objects publishing *Numpy* arrays to worker processes without
+copying nor pickling them:
+
+-   :class:`SharedArrayHandle`
+-   :class:`SharedArray`
+-   :func:`attach_shared_array`
+-   :func:`detach_shared_arrays`
+
+The publishing process copies the array once into a shared memory segment or
+a *memory-mapped* temporary file and hands the workers a lightweight
+:class:`SharedArrayHandle` class instance, cheap to pickle, that they use to
+map the same memory.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import tempfile
+from collections import namedtuple
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+from colour.utilities import LRUCache
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['SHARED_ARRAY_BACKENDS',
+           'ATTACHED_SHARED_ARRAYS_CACHE_SIZE',
+           'SharedArrayHandle',
+           'SharedArray',
+           'attach_shared_array',
+           'detach_shared_arrays']
+
+SHARED_ARRAY_BACKENDS = ('Shared Memory', 'Memory Map')
+"""
+Supported shared arrays backends, *Shared Memory* requires
+:mod:`multiprocessing.shared_memory` module, i.e. *Python 3.8* or later.
+
+SHARED_ARRAY_BACKENDS : tuple
+    **{'Shared Memory', 'Memory Map'}**
+"""
+
+ATTACHED_SHARED_ARRAYS_CACHE_SIZE = 32
+"""
+Maximum count of shared arrays kept attached by
+:func:`attach_shared_array` definition in a process.
+
+ATTACHED_SHARED_ARRAYS_CACHE_SIZE : int
+"""
+
+_ATTACHED_SHARED_ARRAYS_CACHE = None
+
+
+class SharedArrayHandle(
+    namedtuple('SharedArrayHandle',
+               ('backend', 'name', 'dtype', 'shape', 'offset'))):
+    """
+    Defines a lightweight handle to a shared array.
+
+    Parameters
+    ----------
+    backend : unicode
+        **{'Shared Memory', 'Memory Map'}**,
+        Shared array backend.
+    name : unicode
+        Shared memory segment name or *memory-mapped* file path.
+    dtype : unicode
+        Array data type string.
+    shape : tuple
+        Array shape.
+    offset : int
+        Array data offset in bytes into the shared memory segment or
+        *memory-mapped* file.
+
+    Notes
+    -----
+    -   A handle can be built directly for an existing file, e.g. a *.npy* file
+        loaded with :func:`numpy.load` definition ``mmap_mode`` argument.
+    """
+
+
+class SharedArray(object):
+    """
+    Publishes given array to worker processes by copying it once into shared
+    memory.
+
+    Parameters
+    ----------
+    array : array_like
+        Array to publish.
+    backend : unicode, optional
+        **{'Shared Memory', 'Memory Map'}**,
+        Shared array backend, default to *Shared Memory* if available,
+        *Memory Map* otherwise.
+
+    Attributes
+    ----------
+    handle
+    array
+
+    Methods
+    -------
+    close
+    __enter__
+    __exit__
+
+    Notes
+    -----
+    -   The shared memory is released by :meth:`SharedArray.close` method,
+        :class:`SharedArray` class is a context manager calling it on exit.
+    -   The workers receive :attr:`SharedArray.handle` attribute and call
+        :func:`attach_shared_array` definition with it.
+
+    Examples
+    --------
+    >>> with SharedArray(np.arange(4)) as shared_array:
+    ...     attach_shared_array(shared_array.handle)
+    array([0, 1, 2, 3])
+    """
+
+    def __init__(self, array, backend=None):
+        array = np.asarray(array)
+
+        if backend is None:
+            backend = ('Shared Memory'
+                       if shared_memory is not None else 'Memory Map')
+
+        assert backend in SHARED_ARRAY_BACKENDS, (
+            '"{0}" backend is not supported, it must be one of "{1}"!'.format(
+                backend, SHARED_ARRAY_BACKENDS))
+
+        self._segment = None
+        if backend == 'Shared Memory':
+            assert shared_memory is not None, (
+                '"Shared Memory" backend requires "Python 3.8" or later!')
+
+            # Empty segments are not supported by the operating systems.
+            self._segment = shared_memory.SharedMemory(
+                create=True, size=max(array.nbytes, 1))
+            name = self._segment.name
+            self._array = np.ndarray(
+                array.shape, array.dtype, buffer=self._segment.buf)
+        else:
+            file_descriptor, name = tempfile.mkstemp(
+                prefix='colour-', suffix='.dat')
+            os.close(file_descriptor)
+            self._array = np.memmap(
+                name, array.dtype, 'w+', shape=array.shape)
+
+        self._array[...] = array
+        self._array.setflags(write=False)
+
+        self._handle = SharedArrayHandle(
+            backend, name, array.dtype.str, array.shape, 0)
+
+    @property
+    def handle(self):
+        """
+        Property for **self._handle** private attribute.
+
+        Returns
+        -------
+        SharedArrayHandle
+            self._handle.
+        """
+
+        return self._handle
+
+    @handle.setter
+    def handle(self, value):
+        """
+        Setter for **self._handle** private attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('handle'))
+
+    @property
+    def array(self):
+        """
+        Property for **self._array** private attribute.
+
+        Returns
+        -------
+        ndarray
+            self._array, *None* if the shared array is closed.
+        """
+
+        return self._array
+
+    @array.setter
+    def array(self, value):
+        """
+        Setter for **self._array** private attribute.
+
+        Parameters
+        ----------
+        value : object
+            Attribute value.
+        """
+
+        raise AttributeError('"{0}" attribute is read only!'.format('array'))
+
+    def close(self):
+        """
+        Releases the shared memory, the workers still attached to it keep
+        their mapping until they detach.
+        """
+
+        if self._array is None:
+            return
+
+        self._array = None
+
+        if self._segment is not None:
+            try:
+                self._segment.close()
+            except BufferError:
+                # Views of the array are still referenced, the memory is
+                # unmapped when they are garbage collected.
+                pass
+            self._segment.unlink()
+            self._segment = None
+        else:
+            os.remove(self._handle.name)
+
+    def __enter__(self):
+        """
+        Returns the shared array upon entering the context manager.
+
+        Returns
+        -------
+        SharedArray
+            Shared array.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__enter__` method.
+        """
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Closes the shared array upon exiting the context manager.
+
+        Parameters
+        ----------
+        \*args : list, optional
+            Arguments.
+
+        Notes
+        -----
+        -   Reimplements the :meth:`object.__exit__` method.
+        """
+
+        self.close()
+
+
+def attach_shared_array(handle):
+    """
+    Attaches to the shared array with given handle and returns a read-only
+    view of it.
+
+    Parameters
+    ----------
+    handle : SharedArrayHandle
+        Shared array handle.
+
+    Returns
+    -------
+    ndarray
+        Shared array read-only view.
+
+    Notes
+    -----
+    -   The attached shared arrays are kept in a *Least Recently Used* cache of
+        :attr:`ATTACHED_SHARED_ARRAYS_CACHE_SIZE` items so that the workers of
+        a pool attach to each shared array only once.
+
+    Examples
+    --------
+    >>> with SharedArray(np.arange(4)) as shared_array:
+    ...     attach_shared_array(shared_array.handle)
+    array([0, 1, 2, 3])
+    """
+
+    global _ATTACHED_SHARED_ARRAYS_CACHE
+    if _ATTACHED_SHARED_ARRAYS_CACHE is None:
+        _ATTACHED_SHARED_ARRAYS_CACHE = LRUCache(
+            ATTACHED_SHARED_ARRAYS_CACHE_SIZE)
+
+    attached = _ATTACHED_SHARED_ARRAYS_CACHE.get(handle)
+    if attached is not None:
+        return attached[1]
+
+    segment = None
+    if handle.backend == 'Shared Memory':
+        segment = shared_memory.SharedMemory(name=handle.name)
+        array = np.ndarray(handle.shape, handle.dtype, buffer=segment.buf,
+                           offset=handle.offset)
+        array.setflags(write=False)
+    else:
+        array = np.memmap(handle.name, handle.dtype, 'r', handle.offset,
+                          handle.shape)
+
+    # The segment is referenced so that it is not closed while attached.
+    _ATTACHED_SHARED_ARRAYS_CACHE[handle] = (segment, array)
+
+    return array
+
+
+def detach_shared_arrays():
+    """
+    Detaches from all the shared arrays attached by
+    :func:`attach_shared_array` definition in the current process.
+    """
+
+    if _ATTACHED_SHARED_ARRAYS_CACHE is not None:
+        _ATTACHED_SHARED_ARRAYS_CACHE.clear()
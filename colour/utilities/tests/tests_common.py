@@ -16,7 +16,8 @@ from colour.utilities import (
     is_string,
     is_numeric,
     is_integer,
-    filter_kwargs)
+    filter_kwargs,
+    content_hash)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
@@ -30,7 +31,8 @@ __all__ = ['TestBatch',
            'TestIsString',
            'TestIsNumeric',
            'TestIsInteger',
-           'TestFilterKwargs']
+           'TestFilterKwargs',
+           'TestContentHash']
 
 
 class TestBatch(unittest.TestCase):
@@ -193,5 +195,50 @@ class TestFilterKwargs(unittest.TestCase):
             fn_c(1, **filter_kwargs(fn_c, b=2, c=3)))
 
 
+class TestContentHash(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.common.content_hash` definition units
+    tests methods.
+    """
+
+    def test_content_hash(self):
+        """
+        Tests :func:`colour.utilities.common.content_hash` definition.
+        """
+
+        a = np.linspace(0, 1, 10)
+
+        self.assertEqual(content_hash(a, 'a', 1),
+                         content_hash(np.copy(a), 'a', 1))
+
+        self.assertEqual(content_hash(a[::2]),
+                         content_hash(np.copy(a[::2])))
+
+        self.assertNotEqual(content_hash(a), content_hash(a + 1e-15))
+
+        self.assertNotEqual(content_hash(a), content_hash(a.astype(np.int_)))
+
+        self.assertNotEqual(content_hash(a), content_hash(a.reshape(2, 5)))
+
+        self.assertNotEqual(content_hash('ab', 'c'),
+                            content_hash('a', 'bc'))
+
+        self.assertEqual(content_hash(5), content_hash(5.0))
+
+        self.assertEqual(content_hash(5), content_hash(np.float32(5)))
+
+        self.assertEqual(content_hash([1, 2, 3]),
+                         content_hash(np.array([1.0, 2.0, 3.0])))
+
+        self.assertNotEqual(content_hash(5), content_hash([5]))
+
+        self.assertEqual(content_hash('a'), content_hash(b'a'))
+
+        self.assertNotEqual(content_hash('5'), content_hash(5))
+
+        self.assertEqual(content_hash('abc', 1, 2.5, np.arange(3)),
+                         '5208b28c012501f71d851df1460d8012dc7646e3')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,14 +7,21 @@ Defines unit tests for :mod:`colour.utilities.data_structures` module.
 
 from __future__ import division, unicode_literals
 
+import numpy as np
 import pickle
+from functools import partial
+import shutil
+import tempfile
+import threading
 import unittest
 
 from colour.utilities import (
     ArbitraryPrecisionMapping,
     Structure,
     Lookup,
-    CaseInsensitiveMapping)
+    CaseInsensitiveMapping,
+    LazyCaseInsensitiveMapping,
+    LRUCache)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
@@ -26,7 +33,9 @@ __status__ = 'Production'
 __all__ = ['TestArbitraryPrecisionMapping',
            'TestStructure',
            'TestLookup',
-           'TestCaseInsensitiveMapping']
+           'TestCaseInsensitiveMapping',
+           'TestLazyCaseInsensitiveMapping',
+           'TestLRUCache']
 
 
 class TestArbitraryPrecisionMapping(unittest.TestCase):
@@ -432,5 +441,222 @@ CaseInsensitiveMapping.lower_items` method.
                              [('jane', 'Doe'), ('john', 'Doe')])
 
 
+class TestLazyCaseInsensitiveMapping(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping` class units tests methods.
+    """
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__getitem__',
+                            'copy',
+                            'update',
+                            'lower_items',
+                            'is_loaded')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LazyCaseInsensitiveMapping))
+
+    def test__getitem__(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.__getitem__` method.
+        """
+
+        calls = []
+
+        def loader(value):
+            """
+            :class:`LazyCaseInsensitiveMapping` unit tests :func:`loader`.
+            """
+
+            calls.append(value)
+
+            return [value]
+
+        mapping = LazyCaseInsensitiveMapping(
+            John=partial(loader, 'Doe'), Jane='Doe')
+
+        self.assertListEqual(calls, [])
+        self.assertFalse(mapping.is_loaded('john'))
+        self.assertTrue(mapping.is_loaded('jane'))
+
+        self.assertListEqual(mapping['JOHN'], ['Doe'])
+        self.assertIs(mapping['john'], mapping['John'])
+        self.assertListEqual(calls, ['Doe'])
+        self.assertTrue(mapping.is_loaded('john'))
+        self.assertListEqual(sorted(mapping), ['Jane', 'John'])
+
+        self.assertEqual(mapping['jane'], 'Doe')
+
+    def test_update(self):
+        """
+        Tests :meth:`colour.utilities.data_structures.\
+LazyCaseInsensitiveMapping.update` method.
+        """
+
+        mapping1 = LazyCaseInsensitiveMapping(John=partial(list, 'Doe'))
+        mapping2 = LazyCaseInsensitiveMapping(mapping1)
+        mapping3 = mapping2.copy()
+        mapping3.update(Jane='Doe')
+
+        self.assertFalse(mapping1.is_loaded('John'))
+        self.assertIs(mapping3['John'], mapping1['John'])
+        self.assertIs(mapping2['John'], mapping1['John'])
+        self.assertEqual(mapping3['Jane'], 'Doe')
+
+        self.assertEqual(mapping1, CaseInsensitiveMapping(John=list('Doe')))
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.data_structures.LRUCache` class units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('maximum_size', 'directory')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LRUCache))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__setitem__',
+                            '__getitem__',
+                            '__delitem__',
+                            '__contains__',
+                            '__iter__',
+                            '__len__',
+                            '__repr__',
+                            'get')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LRUCache))
+
+    def test_eviction(self):
+        """
+        Tests :class:`colour.utilities.data_structures.LRUCache` class
+        least recently used items eviction.
+        """
+
+        cache = LRUCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+        cache['c'] = 3
+
+        self.assertListEqual(list(cache), ['a', 'c'])
+        self.assertNotIn('b', cache)
+        self.assertRaises(KeyError, lambda: cache['b'])
+
+        cache.maximum_size = 1
+        self.assertListEqual(list(cache), ['c'])
+
+        cache = LRUCache()
+        for i in range(256):
+            cache[str(i)] = i
+        self.assertEqual(len(cache), 256)
+
+    def test_directory(self):
+        """
+        Tests :class:`colour.utilities.data_structures.LRUCache` class
+        on-disk tier.
+        """
+
+        cache = LRUCache(1, self._temporary_directory)
+        cache['a'] = np.array([1, 2, 3])
+        cache['b'] = np.array([4, 5, 6])
+
+        self.assertListEqual(list(cache), ['b'])
+        self.assertIn('a', cache)
+        np.testing.assert_equal(cache['a'], np.array([1, 2, 3]))
+
+        cache = LRUCache(1, self._temporary_directory)
+        self.assertEqual(len(cache), 0)
+        np.testing.assert_equal(cache['b'], np.array([4, 5, 6]))
+
+        del cache['b']
+        self.assertNotIn('b', cache)
+        self.assertNotIn('b', LRUCache(1, self._temporary_directory))
+
+    def test_get(self):
+        """
+        Tests :func:`colour.utilities.data_structures.LRUCache.get` method.
+        """
+
+        cache = LRUCache(2)
+        cache['a'] = 1
+        cache['b'] = 2
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual(cache.get('c', 3), 3)
+
+        cache['c'] = 3
+        self.assertListEqual(list(cache), ['a', 'c'])
+
+        cache = LRUCache(1, self._temporary_directory)
+        cache['a'] = np.array([1, 2, 3])
+        cache['b'] = np.array([4, 5, 6])
+        np.testing.assert_equal(cache.get('a'), np.array([1, 2, 3]))
+
+    def test_threads(self):
+        """
+        Tests :class:`colour.utilities.data_structures.LRUCache` class
+        concurrent use from multiple threads.
+        """
+
+        cache = LRUCache(4)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(2000):
+                    key = (offset + i) % 8
+                    value = cache.get(key)
+                    if value is None:
+                        cache[key] = key
+                    else:
+                        self.assertEqual(value, key)
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker, args=(i, ))
+                   for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertListEqual(errors, [])
+        self.assertLessEqual(len(cache), 4)
+
+
 if __name__ == '__main__':
     unittest.main()
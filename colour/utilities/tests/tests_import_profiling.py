@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.utilities.import_profiling` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import unittest
+
+from colour.utilities.import_profiling import (
+    ImportProfile,
+    profile_imports,
+    import_profile_report,
+    main)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestProfileImports',
+           'TestImportProfileReport',
+           'TestMain']
+
+
+class TestProfileImports(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.import_profiling.profile_imports`
+    definition units tests methods.
+    """
+
+    def test_profile_imports(self):
+        """
+        Tests :func:`colour.utilities.import_profiling.profile_imports`
+        definition.
+        """
+
+        profiles, total = profile_imports('json')
+        profiles = dict((profile.name, profile) for profile in profiles)
+
+        self.assertIn('json', profiles)
+        self.assertIn('json.decoder', profiles)
+
+        json = profiles['json']
+        self.assertGreaterEqual(json.cumulative_time, json.self_time)
+        self.assertGreaterEqual(json.cumulative_time,
+                                profiles['json.decoder'].cumulative_time)
+        self.assertGreaterEqual(total.cumulative_time, json.cumulative_time)
+        self.assertGreater(total.cumulative_memory, 0)
+
+        profiles, total = profile_imports('json', trace_memory=False)
+        self.assertEqual(total.cumulative_memory, 0)
+
+    def test_raise_exception_profile_imports(self):
+        """
+        Tests :func:`colour.utilities.import_profiling.profile_imports`
+        definition raised exception.
+        """
+
+        self.assertRaises(RuntimeError, profile_imports, 'colour.undefined')
+
+
+class TestImportProfileReport(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.import_profiling.import_profile_report`
+    definition units tests methods.
+    """
+
+    def test_import_profile_report(self):
+        """
+        Tests :func:`colour.utilities.import_profiling.import_profile_report`
+        definition.
+        """
+
+        profiles = [ImportProfile('a.b', 0.2, 0.2, 1024, 1024),
+                    ImportProfile('a.c', 0.1, 0.1, 4096, 4096),
+                    ImportProfile('a', 0.05, 0.35, 0, 5120)]
+        total = ImportProfile('a', 0.35, 0.35, 5120, 5120)
+
+        lines = import_profile_report(profiles, total).splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertListEqual([line.split()[-1] for line in lines[3:]],
+                             ['a.b', 'a.c', 'a'])
+
+        lines = import_profile_report(
+            profiles, total, 'self_memory', limit=1).splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[-1].split()[-1], 'a.c')
+
+        self.assertRaises(AssertionError, import_profile_report, profiles,
+                          total, 'undefined')
+
+
+class TestMain(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.import_profiling.main` definition units
+    tests methods.
+    """
+
+    def test_main(self):
+        """
+        Tests :func:`colour.utilities.import_profiling.main` definition.
+        """
+
+        self.assertEqual(main(['json', '--no-memory']), 0)
+        self.assertEqual(main(['json', '--maximum-time', '0']), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
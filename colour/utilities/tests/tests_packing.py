@@ -0,0 +1,534 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.utilities.packing` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import importlib
+import json
+import numpy as np
+import os
+import shutil
+import sys
+import unittest
+import tempfile
+import warnings
+
+try:
+    from importlib import reload
+except ImportError:
+    from imp import reload
+
+from colour.utilities.packing import (
+    write_array_pack,
+    read_array_pack,
+    read_array_pack_metadata,
+    build_dataset_pack,
+    dataset_pack,
+    dataset_pack_data,
+    dataset_pack_loader,
+    dataset_pack_mapping)
+from colour.utilities import packing
+from colour.recovery.dataset.smits1999_data import SMITS_1999_SPDS_DATA
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['ARRAYS',
+           'DATASETS',
+           'TestWriteArrayPack',
+           'TestReadArrayPack',
+           'TestReadArrayPackMetadata',
+           'TestBuildDatasetPack',
+           'TestDatasetPackData',
+           'TestDatasetPackLoader',
+           'TestDatasetPackMapping']
+
+ARRAYS = {'Scalar': 1,
+          'Vector': np.linspace(0, 1, 5),
+          'Matrix': np.arange(12).reshape(4, 3)}
+
+DATASETS = (
+    ('colour.characterisation.dataset.cameras.dslr.spectral_sensitivities',
+     ('DSL_CAMERAS_RGB_SPECTRAL_SENSITIVITIES', )),
+    ('colour.characterisation.dataset.colour_checkers.spds',
+     ('COLORCHECKER_N_OHTA_SPDS', 'BABELCOLOR_AVERAGE_SPDS')),
+    ('colour.characterisation.dataset.displays.crt.rgb_primaries',
+     ('CRT_DISPLAYS_RGB_PRIMARIES', )),
+    ('colour.characterisation.dataset.displays.lcd.rgb_primaries',
+     ('LCD_DISPLAYS_RGB_PRIMARIES', )),
+    ('colour.colorimetry.dataset.cmfs',
+     ('LMS_CMFS', 'RGB_CMFS', 'STANDARD_OBSERVERS_CMFS')),
+    ('colour.colorimetry.dataset.illuminants.d_illuminants_s_spds',
+     ('D_ILLUMINANTS_S_SPDS', )),
+    ('colour.colorimetry.dataset.illuminants.spds',
+     ('ILLUMINANTS_RELATIVE_SPDS', )),
+    ('colour.colorimetry.dataset.lefs',
+     ('PHOTOPIC_LEFS', 'SCOTOPIC_LEFS')),
+    ('colour.colorimetry.dataset.light_sources.spds',
+     ('LIGHT_SOURCES_RIT_RELATIVE_SPDS',
+      'LIGHT_SOURCES_NIST_TRADITIONAL_RELATIVE_SPDS',
+      'LIGHT_SOURCES_NIST_LED_RELATIVE_SPDS',
+      'LIGHT_SOURCES_NIST_PHILIPS_RELATIVE_SPDS',
+      'LIGHT_SOURCES_PROJECTORS_RELATIVE_SPDS')),
+    ('colour.quality.dataset.tcs', ('TCS_SPDS', )),
+    ('colour.quality.dataset.vs', ('VS_SPDS', )),
+    ('colour.recovery.dataset.smits1999', ('SMITS_1999_SPDS', )),
+    ('colour.notation.dataset.munsell', ('MUNSELL_COLOURS', )))
+"""
+Datasets modules and their lazy mappings whose loaders read the bundled
+datasets array pack.
+
+DATASETS : tuple
+"""
+
+
+def _write_dataset_pack(path, sources=None):
+    """
+    Writes a bundled datasets array pack storing the *Smits (1999)* *white*
+    spectral power distribution and a *Munsell* colour.
+    """
+
+    smits1999 = 'colour.recovery.dataset.smits1999_data'
+    munsell = 'colour.notation.dataset.munsell.real'
+
+    if sources is None:
+        sources = {smits1999: packing._dataset_module_hash(smits1999),
+                   munsell: packing._dataset_module_hash(munsell)}
+
+    return write_array_pack(
+        path,
+        {'{0}.SMITS_1999_SPDS_DATA.white'.format(smits1999): (
+            [[510, 1], [520, 2]]),
+         '{0}.MUNSELL_COLOURS_REAL'.format(munsell): (
+             [[1, 2, 0.3, 0.4, 0.5]])},
+        {'{0}.SMITS_1999_SPDS_DATA.white'.format(smits1999): {
+            'module': smits1999,
+            'variable': 'SMITS_1999_SPDS_DATA',
+            'keys': ['white'],
+            'integer': True},
+         '{0}.MUNSELL_COLOURS_REAL'.format(munsell): {
+             'module': munsell,
+             'variable': 'MUNSELL_COLOURS_REAL',
+             'hues': ['5R']}},
+        sources=sources)
+
+
+def _set_dataset_pack_path(path):
+    """
+    Sets the bundled datasets array pack path stem and discards the cached
+    array pack.
+    """
+
+    packing.DEFAULT_DATASET_PACK_PATH = path
+    packing._DATASET_PACK_CACHE = None
+
+
+def _load_datasets():
+    """
+    Loads the entries of the :attr:`DATASETS` lazy mappings by executing their
+    modules again, the modules namespaces are restored afterwards.
+    """
+
+    entries = {}
+    for module, attributes in DATASETS:
+        module = importlib.import_module(module)
+        namespace = dict(vars(module))
+        try:
+            reload(module)
+            for attribute in attributes:
+                mapping = getattr(module, attribute)
+                for name in mapping:
+                    entries[(attribute, name)] = mapping[name]
+        finally:
+            vars(module).update(namespace)
+
+    return entries
+
+
+class TestWriteArrayPack(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.packing.write_array_pack` definition units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_array_pack(self):
+        """
+        Tests :func:`colour.utilities.packing.write_array_pack` definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'pack', 'pack')
+        self.assertTrue(write_array_pack(path, ARRAYS, sources={'A': 'B'}))
+
+        data = np.load('{0}.npy'.format(path))
+        self.assertTupleEqual(data.shape, (18, ))
+
+        with open('{0}.json'.format(path)) as file_:
+            manifest = json.load(file_)
+
+        self.assertDictEqual(manifest['sources'], {'A': 'B'})
+        self.assertListEqual(manifest['arrays']['Matrix']['shape'], [4, 3])
+        offset = manifest['arrays']['Vector']['offset']
+        np.testing.assert_equal(data[offset:offset + 5], ARRAYS['Vector'])
+
+
+class TestReadArrayPack(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.packing.read_array_pack` definition units
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_array_pack(self):
+        """
+        Tests :func:`colour.utilities.packing.read_array_pack` definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'pack')
+        write_array_pack(path, ARRAYS)
+
+        pack = read_array_pack(path)
+        self.assertListEqual(sorted(pack.keys()), sorted(ARRAYS.keys()))
+        self.assertFalse(pack.is_loaded('Matrix'))
+
+        for name, array in ARRAYS.items():
+            np.testing.assert_equal(pack[name], array)
+
+        self.assertTrue(pack.is_loaded('matrix'))
+        self.assertFalse(pack['Matrix'].flags.writeable)
+
+    def test_raise_exception_read_array_pack(self):
+        """
+        Tests :func:`colour.utilities.packing.read_array_pack` definition
+        raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'pack')
+        write_array_pack(path, ARRAYS)
+
+        with open('{0}.json'.format(path), 'w') as file_:
+            json.dump({'version': 0, 'arrays': {}}, file_)
+
+        self.assertRaises(ValueError, read_array_pack, path)
+
+
+class TestReadArrayPackMetadata(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.packing.read_array_pack_metadata`
+    definition units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_array_pack_metadata(self):
+        """
+        Tests :func:`colour.utilities.packing.read_array_pack_metadata`
+        definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'pack')
+        write_array_pack(path, ARRAYS, {'Vector': {'hues': ['5R', '5Y']}})
+
+        metadata = read_array_pack_metadata(path)
+        self.assertDictEqual(metadata['Vector'], {'hues': ['5R', '5Y']})
+        self.assertIsNone(metadata['Matrix'])
+
+
+class TestBuildDatasetPack(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.packing.build_dataset_pack` definition
+    units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+        self._dataset_pack_path = packing.DEFAULT_DATASET_PACK_PATH
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        _set_dataset_pack_path(self._dataset_pack_path)
+        shutil.rmtree(self._temporary_directory)
+
+    def test_build_dataset_pack(self):
+        """
+        Tests :func:`colour.utilities.packing.build_dataset_pack` definition.
+        """
+
+        path = os.path.join(self._temporary_directory, 'datasets')
+        self.assertTrue(build_dataset_pack(path))
+
+        _set_dataset_pack_path(
+            os.path.join(self._temporary_directory, 'undefined'))
+        self.assertIsNone(dataset_pack())
+        literal_entries = _load_datasets()
+
+        _set_dataset_pack_path(path)
+        self.assertIsNotNone(dataset_pack())
+        pack_entries = _load_datasets()
+
+        self.assertSetEqual(set(pack_entries.keys()),
+                            set(literal_entries.keys()))
+        for key, literal_entry in literal_entries.items():
+            pack_entry = pack_entries[key]
+            self.assertIsNot(pack_entry, literal_entry)
+            if key[0] == 'MUNSELL_COLOURS':
+                self.assertListEqual(
+                    [specification for specification, _xyY in pack_entry],
+                    [specification for specification, _xyY in literal_entry])
+                np.testing.assert_equal(
+                    [xyY for _specification, xyY in pack_entry],
+                    [xyY for _specification, xyY in literal_entry])
+            else:
+                self.assertEqual(pack_entry.name, literal_entry.name)
+                self.assertEqual(pack_entry, literal_entry)
+                self.assertEqual(pack_entry.wavelengths.dtype,
+                                 literal_entry.wavelengths.dtype)
+
+
+class TestDatasetPackData(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.packing.dataset_pack_data` definition
+    units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+        self._dataset_pack_path = packing.DEFAULT_DATASET_PACK_PATH
+
+        path = os.path.join(self._temporary_directory, 'datasets')
+        _write_dataset_pack(path)
+        _set_dataset_pack_path(path)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        _set_dataset_pack_path(self._dataset_pack_path)
+        shutil.rmtree(self._temporary_directory)
+
+    def test_dataset_pack_data(self):
+        """
+        Tests :func:`colour.utilities.packing.dataset_pack_data` definition.
+        """
+
+        self.assertDictEqual(
+            dataset_pack_data('colour.recovery.dataset.smits1999_data',
+                              'SMITS_1999_SPDS_DATA', 'white'),
+            {510: 1, 520: 2})
+
+        data = dataset_pack_data('colour.notation.dataset.munsell.real',
+                                 'MUNSELL_COLOURS_REAL')
+        self.assertTupleEqual(data[0][0], ('5R', 1, 2))
+        np.testing.assert_equal(data[0][1], [0.3, 0.4, 0.5])
+
+        self.assertDictEqual(
+            dataset_pack_data('colour.recovery.dataset.smits1999_data',
+                              'SMITS_1999_SPDS_DATA', 'cyan'),
+            SMITS_1999_SPDS_DATA['cyan'])
+
+        self.assertDictEqual(
+            dataset_pack_data('colour.recovery.dataset.smits1999_data',
+                              'SMITS_1999_SPDS_DATA'),
+            {'white': {510: 1, 520: 2}})
+
+        _set_dataset_pack_path(
+            os.path.join(self._temporary_directory, 'undefined'))
+        self.assertIs(
+            dataset_pack_data('colour.recovery.dataset.smits1999_data',
+                              'SMITS_1999_SPDS_DATA', 'white'),
+            SMITS_1999_SPDS_DATA['white'])
+
+    def test_dataset_pack_data_import(self):
+        """
+        Tests :func:`colour.utilities.packing.dataset_pack_data` definition
+        dataset module import.
+        """
+
+        module = sys.modules.pop('colour.recovery.dataset.smits1999_data')
+        try:
+            self.assertDictEqual(
+                dataset_pack_data('colour.recovery.dataset.smits1999_data',
+                                  'SMITS_1999_SPDS_DATA', 'white'),
+                {510: 1, 520: 2})
+            self.assertNotIn('colour.recovery.dataset.smits1999_data',
+                             sys.modules)
+        finally:
+            sys.modules['colour.recovery.dataset.smits1999_data'] = module
+
+    def test_dataset_pack_data_source_hash(self):
+        """
+        Tests :func:`colour.utilities.packing.dataset_pack_data` definition
+        with a dataset module source not matching the array pack.
+        """
+
+        path = os.path.join(self._temporary_directory, 'stale')
+        _write_dataset_pack(
+            path,
+            {'colour.recovery.dataset.smits1999_data': 'Undefined',
+             'colour.notation.dataset.munsell.real': (
+                 packing._dataset_module_hash(
+                     'colour.notation.dataset.munsell.real'))})
+        _set_dataset_pack_path(path)
+
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+            self.assertIs(
+                dataset_pack_data('colour.recovery.dataset.smits1999_data',
+                                  'SMITS_1999_SPDS_DATA', 'white'),
+                SMITS_1999_SPDS_DATA['white'])
+            self.assertEqual(len(records), 1)
+
+            data = dataset_pack_data('colour.notation.dataset.munsell.real',
+                                     'MUNSELL_COLOURS_REAL')
+            self.assertEqual(len(data), 1)
+            self.assertEqual(len(records), 1)
+
+    def test_dataset_pack_data_version(self):
+        """
+        Tests :func:`colour.utilities.packing.dataset_pack_data` definition
+        with an array pack whose version is not supported.
+        """
+
+        path = os.path.join(self._temporary_directory, 'datasets')
+        with open('{0}.json'.format(path), 'w') as file_:
+            json.dump({'version': 0, 'arrays': {}}, file_)
+        _set_dataset_pack_path(path)
+
+        with warnings.catch_warnings(record=True) as records:
+            warnings.simplefilter('always')
+            self.assertIs(
+                dataset_pack_data('colour.recovery.dataset.smits1999_data',
+                                  'SMITS_1999_SPDS_DATA', 'white'),
+                SMITS_1999_SPDS_DATA['white'])
+            self.assertIsNone(dataset_pack())
+            self.assertEqual(len(records), 1)
+
+
+class TestDatasetPackLoader(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.packing.dataset_pack_loader` definition
+    units tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+        self._dataset_pack_path = packing.DEFAULT_DATASET_PACK_PATH
+
+        path = os.path.join(self._temporary_directory, 'datasets')
+        _write_dataset_pack(path)
+        _set_dataset_pack_path(path)
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        _set_dataset_pack_path(self._dataset_pack_path)
+        shutil.rmtree(self._temporary_directory)
+
+    def test_dataset_pack_loader(self):
+        """
+        Tests :func:`colour.utilities.packing.dataset_pack_loader` definition.
+        """
+
+        self.assertTupleEqual(
+            dataset_pack_loader(lambda *args, **kwargs: (args, kwargs),
+                                'colour.recovery.dataset.smits1999_data',
+                                'SMITS_1999_SPDS_DATA', 'white', 'A', b=1),
+            (('white', {510: 1, 520: 2}, 'A'), {'b': 1}))
+
+
+class TestDatasetPackMapping(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.packing.dataset_pack_mapping` definition
+    units tests methods.
+    """
+
+    def test_dataset_pack_mapping(self):
+        """
+        Tests :func:`colour.utilities.packing.dataset_pack_mapping` definition.
+        """
+
+        mapping = dataset_pack_mapping(
+            lambda *args: args, 'colour.recovery.dataset.smits1999_data',
+            'SMITS_1999_SPDS_DATA', ('white', 'cyan'))
+        self.assertListEqual(sorted(mapping.keys()), ['cyan', 'white'])
+        self.assertFalse(mapping.is_loaded('White'))
+        self.assertTupleEqual(
+            mapping['White'], ('white', SMITS_1999_SPDS_DATA['white']))
+        self.assertTrue(mapping.is_loaded('white'))
+
+        mapping = dataset_pack_mapping(
+            lambda *args: args, 'colour.recovery.dataset.smits1999_data',
+            'SMITS_1999_SPDS_DATA', {'white': 'White', 'cyan': None})
+        self.assertTupleEqual(
+            mapping['white'],
+            ('white', SMITS_1999_SPDS_DATA['white'], 'White'))
+        self.assertTupleEqual(
+            mapping['cyan'], ('cyan', SMITS_1999_SPDS_DATA['cyan']))
+
+
+if __name__ == '__main__':
+    unittest.main()
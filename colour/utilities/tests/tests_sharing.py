@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Defines unit tests for :mod:`colour.utilities.sharing` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import pickle
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+from colour.utilities.sharing import (
+    SharedArrayHandle,
+    SharedArray,
+    attach_shared_array,
+    detach_shared_arrays,
+    shared_memory)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['BACKENDS',
+           'ARRAY',
+           'sum_shared_array',
+           'TestSharedArray',
+           'TestAttachSharedArray']
+
+BACKENDS = (('Shared Memory', 'Memory Map')
+            if shared_memory is not None else ('Memory Map',))
+
+ARRAY = np.linspace(0, 1, 24).reshape(4, 6)
+
+
+def sum_shared_array(handle):
+    """
+    Returns the sum of the shared array with given handle, this definition is
+    executed by worker processes.
+    """
+
+    return np.sum(attach_shared_array(handle))
+
+
+class TestSharedArray(unittest.TestCase):
+    """
+    Defines :class:`colour.utilities.sharing.SharedArray` class units tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('handle', 'array')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(SharedArray))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('close', '__enter__', '__exit__')
+
+        for method in required_methods:
+            self.assertIn(method, dir(SharedArray))
+
+    def test_array(self):
+        """
+        Tests :attr:`colour.utilities.sharing.SharedArray.array` attribute.
+        """
+
+        for backend in BACKENDS:
+            with SharedArray(ARRAY, backend) as shared_array:
+                np.testing.assert_equal(shared_array.array, ARRAY)
+                self.assertFalse(shared_array.array.flags.writeable)
+
+                handle = shared_array.handle
+                self.assertEqual(handle.backend, backend)
+                self.assertEqual(handle.shape, ARRAY.shape)
+                self.assertEqual(np.dtype(handle.dtype), ARRAY.dtype)
+                self.assertEqual(
+                    pickle.loads(pickle.dumps(handle)), handle)
+
+            self.assertIsNone(shared_array.array)
+
+    def test_close(self):
+        """
+        Tests :meth:`colour.utilities.sharing.SharedArray.close` method.
+        """
+
+        shared_array = SharedArray(ARRAY, 'Memory Map')
+        self.assertTrue(os.path.exists(shared_array.handle.name))
+        shared_array.close()
+        self.assertFalse(os.path.exists(shared_array.handle.name))
+        shared_array.close()
+
+        if shared_memory is not None:
+            shared_array = SharedArray(ARRAY, 'Shared Memory')
+            shared_array.close()
+            self.assertRaises(FileNotFoundError,
+                              shared_memory.SharedMemory,
+                              name=shared_array.handle.name)
+            shared_array.close()
+
+    def test_raise_exception_SharedArray(self):
+        """
+        Tests :class:`colour.utilities.sharing.SharedArray` class raised
+        exception.
+        """
+
+        self.assertRaises(AssertionError, SharedArray, ARRAY, 'Undefined')
+
+
+class TestAttachSharedArray(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.sharing.attach_shared_array` definition
+    units tests methods.
+    """
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        detach_shared_arrays()
+
+    def test_attach_shared_array(self):
+        """
+        Tests :func:`colour.utilities.sharing.attach_shared_array` definition.
+        """
+
+        for backend in BACKENDS:
+            with SharedArray(ARRAY, backend) as shared_array:
+                array = attach_shared_array(shared_array.handle)
+                np.testing.assert_equal(array, ARRAY)
+                self.assertFalse(array.flags.writeable)
+                self.assertIs(attach_shared_array(shared_array.handle), array)
+
+                detach_shared_arrays()
+                del array
+
+    def test_attach_shared_array_offset(self):
+        """
+        Tests :func:`colour.utilities.sharing.attach_shared_array` definition
+        with a handle built for an existing file.
+        """
+
+        with SharedArray(ARRAY, 'Memory Map') as shared_array:
+            itemsize = ARRAY.dtype.itemsize
+            handle = SharedArrayHandle(
+                'Memory Map', shared_array.handle.name, ARRAY.dtype.str,
+                (3, 6), 6 * itemsize)
+            np.testing.assert_equal(attach_shared_array(handle), ARRAY[1:])
+
+            detach_shared_arrays()
+
+    def test_attach_shared_array_processes(self):
+        """
+        Tests :func:`colour.utilities.sharing.attach_shared_array` definition
+        from worker processes.
+        """
+
+        for backend in BACKENDS:
+            with SharedArray(ARRAY, backend) as shared_array:
+                with ProcessPoolExecutor(max_workers=2) as pool:
+                    sums = list(pool.map(sum_shared_array,
+                                         [shared_array.handle] * 4))
+
+                np.testing.assert_almost_equal(
+                    sums, [np.sum(ARRAY)] * 4, decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
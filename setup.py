@@ -13,6 +13,7 @@ import sys
 
 from setuptools import setup
 from setuptools import find_packages
+from setuptools.command.build_py import build_py
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
@@ -26,7 +27,8 @@ __all__ = ['SHORT_DESCRIPTION',
            'INSTALLATION_REQUIREMENTS',
            'PLOTTING_REQUIREMENTS',
            'DOCS_REQUIREMENTS',
-           'TESTS_REQUIREMENTS']
+           'TESTS_REQUIREMENTS',
+           'BuildPy']
 
 SHORT_DESCRIPTION = 'Colour Science for Python'
 
@@ -42,17 +44,50 @@ TESTS_REQUIREMENTS = ['coverage>=3.7.1',
                       'flake8>=2.1.0',
                       'nose>=1.3.4']
 
+if sys.version_info[:2] < (3, 2):
+    INSTALLATION_REQUIREMENTS += ['futures>=3.0.5']
+
 if sys.version_info[:2] <= (3, 2):
     TESTS_REQUIREMENTS += ['mock==1.0.1']
 
 if os.environ.get('READTHEDOCS') == 'True':
     INSTALLATION_REQUIREMENTS = ['numpy>=1.8.1', 'mock==1.0.1']
 
+
+class BuildPy(build_py):
+    """
+    Builds the *Python* modules and the bundled datasets array pack.
+    """
+
+    def run(self):
+        """
+        Runs the command.
+        """
+
+        build_py.run(self)
+
+        if self.dry_run:
+            return
+
+        try:
+            from colour.utilities.packing import build_dataset_pack
+        except ImportError as error:
+            print('Skipping the bundled datasets array pack build: {0}'.format(
+                error))
+            return
+
+        path = os.path.join(self.build_lib, 'colour', 'resources', 'datasets')
+        print('Building the bundled datasets array pack into "{0}".'.format(
+            path))
+        build_dataset_pack(path)
+
+
 setup(name='colour-science',
       version='0.3.8',
       author=__author__,
       author_email=__email__,
       include_package_data=True,
+      cmdclass={'build_py': BuildPy},
       packages=find_packages(),
       scripts=[],
       url='http://github.com/colour-science/colour',
@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tristimulus Weighting Factors Benchmark Utility
+===============================================
+
+Compares the vectorised
+:func:`colour.colorimetry.tristimulus_weighting_factors_ASTME202211`
+definition with the reference loop based implementation, both for accuracy
+and speed.
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import numpy as np
+import os
+import timeit
+
+# The benchmark must not be skewed by an on-disk cache tier.
+os.environ.pop('COLOUR_TRISTIMULUS_WEIGHTING_FACTORS_CACHE_DIRECTORY', None)
+
+import colour.colorimetry.tristimulus  # noqa
+from colour.colorimetry import (  # noqa
+    CMFS,
+    ILLUMINANTS_RELATIVE_SPDS,
+    SpectralShape,
+    lagrange_coefficients_ASTME202211,
+    tristimulus_weighting_factors_ASTME202211)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TOLERANCE',
+           'tristimulus_weighting_factors_ASTME202211_loop',
+           'tristimulus_weighting_factors_ASTME202211_vectorised',
+           'benchmark_tristimulus_weighting_factors']
+
+TOLERANCE = 1e-12
+
+
+def tristimulus_weighting_factors_ASTME202211_loop(cmfs, illuminant, shape):
+    """
+    Reference loop based implementation of
+    :func:`colour.colorimetry.tristimulus_weighting_factors_ASTME202211`
+    definition.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution
+        Illuminant spectral power distribution.
+    shape : SpectralShape
+        Shape used to build the table, only the interval is needed.
+
+    Returns
+    -------
+    ndarray
+        Tristimulus weighting factors table.
+    """
+
+    Y = cmfs.values
+    S = illuminant.values
+
+    W = S[::shape.interval, np.newaxis] * Y[::shape.interval, :]
+
+    c_c = lagrange_coefficients_ASTME202211(shape.interval, 'boundary')
+    c_b = lagrange_coefficients_ASTME202211(shape.interval, 'inner')
+
+    w_c = len(Y)
+    r_c = c_b.shape[0]
+    w_lif = w_c - (w_c - 1) % shape.interval - 1 - r_c
+
+    i_c = W.shape[0]
+    i_cm = i_c - 1
+
+    for i in range(3):
+        for j in range(r_c):
+            for k in range(3):
+                W[k, i] = W[k, i] + c_c[j, k] * S[j + 1] * Y[j + 1, i]
+
+        for j in range(r_c):
+            for k in range(i_cm, i_cm - 3, -1):
+                W[k, i] = (W[k, i] + c_c[r_c - j - 1, i_cm - k] *
+                           S[j + w_lif] * Y[j + w_lif, i])
+
+        for j in range(i_c - 3):
+            for k in range(r_c):
+                w_i = (r_c + 1) * (j + 1) + 1 + k
+                W[j, i] = W[j, i] + c_b[k, 0] * S[w_i] * Y[w_i, i]
+                W[j + 1, i] = W[j + 1, i] + c_b[k, 1] * S[w_i] * Y[w_i, i]
+                W[j + 2, i] = W[j + 2, i] + c_b[k, 2] * S[w_i] * Y[w_i, i]
+                W[j + 3, i] = W[j + 3, i] + c_b[k, 3] * S[w_i] * Y[w_i, i]
+
+        for j in range(int(w_c - ((w_c - 1) % shape.interval)), w_c, 1):
+            W[i_cm, i] = W[i_cm, i] + S[j] * Y[j, i]
+
+    W *= 100 / np.sum(W, axis=0)[1]
+
+    return W
+
+
+def tristimulus_weighting_factors_ASTME202211_vectorised(
+        cmfs, illuminant, shape):
+    """
+    Calls :func:`colour.colorimetry.tristimulus_weighting_factors_ASTME202211`
+    definition with an empty cache.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution
+        Illuminant spectral power distribution.
+    shape : SpectralShape
+        Shape used to build the table, only the interval is needed.
+
+    Returns
+    -------
+    ndarray
+        Tristimulus weighting factors table.
+    """
+
+    colour.colorimetry.tristimulus._TRISTIMULUS_WEIGHTING_FACTORS_CACHE = None
+
+    return tristimulus_weighting_factors_ASTME202211(cmfs, illuminant, shape)
+
+
+def benchmark_tristimulus_weighting_factors(number=10):
+    """
+    Benchmarks the vectorised implementation against the reference loop based
+    implementation for various colour matching functions, illuminants and
+    intervals.
+
+    Parameters
+    ----------
+    number : int, optional
+        Timed executions count per case.
+
+    Returns
+    -------
+    bool
+        Whether all the cases match within :attr:`TOLERANCE`.
+    """
+
+    success = True
+    for cmfs_name, illuminant_name, end in (
+            ('CIE 1931 2 Degree Standard Observer', 'D65', 830),
+            ('CIE 1964 10 Degree Standard Observer', 'A', 830),
+            ('CIE 1964 10 Degree Standard Observer', 'F2', 827)):
+        cmfs = CMFS.get(cmfs_name).clone().trim_wavelengths(
+            SpectralShape(360, end, 1))
+        illuminant = ILLUMINANTS_RELATIVE_SPDS.get(
+            illuminant_name).clone().align(cmfs.shape)
+
+        for interval in (1, 5, 10, 20):
+            shape = SpectralShape(360, end, interval)
+            arguments = (cmfs, illuminant, shape)
+
+            delta = np.max(np.abs(
+                tristimulus_weighting_factors_ASTME202211_loop(*arguments) -
+                tristimulus_weighting_factors_ASTME202211_vectorised(
+                    *arguments)))
+            success = success and delta <= TOLERANCE
+
+            loop = timeit.timeit(
+                lambda: tristimulus_weighting_factors_ASTME202211_loop(
+                    *arguments),
+                number=number) / number
+            vectorised = timeit.timeit(
+                lambda: tristimulus_weighting_factors_ASTME202211_vectorised(
+                    *arguments),
+                number=number) / number
+
+            print('{0}, {1}, {2}: loop {3:.6f}s, vectorised {4:.6f}s, '
+                  'speedup {5:.1f}x, maximum delta {6:.3e} [{7}]'.format(
+                      cmfs_name, illuminant_name, shape, loop, vectorised,
+                      loop / vectorised, delta,
+                      'OK' if delta <= TOLERANCE else 'FAIL'))
+
+    return success
+
+
+if __name__ == '__main__':
+    raise SystemExit(0 if benchmark_tristimulus_weighting_factors() else 1)
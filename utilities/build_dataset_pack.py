@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Dataset Pack Build Utility
+==========================
+
+Packs the bundled spectral and *Munsell* datasets into an array pack readable
+with :func:`colour.utilities.packing.read_array_pack` definition using
+:func:`colour.utilities.packing.build_dataset_pack` definition.
+
+The *Python* literals remain the canonical source of the datasets, the
+*setup.py* *build_py* command builds the array pack of the installed package
+while this utility builds it in the source tree. Datasets whose modules have
+changed since the array pack was built are read from their literals.
+"""
+
+from __future__ import division, print_function, unicode_literals
+
+import sys
+
+from colour.utilities.packing import (
+    DEFAULT_DATASET_PACK_PATH,
+    build_dataset_pack)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2016 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['main']
+
+
+def main(path=DEFAULT_DATASET_PACK_PATH):
+    """
+    Builds the bundled datasets array pack at given path stem.
+
+    Parameters
+    ----------
+    path : unicode, optional
+        Array pack path stem.
+
+    Returns
+    -------
+    bool
+        Definition success.
+    """
+
+    build_dataset_pack(path)
+
+    print('Packed the bundled datasets into "{0}".'.format(path))
+
+    return True
+
+
+if __name__ == '__main__':
+    raise SystemExit(0 if main(*sys.argv[1:]) else 1)